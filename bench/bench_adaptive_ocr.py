@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark adaptive-DPI OCR.
+Builds a synthetic scanned corpus (clean pages plus faint, blurred and
+noisy ones), OCRs it with PageByPageProcessor at a fixed 400 dpi and in
+adaptive mode, and reports per-page decisions and CPU-seconds saved.
+CPU time includes the tesseract and pdftoppm child processes.
+
+Requires tesseract and poppler on PATH.
+
+Usage:
+    python bench/bench_adaptive_ocr.py
+    python bench/bench_adaptive_ocr.py --docs 6 --pages 8
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from pdf.ocr.page_processor import PageByPageProcessor
+
+SENTENCES = [
+    "The tenant notified the landlord of water damage in the kitchen on March 3.",
+    "Counsel for the defendant requested all records relating to the lease.",
+    "The hearing on the motion is continued to the next available court date.",
+    "Repairs were not completed within the thirty day period stated in the notice.",
+    "Please preserve all emails, photographs and invoices concerning unit 4B.",
+]
+
+
+def make_page(rng: random.Random, kind: str) -> Image.Image:
+    """US letter page rendered at 200 dpi; degraded kinds mimic poor scans."""
+    page = Image.new("L", (1700, 2200), 255)
+    draw = ImageDraw.Draw(page)
+    font = ImageFont.load_default(size=30)
+    ink = 170 if kind == "faint" else 0
+    for row in range(45):
+        draw.text((120, 120 + row * 44), rng.choice(SENTENCES), fill=ink, font=font)
+    if kind == "blurred":
+        page = page.filter(ImageFilter.GaussianBlur(1.6))
+    if kind == "noisy":
+        pixels = page.load()
+        for _ in range(120_000):
+            pixels[rng.randrange(1700), rng.randrange(2200)] = rng.choice((0, 255))
+    return page
+
+
+def build_corpus(directory: Path, docs: int, pages: int) -> tuple[list[Path], dict]:
+    rng = random.Random(0)
+    kinds = {}
+    paths = []
+    for doc in range(docs):
+        page_kinds = [rng.choice(["clean"] * 6 + ["faint", "blurred", "noisy"]) for _ in range(pages)]
+        images = [make_page(rng, kind).convert("RGB") for kind in page_kinds]
+        path = directory / f"scan_{doc:02d}.pdf"
+        images[0].save(path, save_all=True, append_images=images[1:], resolution=200)
+        paths.append(path)
+        kinds[path.name] = page_kinds
+    return paths, kinds
+
+
+def run_mode(paths: list[Path], adaptive: bool) -> dict:
+    processor = PageByPageProcessor(adaptive=adaptive)
+    per_doc = {}
+    for path in paths:
+        result = processor.process_large_pdf(str(path))
+        if not result["success"]:
+            raise RuntimeError(f"{path.name}: {result['error']}")
+        per_doc[path.name] = result
+    return {
+        "cpu_seconds": round(sum(r["cpu_seconds"] for r in per_doc.values()), 2),
+        "avg_confidence": round(sum(r["confidence"] for r in per_doc.values()) / len(per_doc), 3),
+        "documents": per_doc,
+    }
+
+
+def run_benchmark(docs: int, pages: int) -> dict:
+    if not (shutil.which("tesseract") and shutil.which("pdftoppm")):
+        sys.exit("tesseract and pdftoppm are required for this benchmark")
+
+    print(f"Running adaptive OCR benchmark ({docs} docs x {pages} pages)...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, kinds = build_corpus(Path(tmp), docs, pages)
+        fixed = run_mode(paths, adaptive=False)
+        adaptive = run_mode(paths, adaptive=True)
+
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "docs": docs,
+        "pages": docs * pages,
+        "fixed_400dpi": {k: v for k, v in fixed.items() if k != "documents"},
+        "adaptive": {k: v for k, v in adaptive.items() if k != "documents"},
+        "page_decisions": {},
+    }
+
+    for name, result in adaptive["documents"].items():
+        decisions = result["page_decisions"]
+        for decision, kind in zip(decisions, kinds[name]):
+            decision["synthetic_kind"] = kind
+            print(
+                f"{name} p{decision['page']:<3} {kind:8} {decision['dpi']} dpi  "
+                f"conf {decision['confidence']:.2f}  quality {decision['quality_score']:.2f}  "
+                f"{decision['reason']}"
+            )
+        results["page_decisions"][name] = decisions
+
+    escalated = sum(r["escalated_pages"] for r in adaptive["documents"].values())
+    saved = fixed["cpu_seconds"] - adaptive["cpu_seconds"]
+    results["escalated_pages"] = escalated
+    results["cpu_seconds_saved"] = round(saved, 2)
+
+    output_file = Path(__file__).parent / "adaptive_ocr_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"fixed 400 dpi: {fixed['cpu_seconds']} CPU-s, avg confidence {fixed['avg_confidence']}")
+    print(f"adaptive:      {adaptive['cpu_seconds']} CPU-s, avg confidence {adaptive['avg_confidence']}")
+    print(f"escalated pages: {escalated}/{docs * pages}")
+    print(f"CPU-seconds saved: {saved:.1f} ({saved / fixed['cpu_seconds']:.0%})")
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Adaptive OCR benchmark")
+    parser.add_argument("--docs", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=6)
+    args = parser.parse_args()
+    run_benchmark(args.docs, args.pages)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark PDF text chunking.
+Compares the legacy 900-character chunker with the token-budgeted chunker on
+chunks/sec and on how well chunks fit the embedding model's 512-token window:
+the fraction of tokens EmbeddingService would truncate, and the average share
+of the window each chunk fills.
+
+Usage:
+    python bench/bench_chunking.py            # Legal BERT tokenizer (needs HF cache)
+    python bench/bench_chunking.py --approx   # regex token estimate, no model files
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pdf.pdf_processor import PDFProcessor
+from shared.token_chunker import (
+    MODEL_MAX_TOKENS,
+    ApproxTokenizer,
+    TokenChunker,
+    count_tokens,
+    get_chunk_tokenizer,
+)
+
+PROSE = [
+    "The tenant notified the landlord of water damage in the kitchen on March 3.",
+    "Counsel for the defendant requested all records relating to the lease.",
+    "The hearing on the motion is continued to the next available court date.",
+    "Repairs were not completed within the thirty day period stated in the notice.",
+    "Pursuant to Civil Code section 1942.4, rent may be withheld for uncorrected violations.",
+]
+
+
+def make_prose(rng: random.Random, sentences: int) -> str:
+    paragraphs = []
+    for _ in range(sentences // 6):
+        paragraphs.append(" ".join(rng.choice(PROSE) for _ in range(6)))
+    return "\n\n".join(paragraphs)
+
+
+def make_ledger(rng: random.Random, rows: int) -> str:
+    """Rent ledger / bank statement text: numbers and codes tokenize densely."""
+    lines = []
+    for _ in range(rows):
+        lines.append(
+            f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2024 CHK#{rng.randint(1000, 9999)} "
+            f"ACH-{rng.randint(10**7, 10**8)} ${rng.randint(10, 4000)}.{rng.randint(0, 99):02d} "
+            f"BAL ${rng.randint(100, 90000)}.{rng.randint(0, 99):02d} REF {rng.getrandbits(40):x}"
+        )
+    return "\n".join(lines)
+
+
+def build_corpus(docs: int) -> list[str]:
+    rng = random.Random(0)
+    corpus = []
+    for i in range(docs):
+        if i % 4 == 3:
+            corpus.append(make_ledger(rng, 400))
+        else:
+            corpus.append(make_prose(rng, 300))
+    return corpus
+
+
+def measure(name: str, chunk_fn, corpus: list[str], tokenizer) -> dict:
+    t0 = time.perf_counter()
+    chunks = [chunk for doc in corpus for chunk in chunk_fn(doc)]
+    elapsed = time.perf_counter() - t0
+
+    window = MODEL_MAX_TOKENS - 2  # [CLS] and [SEP]
+    counts = [count_tokens(chunk, tokenizer) for chunk in chunks]
+    total = sum(counts)
+    lost = sum(max(0, n - window) for n in counts)
+    result = {
+        "chunks": len(chunks),
+        "time_s": round(elapsed, 3),
+        "chunks_per_sec": round(len(chunks) / elapsed, 1),
+        "truncated_chunks": sum(n > window for n in counts),
+        "tokens_lost_fraction": round(lost / total, 4),
+        "avg_window_fill": round(sum(min(n, window) for n in counts) / (len(counts) * window), 3),
+    }
+    print(
+        f"{name:7} {result['chunks']:6} chunks  {result['chunks_per_sec']:>9} chunks/sec  "
+        f"lost {result['tokens_lost_fraction']:.2%}  fill {result['avg_window_fill']:.0%}"
+    )
+    return result
+
+
+def run_benchmark(docs: int, approx: bool) -> dict:
+    tokenizer = ApproxTokenizer() if approx else get_chunk_tokenizer()
+    corpus = build_corpus(docs)
+
+    print(f"Running chunking benchmark ({docs} docs, {tokenizer.name} tokenizer)...")
+    print("=" * 50)
+
+    legacy = PDFProcessor(token_chunking=False)
+    token = PDFProcessor(token_chunker=TokenChunker(tokenizer=tokenizer))
+
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "docs": docs,
+        "corpus_chars": sum(len(doc) for doc in corpus),
+        "tokenizer": tokenizer.name,
+        "legacy_900_chars": measure("legacy", legacy.chunk_text, corpus, tokenizer),
+        "token_budget": measure("tokens", token.chunk_text, corpus, tokenizer),
+    }
+
+    # Offsets only: what callers that store spans instead of strings pay
+    t0 = time.perf_counter()
+    spans = sum(1 for doc in corpus for _ in token.chunk_offsets(doc))
+    elapsed = time.perf_counter() - t0
+    results["token_offsets_only"] = {"chunks": spans, "chunks_per_sec": round(spans / elapsed, 1)}
+
+    output_file = Path(__file__).parent / "chunking_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"Offsets only: {results['token_offsets_only']['chunks_per_sec']} chunks/sec")
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Chunking benchmark")
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--approx", action="store_true", help="Estimate tokens without model files")
+    args = parser.parse_args()
+    run_benchmark(args.docs, args.approx)
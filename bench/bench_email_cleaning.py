@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark email cleaning.
+Compares the original per-tag substitution passes against the precompiled
+cleaning engine on synthetic HTML-heavy newsletters and long plain-text
+legal threads, and times EmailCleaner.batch_clean serial vs process pool.
+
+Usage:
+    python bench/bench_email_cleaning.py
+    python bench/bench_email_cleaning.py --emails 10000 --workers 4
+"""
+
+import argparse
+import html
+import json
+import random
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared.email_cleaner import EmailCleaner
+from shared.html_cleaner import clean_html_content
+
+# Original implementation, kept here as the baseline
+LEGACY = {
+    "style_script": re.compile(r"<(style|script)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE),
+    "block_elements": re.compile(r"<(p|div|br|li)[^>]*>", re.IGNORECASE),
+    "block_end": re.compile(r"</?(p|div|br|li)[^>]*>", re.IGNORECASE),
+    "html_tags": re.compile(r"<[^<]+?>"),
+    "excessive_newlines": re.compile(r"\n{3,}"),
+    "whitespace": re.compile(r"\s+"),
+}
+
+
+def legacy_clean_body(body: str) -> str:
+    text = LEGACY["style_script"].sub("", body)
+    text = LEGACY["block_elements"].sub("\n", text)
+    text = LEGACY["block_end"].sub("", text)
+    text = html.unescape(LEGACY["html_tags"].sub("", text))
+    text = LEGACY["excessive_newlines"].sub("\n\n", text)
+    return "\n".join(LEGACY["whitespace"].sub(" ", line).strip() for line in text.split("\n")).strip()
+
+
+def legacy_clean_html_content(text: str) -> str:
+    text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    for element in ["div", "p", "br", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote"]:
+        text = re.sub(f"<{element}[^>]*>", "\n", text, flags=re.IGNORECASE)
+        text = re.sub(f"</{element}>", "\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<li[^>]*>", "\n• ", text, flags=re.IGNORECASE)
+    text = re.sub(r"</li>", "", text, flags=re.IGNORECASE)
+    text = html.unescape(re.sub(r"<[^>]+>", "", text))
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n\s*\n\s*\n+", "\n\n", text)
+    return "\n".join(line.strip() for line in text.split("\n") if line.strip())
+
+
+def make_newsletter(rng: random.Random) -> str:
+    rows = []
+    for i in range(rng.randint(80, 200)):
+        rows.append(
+            f'<tr><td style="padding:8px;font-family:Arial"><div class="card">'
+            f'<h3>Story {i}</h3><p>Update &amp; news item {i}&nbsp;with <b>bold</b>, '
+            f'<i>italic</i> and a <a href="https://example.com/{i}?utm=1">link</a>.</p>'
+            f"<ul><li>Point one</li><li>Point two</li></ul><br/></div></td></tr>\n"
+        )
+    return (
+        "<html><head><style>td { color: #333 } .card { margin: 0 }</style>"
+        "<script>window.track = function () { return 1 < 2; };</script></head>"
+        f"<body><table>{''.join(rows)}</table>"
+        "<p>Unsubscribe &middot; Preferences</p></body></html>"
+    )
+
+
+def make_legal_thread(rng: random.Random) -> str:
+    messages = []
+    for i in range(rng.randint(40, 120)):
+        depth = "> " * (i % 4)
+        messages.append(
+            f"{depth}On Mon, Jan {i % 28 + 1}, 2024, Counsel {i} wrote:\n"
+            f"{depth}Regarding the notice   dated   {i}/1/2024,\tthe tenant disputes the claim.\n"
+            f"{depth}Please preserve all records relating to unit {i}.\n\n\n\n"
+        )
+    return "".join(messages)
+
+
+def time_per_email(func, bodies: list[str]) -> dict:
+    start = time.perf_counter()
+    for body in bodies:
+        func(body)
+    elapsed = time.perf_counter() - start
+    return {"total_time_s": round(elapsed, 3), "emails_per_sec": round(len(bodies) / elapsed, 1)}
+
+
+def run_benchmark(num_emails: int, workers: int) -> dict:
+    rng = random.Random(0)
+    newsletters = [make_newsletter(rng) for _ in range(num_emails // 2)]
+    threads = [make_legal_thread(rng) for _ in range(num_emails - len(newsletters))]
+    cleaner = EmailCleaner()
+    results = {"timestamp": datetime.now().isoformat(), "emails": num_emails}
+
+    print(f"Running email cleaning benchmark ({num_emails} emails)...")
+    print("=" * 50)
+
+    for name, bodies in (("newsletters", newsletters), ("legal_threads", threads)):
+        assert all(cleaner._clean_body(b) == legacy_clean_body(b) for b in bodies[:50])
+        legacy = time_per_email(legacy_clean_body, bodies)
+        engine = time_per_email(cleaner._clean_body, bodies)
+        results[name] = {"legacy": legacy, "engine": engine}
+        print(f"{name:14} legacy {legacy['emails_per_sec']:>9} /s   engine {engine['emails_per_sec']:>9} /s")
+
+    legacy = time_per_email(legacy_clean_html_content, newsletters)
+    engine = time_per_email(clean_html_content, newsletters)
+    results["clean_html_content"] = {"legacy": legacy, "engine": engine}
+    print(f"{'html_cleaner':14} legacy {legacy['emails_per_sec']:>9} /s   engine {engine['emails_per_sec']:>9} /s")
+
+    emails = [{"subject": f"<b>Update {i}</b>", "content": body} for i, body in enumerate(newsletters + threads)]
+    for label, count in (("batch_serial", 1), ("batch_parallel", workers)):
+        start = time.perf_counter()
+        cleaner.batch_clean(emails, workers=count)
+        elapsed = time.perf_counter() - start
+        results[label] = {"workers": count, "total_time_s": round(elapsed, 3), "emails_per_sec": round(len(emails) / elapsed, 1)}
+        print(f"{label:14} {results[label]['emails_per_sec']:>9} emails/sec ({count} workers)")
+
+    results["improvements"] = {
+        name: f"{results[name]['engine']['emails_per_sec'] / results[name]['legacy']['emails_per_sec']:.1f}x"
+        for name in ("newsletters", "legal_threads", "clean_html_content")
+    }
+    results["improvements"]["batch_parallel"] = (
+        f"{results['batch_parallel']['emails_per_sec'] / results['batch_serial']['emails_per_sec']:.1f}x"
+    )
+
+    output_file = Path(__file__).parent / "email_cleaning_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("\n" + "=" * 50)
+    for name, speedup in results["improvements"].items():
+        print(f"{name}: {speedup}")
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Email cleaning benchmark")
+    parser.add_argument("--emails", type=int, default=4_000)
+    parser.add_argument("--workers", type=int, default=4, help="Processes for the parallel batch run")
+    args = parser.parse_args()
+    run_benchmark(args.emails, args.workers)
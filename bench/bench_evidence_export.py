@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark streaming evidence package export.
+Exports a synthetic 50k-email package (with attachment files) through
+StreamingEvidenceExporter and reports throughput and peak traced memory,
+next to the memory needed to hold the same package in memory at once.
+
+Usage:
+    python bench/bench_evidence_export.py
+    python bench/bench_evidence_export.py --emails 10000 --attachments 200
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from legal_evidence.evidence_export import StreamingEvidenceExporter
+from shared.simple_db import SimpleDB
+
+WORDS = "tenant landlord repair notice entry lease deposit mold leak heater permit".split()
+
+
+def make_database(path: str, tmp: Path, num_emails: int, num_attachments: int, attachment_kb: int) -> None:
+    db = SimpleDB(path)
+    db.execute(
+        """
+        CREATE TABLE emails (
+            id INTEGER PRIMARY KEY, message_id TEXT UNIQUE, subject TEXT, sender TEXT,
+            recipient_to TEXT, datetime_utc TEXT, content TEXT, eid TEXT, thread_id TEXT
+        )
+        """
+    )
+    db.execute(
+        """
+        CREATE TABLE email_attachments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, message_id TEXT, filename TEXT,
+            mime_type TEXT, size_bytes INTEGER, attachment_id TEXT, stored_path TEXT
+        )
+        """
+    )
+    rng = random.Random(0)
+    # Insert in slices so generating the corpus doesn't dominate peak memory
+    for start in range(0, num_emails, 5000):
+        rows = [
+            (
+                f"msg-{i}",
+                " ".join(rng.sample(WORDS, 3)),
+                f"sender{i % 50}@example.com",
+                "tenant@example.com",
+                f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00",
+                " ".join(rng.choice(WORDS) for _ in range(300)),
+                f"EID-2024-{i + 1:05d}",
+                f"THREAD-{i % 2000:04d}",
+            )
+            for i in range(start, min(start + 5000, num_emails))
+        ]
+        db.batch_insert(
+            "emails",
+            ["message_id", "subject", "sender", "recipient_to", "datetime_utc", "content", "eid", "thread_id"],
+            rows,
+            5000,
+        )
+
+    files = tmp / "attachments_src"
+    files.mkdir()
+    payload = bytes(rng.getrandbits(8) for _ in range(1024)) * attachment_kb
+    attachments = []
+    for n in range(num_attachments):
+        path = files / f"exhibit_{n}.pdf"
+        path.write_bytes(payload)
+        message = f"msg-{n * max(1, num_emails // max(1, num_attachments))}"
+        attachments.append((message, path.name, "application/pdf", len(payload), str(path)))
+    db.batch_insert(
+        "email_attachments", ["message_id", "filename", "mime_type", "size_bytes", "stored_path"], attachments
+    )
+
+
+def bench_streaming(db_path: str, out_dir: str) -> dict:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = StreamingEvidenceExporter(db_path).export(out_dir)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    package_mb = sum(p.stat().st_size for p in Path(out_dir).rglob("*") if p.is_file()) / 1e6
+    return {
+        "emails": result["emails"],
+        "attachments": result["attachments"],
+        "package_mb": round(package_mb, 1),
+        "total_time_s": round(elapsed, 2),
+        "emails_per_sec": round(result["emails"] / elapsed, 1),
+        "peak_traced_mb": round(peak / 1e6, 1),
+    }
+
+
+def bench_in_memory(db_path: str) -> dict:
+    """What holding every email record in memory before writing would cost."""
+    tracemalloc.start()
+    rows = SimpleDB(db_path).fetch("SELECT * FROM emails ORDER BY id")
+    lines = [json.dumps(row) for row in rows]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows, lines
+    return {"peak_traced_mb": round(peak / 1e6, 1)}
+
+
+def run_benchmark(num_emails: int, num_attachments: int, attachment_kb: int) -> dict:
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    results = {"timestamp": datetime.now().isoformat(), "emails": num_emails}
+
+    print(f"Running evidence export benchmark ({num_emails} emails, {num_attachments} attachments)...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "evidence.db")
+        make_database(db_path, Path(tmp), num_emails, num_attachments, attachment_kb)
+
+        results["streaming"] = bench_streaming(db_path, str(Path(tmp) / "package"))
+        streaming = results["streaming"]
+        print(f"Streaming export: {streaming['emails_per_sec']} emails/sec, {streaming['package_mb']}MB package")
+        print(f"  peak traced memory: {streaming['peak_traced_mb']}MB")
+
+        results["in_memory"] = bench_in_memory(db_path)
+        print(f"Email records held in memory: {results['in_memory']['peak_traced_mb']}MB peak")
+
+    output_file = Path(__file__).parent / "evidence_export_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming evidence export benchmark")
+    parser.add_argument("--emails", type=int, default=50_000)
+    parser.add_argument("--attachments", type=int, default=500)
+    parser.add_argument("--attachment-kb", type=int, default=256)
+    args = parser.parse_args()
+    run_benchmark(args.emails, args.attachments, args.attachment_kb)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark knowledge graph edge ingestion.
+Compares per-edge add_edge (node lookup/creation per endpoint) against
+add_edges_bulk (set-based node upsert per chunk, cached node IDs,
+executemany with conflict handling) and reports edges/sec.
+
+Usage:
+    python bench/bench_kg_edges.py
+    python bench/bench_kg_edges.py --docs 20000 --edges 200000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from knowledge_graph.main import KnowledgeGraphService
+from shared.simple_db import SimpleDB
+
+
+def make_database(path: str, num_docs: int) -> None:
+    db = SimpleDB(path)
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_unified (
+            id INTEGER PRIMARY KEY, source_type TEXT, source_id INTEGER,
+            title TEXT, body TEXT, sha256 TEXT, ready_for_embedding INTEGER DEFAULT 0
+        )
+        """
+    )
+    rows = [(i, "email", i, f"Document {i}", "") for i in range(1, num_docs + 1)]
+    db.batch_insert("content_unified", ["id", "source_type", "source_id", "title", "body"], rows)
+
+
+def make_edges(num_docs: int, num_edges: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "source_content_id": str(rng.randint(1, num_docs)),
+            "target_content_id": str(rng.randint(1, num_docs)),
+            "relationship_type": "similar_to",
+            "strength": round(rng.random(), 3),
+            "metadata": {"method": "bench"},
+        }
+        for _ in range(num_edges)
+    ]
+
+
+def bench_per_edge(db_path: str, edges: list[dict]) -> dict:
+    service = KnowledgeGraphService(db_path)
+    start = time.perf_counter()
+    for edge in edges:
+        service.add_edge(
+            edge["source_content_id"],
+            edge["target_content_id"],
+            edge["relationship_type"],
+            edge["strength"],
+            edge["metadata"],
+        )
+    elapsed = time.perf_counter() - start
+    return {"edges": len(edges), "total_time_s": round(elapsed, 3), "edges_per_sec": round(len(edges) / elapsed, 1)}
+
+
+def bench_bulk(db_path: str, edges: list[dict]) -> dict:
+    service = KnowledgeGraphService(db_path)
+    stats = service.add_edges_bulk(edges)
+    return {
+        "edges": stats["total"],
+        "written": stats["written"],
+        "total_time_s": stats["time_seconds"],
+        "edges_per_sec": stats["edges_per_sec"],
+    }
+
+
+def run_benchmark(num_docs: int, num_edges: int, per_edge_sample: int) -> dict:
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    results = {"timestamp": datetime.now().isoformat(), "documents": num_docs}
+
+    print(f"Running edge ingestion benchmark ({num_docs} docs, {num_edges} edges)...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Separate databases so each path starts with no nodes
+        per_edge_db, bulk_db = str(Path(tmp) / "per_edge.db"), str(Path(tmp) / "bulk.db")
+        make_database(per_edge_db, num_docs)
+        make_database(bulk_db, num_docs)
+
+        results["per_edge"] = bench_per_edge(per_edge_db, make_edges(num_docs, per_edge_sample, seed=1))
+        print(f"add_edge:       {results['per_edge']['edges_per_sec']} edges/sec ({per_edge_sample} edges)")
+
+        results["bulk"] = bench_bulk(bulk_db, make_edges(num_docs, num_edges))
+        print(f"add_edges_bulk: {results['bulk']['edges_per_sec']} edges/sec ({num_edges} edges)")
+
+        # Same edges again: every row hits the conflict clause
+        results["bulk_rerun"] = bench_bulk(bulk_db, make_edges(num_docs, num_edges))
+        print(f"bulk re-run:    {results['bulk_rerun']['edges_per_sec']} edges/sec")
+
+    results["improvements"] = {
+        "bulk_speedup": f"{results['bulk']['edges_per_sec'] / results['per_edge']['edges_per_sec']:.1f}x"
+    }
+
+    output_file = Path(__file__).parent / "kg_edges_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"Bulk speedup: {results['improvements']['bulk_speedup']}")
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Knowledge graph edge ingestion benchmark")
+    parser.add_argument("--docs", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--per-edge-sample", type=int, default=2_000, help="Edges timed through add_edge")
+    args = parser.parse_args()
+    run_benchmark(args.docs, args.edges, args.per_edge_sample)
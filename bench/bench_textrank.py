@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark TextRank sentence extraction.
+Compares per-sentence encoding + networkx PageRank against batched encoding +
+sparse power iteration, and the cached re-summarization path.
+
+Usage:
+    python bench/bench_textrank.py               # Legal BERT (slow to load)
+    python bench/bench_textrank.py --synthetic   # hash embeddings, isolates ranking overhead
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from summarization.engine import TextRankSummarizer
+
+CLAUSES = [
+    "The plaintiff alleges the defendant failed to make repairs after written notice",
+    "Rent was withheld pending abatement of the habitability violations",
+    "The court finds the notice to quit defective under Civil Code section 1946",
+    "Defendant contends the inspection report is inadmissible hearsay",
+    "Counsel for both parties stipulated to a continuance of the hearing",
+    "The landlord entered the unit without the required twenty-four hour notice",
+    "Exhibits A through F were received into evidence without objection",
+    "The tenant requests statutory damages and reasonable attorney fees",
+]
+
+
+class SyntheticEmbeddingService:
+    """Deterministic hashed bag-of-words vectors (no model cost)."""
+
+    def __init__(self, dims: int = 1024):
+        self.dims = dims
+
+    def encode(self, text: str) -> np.ndarray:
+        vec = np.zeros(self.dims, dtype=np.float32)
+        for word in text.lower().split():
+            vec[hash(word) % self.dims] += 1.0
+        return vec / max(np.linalg.norm(vec), 1e-9)
+
+    def batch_encode(self, texts: list[str], batch_size: int = 16) -> list[np.ndarray]:
+        return [self.encode(t) for t in texts]
+
+
+def make_document(num_sentences: int, seed: int = 0) -> str:
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(len(CLAUSES), size=num_sentences)
+    return " ".join(f"{CLAUSES[p]} (paragraph {i + 1})." for i, p in enumerate(picks))
+
+
+def bench_mode(summarizer: TextRankSummarizer, docs: list[str], max_sentences: int = 5) -> dict:
+    times = []
+    sentences = 0
+    for doc in docs:
+        sentences += len(summarizer.split_sentences(doc))
+        t0 = time.perf_counter()
+        summarizer.extract_sentences(doc, max_sentences=max_sentences)
+        times.append(time.perf_counter() - t0)
+    total = sum(times)
+    return {
+        "documents": len(docs),
+        "sentences": sentences,
+        "p50_ms": round(statistics.median(times) * 1000, 2),
+        "total_time_s": round(total, 3),
+        "sentences_per_sec": round(sentences / total, 1) if total else None,
+    }
+
+
+def run_benchmark(num_docs: int, num_sentences: int, synthetic: bool) -> dict:
+    if synthetic:
+        service = SyntheticEmbeddingService()
+    else:
+        from utilities.embeddings import get_embedding_service
+
+        service = get_embedding_service()
+
+    docs = [make_document(num_sentences, seed=i) for i in range(num_docs)]
+    results = {
+        "timestamp": datetime.now().isoformat(),
+        "embeddings": "synthetic" if synthetic else "legal-bert",
+        "sentences_per_doc": num_sentences,
+    }
+
+    print(f"Running TextRank benchmark ({num_docs} docs x {num_sentences} sentences)...")
+    print("=" * 50)
+
+    legacy = TextRankSummarizer(batch_mode=False)
+    legacy.embedding_service = service
+    results["per_sentence"] = bench_mode(legacy, docs)
+    print(f"Per-sentence + networkx: {results['per_sentence']['sentences_per_sec']} sentences/sec")
+
+    batched = TextRankSummarizer(batch_mode=True, embedding_cache_size=num_docs)
+    batched.embedding_service = service
+    results["batched"] = bench_mode(batched, docs)
+    print(f"Batched + sparse PageRank: {results['batched']['sentences_per_sec']} sentences/sec")
+
+    # Same documents again: embeddings come from the per-document cache
+    results["batched_cached"] = bench_mode(batched, docs, max_sentences=3)
+    print(f"Batched, cached embeddings: {results['batched_cached']['sentences_per_sec']} sentences/sec")
+
+    base = results["per_sentence"]["total_time_s"]
+    results["improvements"] = {
+        "batched_speedup": f"{base / results['batched']['total_time_s']:.1f}x",
+        "cached_speedup": f"{base / results['batched_cached']['total_time_s']:.1f}x",
+    }
+
+    output_file = Path(__file__).parent / "textrank_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print("\n" + "=" * 50)
+    print(f"Batched speedup: {results['improvements']['batched_speedup']}")
+    print(f"Cached speedup: {results['improvements']['cached_speedup']}")
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TextRank benchmark")
+    parser.add_argument("--docs", type=int, default=10)
+    parser.add_argument("--sentences", type=int, default=200)
+    parser.add_argument("--synthetic", action="store_true", help="Use hashed embeddings instead of Legal BERT")
+    args = parser.parse_args()
+    run_benchmark(args.docs, args.sentences, args.synthetic)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark scalable topic clustering.
+Clusters synthetic Legal BERT-sized embeddings (served by an in-process stand-in
+for the vector store) and reports wall time, edges written and peak RSS.
+
+Usage:
+    python bench/bench_topic_clustering.py                  # 50k documents
+    python bench/bench_topic_clustering.py --docs 10000 --memory-mb 512
+"""
+
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from knowledge_graph import topic_clustering
+from shared.simple_db import SimpleDB
+
+DIMS = 1024
+TOPICS = 64
+
+
+class SyntheticVectorStore:
+    """Deterministic vectors around a fixed set of topic centers."""
+
+    def __init__(self, dims: int = DIMS, topics: int = TOPICS):
+        rng = np.random.default_rng(0)
+        self.centers = rng.normal(size=(topics, dims)).astype(np.float32)
+
+    def get_many(self, ids, with_payload=True, **kwargs):
+        points = []
+        for point_id in ids:
+            rng = np.random.default_rng(int(point_id))
+            center = self.centers[int(point_id) % len(self.centers)]
+            vector = center + rng.normal(scale=0.5, size=center.shape).astype(np.float32)
+            points.append({"id": point_id, "vector": vector, "payload": None})
+        return points
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_database(path: str, num_docs: int) -> SimpleDB:
+    db = SimpleDB(path)
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS content_unified (
+            id INTEGER PRIMARY KEY, source_type TEXT, source_id INTEGER,
+            title TEXT, body TEXT, sha256 TEXT, ready_for_embedding INTEGER DEFAULT 0
+        )
+        """
+    )
+    rows = [(i, "email", i, f"Document {i}", "") for i in range(1, num_docs + 1)]
+    db.batch_insert("content_unified", ["id", "source_type", "source_id", "title", "body"], rows)
+    return db
+
+
+def run_benchmark(num_docs: int, memory_mb: int) -> dict:
+    results = {"timestamp": datetime.now().isoformat(), "documents": num_docs, "memory_limit_mb": memory_mb}
+
+    print(f"Running topic clustering benchmark ({num_docs} docs x {DIMS} dims)...")
+    print("=" * 50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = make_database(str(Path(tmp) / "topics.db"), num_docs)
+        topic_clustering.EntityService = MagicMock
+        service = topic_clustering.TopicClusteringService(db.db_path, vector_store=SyntheticVectorStore())
+        rss_before = peak_rss_mb()
+
+        t0 = time.perf_counter()
+        result = service.perform_scalable_clustering(memory_limit_mb=memory_mb, label_clusters=False)
+        elapsed = time.perf_counter() - t0
+
+    results.update(
+        {
+            "clusters": result["num_clusters"],
+            "edges": result["edges"],
+            "total_time_s": round(elapsed, 2),
+            "docs_per_sec": round(num_docs / elapsed, 1),
+            "peak_rss_mb_before": round(rss_before, 1),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+        }
+    )
+    print(f"Clusters: {results['clusters']}, edges: {results['edges']}")
+    print(f"Time: {results['total_time_s']}s ({results['docs_per_sec']} docs/sec)")
+    print(f"Peak RSS: {results['peak_rss_mb']}MB")
+
+    output_file = Path(__file__).parent / "topic_clustering_last_run.json"
+    with open(output_file, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nFull results saved to: {output_file}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Topic clustering benchmark")
+    parser.add_argument("--docs", type=int, default=50_000)
+    parser.add_argument("--memory-mb", type=int, default=1024)
+    args = parser.parse_args()
+    run_benchmark(args.docs, args.memory_mb)
@@ -5,7 +5,7 @@ from loguru import logger
 
 from shared.simple_db import SimpleDB
 from config.settings import get_db_path
-from summarization import get_document_summarizer
+from summarization import get_batch_summarizer, get_document_summarizer
 
 # Import advanced email parsing modules
 try:
@@ -587,54 +587,44 @@ class GmailService:
             }
 
     def _process_email_summaries(self, email_list: list[dict]) -> None:
-        """Process and store summaries for a list of emails."""
-        try:
-            for email_data in email_list:
-                # Skip if no content
-                if not email_data.get("content"):
-                    continue
-
-                # First, add email to content table to get content_id
-                content_id = self.db.add_content(
-                    content_type="email",
-                    title=email_data.get("subject", "No Subject"),
-                    content=email_data.get("content", ""),
-                    metadata={
-                        "message_id": email_data.get("message_id"),
-                        "sender": email_data.get("sender"),
-                        "recipient": email_data.get("recipient_to"),
-                        "datetime_utc": email_data.get("datetime_utc"),
-                    },
-                )
-
-                # Generate summary
-                email_content = email_data.get("content", "")
-
-                if email_content and len(email_content) > 50:  # Only summarize meaningful content
-                    summary = self.summarizer.extract_summary(
-                        email_content,
-                        max_sentences=3,  # Emails typically need fewer sentences
-                        max_keywords=10,
-                        summary_type="combined",
-                    )
+        """Process and store summaries for a list of emails.
 
-                    # Store summary in database
-                    if summary and (summary.get("summary_text") or summary.get("tf_idf_keywords")):
-                        summary_id = self.db.add_document_summary(
-                            document_id=content_id,
-                            summary_type="combined",
-                            summary_text=summary.get("summary_text"),
-                            tf_idf_keywords=summary.get("tf_idf_keywords"),
-                            textrank_sentences=summary.get("textrank_sentences"),
-                        )
-
-                        if summary_id:
-                            logger.debug(
-                                f"Generated summary for email: {email_data.get('subject', 'No Subject')[:50]}"
-                            )
+        Emails are added to content_unified in one batch, then summarized against
+        the shared TF-IDF vocabulary and written to document_summaries in bulk.
+        """
+        try:
+            emails = [e for e in email_list if e.get("content")]
+            if not emails:
+                return
+
+            # Add all emails to the content table in one pass to get content_ids
+            content_result = self.db.batch_add_content(
+                [
+                    {
+                        "content_type": "email",
+                        "title": e.get("subject", "No Subject"),
+                        "content": e.get("content", ""),
+                    }
+                    for e in emails
+                ]
+            )
 
-                            # Exports are now done separately via export_documents.py
-                            logger.debug(f"Email stored with content_id: {content_id}")
+            # Only summarize meaningful content
+            documents = [
+                (content_id, e["content"])
+                for content_id, e in zip(content_result["content_ids"], emails)
+                if content_id and len(e["content"]) > 50
+            ]
+            if not documents:
+                return
+
+            result = get_batch_summarizer().summarize_to_db(
+                self.db,
+                documents,
+                max_sentences=3,  # Emails typically need fewer sentences
+                max_keywords=10,
+            )
+            logger.debug(f"Stored {result['stored']} email summaries for {len(emails)} emails")
 
         except Exception as e:
             # Don't fail email sync if summarization fails
@@ -6,6 +6,7 @@ Leverages existing PDF service infrastructure for text extraction and validation
 """
 
 import hashlib
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,6 +15,13 @@ import frontmatter
 from loguru import logger
 from config.settings import get_db_path
 
+from .parallel_runner import (
+    DEFAULT_FILE_TIMEOUT,
+    DEFAULT_MAX_INFLIGHT_BYTES,
+    ThroughputStats,
+    run_parallel,
+)
+
 # PDF service factories - to be injected from higher layers
 _pdf_service_factories = None
 PDF_AVAILABLE = True
@@ -29,6 +37,20 @@ def set_pdf_service_factories(factories):
     logger.info("PDF service factories configured")
 
 
+_worker_converter = None
+
+
+def _init_converter_worker(factories, db_path: str) -> None:
+    """Pool initializer: worker processes get the parent's factories and their own converter."""
+    global _pdf_service_factories, _worker_converter
+    _pdf_service_factories = factories
+    _worker_converter = DocumentConverter(db_path)
+
+
+def _convert_in_worker(pdf_path: str, output_path: str) -> dict[str, Any]:
+    return _worker_converter.convert_pdf_to_markdown(Path(pdf_path), Path(output_path))
+
+
 class DocumentConverter:
     """Converts PDF files to markdown with YAML frontmatter metadata."""
 
@@ -37,6 +59,7 @@ class DocumentConverter:
         # Use centralized config if no path provided
         if db_path is None:
             db_path = get_db_path()
+        self.db_path = db_path
             
         if not PDF_AVAILABLE:
             raise ImportError("PDF infrastructure required for DocumentConverter")
@@ -264,7 +287,11 @@ class DocumentConverter:
         self, 
         directory_path: Path, 
         output_dir: Path | None = None,
-        recursive: bool = False
+        recursive: bool = False,
+        parallel: bool = False,
+        workers: int | None = None,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        file_timeout: float = DEFAULT_FILE_TIMEOUT,
     ) -> dict[str, Any]:
         """
         Convert all PDFs in a directory to markdown.
@@ -273,6 +300,10 @@ class DocumentConverter:
             directory_path: Directory containing PDF files
             output_dir: Optional output directory for markdown files
             recursive: Whether to process subdirectories
+            parallel: Convert in a process pool (results keep file order)
+            workers: Worker processes (default: CPU count)
+            max_inflight_bytes: Cap on PDF bytes being converted at once
+            file_timeout: Seconds before a file is abandoned
             
         Returns:
             Batch conversion results
@@ -283,7 +314,7 @@ class DocumentConverter:
 
             # Find PDF files
             pattern = "**/*.pdf" if recursive else "*.pdf"
-            pdf_files = list(directory_path.glob(pattern))
+            pdf_files = sorted(directory_path.glob(pattern))
 
             if not pdf_files:
                 return {"success": True, "message": "No PDF files found", "results": []}
@@ -297,15 +328,36 @@ class DocumentConverter:
             results = []
             success_count = 0
             error_count = 0
+            throughput = ThroughputStats()
+            start = time.perf_counter()
+            output_files = [output_dir / pdf_file.with_suffix('.md').name for pdf_file in pdf_files]
+
+            if parallel:
+                jobs = [
+                    (pdf_file, (str(pdf_file), str(output_file)))
+                    for pdf_file, output_file in zip(pdf_files, output_files)
+                ]
+                outcomes = run_parallel(
+                    _convert_in_worker,
+                    jobs,
+                    workers,
+                    max_inflight_bytes,
+                    file_timeout,
+                    initializer=_init_converter_worker,
+                    initargs=(_pdf_service_factories, self.db_path),
+                )
+            else:
+                outcomes = self._convert_sequential(pdf_files, output_files)
 
-            for pdf_file in pdf_files:
-                output_file = output_dir / pdf_file.with_suffix('.md').name
-                result = self.convert_pdf_to_markdown(pdf_file, output_file)
-                
+            for index, result in outcomes:
+                pdf_file, output_file = pdf_files[index], output_files[index]
                 if result["success"]:
                     success_count += 1
                 else:
                     error_count += 1
+                throughput.add(
+                    "pdf", pdf_file.stat().st_size, result.get("elapsed_seconds", 0.0), result["success"]
+                )
 
                 results.append({
                     "file": pdf_file.name,
@@ -322,13 +374,23 @@ class DocumentConverter:
                 "success_count": success_count,
                 "error_count": error_count,
                 "output_directory": str(output_dir),
-                "results": results
+                "results": results,
+                "throughput": throughput.summary(),
+                "elapsed_seconds": round(time.perf_counter() - start, 3),
             }
 
         except Exception as e:
             logger.error(f"Directory conversion failed: {e}")
             return {"success": False, "error": f"Directory conversion failed: {str(e)}"}
 
+    def _convert_sequential(self, pdf_files: list[Path], output_files: list[Path]):
+        """Convert files one by one, yielding (index, result) like run_parallel."""
+        for index, (pdf_file, output_file) in enumerate(zip(pdf_files, output_files)):
+            start = time.perf_counter()
+            result = self.convert_pdf_to_markdown(pdf_file, output_file)
+            result["elapsed_seconds"] = time.perf_counter() - start
+            yield index, result
+
     def validate_setup(self) -> dict[str, Any]:
         """Validate DocumentConverter setup and dependencies."""
         try:
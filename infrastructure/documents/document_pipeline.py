@@ -5,29 +5,38 @@ Routes documents through the appropriate processor based on format.
 Manages the complete document lifecycle from raw to export.
 """
 
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+from config.settings import get_db_path
+
 from .format_detector import FormatDetector
 from .lifecycle_manager import DocumentLifecycleManager
 from .naming_convention import NamingConvention
+from .parallel_runner import (
+    DEFAULT_FILE_TIMEOUT,
+    DEFAULT_MAX_INFLIGHT_BYTES,
+    ThroughputStats,
+    run_parallel,
+)
 from .processors import DocxProcessor, MarkdownProcessor, TextProcessor
 
 # Import PDF processor if available
 try:
+    from pdf.wiring import build_pdf_service
 
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
-    PDFService = None
+    build_pdf_service = None
 
 # Import shared database
 try:
     from shared.simple_db import SimpleDB
-from config.settings import get_db_path
 
     DB_AVAILABLE = True
 except ImportError:
@@ -36,6 +45,23 @@ except ImportError:
 
 # Logger is now imported globally from loguru
 
+# Formats whose processors are self-contained and can run in worker processes
+PARALLEL_PROCESSORS = {
+    "txt": TextProcessor,
+    "md": MarkdownProcessor,
+    "docx": DocxProcessor,
+}
+
+_worker_processors: dict[str, Any] = {}
+
+
+def _extract_document(format_type: str, file_path: str) -> dict[str, Any]:
+    """Worker entry point: extract one file with a per-process processor instance."""
+    processor = _worker_processors.get(format_type)
+    if processor is None:
+        processor = _worker_processors[format_type] = PARALLEL_PROCESSORS[format_type]()
+    return processor.process(Path(file_path))
+
 
 class DocumentPipeline:
     """Main document processing pipeline router."""
@@ -65,14 +91,13 @@ class DocumentPipeline:
 
         # Add PDF processor if available
         if PDF_AVAILABLE:
-            from pdf.wiring import build_pdf_service
-
             self.processors["pdf"] = build_pdf_service(db_path)
 
         # Initialize database if available
         self.db = SimpleDB(db_path) if DB_AVAILABLE else None
 
         self.stats = {"processed": 0, "failed": 0, "quarantined": 0, "unsupported": 0}
+        self.throughput = ThroughputStats()
 
         logger.info(
             f"Document pipeline initialized with processors: {list(self.processors.keys())}"
@@ -116,11 +141,35 @@ class DocumentPipeline:
                 }
 
             # Process document in place
+            start = time.perf_counter()
             if format_type == "pdf" and PDF_AVAILABLE:
                 # Use PDF service for PDF files
                 result = processor.upload_single_pdf(str(file_path))
             else:
                 result = processor.process(file_path)
+            result["elapsed_seconds"] = time.perf_counter() - start
+
+            return self._finish_document(file_path, format_type, result, case_name, doc_type)
+
+        except Exception as e:
+            return self._handle_failure(file_path, e)
+
+    def _finish_document(
+        self,
+        file_path: Path,
+        format_type: str,
+        result: dict[str, Any],
+        case_name: str | None,
+        doc_type: str | None,
+    ) -> dict[str, Any]:
+        """Apply the lifecycle transition for an extraction result (quarantine or save)."""
+        try:
+            self.throughput.add(
+                format_type,
+                file_path.stat().st_size,
+                result.get("elapsed_seconds", 0.0),
+                bool(result.get("success")),
+            )
 
             if not result.get("success"):
                 # Quarantine on failure (copy, don't move)
@@ -157,18 +206,20 @@ class DocumentPipeline:
             }
 
         except Exception as e:
-            logger.error(f"Pipeline processing failed for {file_path}: {e}")
-            self.stats["failed"] += 1
+            return self._handle_failure(file_path, e)
 
-            # Try to quarantine if possible
-            try:
-                if file_path.exists():
-                    self.lifecycle.quarantine_file(file_path, str(e))
-            except Exception:
-                pass
+    def _handle_failure(self, file_path: Path, error: Exception) -> dict[str, Any]:
+        logger.error(f"Pipeline processing failed for {file_path}: {error}")
+        self.stats["failed"] += 1
 
-            return {"success": False, "error": str(e), "file": str(file_path)}
+        # Try to quarantine if possible
+        try:
+            if file_path.exists():
+                self.lifecycle.quarantine_file(file_path, str(error))
+        except Exception:
+            pass
 
+        return {"success": False, "error": str(error), "file": str(file_path)}
 
     def process_directory(
         self,
@@ -176,15 +227,29 @@ class DocumentPipeline:
         case_name: str | None = None,
         doc_type: str | None = None,
         recursive: bool = False,
+        parallel: bool = False,
+        workers: int | None = None,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        file_timeout: float = DEFAULT_FILE_TIMEOUT,
     ) -> dict[str, Any]:
         """
         Process all documents in a directory.
 
+        In parallel mode TXT, MD and DOCX extraction runs in a process pool
+        (one worker per core by default). PDFs always go through the PDF
+        service here, one at a time. Quarantine and save steps for both are
+        applied in file order, so results and lifecycle transitions match a
+        sequential run.
+
         Args:
             directory_path: Path to directory
             case_name: Case identifier for naming
             doc_type: Document type for naming
             recursive: Process subdirectories
+            parallel: Extract supported formats in worker processes
+            workers: Worker processes (default: CPU count)
+            max_inflight_bytes: Cap on input bytes being extracted at once
+            file_timeout: Seconds before a file is abandoned and quarantined
 
         Returns:
             Batch processing results
@@ -196,29 +261,66 @@ class DocumentPipeline:
 
         # Find all supported files
         pattern = "**/*" if recursive else "*"
-        files = []
-
-        for file_path in dir_path.glob(pattern):
-            if file_path.is_file() and self.detector.is_supported_format(file_path):
-                files.append(file_path)
+        files = sorted(
+            file_path
+            for file_path in dir_path.glob(pattern)
+            if file_path.is_file() and self.detector.is_supported_format(file_path)
+        )
 
         if not files:
             return {"success": True, "message": "No supported documents found", "stats": self.stats}
 
-        # Process each file
-        results = []
-        for file_path in files:
-            result = self.process_document(file_path, case_name, doc_type)
-            results.append(
-                {
-                    "file": str(file_path),
-                    "success": result["success"],
-                    "format": result.get("format"),
-                    "error": result.get("error"),
-                }
-            )
+        start = time.perf_counter()
+        outcomes: dict[int, dict[str, Any]] = {}
+        parallel_files, serial_files = [], []
+        for index, file_path in enumerate(files):
+            format_type = self.detector.detect_format(file_path) if parallel else None
+            if format_type in PARALLEL_PROCESSORS:
+                parallel_files.append((index, file_path, format_type))
+            else:
+                serial_files.append(index)
+
+        serial = iter(serial_files)
+        next_serial = next(serial, None)
+        if parallel_files:
+            jobs = [(path, (fmt, str(path))) for _, path, fmt in parallel_files]
+            for job_index, result in run_parallel(
+                _extract_document, jobs, workers, max_inflight_bytes, file_timeout
+            ):
+                index, file_path, format_type = parallel_files[job_index]
+                # Sequential files that sort earlier go first; the pool keeps extracting meanwhile
+                while next_serial is not None and next_serial < index:
+                    outcomes[next_serial] = self.process_document(
+                        files[next_serial], case_name, doc_type
+                    )
+                    next_serial = next(serial, None)
+                outcomes[index] = self._finish_document(
+                    file_path, format_type, result, case_name, doc_type
+                )
 
-        return {"success": True, "total_files": len(files), "results": results, "stats": self.stats}
+        # Process remaining files one by one
+        while next_serial is not None:
+            outcomes[next_serial] = self.process_document(files[next_serial], case_name, doc_type)
+            next_serial = next(serial, None)
+
+        results = [
+            {
+                "file": str(file_path),
+                "success": outcomes[index]["success"],
+                "format": outcomes[index].get("format"),
+                "error": outcomes[index].get("error"),
+            }
+            for index, file_path in enumerate(files)
+        ]
+
+        return {
+            "success": True,
+            "total_files": len(files),
+            "results": results,
+            "stats": self.stats,
+            "throughput": self.throughput.summary(),
+            "elapsed_seconds": round(time.perf_counter() - start, 3),
+        }
 
     def get_pipeline_stats(self) -> dict[str, Any]:
         """Get pipeline statistics."""
@@ -226,6 +328,7 @@ class DocumentPipeline:
 
         return {
             "pipeline_stats": self.stats,
+            "throughput": self.throughput.summary(),
             "folder_stats": folder_stats,
             "supported_formats": list(self.processors.keys()),
             "database_available": self.db is not None,
@@ -0,0 +1,177 @@
+"""
+Parallel file runner for document conversion.
+
+Runs a picklable per-file function in a process pool and yields results in
+input order, so callers can apply database and lifecycle updates serially and
+deterministically. In-flight work is capped by file count (the pool size) and
+by total input bytes. A file that exceeds its timeout, or kills its worker,
+is reported as failed and the pool is restarted; files that were in flight
+alongside a crash are re-run one at a time so the crash is pinned to the
+right file.
+"""
+
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+DEFAULT_FILE_TIMEOUT = float(os.getenv("DOC_FILE_TIMEOUT", "120"))
+DEFAULT_MAX_INFLIGHT_BYTES = int(os.getenv("DOC_MAX_INFLIGHT_MB", "256")) * 1024 * 1024
+
+
+def _timed_call(func: Callable[..., dict], args: tuple) -> dict:
+    """Run func in the worker and attach its wall time."""
+    start = time.perf_counter()
+    try:
+        result = func(*args)
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+    result["elapsed_seconds"] = time.perf_counter() - start
+    return result
+
+
+def _terminate(pool: ProcessPoolExecutor) -> None:
+    """Stop a pool whose workers may be stuck (shutdown alone waits for running tasks)."""
+    # ProcessPoolExecutor has no public way to kill a running task
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_parallel(
+    func: Callable[..., dict],
+    jobs: list[tuple[Path, tuple]],
+    workers: int | None = None,
+    max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+    file_timeout: float = DEFAULT_FILE_TIMEOUT,
+    initializer: Callable | None = None,
+    initargs: tuple = (),
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """
+    Run func(*args) for each (path, args) job in a process pool.
+
+    Args:
+        func: Module-level function returning a result dict
+        jobs: (input path, func args) pairs; the path's size counts toward the byte cap
+        workers: Pool size (default: CPU count)
+        max_inflight_bytes: Cap on input bytes being processed at once
+        file_timeout: Seconds before a file is abandoned
+        initializer: Optional pool initializer (e.g. to inject service factories)
+        initargs: Arguments for initializer
+
+    Yields:
+        (job index, result dict) in job order; results carry elapsed_seconds
+    """
+    workers = max(1, workers or DEFAULT_WORKERS)
+    sizes = []
+    for path, _ in jobs:
+        try:
+            sizes.append(Path(path).stat().st_size)
+        except OSError:
+            sizes.append(0)
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs)
+
+    pending = deque(range(len(jobs)))
+    inflight: deque[tuple[int, Any, float]] = deque()
+    inflight_bytes = 0
+    suspects: set[int] = set()
+    pool = new_pool()
+
+    def restart(requeue: list[int]) -> None:
+        nonlocal pool, inflight_bytes
+        _terminate(pool)
+        pool = new_pool()
+        inflight.clear()
+        inflight_bytes = 0
+        pending.extendleft(reversed(requeue))
+
+    try:
+        while pending or inflight:
+            # Fill up to the worker and byte caps; suspects run alone
+            while pending and len(inflight) < workers:
+                index = pending[0]
+                if inflight and (
+                    index in suspects
+                    or inflight[0][0] in suspects
+                    or inflight_bytes + sizes[index] > max_inflight_bytes
+                ):
+                    break
+                pending.popleft()
+                future = pool.submit(_timed_call, func, jobs[index][1])
+                inflight.append((index, future, time.monotonic() + file_timeout))
+                inflight_bytes += sizes[index]
+
+            index, future, deadline = inflight[0]
+            try:
+                result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.warning(f"Timed out after {file_timeout}s: {jobs[index][0]}")
+                restart([i for i, _, _ in list(inflight)[1:]])
+                suspects.discard(index)
+                yield index, {
+                    "success": False,
+                    "error": f"Timed out after {file_timeout}s",
+                    "timed_out": True,
+                    "elapsed_seconds": file_timeout,
+                }
+                continue
+            except BrokenProcessPool:
+                if index in suspects:
+                    logger.warning(f"Worker crashed processing {jobs[index][0]}")
+                    restart([i for i, _, _ in list(inflight)[1:]])
+                    suspects.discard(index)
+                    yield index, {"success": False, "error": "Worker process crashed"}
+                else:
+                    # Unknown culprit: re-run everything that was in flight one by one
+                    requeue = [i for i, _, _ in inflight]
+                    suspects.update(requeue)
+                    restart(requeue)
+                continue
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            inflight.popleft()
+            inflight_bytes -= sizes[index]
+            suspects.discard(index)
+            yield index, result
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ThroughputStats:
+    """Per-format file, byte and time totals for a conversion run."""
+
+    def __init__(self):
+        self.formats: dict[str, dict[str, float]] = {}
+
+    def add(self, format_type: str, size_bytes: int, elapsed: float, success: bool) -> None:
+        entry = self.formats.setdefault(
+            format_type, {"files": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+        )
+        entry["files"] += 1
+        entry["failed"] += 0 if success else 1
+        entry["bytes"] += size_bytes
+        entry["seconds"] += elapsed
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Totals per format plus files/sec and MB/sec of worker time."""
+        report = {}
+        for format_type, entry in sorted(self.formats.items()):
+            seconds = entry["seconds"] or 1e-9
+            report[format_type] = {
+                **entry,
+                "seconds": round(entry["seconds"], 3),
+                "files_per_sec": round(entry["files"] / seconds, 2),
+                "mb_per_sec": round(entry["bytes"] / (1024 * 1024) / seconds, 2),
+            }
+        return report
@@ -4,7 +4,6 @@ Document processors for different formats.
 
 from .base_processor import BaseProcessor
 from .docx_processor import DocxProcessor
-from .email_thread_processor import EmailThreadProcessor, get_email_thread_processor
 from .markdown_processor import MarkdownProcessor
 from .text_processor import TextProcessor
 
@@ -13,6 +12,4 @@ __all__ = [
     "TextProcessor",
     "MarkdownProcessor",
     "DocxProcessor",
-    "EmailThreadProcessor",
-    "get_email_thread_processor",
 ]
@@ -6,7 +6,9 @@ enterprise abstractions.
 """
 
 import json
+import time
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 
 from loguru import logger
@@ -15,6 +17,43 @@ from shared.simple_db import SimpleDB
 
 # Logger is now imported globally from loguru
 
+# Namespace for deterministic edge IDs (re-adding the same edge is a no-op)
+EDGE_ID_NAMESPACE = uuid.UUID("6b3c1f5e-8d2a-4e7b-9c41-2f0a7d5e9b13")
+
+SQL_CHUNK = 500
+
+EDGE_BATCH_SIZE = 5000
+
+# Canonical UUID4 text generated inside SQLite, for set-based node creation
+_SQL_UUID4 = (
+    "lower(hex(randomblob(4)) || '-' || hex(randomblob(2)) || '-4' || substr(hex(randomblob(2)), 2)"
+    " || '-' || substr('89ab', 1 + (abs(random()) % 4), 1) || substr(hex(randomblob(2)), 2)"
+    " || '-' || hex(randomblob(6)))"
+)
+
+_EDGE_CONFLICT_CLAUSES = {
+    "ignore": "DO NOTHING",
+    "update": "DO UPDATE SET strength = excluded.strength, edge_metadata = excluded.edge_metadata",
+}
+
+
+def stable_edge_id(source_node_id: str, target_node_id: str, relationship_type: str) -> str:
+    """
+    Deterministic edge ID for a (source, target, type) triple.
+    """
+    return str(uuid.uuid5(EDGE_ID_NAMESPACE, f"{source_node_id}|{target_node_id}|{relationship_type}"))
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 
 class KnowledgeGraphService:
     """
@@ -24,6 +63,8 @@ class KnowledgeGraphService:
     def __init__(self, db_path: str = "data/emails.db"):
         self.db = SimpleDB(db_path)
         self.db_path = db_path
+        # content_id -> node_id for this service instance (nodes are never re-keyed)
+        self._node_cache: dict[str, str] = {}
         self._ensure_schema()
 
     def _ensure_schema(self):
@@ -170,7 +211,8 @@ class KnowledgeGraphService:
         if not source_node_id or not target_node_id:
             return None
 
-        edge_id = str(uuid.uuid4())
+        # Same ID as add_edges_bulk, so either path re-adding the edge is ignored
+        edge_id = stable_edge_id(source_node_id, target_node_id, relationship_type)
         metadata_json = json.dumps(metadata) if metadata else None
 
         self.db.execute(
@@ -190,14 +232,21 @@ class KnowledgeGraphService:
 
         Returns node_id.
         """
+        cached = self._node_cache.get(str(content_id))
+        if cached:
+            return cached
+
         node = self.get_node_by_content(content_id)
         if node:
+            self._node_cache[str(content_id)] = node["node_id"]
             return node["node_id"]
 
         # Create new node
         content = self.db.get_content(content_id)
         if content:
-            return self.add_node(content_id, content["type"], content.get("title"))
+            node_id = self.add_node(content_id, content["source_type"], content.get("title"))
+            self._node_cache[str(content_id)] = node_id
+            return node_id
         else:
             logger.error(f"Cannot find content {content_id}")
             return None
@@ -311,7 +360,9 @@ class KnowledgeGraphService:
         # Prepare data tuples
         prepared_data = []
         for item in edge_data:
-            edge_id = item.get("edge_id", str(uuid.uuid4()))
+            edge_id = item.get("edge_id") or stable_edge_id(
+                item["source_node_id"], item["target_node_id"], item["relationship_type"]
+            )
             metadata_json = json.dumps(item.get("metadata")) if item.get("metadata") else None
             prepared_data.append(
                 (
@@ -334,6 +385,130 @@ class KnowledgeGraphService:
         ]
         return self.db.batch_insert("kg_edges", columns, prepared_data, batch_size)
 
+    def resolve_node_ids(self, content_ids: Iterable) -> dict[str, str]:
+        """Map content IDs to node IDs, creating nodes for content without one.
+
+        Uncached IDs are resolved with one set-based insert plus one select per
+        chunk, and results are cached for the lifetime of this service.
+
+        Returns:
+            {str(content_id): node_id}; IDs not found in content_unified are omitted
+        """
+        keys = list(dict.fromkeys(str(cid) for cid in content_ids))
+        uncached = [key for key in keys if key not in self._node_cache]
+        if uncached:
+            conn = self.db.get_connection()
+            try:
+                self._resolve_uncached(conn, uncached)
+            finally:
+                conn.close()
+        return {key: self._node_cache[key] for key in keys if key in self._node_cache}
+
+    def _resolve_uncached(self, conn, keys: list[str]) -> None:
+        """
+        Upsert nodes for keys (one transaction per chunk) and cache their IDs.
+        """
+        for start in range(0, len(keys), SQL_CHUNK):
+            chunk = keys[start:start + SQL_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            with conn:
+                conn.execute(
+                    f"""
+                    INSERT INTO kg_nodes (node_id, id, content_type, title)
+                    SELECT {_SQL_UUID4}, CAST(c.id AS TEXT), COALESCE(c.source_type, 'unknown'), c.title
+                    FROM content_unified c
+                    WHERE c.id IN ({placeholders})
+                      AND NOT EXISTS (SELECT 1 FROM kg_nodes n WHERE n.id = CAST(c.id AS TEXT))
+                    """,
+                    chunk,
+                )
+                rows = conn.execute(
+                    f"SELECT id, node_id FROM kg_nodes WHERE id IN ({placeholders}) ORDER BY rowid DESC",
+                    chunk,
+                ).fetchall()
+            # Oldest node wins if legacy duplicates exist
+            self._node_cache.update((str(row["id"]), row["node_id"]) for row in rows)
+
+    def clear_node_cache(self) -> None:
+        """
+        Forget cached node IDs (e.g. after nodes were deleted elsewhere).
+        """
+        self._node_cache.clear()
+
+    def add_edges_bulk(
+        self,
+        edges: Iterable[dict],
+        batch_size: int = EDGE_BATCH_SIZE,
+        on_conflict: str = "ignore",
+    ) -> dict:
+        """Add many edges between content items without per-edge node lookups.
+
+        Edges use the add_edge argument names (source_content_id,
+        target_content_id, relationship_type, strength, metadata) and get
+        deterministic IDs unless an edge_id is given, so re-adding an edge
+        hits the conflict clause instead of duplicating it.
+
+        Args:
+            edges: Edge dicts (any iterable; consumed in batches)
+            batch_size: Edges per executemany/transaction
+            on_conflict: "ignore" keeps existing edges, "update" refreshes strength and metadata
+
+        Returns:
+            Counts (total, written, unresolved) and edges_per_sec; written counts
+            inserts, plus updates when on_conflict="update"
+        """
+        query = f"""
+            INSERT INTO kg_edges
+            (edge_id, source_node_id, target_node_id, relationship_type, strength, edge_metadata)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(edge_id) {_EDGE_CONFLICT_CLAUSES[on_conflict]}
+        """
+        stats = {"total": 0, "written": 0, "unresolved": 0}
+        start_time = time.perf_counter()
+        conn = self.db.get_connection()
+        try:
+            for batch in _batched(edges, batch_size):
+                keys = [str(edge[k]) for edge in batch for k in ("source_content_id", "target_content_id")]
+                self._resolve_uncached(conn, [k for k in dict.fromkeys(keys) if k not in self._node_cache])
+                rows = self._edge_rows(batch)
+                with conn:
+                    cursor = conn.executemany(query, rows)
+                stats["total"] += len(batch)
+                stats["written"] += cursor.rowcount
+                stats["unresolved"] += len(batch) - len(rows)
+        finally:
+            conn.close()
+
+        elapsed = time.perf_counter() - start_time
+        stats["time_seconds"] = round(elapsed, 3)
+        stats["edges_per_sec"] = round(stats["total"] / elapsed, 1) if elapsed > 0 else None
+        logger.info(f"Bulk edge ingestion: {stats}")
+        return stats
+
+    def _edge_rows(self, batch: list[dict]) -> list[tuple]:
+        """
+        kg_edges tuples for edges whose endpoints resolved to nodes.
+        """
+        rows = []
+        for edge in batch:
+            source = self._node_cache.get(str(edge["source_content_id"]))
+            target = self._node_cache.get(str(edge["target_content_id"]))
+            if not source or not target:
+                continue
+            relationship_type = edge["relationship_type"]
+            metadata = edge.get("metadata")
+            rows.append(
+                (
+                    edge.get("edge_id") or stable_edge_id(source, target, relationship_type),
+                    source,
+                    target,
+                    relationship_type,
+                    edge.get("strength", 0.0),
+                    json.dumps(metadata) if metadata else None,
+                )
+            )
+        return rows
+
     # Graph statistics and metadata
     def get_graph_stats(self) -> dict:
         """
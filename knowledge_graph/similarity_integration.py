@@ -55,23 +55,27 @@ class SimilarityIntegration:
             # Compute similarities for this batch
             similarities = self.similarity_analyzer.batch_compute_similarities(batch_ids)
 
-            # Store as knowledge graph edges
-            for source_id, target_id, similarity in similarities:
-                edge_id = self.kg_service.add_edge(
-                    source_id,
-                    target_id,
-                    "similar_to",
-                    similarity,
-                    metadata={
-                        "method": "legal_bert",
-                        "model": "pile-of-law/legalbert-large-1.7M-2",
-                        "threshold": self.similarity_analyzer.similarity_threshold,
-                        "computed_at": time.time(),
-                    },
-                )
-
-                if edge_id:
-                    relationships_created += 1
+            # Store as knowledge graph edges (one bulk write per batch)
+            metadata = {
+                "method": "legal_bert",
+                "model": "pile-of-law/legalbert-large-1.7M-2",
+                "threshold": self.similarity_analyzer.similarity_threshold,
+                "computed_at": time.time(),
+            }
+            stored = self.kg_service.add_edges_bulk(
+                (
+                    {
+                        "source_content_id": source_id,
+                        "target_content_id": target_id,
+                        "relationship_type": "similar_to",
+                        "strength": similarity,
+                        "metadata": metadata,
+                    }
+                    for source_id, target_id, similarity in similarities
+                ),
+                on_conflict="update",
+            )
+            relationships_created += stored["written"]
 
             processed_pairs += len(similarities)
 
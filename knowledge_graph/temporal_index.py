@@ -0,0 +1,195 @@
+"""Persisted, sorted date index for content_unified.
+
+One row per content item holds its primary date as an epoch timestamp.
+New content is indexed incrementally (keyset paging above the highest
+indexed ID), and lookups run against an in-memory sorted array with
+bisect, so window queries cost O(log n + k) instead of a full rescan.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from dateutil import parser as date_parser
+from loguru import logger
+
+from shared.simple_db import SimpleDB
+
+INDEX_BATCH_SIZE = 5000
+
+
+def _parse_date(value: str) -> datetime | None:
+    try:
+        return date_parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def to_timestamp(date: datetime) -> float:
+    """
+    Epoch seconds; naive datetimes are treated as UTC.
+    """
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
+
+class TemporalIndex:
+    """
+    Sorted (timestamp, content_id) index backed by the kg_content_dates table.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/emails.db",
+        parse_date: Callable[[str], datetime | None] | None = None,
+    ):
+        self.db = SimpleDB(db_path)
+        self.parse_date = parse_date or _parse_date
+        self.ids: list[str] = []
+        self.timestamps: list[float] = []
+        self._positions: dict[str, int] | None = None
+        self._loaded = False
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """
+        Create the date index table if it doesn't exist.
+        """
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS kg_content_dates (
+                content_id INTEGER PRIMARY KEY,
+                event_ts REAL NOT NULL,
+                event_date TEXT NOT NULL,
+                source_type TEXT
+            )
+            """
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_kg_content_dates_ts ON kg_content_dates(event_ts)")
+
+    def watermark(self) -> int:
+        """
+        Highest content_unified ID already indexed.
+        """
+        row = self.db.fetch_one("SELECT MAX(content_id) AS max_id FROM kg_content_dates")
+        return (row["max_id"] or 0) if row else 0
+
+    def refresh(self, batch_size: int = INDEX_BATCH_SIZE) -> list[tuple[str, float]]:
+        """Index content added since the last refresh.
+
+        Returns:
+            Newly indexed (content_id, timestamp) pairs
+        """
+        added: list[tuple[str, float]] = []
+        last_id = self.watermark()
+        query = self._date_query()
+        while True:
+            rows = self.db.fetch(query, (last_id, batch_size))
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            entries = self._dated_entries(rows)
+            if entries:
+                self.db.batch_insert(
+                    "kg_content_dates",
+                    ["content_id", "event_ts", "event_date", "source_type"],
+                    entries,
+                    batch_size,
+                )
+                added.extend((str(e[0]), e[1]) for e in entries)
+
+        if added:
+            logger.info(f"Indexed dates for {len(added)} new content items")
+            self._merge(added)
+        return added
+
+    def _date_query(self) -> str:
+        """
+        Keyset-paged date query; email rows prefer emails.datetime_utc when linked.
+        """
+        has_emails = self.db.fetch_one(
+            "SELECT 1 AS present FROM sqlite_master WHERE type = 'table' AND name = 'emails'"
+        )
+        email_date = (
+            "(SELECT e.datetime_utc FROM emails e WHERE c.source_type = 'email' AND e.id = c.source_id)"
+            if has_emails
+            else "NULL"
+        )
+        return f"""
+            SELECT c.id, c.source_type, c.created_at, {email_date} AS email_date
+            FROM content_unified c
+            WHERE c.id > ?
+            ORDER BY c.id
+            LIMIT ?
+        """
+
+    def _dated_entries(self, rows: list[dict]) -> list[tuple]:
+        """
+        (content_id, ts, iso date, source_type) for rows with a parseable date.
+        """
+        entries = []
+        for row in rows:
+            date = None
+            for value in (row.get("email_date"), row.get("created_at")):
+                date = self.parse_date(value) if value else None
+                if date:
+                    break
+            if date:
+                entries.append((row["id"], to_timestamp(date), date.isoformat(), row["source_type"]))
+        return entries
+
+    def load(self) -> None:
+        """
+        Load the sorted index into memory (one ordered scan).
+        """
+        rows = self.db.fetch("SELECT content_id, event_ts FROM kg_content_dates ORDER BY event_ts, content_id")
+        self.ids = [str(row["content_id"]) for row in rows]
+        self.timestamps = [row["event_ts"] for row in rows]
+        self._positions = None
+        self._loaded = True
+
+    def _merge(self, added: list[tuple[str, float]]) -> None:
+        """
+        Merge new entries into the loaded arrays (or load on first use).
+        """
+        if not self._loaded:
+            self.load()
+            return
+        merged = list(zip(self.timestamps, self.ids))
+        merged.extend((ts, cid) for cid, ts in added)
+        # Same order as load(): timestamp, then numeric content ID
+        merged.sort(key=lambda e: (e[0], int(e[1])))
+        self.timestamps = [ts for ts, _ in merged]
+        self.ids = [cid for _, cid in merged]
+        self._positions = None
+
+    def ensure_current(self) -> "TemporalIndex":
+        """
+        Load if needed and pick up new content.
+        """
+        if not self._loaded:
+            self.load()
+        self.refresh()
+        return self
+
+    def position(self, content_id: str) -> int | None:
+        """
+        Index of content in the sorted timeline.
+        """
+        if self._positions is None:
+            self._positions = {cid: i for i, cid in enumerate(self.ids)}
+        return self._positions.get(str(content_id))
+
+    def timestamp_of(self, content_id: str) -> float | None:
+        pos = self.position(content_id)
+        return self.timestamps[pos] if pos is not None else None
+
+    def window(self, start_ts: float, end_ts: float) -> range:
+        """
+        Positions with start_ts <= timestamp <= end_ts.
+        """
+        return range(bisect_left(self.timestamps, start_ts), bisect_right(self.timestamps, end_ts))
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -1,23 +1,35 @@
 """Timeline-Based Relationship Engine for Knowledge Graph.
 
 Extracts temporal data FROM content_unified and creates chronological
-relationships. Follows CLAUDE.md principles: simple patterns, functions
-under 30 lines.
+relationships. Dates live in a persisted sorted index (TemporalIndex), so
+runs only parse new content and window queries use bisect instead of a
+rescan. Follows CLAUDE.md principles: simple patterns, functions under 30
+lines.
 """
 
-import json
 import re
-from datetime import datetime, timedelta
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
 
 from dateutil import parser as date_parser
 from loguru import logger
 
 from shared.simple_db import SimpleDB
 
-from .main import KnowledgeGraphService
+from .main import KnowledgeGraphService, stable_edge_id
+from .temporal_index import TemporalIndex
 
 # Logger is now imported globally from loguru
 
+# kg_metadata key: highest content ID whose temporal edges have been built
+EDGES_WATERMARK_KEY = "temporal_edges_watermark"
+
+EDGE_BATCH_SIZE = 5000
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
 
 class TimelineRelationships:
     """
@@ -27,80 +39,15 @@ class TimelineRelationships:
     def __init__(self, db_path: str = "data/emails.db"):
         self.kg_service = KnowledgeGraphService(db_path)
         self.db = SimpleDB(db_path)
+        self.index = TemporalIndex(db_path, parse_date=self._parse_date_string)
         self.time_window_hours = 24  # Default clustering window
 
     def extract_content_dates(self, content_id: str) -> datetime | None:
         """
-        Extract primary date FROM content_unified based on type.
-        """
-        content = self.db.fetch_one(
-            "SELECT source_type, metadata, created_at FROM content_unified WHERE id = ?",
-            (content_id,),
-        )
-
-        if not content:
-            return None
-
-        # Handle different content types
-        if content["content_type"] == "email":
-            return self._extract_email_date(content_id)
-        elif content["content_type"] == "pdf":
-            return self._extract_pdf_date(content_id, content["metadata"])
-        elif content["content_type"] == "transcript":
-            return self._extract_transcript_date(content_id, content["metadata"])
-        else:
-            # Fallback to created_at
-            return self._parse_date_string(content["created_at"])
-
-    def _extract_email_date(self, content_id: str) -> datetime | None:
-        """
-        Extract date from email record.
-        """
-        email = self.db.fetch_one(
-            "SELECT datetime_utc FROM emails WHERE message_id = ?", (content_id,)
-        )
-
-        if email and email["datetime_utc"]:
-            return self._parse_date_string(email["datetime_utc"])
-        return None
-
-    def _extract_pdf_date(self, content_id: str, metadata_json: str) -> datetime | None:
-        """
-        Extract date from PDF metadata.
-        """
-        if metadata_json:
-            try:
-                metadata = json.loads(metadata_json)
-                # Look for common date fields in PDF metadata
-                for field in ["creation_date", "modified_date", "date", "Date"]:
-                    if field in metadata:
-                        return self._parse_date_string(metadata[field])
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON metadata for PDF {content_id}")
-
-        # Try to extract from documents table
-        doc = self.db.fetch_one(
-            "SELECT processed_time FROM documents WHERE chunk_id = ?", (content_id,)
-        )
-
-        if doc and doc["processed_time"]:
-            return self._parse_date_string(doc["processed_time"])
-        return None
-
-    def _extract_transcript_date(self, content_id: str, metadata_json: str) -> datetime | None:
+        Primary date of content (emails.datetime_utc for linked emails, else created_at).
         """
-        Extract date from transcript metadata.
-        """
-        if metadata_json:
-            try:
-                metadata = json.loads(metadata_json)
-                # Look for recording date or transcription date
-                for field in ["recording_date", "transcription_date", "date"]:
-                    if field in metadata:
-                        return self._parse_date_string(metadata[field])
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON metadata for transcript {content_id}")
-        return None
+        timestamp = self.index.ensure_current().timestamp_of(content_id)
+        return _to_datetime(timestamp) if timestamp is not None else None
 
     def _parse_date_string(self, date_str: str) -> datetime | None:
         """
@@ -144,78 +91,157 @@ class TimelineRelationships:
         logger.debug(f"Could not parse date: {date_str}")
         return None
 
-    def create_temporal_relationships(self, batch_size: int = 100) -> dict:
-        """
-        Create temporal relationships for all content.
+    def create_temporal_relationships(self, batch_size: int = EDGE_BATCH_SIZE, incremental: bool = True) -> dict:
+        """Create temporal relationships for all content.
+
+        With incremental=True only content added since the last run gets new
+        edges (and followed_by edges it now sits between are replaced).
+        Edges have deterministic IDs, so reruns never duplicate them.
+
+        Args:
+            batch_size: Edges per bulk insert
+            incremental: Only process content newer than the edge watermark
         """
         logger.info("Creating temporal relationships for all content")
+        index = self.index.ensure_current()
 
-        # Get all content with dates
-        content_dates = self._get_all_content_dates()
-
-        if len(content_dates) < 2:
+        if len(index) < 2:
             return {"processed": 0, "relationships_created": 0}
 
-        # Sort by date
-        sorted_content = sorted(content_dates, key=lambda x: x[1])
-
-        # Create sequential relationships
-        sequential_created = self._create_sequential_relationships(sorted_content)
+        watermark = int(self.kg_service.get_metadata(EDGES_WATERMARK_KEY) or 0) if incremental else 0
+        new_positions = [i for i, cid in enumerate(index.ids) if int(cid) > watermark]
 
-        # Create concurrent relationships (within time window)
-        concurrent_created = self._create_concurrent_relationships(sorted_content)
+        removed = self._remove_stale_sequential_edges(new_positions) if watermark else 0
+        sequential_created = self._write_edges(self._sequential_edges(new_positions), batch_size)
+        concurrent_created = self._write_edges(self._concurrent_edges(new_positions), batch_size)
+        self.kg_service.set_metadata(EDGES_WATERMARK_KEY, max(int(cid) for cid in index.ids))
 
         result = {
-            "processed": len(content_dates),
+            "processed": len(new_positions),
             "relationships_created": sequential_created + concurrent_created,
             "sequential": sequential_created,
             "concurrent": concurrent_created,
+            "sequential_replaced": removed,
         }
 
         logger.info(f"Temporal relationship creation complete: {result}")
         return result
 
-    def _create_sequential_relationships(self, sorted_content: list[tuple[str, datetime]]) -> int:
+    @staticmethod
+    def _runs(positions: list[int]) -> Iterator[tuple[int, int]]:
+        """
+        Maximal runs of consecutive positions as (first, last).
+        """
+        start = prev = None
+        for pos in positions:
+            if start is None:
+                start = prev = pos
+            elif pos == prev + 1:
+                prev = pos
+            else:
+                yield start, prev
+                start = prev = pos
+        if start is not None:
+            yield start, prev
+
+    def _sequential_edges(self, positions: list[int]) -> Iterator[tuple]:
+        """
+        followed_by edges for adjacent pairs touching the given positions.
+        """
+        index = self.index
+        for first, last in self._runs(positions):
+            for i in range(max(first - 1, 0), min(last + 1, len(index) - 1)):
+                current_date, next_date = _to_datetime(index.timestamps[i]), _to_datetime(index.timestamps[i + 1])
+                yield (
+                    index.ids[i],
+                    index.ids[i + 1],
+                    "followed_by",
+                    self._calculate_temporal_strength(current_date, next_date),
+                    {
+                        "current_date": current_date.isoformat(),
+                        "next_date": next_date.isoformat(),
+                        "time_delta_hours": (next_date - current_date).total_seconds() / 3600,
+                    },
+                )
+
+    def _concurrent_edges(self, positions: list[int]) -> Iterator[tuple]:
         """
-        Create sequential temporal relationships.
+        concurrent_with edges between each given position and its window neighbours.
         """
-        relationships_created = 0
-
-        for i in range(len(sorted_content) - 1):
-            current_id, current_date = sorted_content[i]
-            next_id, next_date = sorted_content[i + 1]
+        index = self.index
+        window = self.time_window_hours * 3600
+        is_new = set(positions)
+        for i in positions:
+            for j in index.window(index.timestamps[i] - window, index.timestamps[i] + window):
+                # A pair of two new items is emitted once, from its earlier member
+                if j == i or (j < i and j in is_new):
+                    continue
+                first, second = min(i, j), max(i, j)
+                yield (
+                    index.ids[first],
+                    index.ids[second],
+                    "concurrent_with",
+                    0.8,
+                    {
+                        "time_window_hours": self.time_window_hours,
+                        "dates": [
+                            _to_datetime(index.timestamps[first]).isoformat(),
+                            _to_datetime(index.timestamps[second]).isoformat(),
+                        ],
+                    },
+                )
 
-            # Create preceded_by/followed_by relationship
-            edge_id = self.kg_service.add_edge(
-                current_id,
-                next_id,
-                "followed_by",
-                strength=self._calculate_temporal_strength(current_date, next_date),
-                metadata={
-                    "current_date": current_date.isoformat(),
-                    "next_date": next_date.isoformat(),
-                    "time_delta_hours": (next_date - current_date).total_seconds() / 3600,
-                },
+    def _remove_stale_sequential_edges(self, positions: list[int]) -> int:
+        """
+        Delete followed_by edges between items that new content now sits between.
+        """
+        index = self.index
+        pairs = [
+            (index.ids[first - 1], index.ids[last + 1])
+            for first, last in self._runs(positions)
+            if first > 0 and last + 1 < len(index)
+        ]
+        if not pairs:
+            return 0
+        node_ids = self.kg_service.resolve_node_ids([cid for pair in pairs for cid in pair])
+        edge_ids = [
+            stable_edge_id(node_ids[src], node_ids[tgt], "followed_by")
+            for src, tgt in pairs
+            if src in node_ids and tgt in node_ids
+        ]
+        removed = 0
+        for start in range(0, len(edge_ids), 500):
+            chunk = edge_ids[start:start + 500]
+            cursor = self.db.execute(
+                f"DELETE FROM kg_edges WHERE edge_id IN ({','.join('?' * len(chunk))})", tuple(chunk)
             )
-
-            if edge_id:
-                relationships_created += 1
-
-        return relationships_created
+            removed += cursor.rowcount
+        return removed
+
+    def _write_edges(self, edges: Iterable[tuple], batch_size: int) -> int:
+        """Bulk-insert (source, target, type, strength, metadata) edges.
+
+        Returns:
+            Number of edges inserted (existing edges are ignored)
+        """
+        edge_dicts = (
+            {
+                "source_content_id": source,
+                "target_content_id": target,
+                "relationship_type": relationship_type,
+                "strength": strength,
+                "metadata": metadata,
+            }
+            for source, target, relationship_type, strength, metadata in edges
+        )
+        return self.kg_service.add_edges_bulk(edge_dicts, batch_size=batch_size)["written"]
 
     def _get_all_content_dates(self) -> list[tuple[str, datetime]]:
         """
-        Get all content IDs with their dates.
+        Get all content IDs with their dates, in timeline order.
         """
-        content_items = self.db.fetch("SELECT id FROM content_unified")
-
-        content_dates = []
-        for item in content_items:
-            date = self.extract_content_dates(item["content_id"])
-            if date:
-                content_dates.append((item["content_id"], date))
-
-        return content_dates
+        index = self.index.ensure_current()
+        return [(cid, _to_datetime(ts)) for cid, ts in zip(index.ids, index.timestamps)]
 
     def _calculate_temporal_strength(self, date1: datetime, date2: datetime) -> float:
         """
@@ -236,71 +262,26 @@ class TimelineRelationships:
         else:
             return 0.1
 
-    def _create_concurrent_relationships(self, sorted_content: list[tuple[str, datetime]]) -> int:
-        """
-        Create relationships for content within time windows.
-        """
-        relationships_created = 0
-
-        for i, (current_id, current_date) in enumerate(sorted_content):
-            concurrent_count = self._process_time_window(
-                sorted_content, i, current_id, current_date
-            )
-            relationships_created += concurrent_count
-
-        return relationships_created
-
-    def _process_time_window(
-        self, sorted_content: list, index: int, current_id: str, current_date: datetime
-    ) -> int:
-        """
-        Process concurrent relationships within a time window.
-        """
-        window_end = current_date + timedelta(hours=self.time_window_hours)
-        relationships_created = 0
-
-        j = index + 1
-        while j < len(sorted_content) and sorted_content[j][1] <= window_end:
-            next_id, next_date = sorted_content[j]
-
-            edge_id = self.kg_service.add_edge(
-                current_id,
-                next_id,
-                "concurrent_with",
-                strength=0.8,
-                metadata={
-                    "time_window_hours": self.time_window_hours,
-                    "dates": [current_date.isoformat(), next_date.isoformat()],
-                },
-            )
-
-            if edge_id:
-                relationships_created += 1
-            j += 1
-
-        return relationships_created
-
     def find_temporal_cluster(self, content_id: str, window_days: int = 7) -> list[dict]:
         """
         Find all content within a time window of given content.
         """
-        # Get date for target content
-        target_date = self.extract_content_dates(content_id)
+        index = self.index.ensure_current()
+        target_ts = index.timestamp_of(content_id)
 
-        if not target_date:
+        if target_ts is None:
             logger.warning(f"No date found for content {content_id}")
             return []
 
-        # Calculate window boundaries
-        window_start = target_date - timedelta(days=window_days)
-        window_end = target_date + timedelta(days=window_days)
-
-        # Get all content with dates in window
-        all_dates = self._get_all_content_dates()
+        # Calculate window boundaries and bisect into the sorted index
+        target_date = _to_datetime(target_ts)
+        window = timedelta(days=window_days).total_seconds()
 
         cluster = []
-        for cid, date in all_dates:
-            if cid != content_id and window_start <= date <= window_end:
+        for pos in index.window(target_ts - window, target_ts + window):
+            cid = index.ids[pos]
+            if cid != str(content_id):
+                date = _to_datetime(index.timestamps[pos])
                 cluster.append(
                     {
                         "content_id": cid,
@@ -332,40 +313,31 @@ class TimelineRelationships:
         """
         Get timeline context around a piece of content.
         """
-        target_date = self.extract_content_dates(content_id)
+        index = self.index.ensure_current()
+        target_idx = index.position(content_id)
 
-        if not target_date:
+        if target_idx is None:
             return {"error": "No date found for content"}
 
-        all_dates = self._get_all_content_dates()
-        sorted_dates = sorted(all_dates, key=lambda x: x[1])
-
-        # Find position of target in timeline
-        target_idx = self._find_timeline_position(sorted_dates, content_id)
-
-        if target_idx is None:
-            return {"error": "Content not found in timeline"}
+        # Only the surrounding slice of the timeline is materialized
+        start = max(0, target_idx - before)
+        sorted_dates = [
+            (index.ids[i], _to_datetime(index.timestamps[i]))
+            for i in range(start, min(len(index), target_idx + after + 1))
+        ]
+        target_date = sorted_dates[target_idx - start][1]
 
         # Get surrounding content
-        before_content = self._get_before_content(sorted_dates, target_idx, target_date, before)
-        after_content = self._get_after_content(sorted_dates, target_idx, target_date, after)
+        before_content = self._get_before_content(sorted_dates, target_idx - start, target_date, before)
+        after_content = self._get_after_content(sorted_dates, target_idx - start, target_date, after)
 
         return {
-            "target": {"content_id": content_id, "date": target_date.isoformat()},
+            "target": {"content_id": str(content_id), "date": target_date.isoformat()},
             "before": before_content,
             "after": after_content,
-            "total_in_timeline": len(sorted_dates),
+            "total_in_timeline": len(index),
         }
 
-    def _find_timeline_position(self, sorted_dates: list, content_id: str) -> int | None:
-        """
-        Find position of content in timeline.
-        """
-        for i, (cid, _) in enumerate(sorted_dates):
-            if cid == content_id:
-                return i
-        return None
-
     def _get_before_content(
         self, sorted_dates: list, target_idx: int, target_date: datetime, count: int
     ) -> list[dict]:
@@ -6,22 +6,42 @@ functions under 30 lines.
 """
 
 import json
+import os
+import tempfile
 from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 import numpy as np
 from loguru import logger
 from scipy.cluster.hierarchy import fcluster, linkage
 from scipy.spatial.distance import pdist
+from sklearn.cluster import MiniBatchKMeans
 
 from entity.main import EntityService
 from shared.simple_db import SimpleDB
 from utilities.embeddings import get_embedding_service
+from utilities.vector_store import point_id_for
 
 from .main import KnowledgeGraphService
 from .similarity_analyzer import SimilarityAnalyzer
 
 # Logger is now imported globally from loguru
 
+# pdist/linkage need O(n^2) memory; above this many documents use mini-batch k-means
+HIERARCHICAL_MAX_DOCS = int(os.getenv("TOPIC_HIERARCHICAL_MAX_DOCS", "2000"))
+
+# Working-memory budget for the scalable mode (embedding matrix + k-means batches)
+DEFAULT_MEMORY_LIMIT_MB = int(os.getenv("TOPIC_CLUSTER_MEMORY_MB", "1024"))
+
+EMBEDDING_FETCH_BATCH = 256
+SQL_CHUNK = 500
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class TopicClusteringService:
     """
@@ -29,19 +49,62 @@ class TopicClusteringService:
     occurrence.
     """
 
-    def __init__(self, db_path: str = "data/emails.db"):
+    def __init__(self, db_path: str = "data/emails.db", vector_store=None):
         self.db = SimpleDB(db_path)
+        self.db_path = db_path
         self.kg_service = KnowledgeGraphService(db_path)
-        self.similarity_analyzer = SimilarityAnalyzer(db_path)
         self.entity_service = EntityService()
-        self.embedding_service = get_embedding_service()
+        self._similarity_analyzer = None
+        self._embedding_service = None
+        self._vector_store = vector_store
+
+    @property
+    def similarity_analyzer(self) -> SimilarityAnalyzer:
+        """Similarity analyzer (loads the embedding model, so created on first use)."""
+        if self._similarity_analyzer is None:
+            self._similarity_analyzer = SimilarityAnalyzer(self.db_path)
+        return self._similarity_analyzer
+
+    @property
+    def embedding_service(self):
+        """Embedding model, loaded only when cached vectors are missing."""
+        if self._embedding_service is None:
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
+
+    @embedding_service.setter
+    def embedding_service(self, service) -> None:
+        self._embedding_service = service
+
+    def _get_vector_store(self):
+        """
+        Vector store holding cached content embeddings (None if unavailable).
+        """
+        if self._vector_store is None:
+            try:
+                from utilities.vector_store import get_vector_store
+
+                self._vector_store = get_vector_store("emails")
+            except Exception as e:
+                logger.warning(f"Vector store unavailable, embeddings will be computed: {e}")
+                self._vector_store = False
+        return self._vector_store or None
 
     def perform_hierarchical_clustering(
         self, content_ids: list[str], distance_threshold: float = 0.5, method: str = "ward"
     ) -> dict:
         """
         Perform hierarchical clustering on content embeddings.
+
+        Large inputs are routed to perform_scalable_clustering.
         """
+        if len(content_ids) > HIERARCHICAL_MAX_DOCS:
+            logger.info(
+                f"{len(content_ids)} documents exceeds hierarchical limit "
+                f"({HIERARCHICAL_MAX_DOCS}), using mini-batch k-means"
+            )
+            return self.perform_scalable_clustering(content_ids)
+
         logger.info(f"Performing hierarchical clustering on {len(content_ids)} documents")
 
         # Get embeddings for all content
@@ -60,9 +123,10 @@ class TopicClusteringService:
 
         # Get cluster assignments
         clusters = fcluster(linkage_matrix, distance_threshold, criterion="distance")
+        similarities = self._centroid_similarities(embedding_matrix, clusters)
 
         # Organize results by cluster
-        cluster_results = self._organize_clusters(content_id_list, clusters)
+        cluster_results = self._organize_clusters(content_id_list, clusters, similarities)
 
         # Store cluster relationships in knowledge graph
         self._store_cluster_relationships(cluster_results)
@@ -74,44 +138,223 @@ class TopicClusteringService:
             "distance_threshold": distance_threshold,
         }
 
-    def _get_content_embeddings(self, content_ids: list[str]) -> dict[str, np.ndarray]:
-        """
-        Get embeddings for content items.
+    def perform_scalable_clustering(
+        self,
+        content_ids: list[str] | None = None,
+        n_clusters: int | None = None,
+        memory_limit_mb: int | None = None,
+        epochs: int = 3,
+        label_clusters: bool = False,
+        seed: int = 0,
+    ) -> dict:
+        """Mini-batch k-means over cached embeddings with bounded memory.
+
+        Embeddings come from the vector store (only missing ones are encoded)
+        and are L2-normalized, so k-means approximates cosine clustering. The
+        matrix is spilled to a temporary memmap when it would take more than
+        half the memory budget, and k-means only ever sees one batch at a time.
+
+        Args:
+            content_ids: Content to cluster (all content_unified rows if omitted)
+            n_clusters: Number of clusters (default sqrt(n / 2))
+            memory_limit_mb: Working-memory cap (env TOPIC_CLUSTER_MEMORY_MB)
+            epochs: Shuffled passes of partial_fit over the data
+            label_clusters: Generate entity labels (costs entity extraction per
+                cluster); otherwise clusters are labeled "Cluster <id>"
+            seed: Random seed for shuffling and centroid init
+
+        Returns:
+            Same shape as perform_hierarchical_clustering, plus edge counts
         """
-        embeddings = {}
+        if content_ids is None:
+            content_ids = [row["id"] for row in self.db.fetch("SELECT id FROM content_unified ORDER BY id")]
+        limit_bytes = (memory_limit_mb or DEFAULT_MEMORY_LIMIT_MB) * 1024 * 1024
+        logger.info(f"Scalable clustering of {len(content_ids)} documents ({limit_bytes >> 20}MB cap)")
+
+        with self._embedding_matrix(content_ids, limit_bytes) as (found_ids, matrix):
+            if len(found_ids) < 2:
+                return {"error": "Need at least 2 documents for clustering"}
+            k = min(n_clusters or max(2, int(np.sqrt(len(found_ids) / 2))), len(found_ids))
+            batch_rows = self._batch_rows(matrix.shape[1], k, limit_bytes)
+            model = self._fit_minibatch_kmeans(matrix, k, batch_rows, epochs, seed)
+            labels, similarities = self._assign_to_centroids(matrix, model.cluster_centers_, batch_rows)
+
+        cluster_results = self._organize_clusters(found_ids, labels, similarities, label_clusters)
+        stored = self._store_cluster_relationships(cluster_results)
 
-        for content_id in content_ids:
-            # Get content and generate embedding
-            content = self.db.fetch_one(
-                "SELECT * FROM content_unified WHERE id = ?", (content_id,)
-            )
+        return {
+            "num_clusters": len(cluster_results),
+            "clusters": cluster_results,
+            "method": "minibatch_kmeans",
+            "documents": len(found_ids),
+            "edges": stored["written"],
+        }
+
+    @staticmethod
+    def _batch_rows(dims: int, k: int, limit_bytes: int) -> int:
+        """Rows per k-means batch: a few float32 copies of (rows x (dims + k)) under a quarter of the cap."""
+        rows = (limit_bytes // 4) // (4 * 4 * (dims + k))
+        return int(max(k, min(rows, 8192)))
 
-            if content:
-                text = f"{content['title'] or ''} {content['body'] or ''}"[:5000]
-                embedding = self.embedding_service.encode(text)
-                embeddings[content_id] = embedding
+    @staticmethod
+    def _fit_minibatch_kmeans(
+        matrix: np.ndarray, k: int, batch_rows: int, epochs: int, seed: int
+    ) -> MiniBatchKMeans:
+        """
+        Fit k-means with partial_fit over shuffled batches.
+        """
+        model = MiniBatchKMeans(n_clusters=k, batch_size=batch_rows, random_state=seed, n_init=1)
+        rng = np.random.default_rng(seed)
+        n = matrix.shape[0]
+        for _ in range(max(1, epochs)):
+            order = rng.permutation(n)
+            for start in range(0, n, batch_rows):
+                # Sorted indices keep memmap reads sequential
+                rows = np.sort(order[start:start + batch_rows])
+                model.partial_fit(np.asarray(matrix[rows]))
+        return model
+
+    @staticmethod
+    def _assign_to_centroids(
+        matrix: np.ndarray, centers: np.ndarray, batch_rows: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Nearest centroid and cosine similarity to it, computed in blocks.
+        """
+        norms = np.linalg.norm(centers, axis=1, keepdims=True)
+        unit_centers = (centers / np.maximum(norms, 1e-12)).astype(np.float32)
+        labels = np.empty(matrix.shape[0], dtype=np.int32)
+        similarities = np.empty(matrix.shape[0], dtype=np.float32)
+        for start in range(0, matrix.shape[0], batch_rows):
+            scores = np.asarray(matrix[start:start + batch_rows]) @ unit_centers.T
+            labels[start:start + len(scores)] = scores.argmax(axis=1)
+            similarities[start:start + len(scores)] = scores.max(axis=1)
+        return labels, similarities
+
+    @staticmethod
+    def _centroid_similarities(matrix: np.ndarray, clusters: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of each row to its cluster's centroid.
+        """
+        unit = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+        similarities = np.empty(len(unit), dtype=np.float32)
+        for cluster_id in np.unique(clusters):
+            rows = clusters == cluster_id
+            centroid = unit[rows].mean(axis=0)
+            centroid /= max(np.linalg.norm(centroid), 1e-12)
+            similarities[rows] = unit[rows] @ centroid
+        return similarities
+
+    @contextmanager
+    def _embedding_matrix(self, content_ids: list[str], limit_bytes: int):
+        """
+        Yield (ids, normalized float32 matrix), spilled to a memmap when large.
+        """
+        found_ids: list[str] = []
+        matrix = None
+        tmp_path = None
+        try:
+            for ids, block in self._iter_embedding_blocks(content_ids):
+                if matrix is None:
+                    shape = (len(content_ids), block.shape[1])
+                    if shape[0] * shape[1] * 4 > limit_bytes // 2:
+                        fd, tmp_path = tempfile.mkstemp(suffix=".f32")
+                        os.close(fd)
+                        matrix = np.memmap(tmp_path, dtype=np.float32, mode="w+", shape=shape)
+                    else:
+                        matrix = np.empty(shape, dtype=np.float32)
+                norms = np.maximum(np.linalg.norm(block, axis=1, keepdims=True), 1e-12)
+                matrix[len(found_ids):len(found_ids) + len(ids)] = block / norms
+                found_ids.extend(ids)
+            yield found_ids, (matrix[: len(found_ids)] if matrix is not None else np.empty((0, 0)))
+        finally:
+            del matrix
+            if tmp_path:
+                os.unlink(tmp_path)
+
+    def _iter_embedding_blocks(
+        self, content_ids: list[str], batch_size: int = EMBEDDING_FETCH_BATCH
+    ) -> Iterator[tuple[list[str], np.ndarray]]:
+        """
+        Yield (ids, float32 embeddings) per batch: cached vectors first, encode the rest.
+        """
+        vector_store = self._get_vector_store()
+        for batch in _chunks(list(content_ids), batch_size):
+            vectors: dict[str, np.ndarray] = {}
+            if vector_store is not None:
+                point_ids = {str(point_id_for(cid)): cid for cid in batch}
+                for point in vector_store.get_many(list(point_ids), with_payload=False):
+                    if point["vector"] is not None:
+                        vectors[point_ids[str(point["id"])]] = np.asarray(point["vector"], dtype=np.float32)
+
+            missing = [cid for cid in batch if cid not in vectors]
+            if missing:
+                vectors.update(self._encode_content(missing))
+
+            ids = [cid for cid in batch if cid in vectors]
+            if ids:
+                yield ids, np.vstack([vectors[cid] for cid in ids])
+
+    def _encode_content(self, content_ids: list[str]) -> dict[str, np.ndarray]:
+        """
+        Encode content that has no cached vector (one query, one batch_encode).
+        """
+        placeholders = ",".join("?" * len(content_ids))
+        rows = self.db.fetch(
+            f"SELECT id, title, body FROM content_unified WHERE id IN ({placeholders})",
+            tuple(content_ids),
+        )
+        by_id = {str(row["id"]): row for row in rows}
+        present = [cid for cid in content_ids if str(cid) in by_id]
+        if not present:
+            return {}
+        texts = [
+            f"{by_id[str(cid)]['title'] or ''} {by_id[str(cid)]['body'] or ''}"[:5000] for cid in present
+        ]
+        embeddings = self.embedding_service.batch_encode(texts)
+        return {cid: np.asarray(emb, dtype=np.float32) for cid, emb in zip(present, embeddings)}
 
+    def _get_content_embeddings(self, content_ids: list[str]) -> dict[str, np.ndarray]:
+        """
+        Get embeddings for content items (cached vectors where available).
+        """
+        embeddings = {}
+        for ids, block in self._iter_embedding_blocks(content_ids):
+            embeddings.update(zip(ids, block))
         return embeddings
 
     def _organize_clusters(
-        self, content_ids: list[str], cluster_assignments: np.ndarray
+        self,
+        content_ids: list[str],
+        cluster_assignments: np.ndarray,
+        similarities: np.ndarray | None = None,
+        label_clusters: bool = True,
     ) -> dict[int, dict]:
         """
         Organize clustering results by cluster ID.
+
+        With similarities (to the cluster centroid) members are ordered most
+        central first and the first member is the cluster hub.
         """
         clusters = defaultdict(list)
 
-        for content_id, cluster_id in zip(content_ids, cluster_assignments):
-            clusters[int(cluster_id)].append(content_id)
+        for index, (content_id, cluster_id) in enumerate(zip(content_ids, cluster_assignments)):
+            clusters[int(cluster_id)].append((content_id, index))
 
         # Convert to structured format with labels
         result = {}
-        for cluster_id, members in clusters.items():
+        for cluster_id, entries in clusters.items():
+            if similarities is not None:
+                entries.sort(key=lambda entry: -similarities[entry[1]])
+            members = [content_id for content_id, _ in entries]
             result[cluster_id] = {
                 "members": members,
                 "size": len(members),
-                "label": self._generate_cluster_label(members),
+                "hub": members[0],
+                "label": self._generate_cluster_label(members) if label_clusters else f"Cluster {cluster_id}",
             }
+            if similarities is not None:
+                result[cluster_id]["similarities"] = [round(float(similarities[i]), 4) for _, i in entries]
 
         return result
 
@@ -145,28 +388,58 @@ class TopicClusteringService:
 
         return f"Cluster {len(content_ids)} documents"
 
-    def _store_cluster_relationships(self, clusters: dict[int, dict]) -> None:
-        """
-        Store cluster memberships as edges in knowledge graph.
+    def _store_cluster_relationships(self, clusters: dict[int, dict]) -> dict:
+        """Store cluster memberships as star edges in the knowledge graph.
+
+        Each member links to its cluster hub (k - 1 edges per cluster rather
+        than k^2 / 2), with strength set to its centroid similarity when known.
+        Existing same_cluster edges from these members are replaced, and all
+        edges are written with the bulk edge path.
         """
+        members = [m for info in clusters.values() if info["size"] > 1 for m in info["members"]]
+        node_ids = self.kg_service.resolve_node_ids(members)
+        self._clear_cluster_edges(list(node_ids.values()))
+
+        edges = []
         for cluster_id, cluster_info in clusters.items():
-            members = cluster_info["members"]
-
-            # Create edges between cluster members
-            for i, member1 in enumerate(members):
-                for member2 in members[i + 1 :]:
-                    self.kg_service.add_edge(
-                        member1,
-                        member2,
-                        "same_cluster",
-                        strength=0.7,
-                        metadata={
-                            "cluster_id": cluster_id,
-                            "cluster_label": cluster_info["label"],
-                            "cluster_size": cluster_info["size"],
-                        },
+            hub = str(cluster_info.get("hub", cluster_info["members"][0]))
+            strengths = cluster_info.get("similarities") or [0.7] * cluster_info["size"]
+            metadata = {
+                "cluster_id": cluster_id,
+                "cluster_label": cluster_info["label"],
+                "cluster_size": cluster_info["size"],
+                "topology": "star",
+            }
+            for member, strength in zip(cluster_info["members"], strengths):
+                if str(member) != hub and str(member) in node_ids and hub in node_ids:
+                    edges.append(
+                        {
+                            "source_content_id": member,
+                            "target_content_id": hub,
+                            "relationship_type": "same_cluster",
+                            "strength": float(strength),
+                            "metadata": metadata,
+                        }
                     )
 
+        result = self.kg_service.add_edges_bulk(edges, on_conflict="update")
+        logger.info(f"Stored {len(edges)} cluster edges for {len(clusters)} clusters")
+        return result
+
+    def _clear_cluster_edges(self, node_ids: list[str]) -> None:
+        """
+        Remove same_cluster edges originating from these nodes.
+        """
+        for chunk in _chunks(node_ids, SQL_CHUNK):
+            placeholders = ",".join("?" * len(chunk))
+            self.db.execute(
+                f"""
+                DELETE FROM kg_edges
+                WHERE relationship_type = 'same_cluster' AND source_node_id IN ({placeholders})
+                """,
+                tuple(chunk),
+            )
+
     def calculate_entity_cooccurrence(
         self, content_type: str = None, min_cooccurrence: int = 2
     ) -> dict:
@@ -309,7 +582,7 @@ class TopicClusteringService:
         # If too many new items, trigger full recalculation
         if len(new_content_ids) > recalculate_threshold:
             all_content = self.db.fetch("SELECT id FROM content_unified")
-            all_ids = [item["content_id"] for item in all_content]
+            all_ids = [item["id"] for item in all_content]
             return self.perform_hierarchical_clustering(all_ids)
 
         # Otherwise, find best cluster for each new item
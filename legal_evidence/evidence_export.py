@@ -0,0 +1,296 @@
+"""Streaming Evidence Exporter - Writes evidence packages with bounded memory.
+
+Emails are paged from the database by ID and appended to ``emails.jsonl``;
+attachment files are copied in fixed-size chunks. Every record is hashed as
+it is written and listed in ``manifest.jsonl``. After each batch the file
+offsets and last email ID are checkpointed, so an interrupted export resumes
+from the last checkpoint instead of starting over. Rerunning a finished export
+appends emails added since; any other change to the emails starts a new package.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .evidence_tracker import get_evidence_tracker
+from .term_index import EmailTermIndex
+
+EXPORT_BATCH_SIZE = 500
+COPY_CHUNK_BYTES = 1024 * 1024
+
+EMAILS_FILE = "emails.jsonl"
+MANIFEST_FILE = "manifest.jsonl"
+STATE_FILE = "export_state.json"
+
+EMAIL_COLUMNS = "id, eid, message_id, thread_id, subject, sender, recipient_to, datetime_utc, content"
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', name).strip('._') or "file"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(COPY_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_with_hash(source: Path, target: Path) -> tuple[str, int]:
+    """Copy a file chunk by chunk, hashing as it goes."""
+    digest = hashlib.sha256()
+    size = 0
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        for chunk in iter(lambda: src.read(COPY_CHUNK_BYTES), b''):
+            digest.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+class StreamingEvidenceExporter:
+    """Export selected emails and their attachments as a resumable JSONL package."""
+
+    def __init__(self, db_path: str = "data/emails.db"):
+        """Initialize with database connection (EID/thread columns ensured by the tracker)."""
+        self.db = get_evidence_tracker(db_path).db
+        self.term_index = EmailTermIndex(self.db)
+
+    def _selection(
+        self, thread_ids: list[str] | None, keywords: list[str] | None
+    ) -> tuple[str, tuple]:
+        """WHERE clause for the emails in the package (all emails if no filter)."""
+        if thread_ids:
+            return f"thread_id IN ({','.join('?' * len(thread_ids))})", tuple(thread_ids)
+        if keywords:
+            self.term_index.ensure_current()
+            clauses, params = [], []
+            for keyword in keywords:
+                clause, clause_params = self.term_index.match_clause(keyword)
+                clauses.append(clause)
+                params.extend(clause_params)
+            return "(" + " OR ".join(clauses) + ")", tuple(params)
+        return "1=1", ()
+
+    def _has_attachments_table(self) -> bool:
+        return self.db.fetch_one(
+            "SELECT 1 AS present FROM sqlite_master WHERE type = 'table' AND name = 'email_attachments'"
+        ) is not None
+
+    def _load_state(self, package_dir: Path, selection: dict, corpus: list) -> dict:
+        """Checkpoint to resume from, or a fresh state if the selection or emails changed."""
+        state_path = package_dir / STATE_FILE
+        if state_path.exists():
+            try:
+                state = json.loads(state_path.read_text())
+                if state.get('selection') != selection:
+                    logger.info("Existing export has a different selection, starting over")
+                elif not self._only_appended(state.get('corpus'), corpus):
+                    logger.info("Emails changed since the export was written, starting over")
+                else:
+                    return state
+            except json.JSONDecodeError:
+                logger.warning(f"Unreadable export state in {package_dir}, starting over")
+        return self._new_state(selection, corpus)
+
+    def _only_appended(self, old: list | None, new: list) -> bool:
+        """True if the only change between two corpus versions is emails added at higher IDs.
+
+        Those are picked up by continuing after last_email_id; any other change
+        (edits, deletions, EID/thread reassignment) needs a fresh export.
+        """
+        if old is None:
+            return False
+        if old == new:
+            return True
+        old_generation, old_total, old_max_id = old
+        generation, total, _ = new
+        if generation != old_generation:
+            return False
+        added = self.db.fetch_one(
+            "SELECT COUNT(*) AS n FROM emails WHERE id > ?", (old_max_id or 0,)
+        )['n']
+        return total - old_total == added
+
+    @staticmethod
+    def _new_state(selection: dict, corpus: list) -> dict:
+        return {
+            'selection': selection,
+            'corpus': corpus,
+            'last_email_id': 0,
+            'emails': 0,
+            'attachments': 0,
+            'attachment_bytes': 0,
+            'offsets': {EMAILS_FILE: 0, MANIFEST_FILE: 0},
+            'complete': False,
+        }
+
+    def _save_state(self, package_dir: Path, state: dict) -> None:
+        """Write the checkpoint atomically."""
+        tmp = package_dir / f"{STATE_FILE}.tmp"
+        tmp.write_text(json.dumps(state, indent=2))
+        os.replace(tmp, package_dir / STATE_FILE)
+
+    def export(
+        self,
+        output_dir: str,
+        thread_ids: list[str] | None = None,
+        keywords: list[str] | None = None,
+        resume: bool = True,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> dict[str, Any]:
+        """Stream selected emails and attachments into output_dir.
+
+        Args:
+            output_dir: Package directory (created if missing)
+            thread_ids: Export only these threads
+            keywords: Otherwise export emails mentioning any keyword
+            resume: Continue an interrupted export of the same selection, or
+                extend a finished one with emails added since
+            batch_size: Emails per read and checkpoint
+
+        Returns:
+            Counts, byte totals and per-file SHA-256 of the finished package
+        """
+        package_dir = Path(output_dir)
+        package_dir.mkdir(parents=True, exist_ok=True)
+        selection = {'thread_ids': thread_ids or None, 'keywords': keywords or None}
+        corpus = list(self.term_index.corpus_version())
+        if resume:
+            state = self._load_state(package_dir, selection, corpus)
+        else:
+            state = self._new_state(selection, corpus)
+        if state['complete'] and state['corpus'] == corpus:
+            logger.info(f"Evidence export in {package_dir} already complete")
+            return self._summary(package_dir, state, resumed=True)
+        # New emails since the last run are appended after last_email_id
+        state['complete'] = False
+        state['corpus'] = corpus
+        resumed = state['last_email_id'] > 0
+        if not resumed:
+            shutil.rmtree(package_dir / "attachments", ignore_errors=True)
+
+        # Drop anything written after the last checkpoint
+        for name, offset in state['offsets'].items():
+            with open(package_dir / name, 'ab') as f:
+                f.truncate(offset)
+
+        where, params = self._selection(thread_ids, keywords)
+        with_attachments = self._has_attachments_table()
+        query = f"""
+            SELECT {EMAIL_COLUMNS} FROM emails
+            WHERE id > ? AND {where}
+            ORDER BY id
+            LIMIT ?
+        """
+
+        with open(package_dir / EMAILS_FILE, 'ab') as emails_out, \
+                open(package_dir / MANIFEST_FILE, 'ab') as manifest_out:
+            while True:
+                rows = self.db.fetch(query, (state['last_email_id'], *params, batch_size))
+                if not rows:
+                    break
+                attachments = self._attachments_for(rows) if with_attachments else {}
+
+                for row in rows:
+                    email_id = row.pop('id')
+                    offset = emails_out.tell()
+                    line = json.dumps(row, ensure_ascii=False, default=str).encode() + b"\n"
+                    emails_out.write(line)
+                    entries = [{
+                        'type': 'email',
+                        'eid': row['eid'],
+                        'message_id': row['message_id'],
+                        'path': EMAILS_FILE,
+                        'offset': offset,
+                        'bytes': len(line),
+                        'sha256': hashlib.sha256(line).hexdigest(),
+                    }]
+                    for attachment in attachments.get(row['message_id'], []):
+                        entries.append(self._export_attachment(package_dir, row, attachment))
+                    for entry in entries:
+                        manifest_out.write(json.dumps(entry).encode() + b"\n")
+                        if entry['type'] == 'attachment' and 'sha256' in entry:
+                            state['attachments'] += 1
+                            state['attachment_bytes'] += entry['bytes']
+                    state['emails'] += 1
+                    state['last_email_id'] = email_id
+
+                emails_out.flush()
+                manifest_out.flush()
+                os.fsync(emails_out.fileno())
+                os.fsync(manifest_out.fileno())
+                state['offsets'] = {EMAILS_FILE: emails_out.tell(), MANIFEST_FILE: manifest_out.tell()}
+                self._save_state(package_dir, state)
+
+        state['complete'] = True
+        state['sha256'] = {
+            name: _file_sha256(package_dir / name) for name in (EMAILS_FILE, MANIFEST_FILE)
+        }
+        self._save_state(package_dir, state)
+        logger.info(
+            f"Exported {state['emails']} emails and {state['attachments']} attachments to {package_dir}"
+        )
+        return self._summary(package_dir, state, resumed=resumed)
+
+    def _attachments_for(self, rows: list[dict]) -> dict[str, list[dict]]:
+        """Attachment rows for a batch of emails, grouped by message_id."""
+        message_ids = [row['message_id'] for row in rows]
+        grouped: dict[str, list[dict]] = {}
+        for attachment in self.db.fetch(
+            f"""
+            SELECT id, message_id, filename, mime_type, size_bytes, stored_path
+            FROM email_attachments
+            WHERE message_id IN ({','.join('?' * len(message_ids))})
+            ORDER BY id
+            """,
+            tuple(message_ids),
+        ):
+            grouped.setdefault(attachment['message_id'], []).append(attachment)
+        return grouped
+
+    def _export_attachment(self, package_dir: Path, email: dict, attachment: dict) -> dict:
+        """Copy one attachment into the package and describe it for the manifest."""
+        entry = {
+            'type': 'attachment',
+            'eid': email['eid'],
+            'message_id': email['message_id'],
+            'filename': attachment['filename'],
+            'mime_type': attachment['mime_type'],
+        }
+        source = Path(attachment['stored_path']) if attachment['stored_path'] else None
+        if not source or not source.is_file():
+            entry['missing'] = True
+            return entry
+
+        folder = _safe_name(email['eid'] or email['message_id'])
+        filename = f"{attachment['id']}_{_safe_name(attachment['filename'] or source.name)}"
+        relative = Path("attachments") / folder / filename
+        entry['sha256'], entry['bytes'] = _copy_with_hash(source, package_dir / relative)
+        entry['path'] = relative.as_posix()
+        return entry
+
+    def _summary(self, package_dir: Path, state: dict, resumed: bool) -> dict[str, Any]:
+        return {
+            "success": True,
+            "output_dir": str(package_dir),
+            "emails": state['emails'],
+            "attachments": state['attachments'],
+            "attachment_bytes": state['attachment_bytes'],
+            "resumed": resumed,
+            "sha256": state.get('sha256', {}),
+        }
+
+
+# Simple factory function
+def get_evidence_exporter(db_path: str = "data/emails.db") -> StreamingEvidenceExporter:
+    """Get streaming evidence exporter instance."""
+    return StreamingEvidenceExporter(db_path)
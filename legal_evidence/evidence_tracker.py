@@ -15,6 +15,19 @@ from loguru import logger
 
 from shared.simple_db import SimpleDB
 
+# Rows per UPDATE transaction when assigning EIDs and thread IDs
+UPDATE_BATCH_SIZE = 1000
+
+
+def _eid_year(datetime_utc: str | None) -> str:
+    return datetime_utc[:4] if datetime_utc else str(datetime.now().year)
+
+
+def _thread_key(subject: str | None) -> str:
+    """Normalize subject by removing Re:, Fwd:, etc."""
+    normalized = re.sub(r'^(Re:|Fwd:|Fw:)\s*', '', subject or "", flags=re.IGNORECASE).strip()
+    return re.sub(r'\s+', ' ', normalized).lower()
+
 
 class EvidenceTracker:
     """Track emails with legal Evidence IDs (EIDs) for court references."""
@@ -29,12 +42,20 @@ class EvidenceTracker:
         # Add EID and thread_id columns if they don't exist
         try:
             self.db.execute("""
-                ALTER TABLE emails ADD COLUMN eid TEXT UNIQUE
+                ALTER TABLE emails ADD COLUMN eid TEXT
             """)
             logger.info("Added eid column to emails table")
         except sqlite3.OperationalError:
             pass  # Column already exists
             
+        # SQLite can't ADD COLUMN ... UNIQUE, so uniqueness comes from an index
+        try:
+            self.db.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_emails_eid ON emails(eid)
+            """)
+        except sqlite3.OperationalError:
+            pass  # No emails table or duplicate EIDs already present
+            
         try:
             self.db.execute("""
                 ALTER TABLE emails ADD COLUMN thread_id TEXT
@@ -56,103 +77,114 @@ class EvidenceTracker:
         
         Format: EID-YYYY-NNNN where NNNN is a unique number for that year.
         """
-        # Extract year from datetime
-        year = datetime_utc[:4] if datetime_utc else str(datetime.now().year)
-        
-        # Get the highest EID number for this year
-        cursor = self.db.execute("""
-            SELECT eid FROM emails 
-            WHERE eid LIKE ? 
-            ORDER BY eid DESC LIMIT 1
-        """, (f"EID-{year}-%",))
-        
-        last_eid = cursor.fetchone()
-        
-        if last_eid and last_eid[0]:
-            # Extract number and increment
-            match = re.match(r'EID-\d{4}-(\d{4})', last_eid[0])
-            if match:
-                next_num = int(match.group(1)) + 1
-            else:
-                next_num = 1
-        else:
-            next_num = 1
-            
-        return f"EID-{year}-{next_num:04d}"
+        year = _eid_year(datetime_utc)
+        last = self._last_eid_numbers(year).get(year, 0)
+        return f"EID-{year}-{last + 1:04d}"
+
+    def _last_eid_numbers(self, year: str | None = None) -> dict[str, int]:
+        """Highest assigned EID sequence number per year (one grouped query)."""
+        query = """
+            SELECT substr(eid, 5, 4) AS year, MAX(CAST(substr(eid, 10) AS INTEGER)) AS last
+            FROM emails
+            WHERE eid LIKE 'EID-____-%'
+        """
+        params: tuple = ()
+        if year:
+            query += " AND eid LIKE ?"
+            params = (f"EID-{year}-%",)
+        rows = self.db.fetch(query + " GROUP BY year", params)
+        return {row['year']: row['last'] or 0 for row in rows}
+
+    def _apply_updates(self, query: str, rows: list[tuple], batch_size: int) -> int:
+        """Run an UPDATE over rows with executemany, one transaction per batch."""
+        updated = 0
+        conn = self.db.get_connection()
+        try:
+            for i in range(0, len(rows), batch_size):
+                with conn:
+                    cursor = conn.executemany(query, rows[i:i + batch_size])
+                updated += cursor.rowcount
+        finally:
+            conn.close()
+        return updated
     
-    def assign_eids(self, limit: int | None = None) -> dict[str, Any]:
-        """Assign EIDs to all emails that don't have them yet."""
-        # Get emails without EIDs
+    def assign_eids(self, limit: int | None = None, batch_size: int = UPDATE_BATCH_SIZE) -> dict[str, Any]:
+        """Assign EIDs to all emails that don't have them yet.
+        
+        Per-year counters are seeded once from the highest existing EID and
+        advanced in memory in (datetime_utc, id) order. Only rows that still
+        have no EID are updated, so reruns pick up where the last one stopped.
+        """
+        total_without_eid = self.db.fetch_one(
+            "SELECT COUNT(*) AS n FROM emails WHERE eid IS NULL"
+        )['n']
         query = """
-            SELECT id, message_id, datetime_utc, thread_id 
+            SELECT id, datetime_utc
             FROM emails 
             WHERE eid IS NULL
             ORDER BY datetime_utc, id
         """
-        
+        params: tuple = ()
         if limit:
-            query += f" LIMIT {limit}"
-            
-        cursor = self.db.execute(query)
-        emails = cursor.fetchall()
+            query += " LIMIT ?"
+            params = (limit,)
+        emails = self.db.fetch(query, params)
         
-        assigned = 0
+        counters = self._last_eid_numbers()
+        updates = []
         for email in emails:
-            eid = self.generate_eid(email['message_id'], email['datetime_utc'])
-            
-            self.db.execute("""
-                UPDATE emails SET eid = ? WHERE id = ?
-            """, (eid, email['id']))
-            
-            assigned += 1
-            
+            year = _eid_year(email['datetime_utc'])
+            counters[year] = counters.get(year, 0) + 1
+            updates.append((f"EID-{year}-{counters[year]:04d}", email['id']))
+        
+        assigned = self._apply_updates(
+            "UPDATE emails SET eid = ? WHERE id = ? AND eid IS NULL", updates, batch_size
+        )
+        if assigned:
+            self.db.bump_content_generation()
         logger.info(f"Assigned {assigned} new EIDs")
         
         return {
             "success": True,
             "assigned": assigned,
-            "total_without_eid": len(emails)
+            "total_without_eid": total_without_eid
         }
     
-    def assign_thread_ids(self) -> dict[str, Any]:
-        """Group emails by thread based on subject similarity."""
-        # Get all emails
-        cursor = self.db.execute("""
-            SELECT id, subject, datetime_utc, sender
+    def assign_thread_ids(self, batch_size: int = UPDATE_BATCH_SIZE) -> dict[str, Any]:
+        """Group emails by thread based on subject similarity.
+        
+        Thread numbers follow first appearance in (datetime_utc, id) order, so
+        a rerun reproduces the same IDs and only rewrites rows that changed.
+        """
+        emails = self.db.fetch("""
+            SELECT id, subject, thread_id
             FROM emails 
-            ORDER BY datetime_utc
+            ORDER BY datetime_utc, id
         """)
         
-        emails = cursor.fetchall()
-        
-        # Simple thread detection: normalize subject
-        threads = {}
-        thread_count = 0
-        
+        threads: dict[str, str] = {}
+        updates = []
         for email in emails:
-            # Normalize subject by removing Re:, Fwd:, etc.
-            subject = email['subject'] or ""
-            normalized = re.sub(r'^(Re:|Fwd:|Fw:)\s*', '', subject, flags=re.IGNORECASE).strip()
-            normalized = re.sub(r'\s+', ' ', normalized).lower()
-            
-            # Create thread key from normalized subject + participants
-            thread_key = f"{normalized}"
-            
+            thread_key = _thread_key(email['subject'])
             if thread_key not in threads:
-                thread_count += 1
-                threads[thread_key] = f"THREAD-{thread_count:04d}"
-                
-            # Update email with thread ID
-            self.db.execute("""
-                UPDATE emails SET thread_id = ? WHERE id = ?
-            """, (threads[thread_key], email['id']))
-            
-        logger.info(f"Assigned {thread_count} thread IDs to {len(emails)} emails")
+                threads[thread_key] = f"THREAD-{len(threads) + 1:04d}"
+            if email['thread_id'] != threads[thread_key]:
+                updates.append((threads[thread_key], email['id']))
+        
+        updated = self._apply_updates(
+            "UPDATE emails SET thread_id = ? WHERE id = ?", updates, batch_size
+        )
+        if updated:
+            self.db.bump_content_generation()
+        logger.info(
+            f"Assigned {len(threads)} thread IDs to {len(emails)} emails ({updated} updated)"
+        )
         
         return {
             "success": True,
-            "threads_created": thread_count,
-            "emails_processed": len(emails)
+            "threads_created": len(threads),
+            "emails_processed": len(emails),
+            "emails_updated": updated
         }
     
     def get_email_evidence(self, eid: str) -> dict[str, Any] | None:
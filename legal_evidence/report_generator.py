@@ -6,11 +6,13 @@ Generates both lookup mode (structured references) and report mode (narrative).
 import os
 import re
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
 from loguru import logger
 
+from .evidence_export import EMAILS_FILE, MANIFEST_FILE, StreamingEvidenceExporter
 from .evidence_tracker import get_evidence_tracker
 from .thread_analyzer import get_thread_analyzer
 
@@ -30,18 +32,23 @@ class LegalReportGenerator:
         
         This is for quick evidence retrieval during legal proceedings.
         """
-        report = []
-        report.append("# Legal Evidence Lookup Report")
-        report.append(f"Generated: {datetime.now().isoformat()}")
-        report.append("")
+        return "\n".join(self._lookup_report_lines(thread_ids, keywords))
+    
+    def _lookup_report_lines(self,
+                             thread_ids: list[str] | None = None,
+                             keywords: list[str] | None = None) -> Iterator[str]:
+        """Yield the lookup report one line at a time, one thread in memory at once."""
+        yield "# Legal Evidence Lookup Report"
+        yield f"Generated: {datetime.now().isoformat()}"
+        yield ""
         
         # Get evidence summary
         summary = self.evidence.get_evidence_summary()
-        report.append("## Evidence Summary")
-        report.append(f"- Total Emails with EID: {summary['emails_with_eid']}")
-        report.append(f"- Total Threads: {summary['total_threads']}")
-        report.append(f"- Date Range: {summary['date_range']['earliest']} to {summary['date_range']['latest']}")
-        report.append("")
+        yield "## Evidence Summary"
+        yield f"- Total Emails with EID: {summary['emails_with_eid']}"
+        yield f"- Total Threads: {summary['total_threads']}"
+        yield f"- Date Range: {summary['date_range']['earliest']} to {summary['date_range']['latest']}"
+        yield ""
         
         # Process specified threads or find disputed ones
         if thread_ids:
@@ -58,8 +65,8 @@ class LegalReportGenerator:
             """)
             threads_to_process = [row[0] for row in cursor.fetchall()]
             
-        report.append("## Thread Evidence")
-        report.append("")
+        yield "## Thread Evidence"
+        yield ""
         
         for thread_id in threads_to_process[:20]:  # Limit to 20 threads for report size
             thread_summary = self.threads.get_thread_summary(thread_id)
@@ -67,18 +74,18 @@ class LegalReportGenerator:
             if 'error' in thread_summary:
                 continue
                 
-            report.append(f"### {thread_id}: {thread_summary['base_subject']}")
-            report.append(f"**Participants**: {', '.join(thread_summary['participants'])}")
-            report.append(f"**Period**: {thread_summary['date_range']['start']} to {thread_summary['date_range']['end']}")
-            report.append("")
+            yield f"### {thread_id}: {thread_summary['base_subject']}"
+            yield f"**Participants**: {', '.join(thread_summary['participants'])}"
+            yield f"**Period**: {thread_summary['date_range']['start']} to {thread_summary['date_range']['end']}"
+            yield ""
             
             # List each email with EID and key excerpt
             for email in thread_summary['emails']:
-                report.append(f"[{email['eid']}]")
-                report.append(f"**Subject**: {email['subject']}")
-                report.append(f"**Date**: {email['datetime_utc']}")
-                report.append(f"**From**: {email['sender']}")
-                report.append(f"**Message-ID**: <{email['message_id']}>")
+                yield f"[{email['eid']}]"
+                yield f"**Subject**: {email['subject']}"
+                yield f"**Date**: {email['datetime_utc']}"
+                yield f"**From**: {email['sender']}"
+                yield f"**Message-ID**: <{email['message_id']}>"
                 
                 # Extract key excerpt
                 content = email['content'] or ""
@@ -100,14 +107,12 @@ class LegalReportGenerator:
                     excerpt = re.sub(r'\s+', ' ', excerpt)
                     if len(excerpt) > 200:
                         excerpt = excerpt[:197] + "..."
-                    report.append(f"> \"{excerpt}\"")
+                    yield f"> \"{excerpt}\""
                     
-                report.append("")
+                yield ""
                 
-            report.append("---")
-            report.append("")
-            
-        return "\n".join(report)
+            yield "---"
+            yield ""
     
     def generate_narrative_report(self,
                                  disputed_topics: list[str],
@@ -158,7 +163,7 @@ class LegalReportGenerator:
             report.append(f"### Topic: \"{topic}\"")
             
             # Find all mentions
-            mentions = self.evidence.search_by_pattern(topic, limit=50)
+            mentions = self.threads.search_emails(topic, limit=50)
             
             if mentions:
                 report.append(f"Found {len(mentions)} emails mentioning this topic.")
@@ -258,8 +263,14 @@ class LegalReportGenerator:
     def export_evidence_package(self, 
                                output_dir: str,
                                thread_ids: list[str] | None = None,
-                               keywords: list[str] | None = None) -> dict[str, Any]:
-        """Export complete evidence package with all reports and data."""
+                               keywords: list[str] | None = None,
+                               include_emails: bool = True) -> dict[str, Any]:
+        """Export complete evidence package with all reports and data.
+        
+        Reports are written line by line. With include_emails, the selected
+        emails and attachments are streamed into ``evidence/`` with a hashed
+        manifest; rerunning after an interruption resumes that export.
+        """
         os.makedirs(output_dir, exist_ok=True)
         
         # Generate timestamp for filenames
@@ -268,10 +279,10 @@ class LegalReportGenerator:
         files_created = []
         
         # 1. Generate lookup report
-        lookup_report = self.generate_lookup_report(thread_ids, keywords)
         lookup_file = os.path.join(output_dir, f"evidence_lookup_{timestamp}.md")
         with open(lookup_file, 'w') as f:
-            f.write(lookup_report)
+            for i, line in enumerate(self._lookup_report_lines(thread_ids, keywords)):
+                f.write(f"\n{line}" if i else line)
         files_created.append(lookup_file)
         logger.info(f"Created lookup report: {lookup_file}")
         
@@ -307,7 +318,15 @@ class LegalReportGenerator:
             
         logger.info(f"Exported {len(threads_to_export)} thread chronologies")
         
-        # 4. Create index file
+        # 4. Stream email evidence and attachments
+        evidence = None
+        if include_emails:
+            exporter = StreamingEvidenceExporter(self.evidence.db.db_path)
+            evidence = exporter.export(os.path.join(output_dir, "evidence"), thread_ids, keywords)
+            for name in (EMAILS_FILE, MANIFEST_FILE):
+                files_created.append(os.path.join(evidence['output_dir'], name))
+        
+        # 5. Create index file
         index_content = []
         index_content.append("# Legal Evidence Package")
         index_content.append(f"Generated: {datetime.now().isoformat()}")
@@ -327,7 +346,8 @@ class LegalReportGenerator:
             "success": True,
             "output_dir": output_dir,
             "files_created": len(files_created) + 1,  # +1 for index
-            "timestamp": timestamp
+            "timestamp": timestamp,
+            "evidence": evidence
         }
 
 
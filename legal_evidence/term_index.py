@@ -0,0 +1,111 @@
+"""Full-text term index over the emails table.
+
+An FTS5 trigram index (external content, so email text is not duplicated)
+answers ``LIKE '%keyword%'`` from trigram postings instead of scanning every
+email. New emails are indexed incrementally above a stored ID watermark; the
+index is rebuilt if rows were removed (email text is never updated in
+place). Candidates are re-checked with LIKE against emails, so results stay
+identical to the plain scan. Without FTS5 the index falls back to that scan.
+"""
+
+import sqlite3
+
+from loguru import logger
+
+from shared.simple_db import SimpleDB
+
+
+class EmailTermIndex:
+    """Trigram FTS index on emails(subject, content) kept in step with the table."""
+
+    def __init__(self, db: SimpleDB):
+        self.db = db
+        self.available = self._ensure_schema()
+        self.version: tuple | None = None
+
+    def _ensure_schema(self) -> bool:
+        """Create the FTS table and its watermark row; False if FTS5 is missing."""
+        try:
+            self.db.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS emails_fts USING fts5(
+                    subject, content, content='emails', content_rowid='id', tokenize='trigram'
+                )
+                """
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 trigram index unavailable, using LIKE scans: {e}")
+            return False
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS emails_fts_state (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                last_id INTEGER NOT NULL DEFAULT 0,
+                indexed INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        return True
+
+    def corpus_version(self) -> tuple:
+        """Content generation plus a cheap fingerprint of the emails table."""
+        row = self.db.fetch_one("SELECT COUNT(*) AS n, MAX(id) AS max_id FROM emails")
+        return (self.db.get_content_generation(), row["n"], row["max_id"])
+
+    def ensure_current(self, version: tuple | None = None) -> "EmailTermIndex":
+        """Index emails added since the last sync, or rebuild after deletions."""
+        version = version or self.corpus_version()
+        if not self.available or version == self.version:
+            return self
+
+        _, total, max_id = version
+        state = self.db.fetch_one("SELECT last_id, indexed FROM emails_fts_state WHERE id = 1")
+        last_id, indexed = (state["last_id"], state["indexed"]) if state else (0, 0)
+        new_rows = self.db.fetch_one(
+            "SELECT COUNT(*) AS n FROM emails WHERE id > ?", (last_id,)
+        )["n"]
+
+        if indexed + new_rows != total:
+            self.db.execute("INSERT INTO emails_fts(emails_fts) VALUES ('rebuild')")
+            logger.info(f"Rebuilt email term index ({total} emails)")
+        elif new_rows:
+            self.db.execute(
+                """
+                INSERT INTO emails_fts (rowid, subject, content)
+                SELECT id, subject, content FROM emails WHERE id > ?
+                """,
+                (last_id,),
+            )
+            logger.info(f"Indexed {new_rows} new emails")
+
+        self.db.execute(
+            """
+            INSERT INTO emails_fts_state (id, last_id, indexed) VALUES (1, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET last_id = excluded.last_id, indexed = excluded.indexed
+            """,
+            (max_id or 0, total),
+        )
+        self.version = version
+        return self
+
+    def match_clause(self, keyword: str) -> tuple[str, tuple]:
+        """WHERE fragment over emails matching keyword like LIKE '%keyword%' on content or subject."""
+        pattern = f"%{keyword}%"
+        if not self.available:
+            return "(content LIKE ? OR subject LIKE ?)", (pattern, pattern)
+        # One indexed LIKE per column; an OR across columns would scan
+        clause = """(
+            id IN (
+                SELECT rowid FROM emails_fts WHERE subject LIKE ?
+                UNION
+                SELECT rowid FROM emails_fts WHERE content LIKE ?
+            )
+            AND (content LIKE ? OR subject LIKE ?)
+        )"""
+        return clause, (pattern, pattern, pattern, pattern)
+
+    def matching_ids(self, keyword: str) -> list[int]:
+        """IDs of emails whose content or subject contains keyword, as LIKE would match."""
+        clause, params = self.match_clause(keyword)
+        rows = self.db.fetch(f"SELECT id FROM emails WHERE {clause} ORDER BY id", params)
+        return [row["id"] for row in rows]
@@ -5,11 +5,39 @@ Simple implementation for identifying patterns in email threads.
 
 import re
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Callable
 from typing import Any
 
 from shared.simple_db import SimpleDB
 
+from .term_index import EmailTermIndex
+
+# Bound on ? placeholders per IN (...) clause
+SQL_CHUNK = 500
+
+# Hour of day as written in datetime_utc (no timezone conversion)
+_HOUR_SQL = """
+    CASE
+        WHEN datetime_utc GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9][T ][0-9][0-9]*'
+            THEN substr(datetime_utc, 12, 2)
+        WHEN datetime_utc GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]' THEN '00'
+    END
+"""
+
+SUBJECT_PATTERNS = {
+    'access_related': ('entry', 'access'),
+    'maintenance_related': ('repair', 'maintenance'),
+    'notices': ('notice',),
+    'complaints': ('complaint',),
+}
+
+_SUBJECT_PATTERN_SQL = ",\n".join(
+    "SUM(CASE WHEN "
+    + " OR ".join(f"lower(subject) LIKE '%{word}%'" for word in words)
+    + f" THEN 1 ELSE 0 END) AS {name}"
+    for name, words in SUBJECT_PATTERNS.items()
+)
+
 
 class ThreadAnalyzer:
     """Analyze email threads for patterns and legal significance."""
@@ -17,6 +45,31 @@ class ThreadAnalyzer:
     def __init__(self, db_path: str = "data/emails.db"):
         """Initialize with database connection."""
         self.db = SimpleDB(db_path)
+        self.term_index = EmailTermIndex(self.db)
+        # (name, args) -> result, valid for one corpus version
+        self._cache: dict[tuple, Any] = {}
+        self._cache_version: tuple | None = None
+
+    def _cached(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return a cached analysis result, recomputing after emails change."""
+        version = self.term_index.corpus_version()
+        if version != self._cache_version:
+            self._cache = {}
+            self._cache_version = version
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _fetch_by_ids(self, columns: str, ids: list[int], where: str = "") -> list[dict]:
+        """Fetch email rows by ID in IN-list chunks."""
+        rows = []
+        for i in range(0, len(ids), SQL_CHUNK):
+            chunk = ids[i:i + SQL_CHUNK]
+            rows.extend(self.db.fetch(
+                f"SELECT {columns} FROM emails WHERE id IN ({','.join('?' * len(chunk))}) {where}",
+                tuple(chunk),
+            ))
+        return rows
         
     def get_thread_summary(self, thread_id: str) -> dict[str, Any]:
         """Get comprehensive summary of a thread."""
@@ -61,103 +114,111 @@ class ThreadAnalyzer:
             'emails': emails
         }
     
+    def search_emails(self, pattern: str, limit: int = 100) -> list[dict[str, Any]]:
+        """Emails whose content or subject contains pattern, newest first.
+        
+        Same results as EvidenceTracker.search_by_pattern, served from the term index.
+        """
+        def compute():
+            self.term_index.ensure_current(self._cache_version)
+            ids = self.term_index.matching_ids(pattern)
+            dated = self._fetch_by_ids("id, datetime_utc", ids)
+            # ORDER BY datetime_utc DESC: NULL dates last
+            dated.sort(
+                key=lambda r: (r['datetime_utc'] is not None, r['datetime_utc'] or ""), reverse=True
+            )
+            top = [r['id'] for r in dated[:limit]]
+            rows = {r['id']: r for r in self._fetch_by_ids(
+                "id, eid, message_id, subject, sender, datetime_utc, thread_id, content", top
+            )}
+            return [{k: v for k, v in rows[i].items() if k != 'id'} for i in top]
+            
+        return [dict(row) for row in self._cached(('search', pattern, limit), compute)]
+    
     def find_disputed_topics(self, keywords: list[str]) -> dict[str, list[dict]]:
-        """Find threads containing disputed topics based on keywords."""
-        disputed_threads = defaultdict(list)
-        
-        for keyword in keywords:
-            cursor = self.db.execute("""
-                SELECT DISTINCT thread_id, eid, subject, sender, datetime_utc,
-                       content
-                FROM emails
-                WHERE (content LIKE ? OR subject LIKE ?)
-                AND thread_id IS NOT NULL
-                ORDER BY thread_id, datetime_utc
-            """, (f"%{keyword}%", f"%{keyword}%"))
+        """Find threads containing disputed topics based on keywords.
+        
+        Candidate emails come from the trigram term index, so each keyword
+        costs an index lookup plus a LIKE check on its candidates, not a
+        table scan.
+        """
+        def compute():
+            self.term_index.ensure_current(self._cache_version)
+            disputed_threads = defaultdict(list)
             
-            for row in cursor:
-                thread_data = dict(row)
-                # Extract relevant excerpt
-                content = thread_data['content'] or ""
+            for keyword in keywords:
+                rows = self._fetch_by_ids(
+                    "DISTINCT thread_id, eid, subject, sender, datetime_utc, content",
+                    self.term_index.matching_ids(keyword),
+                    "AND thread_id IS NOT NULL",
+                )
+                unique = {tuple(row.values()): row for row in rows}.values()
                 
-                # Find sentence containing keyword
-                sentences = re.split(r'[.!?]+', content)
-                excerpt = ""
-                for sentence in sentences:
-                    if keyword.lower() in sentence.lower():
-                        excerpt = sentence.strip()
-                        break
-                        
-                thread_data['excerpt'] = excerpt[:200] if excerpt else ""
-                thread_data['keyword'] = keyword
-                
-                disputed_threads[thread_data['thread_id']].append(thread_data)
-                
-        return dict(disputed_threads)
+                ordered = sorted(unique, key=lambda r: (r['thread_id'], r['datetime_utc'] or ""))
+                for thread_data in ordered:
+                    # Extract relevant excerpt
+                    content = thread_data['content'] or ""
+                    
+                    # Find sentence containing keyword
+                    sentences = re.split(r'[.!?]+', content)
+                    excerpt = ""
+                    for sentence in sentences:
+                        if keyword.lower() in sentence.lower():
+                            excerpt = sentence.strip()
+                            break
+                            
+                    thread_data['excerpt'] = excerpt[:200] if excerpt else ""
+                    thread_data['keyword'] = keyword
+                    
+                    disputed_threads[thread_data['thread_id']].append(thread_data)
+                    
+            return dict(disputed_threads)
+        
+        disputed = self._cached(('disputed', tuple(keywords)), compute)
+        return {thread_id: [dict(row) for row in rows] for thread_id, rows in disputed.items()}
     
     def analyze_communication_patterns(self, sender: str | None = None) -> dict[str, Any]:
-        """Analyze communication patterns for specific sender or all."""
-        query = """
-            SELECT sender, recipient_to, datetime_utc, thread_id, subject
-            FROM emails
+        """Analyze communication patterns for specific sender or all.
+        
+        All counting happens in SQL GROUP BY queries; results are cached
+        until the emails change.
         """
-        params = ()
+        return self._cached(('patterns', sender), lambda: self._communication_patterns(sender))
+    
+    def _communication_patterns(self, sender: str | None) -> dict[str, Any]:
+        where, params = ("WHERE sender = ?", (sender,)) if sender else ("", ())
         
-        if sender:
-            query += " WHERE sender = ?"
-            params = (sender,)
-            
-        query += " ORDER BY datetime_utc"
+        totals = self.db.fetch_one(f"""
+            SELECT COUNT(*) AS total_emails,
+                   COUNT(DISTINCT CASE WHEN recipient_to != '' THEN recipient_to END) AS unique_recipients,
+                   COUNT(DISTINCT CASE WHEN thread_id != '' THEN thread_id END) AS total_threads,
+                   {_SUBJECT_PATTERN_SQL}
+            FROM emails {where}
+        """, params)
         
-        cursor = self.db.execute(query, params)
-        emails = [dict(row) for row in cursor.fetchall()]
+        senders = self.db.fetch(f"""
+            SELECT sender, COUNT(*) AS n
+            FROM emails {where}
+            GROUP BY sender
+            ORDER BY n DESC, MIN(datetime_utc), sender
+        """, params)
         
-        # Analyze patterns
-        patterns = {
-            'total_emails': len(emails),
-            'senders': defaultdict(int),
-            'recipients': defaultdict(int),
-            'threads': defaultdict(int),
-            'time_distribution': defaultdict(int),
-            'subject_patterns': defaultdict(int)
-        }
+        hours = self.db.fetch(f"""
+            SELECT hour, COUNT(*) AS n
+            FROM (SELECT {_HOUR_SQL} AS hour FROM emails {where})
+            WHERE hour IS NOT NULL
+            GROUP BY hour
+            ORDER BY hour
+        """, params)
         
-        for email in emails:
-            patterns['senders'][email['sender']] += 1
-            if email['recipient_to']:
-                patterns['recipients'][email['recipient_to']] += 1
-            if email['thread_id']:
-                patterns['threads'][email['thread_id']] += 1
-                
-            # Time analysis (hour of day)
-            if email['datetime_utc']:
-                try:
-                    dt = datetime.fromisoformat(email['datetime_utc'].replace('Z', '+00:00'))
-                    hour = dt.hour
-                    patterns['time_distribution'][f"{hour:02d}:00"] += 1
-                except:
-                    pass
-                    
-            # Subject pattern analysis
-            subject = email['subject'] or ""
-            if 'entry' in subject.lower() or 'access' in subject.lower():
-                patterns['subject_patterns']['access_related'] += 1
-            if 'repair' in subject.lower() or 'maintenance' in subject.lower():
-                patterns['subject_patterns']['maintenance_related'] += 1
-            if 'notice' in subject.lower():
-                patterns['subject_patterns']['notices'] += 1
-            if 'complaint' in subject.lower():
-                patterns['subject_patterns']['complaints'] += 1
-                
-        # Convert defaultdicts to regular dicts for clean output
         return {
-            'total_emails': patterns['total_emails'],
-            'unique_senders': len(patterns['senders']),
-            'unique_recipients': len(patterns['recipients']),
-            'total_threads': len(patterns['threads']),
-            'top_senders': dict(sorted(patterns['senders'].items(), key=lambda x: x[1], reverse=True)[:5]),
-            'time_distribution': dict(patterns['time_distribution']),
-            'subject_patterns': dict(patterns['subject_patterns'])
+            'total_emails': totals['total_emails'],
+            'unique_senders': len(senders),
+            'unique_recipients': totals['unique_recipients'],
+            'total_threads': totals['total_threads'],
+            'top_senders': {row['sender']: row['n'] for row in senders[:5]},
+            'time_distribution': {f"{row['hour']}:00": row['n'] for row in hours},
+            'subject_patterns': {name: totals[name] for name in SUBJECT_PATTERNS if totals[name]}
         }
     
     def get_chronological_narrative(self, thread_id: str) -> str:
@@ -358,13 +358,16 @@ class LegalIntelligenceService:
                     }
                     edges.append(edge)
 
-                    # Add to knowledge graph
-                    self.knowledge_graph.add_edge(
-                        source_content_id=edge["source"],
-                        target_content_id=edge["target"],
-                        relationship_type=edge["type"],
-                        strength=edge["strength"],
-                    )
+        # Add to knowledge graph in one bulk write
+        self.knowledge_graph.add_edges_bulk(
+            {
+                "source_content_id": edge["source"],
+                "target_content_id": edge["target"],
+                "relationship_type": edge["type"],
+                "strength": edge["strength"],
+            }
+            for edge in edges
+        )
 
         return {
             "success": True,
@@ -1,5 +1,6 @@
 """OCR module for PDF processing."""
 
+from .inspector import PDFInspector, get_pdf_inspector
 from .loader import PDFLoader
 from .ocr_coordinator import OCRCoordinator
 from .ocr_engine import OCREngine
@@ -11,9 +12,11 @@ from .validator import PDFValidator
 __all__ = [
     "OCRCoordinator",
     "PageByPageProcessor",
+    "PDFInspector",
     "PDFLoader",
     "PDFValidator",
     "PDFRasterizer",
     "OCREngine",
     "OCRPostprocessor",
+    "get_pdf_inspector",
 ]
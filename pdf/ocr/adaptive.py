@@ -0,0 +1,61 @@
+"""Adaptive OCR policy - low DPI first, escalate only the pages that need it.
+
+Most scanned pages OCR cleanly at 200 dpi, which rasterizes a quarter of
+the pixels of 400 dpi. The policy decides per page whether a result is good
+enough to keep, needs a higher-resolution retry, or can skip the enhanced
+(denoise/deskew) pass.
+"""
+
+import os
+import resource
+import time
+from dataclasses import dataclass
+
+ADAPTIVE_OCR = os.getenv("OCR_ADAPTIVE", "false").lower() == "true"
+BASE_DPI = int(os.getenv("OCR_BASE_DPI", "200"))
+ESCALATION_DPI = int(os.getenv("OCR_ESCALATION_DPI", "400"))
+MIN_CONFIDENCE = float(os.getenv("OCR_MIN_CONFIDENCE", "0.75"))
+MIN_QUALITY = float(os.getenv("OCR_MIN_QUALITY", "0.5"))
+SKIP_ENHANCED_CONFIDENCE = float(os.getenv("OCR_SKIP_ENHANCED_CONFIDENCE", "0.85"))
+
+
+def cpu_seconds() -> float:
+    """CPU time of this process plus finished children (tesseract, pdftoppm)."""
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return time.process_time() + children.ru_utime + children.ru_stime
+
+
+@dataclass
+class PageDecision:
+    """What adaptive OCR did with one page."""
+
+    page: int  # 1-indexed
+    dpi: int
+    confidence: float
+    quality_score: float
+    escalated: bool = False
+    reason: str = "accepted"
+    cpu_seconds: float = 0.0
+
+
+@dataclass
+class AdaptiveOCRPolicy:
+    """Thresholds for DPI escalation and skipping the enhanced pass."""
+
+    base_dpi: int = BASE_DPI
+    escalation_dpi: int = ESCALATION_DPI
+    min_confidence: float = MIN_CONFIDENCE
+    min_quality: float = MIN_QUALITY
+    skip_enhanced_confidence: float = SKIP_ENHANCED_CONFIDENCE
+
+    def escalation_reason(self, confidence: float, quality_score: float) -> str | None:
+        """Why a base-DPI result should be retried at escalation DPI, or None to keep it."""
+        if confidence < self.min_confidence:
+            return f"low_confidence ({confidence:.2f} < {self.min_confidence})"
+        if quality_score < self.min_quality:
+            return f"low_quality ({quality_score:.2f} < {self.min_quality})"
+        return None
+
+    def skips_enhanced_pass(self, confidence: float) -> bool:
+        """Standard-pass confidence high enough that denoise/deskew cannot pay off."""
+        return confidence >= self.skip_enhanced_confidence
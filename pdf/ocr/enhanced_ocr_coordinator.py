@@ -14,12 +14,13 @@ Architecture: Wraps existing OCRCoordinator with quality gates and enhanced proc
 
 import time
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime
 from loguru import logger
 
 from .ocr_coordinator import OCRCoordinator
 from .enhanced_ocr_engine import EnhancedOCREngine
+from .inspector import PDFProfile, get_pdf_inspector
 from .loader import PDFLoader
 from .validator import PDFValidator
 from .rasterizer import PDFRasterizer
@@ -47,7 +48,8 @@ class EnhancedOCRCoordinator:
     def __init__(self, dpi: int = 300):
         # Core components
         self.loader = PDFLoader()
-        self.validator = PDFValidator()
+        self.inspector = get_pdf_inspector()
+        self.validator = PDFValidator(self.inspector)
         self.rasterizer = PDFRasterizer(dpi=dpi)
         self.enhanced_engine = EnhancedOCREngine(dpi=dpi)
         self.quality_scorer = ContentQualityScorer()
@@ -156,12 +158,21 @@ class EnhancedOCRCoordinator:
             logger.info("→ Stage 3: PDF rasterization")
             stage_start = time.time()
             
-            raster_result = self.rasterizer.convert_pdf_to_images(pdf_path)
+            profile = self._cached_profile(pdf_path)
+            if profile and self.rasterizer.should_stream(pdf_path):
+                # Large files: pages are rendered lazily during Stage 4
+                page_count = profile.page_count
+                images = (image for _, image in self.rasterizer.iter_pages(pdf_path, 1, page_count))
+                raster_result = {'success': True, 'streaming': True}
+            else:
+                raster_result = self.rasterizer.convert_pdf_to_images(pdf_path)
+                images = raster_result.get('images', [])
+                page_count = len(images)
             processing_stages.append({
                 'stage': 'pdf_rasterization',
                 'success': raster_result['success'],
                 'duration': time.time() - stage_start,
-                'details': {'image_count': len(raster_result.get('images', []))}
+                'details': {'image_count': page_count, 'streaming': raster_result.get('streaming', False)}
             })
             
             if not raster_result['success']:
@@ -172,8 +183,7 @@ class EnhancedOCRCoordinator:
                     processing_stages
                 )
             
-            images = raster_result['images']
-            logger.info(f"  ✓ Rasterized {len(images)} pages")
+            logger.info(f"  ✓ Rasterizing {page_count} pages")
             
             # Stage 4: Enhanced OCR processing (with quality gates)
             logger.info("→ Stage 4: Enhanced OCR processing")
@@ -181,7 +191,9 @@ class EnhancedOCRCoordinator:
             
             ocr_results = self._process_pages_with_enhanced_ocr(
                 images, 
-                quality_gates_enabled
+                quality_gates_enabled,
+                profile=profile,
+                page_count=page_count
             )
             
             processing_stages.append({
@@ -209,7 +221,7 @@ class EnhancedOCRCoordinator:
             
             final_validation = self._perform_final_quality_validation(
                 ocr_results['text'],
-                len(images),
+                page_count,
                 ocr_results.get('quality_metrics')
             )
             
@@ -230,7 +242,7 @@ class EnhancedOCRCoordinator:
                 'method': 'enhanced_ocr',
                 'text': ocr_results['text'],
                 'ocr_used': True,
-                'page_count': len(images),
+                'page_count': page_count,
                 'confidence': ocr_results.get('average_confidence', 0),
                 'validation_status': final_validation['validation_status'],
                 'quality_score': final_validation.get('quality_score', 0),
@@ -256,28 +268,48 @@ class EnhancedOCRCoordinator:
                 exception=e
             )
     
+    def _cached_profile(self, pdf_path: str) -> Optional[PDFProfile]:
+        """Inspection profile from Stage 2 (cache hit); None if inspection failed."""
+        try:
+            return self.inspector.inspect(pdf_path)
+        except Exception as e:
+            logger.warning(f"PDF profile unavailable, using image analysis: {e}")
+            return None
+
     def _process_pages_with_enhanced_ocr(
         self, 
-        images: List, 
-        quality_gates_enabled: bool
+        images: Iterable, 
+        quality_gates_enabled: bool,
+        profile: Optional[PDFProfile] = None,
+        page_count: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process all pages with enhanced dual-pass OCR.
+        
+        images may be a generator of streamed pages; each image is dropped
+        once its page has been processed.
         """
         page_results = []
         page_texts = []
         confidences = []
         processing_logs = []
         
+        if page_count is None:
+            page_count = len(images)
+        
         try:
             for i, image in enumerate(images):
-                logger.info(f"  Processing page {i+1}/{len(images)}")
+                logger.info(f"  Processing page {i+1}/{page_count}")
                 
-                # Use enhanced dual-pass OCR
-                page_result = self.enhanced_engine.extract_text_with_dual_pass(
-                    image,
-                    page_count=len(images)
-                )
+                # Use enhanced dual-pass OCR (streamed pages are None if rendering failed)
+                if image is None:
+                    page_result = {'success': False, 'error': 'Failed to convert page'}
+                else:
+                    page_result = self.enhanced_engine.extract_text_with_dual_pass(
+                        image,
+                        page_count=page_count,
+                        page_profile=profile.page(i) if profile else None
+                    )
                 
                 page_results.append(page_result)
                 
@@ -30,6 +30,8 @@ try:
 except ImportError:
     TESSERACT_AVAILABLE = False
 
+from .adaptive import ADAPTIVE_OCR, AdaptiveOCRPolicy
+from .inspector import PageProfile
 from .ocr_engine import OCREngine
 import sys
 import os
@@ -51,8 +53,10 @@ class EnhancedOCREngine:
     - Comprehensive metrics and diagnostics
     """
     
-    def __init__(self, dpi: int = 300):
+    def __init__(self, dpi: int = 300, adaptive: bool = ADAPTIVE_OCR, policy: Optional[AdaptiveOCRPolicy] = None):
         self.dpi = dpi
+        self.adaptive = adaptive
+        self.policy = policy or AdaptiveOCRPolicy()
         self.base_engine = OCREngine()
         self.quality_scorer = ContentQualityScorer()
         self.available = TESSERACT_AVAILABLE and CV2_AVAILABLE
@@ -70,7 +74,8 @@ class EnhancedOCREngine:
         self, 
         image: Image.Image, 
         page_count: int = 1,
-        force_enhanced: bool = False
+        force_enhanced: bool = False,
+        page_profile: Optional[PageProfile] = None
     ) -> Dict[str, Any]:
         """
         Main dual-pass OCR extraction with quality gates.
@@ -79,6 +84,8 @@ class EnhancedOCREngine:
             image: PIL Image to process
             page_count: Number of pages for quality calculation
             force_enhanced: Skip standard pass, go straight to enhanced
+            page_profile: Inspection profile for this page; when given it decides
+                the born-digital fast-path instead of image analysis
             
         Returns:
             Dict with text, quality metrics, validation status, and processing metadata
@@ -96,8 +103,11 @@ class EnhancedOCREngine:
         
         # Phase 1: Born-digital detection (fast path)
         if not force_enhanced:
-            born_digital_result = self._detect_born_digital_text(image)
-            if born_digital_result['is_born_digital']:
+            if page_profile is not None:
+                is_born_digital = page_profile.is_born_digital
+            else:
+                is_born_digital = self._detect_born_digital_text(image)['is_born_digital']
+            if is_born_digital:
                 processing_log.append("✓ Born-digital fast-path detected")
                 return {
                     'success': True,
@@ -118,8 +128,15 @@ class EnhancedOCREngine:
                 text = standard_result['text']
                 quality_metrics = self.quality_scorer.score_content(text, page_count)
                 
-                if quality_metrics.validation_status == ValidationStatus.TEXT_VALIDATED:
-                    processing_log.append(f"✓ Standard OCR passed quality gates (confidence: {standard_result['confidence']:.2f})")
+                passed_gates = quality_metrics.validation_status == ValidationStatus.TEXT_VALIDATED
+                # Adaptive mode: a very confident page gains nothing from denoise/deskew
+                confident = self.adaptive and self.policy.skips_enhanced_pass(standard_result['confidence'])
+                
+                if passed_gates or confident:
+                    if passed_gates:
+                        processing_log.append(f"✓ Standard OCR passed quality gates (confidence: {standard_result['confidence']:.2f})")
+                    else:
+                        processing_log.append(f"✓ Standard OCR confident ({standard_result['confidence']:.2f}), enhanced pass skipped")
                     return {
                         'success': True,
                         'text': text,
@@ -128,6 +145,7 @@ class EnhancedOCREngine:
                         'validation_status': quality_metrics.validation_status.value,
                         'quality_score': quality_metrics.quality_score,
                         'quality_metrics': quality_metrics,
+                        'enhanced_skipped': not passed_gates,
                         'processing_log': processing_log,
                         'processing_time': time.time() - start_time
                     }
@@ -0,0 +1,184 @@
+"""PDF inspection - one pass per file that every OCR decision reads from.
+
+The validator, the page-by-page processor and the dual-pass engine used to
+open the same PDF separately to count pages and guess whether it needs OCR.
+PDFInspector opens each file once, records page count plus per-page text
+density and image coverage, and caches the profile by file hash.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from loguru import logger
+
+from .loader import PDFLoader
+
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+
+SAMPLE_PAGES = 5  # Pages that decide scanned vs born-digital
+MIN_TEXT_CHARS = 100  # Average chars/page below this means scanned
+MAX_IMAGE_COVERAGE = 0.5  # Pages mostly covered by images are treated as scans
+MAX_INSPECT_PAGES = int(os.getenv("PDF_INSPECT_MAX_PAGES", "500"))
+PROFILE_CACHE_SIZE = int(os.getenv("PDF_PROFILE_CACHE_SIZE", "256"))
+
+
+@dataclass
+class PageProfile:
+    """Text density and image coverage for one page."""
+
+    index: int
+    text_chars: int
+    image_count: int = 0
+    image_coverage: float = 0.0  # Fraction of the page area drawn by images
+
+    @property
+    def is_born_digital(self) -> bool:
+        """Page has a real text layer and is not a full-page scan."""
+        return self.text_chars >= MIN_TEXT_CHARS and self.image_coverage < MAX_IMAGE_COVERAGE
+
+
+@dataclass
+class PDFProfile:
+    """Everything the OCR pipeline needs to know about a PDF before rasterizing it."""
+
+    file_hash: str
+    page_count: int
+    pages: list[PageProfile] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        """False when inspection stopped early (born-digital or page cap)."""
+        return len(self.pages) == self.page_count
+
+    @property
+    def avg_sample_chars(self) -> float:
+        sample = self.pages[:SAMPLE_PAGES]
+        return sum(p.text_chars for p in sample) / len(sample) if sample else 0.0
+
+    @property
+    def is_scanned(self) -> bool:
+        return self.page_count == 0 or self.avg_sample_chars < MIN_TEXT_CHARS
+
+    @property
+    def scan_confidence(self) -> float:
+        if self.page_count == 0:
+            return 1.0
+        return 1.0 - min(self.avg_sample_chars / 1000, 1.0)
+
+    def page(self, index: int) -> PageProfile | None:
+        """Profile for a 0-indexed page, or None if it was not inspected."""
+        return self.pages[index] if 0 <= index < len(self.pages) else None
+
+
+def _inspect_page(index: int, page) -> PageProfile:
+    """Extract text and sum image areas from a single content-stream pass."""
+    images = []
+
+    try:
+        xobjects = page["/Resources"]["/XObject"]
+    except (KeyError, TypeError):
+        xobjects = {}
+
+    def visit(operator, operands, cm, tm):
+        # An image is painted into the unit square mapped by the current matrix
+        if operator == b"Do" and operands and operands[0] in xobjects:
+            if xobjects[operands[0]].get("/Subtype") == "/Image":
+                images.append(abs(cm[0] * cm[3] - cm[1] * cm[2]))
+
+    try:
+        text = page.extract_text(visitor_operand_before=visit if xobjects else None) or ""
+    except Exception as e:
+        logger.debug(f"Text extraction failed on page {index + 1}: {e}")
+        text = ""
+
+    box = page.mediabox
+    page_area = abs(float(box.width) * float(box.height)) or 1.0
+    return PageProfile(
+        index=index,
+        text_chars=len(text.strip()),
+        image_count=len(images),
+        image_coverage=min(sum(images) / page_area, 1.0),
+    )
+
+
+class PDFInspector:
+    """Builds and caches PDFProfiles keyed by file hash."""
+
+    def __init__(self, max_pages: int = MAX_INSPECT_PAGES, cache_size: int = PROFILE_CACHE_SIZE) -> None:
+        self.max_pages = max_pages
+        self.cache_size = cache_size
+        self.loader = PDFLoader()
+        self._profiles: OrderedDict[str, PDFProfile] = OrderedDict()
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def file_hash(self, pdf_path: str) -> str:
+        """SHA256 of the file, re-hashed only when size or mtime changes."""
+        path = os.path.abspath(pdf_path)
+        stat = os.stat(path)
+        cached = self._hashes.get(path)
+        if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+        file_hash = self.loader.hash_file(path)
+        self._hashes[path] = (stat.st_size, stat.st_mtime_ns, file_hash)
+        return file_hash
+
+    def inspect(self, pdf_path: str) -> PDFProfile:
+        """Return the cached profile for this file, opening it only on a miss."""
+        file_hash = self.file_hash(pdf_path)
+        with self._lock:
+            profile = self._profiles.get(file_hash)
+            if profile is not None:
+                self._profiles.move_to_end(file_hash)
+                return profile
+
+        profile = self._build_profile(pdf_path, file_hash)
+
+        with self._lock:
+            self._profiles[file_hash] = profile
+            while len(self._profiles) > self.cache_size:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def _build_profile(self, pdf_path: str, file_hash: str) -> PDFProfile:
+        if PyPDF2 is None:
+            raise RuntimeError("PyPDF2 not available")
+
+        with open(pdf_path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            profile = PDFProfile(file_hash=file_hash, page_count=len(reader.pages))
+            limit = min(profile.page_count, self.max_pages)
+
+            for index in range(limit):
+                profile.pages.append(_inspect_page(index, reader.pages[index]))
+                # Early exit: a born-digital sample means no page gets rasterized
+                if index + 1 == SAMPLE_PAGES and not profile.is_scanned:
+                    if all(p.is_born_digital for p in profile.pages):
+                        break
+
+        logger.debug(
+            f"Inspected {len(profile.pages)}/{profile.page_count} pages of {pdf_path}: "
+            f"{profile.avg_sample_chars:.0f} chars/page, scanned={profile.is_scanned}"
+        )
+        return profile
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+            self._hashes.clear()
+
+
+_inspector: PDFInspector | None = None
+
+
+def get_pdf_inspector() -> PDFInspector:
+    """Shared inspector so every OCR stage hits the same profile cache."""
+    global _inspector
+    if _inspector is None:
+        _inspector = PDFInspector()
+    return _inspector
@@ -59,20 +59,28 @@ class OCRCoordinator:
     def _extract_with_ocr(self, pdf_path: str) -> dict[str, Any]:
         """Extract text using OCR."""
         try:
-            # Convert PDF to images
-            raster_result = self.rasterizer.convert_pdf_to_images(pdf_path)
-            if not raster_result["success"]:
-                return raster_result
+            if self.rasterizer.should_stream(pdf_path):
+                # Large files: one rendered page in memory at a time
+                pages = self.rasterizer.iter_pages(pdf_path)
+            else:
+                # Convert PDF to images
+                raster_result = self.rasterizer.convert_pdf_to_images(pdf_path)
+                if not raster_result["success"]:
+                    return raster_result
+                pages = enumerate(raster_result["images"], start=1)
 
             # Process each page
             page_texts = []
             confidences = []
 
-            for i, image in enumerate(raster_result["images"]):
-                logger.info(f"Processing page {i+1}/{len(raster_result['images'])}")
+            for page_number, image in pages:
+                logger.info(f"Processing page {page_number}")
 
-                # Extract text from image
-                ocr_result = self.engine.extract_text_from_image(image)
+                # Extract text from image (None if the page failed to render)
+                if image is None:
+                    ocr_result = {"success": False}
+                else:
+                    ocr_result = self.engine.extract_text_from_image(image)
                 if ocr_result["success"]:
                     page_texts.append(ocr_result["text"])
                     confidences.append(ocr_result["confidence"])
@@ -1,33 +1,60 @@
 """Page-by-page processor for memory-efficient OCR of large PDFs."""
 
+import os
 from collections.abc import Callable, Generator
+from dataclasses import asdict
 from typing import Any
 
 from loguru import logger
 
+from shared.content_quality_scorer import ContentQualityScorer
+
+from .adaptive import ADAPTIVE_OCR, AdaptiveOCRPolicy, PageDecision, cpu_seconds
+from .inspector import get_pdf_inspector
 from .ocr_engine import OCREngine
 from .postprocessor import OCRPostprocessor
 from .rasterizer import PDFRasterizer
 
 # Logger is now imported globally from loguru
 
+STREAMING_OCR = os.getenv("OCR_STREAMING", "true").lower() == "true"
+
 
 class PageByPageProcessor:
     """Process large PDFs page by page to manage memory usage."""
 
-    def __init__(self, batch_size: int = 5, max_memory_mb: int = 500) -> None:
+    def __init__(
+        self,
+        batch_size: int = 5,
+        max_memory_mb: int = 500,
+        adaptive: bool = ADAPTIVE_OCR,
+        policy: AdaptiveOCRPolicy | None = None,
+        streaming: bool = STREAMING_OCR,
+    ) -> None:
         """
         Initialize processor with memory constraints.
 
         Args:
             batch_size: Number of pages to process at once
             max_memory_mb: Maximum memory usage in MB
+            adaptive: Rasterize at the policy's base DPI and re-run only
+                low-confidence or low-quality pages at escalation DPI
+            policy: Adaptive thresholds (defaults from OCR_* env settings)
+            streaming: Render one page at a time through a temp file instead
+                of batch_size pages in memory (see PDFRasterizer.iter_pages)
         """
         self.batch_size = batch_size
         self.max_memory_mb = max_memory_mb
         self.ocr_engine = OCREngine()
         self.postprocessor = OCRPostprocessor()
         self.rasterizer = PDFRasterizer(dpi=400)
+        self.inspector = get_pdf_inspector()
+        self.adaptive = adaptive
+        self.policy = policy or AdaptiveOCRPolicy()
+        self.base_rasterizer = PDFRasterizer(dpi=self.policy.base_dpi)
+        self.escalation_rasterizer = PDFRasterizer(dpi=self.policy.escalation_dpi)
+        self.quality_scorer = ContentQualityScorer()
+        self.streaming = streaming
 
     def process_large_pdf(
         self,
@@ -49,12 +76,9 @@ class PageByPageProcessor:
             Processing result with extracted text
         """
         try:
-            # Get total page count
-            import PyPDF2
-
-            with open(pdf_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                total_pages = len(reader.pages)
+            cpu_start = cpu_seconds()
+            # Page count comes from the shared inspection profile
+            total_pages = self.inspector.inspect(pdf_path).page_count
 
             if end_page is None:
                 end_page = total_pages
@@ -64,58 +88,61 @@ class PageByPageProcessor:
             pages_to_process = end_page - start_page
             page_texts = []
             confidences = []
+            decisions = []
+            rasterizer = self.base_rasterizer if self.adaptive else self.rasterizer
 
-            # Process in batches
-            for batch_start in range(start_page, end_page, self.batch_size):
-                batch_end = min(batch_start + self.batch_size, end_page)
-
-                # Convert batch to images
-                result = self.rasterizer.convert_pdf_to_images(
-                    pdf_path,
-                    first_page=batch_start + 1,  # pdf2image uses 1-indexing
-                    last_page=batch_end,
-                )
-
-                if not result["success"]:
-                    logger.error(f"Failed to rasterize pages {batch_start}-{batch_end}")
-                    continue
-
-                # Process each image in batch
-                for i, image in enumerate(result["images"]):
-                    current_page = batch_start + i
-
-                    # Extract text
+            if self.streaming:
+                # pdf2image uses 1-indexing
+                pages = rasterizer.iter_pages(pdf_path, start_page + 1, end_page)
+            else:
+                pages = self._iter_batches(pdf_path, rasterizer, start_page, end_page)
+
+            for page_number, image in pages:
+                current_page = page_number - 1
+
+                # Extract text
+                if image is None:
+                    ocr_result = {"success": False}
+                elif self.adaptive:
+                    ocr_result, decision = self._ocr_page_adaptive(pdf_path, current_page, image)
+                    decisions.append(decision)
+                else:
                     ocr_result = self.ocr_engine.extract_text_from_image(image)
-                    if ocr_result["success"]:
-                        page_texts.append(ocr_result["text"])
-                        confidences.append(ocr_result["confidence"])
-                    else:
-                        page_texts.append("")
-                        confidences.append(0.0)
-
-                    # Report progress
-                    if progress_callback:
-                        progress = (current_page - start_page + 1) / pages_to_process
-                        progress_callback(
-                            {
-                                "current_page": current_page + 1,
-                                "total_pages": total_pages,
-                                "progress_percent": int(progress * 100),
-                            }
-                        )
+                if ocr_result["success"]:
+                    page_texts.append(ocr_result["text"])
+                    confidences.append(ocr_result["confidence"])
+                else:
+                    page_texts.append("")
+                    confidences.append(0.0)
+
+                # Report progress
+                if progress_callback:
+                    progress = (current_page - start_page + 1) / pages_to_process
+                    progress_callback(
+                        {
+                            "current_page": current_page + 1,
+                            "total_pages": total_pages,
+                            "progress_percent": int(progress * 100),
+                        }
+                    )
 
             # Merge results
             merged_text = self.postprocessor.merge_page_texts(page_texts)
             avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-            return {
+            result = {
                 "success": True,
                 "text": merged_text,
                 "method": "page_by_page_ocr",
                 "pages_processed": len(page_texts),
                 "total_pages": total_pages,
                 "confidence": avg_confidence,
+                "cpu_seconds": round(cpu_seconds() - cpu_start, 3),
             }
+            if self.adaptive:
+                result["page_decisions"] = [asdict(d) for d in decisions]
+                result["escalated_pages"] = sum(d.escalated for d in decisions)
+            return result
 
         except Exception as e:
             logger.error(f"Page-by-page processing failed: {e}")
@@ -140,43 +167,43 @@ class PageByPageProcessor:
             Dict with page text and metadata
         """
         try:
-            # Get total pages
-            import PyPDF2
-
-            with open(pdf_path, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                total_pages = len(reader.pages)
+            # Page count comes from the shared inspection profile
+            total_pages = self.inspector.inspect(pdf_path).page_count
 
             if end_page is None:
                 end_page = total_pages
             else:
                 end_page = min(end_page, total_pages)
 
+            rasterizer = self.base_rasterizer if self.adaptive else self.rasterizer
+            if self.streaming:
+                pages = rasterizer.iter_pages(pdf_path, start_page + 1, end_page)
+            else:
+                pages = self._iter_single_pages(pdf_path, rasterizer, start_page, end_page)
+
             # Process each page
-            for page_num in range(start_page, end_page):
-                # Convert single page
-                result = self.rasterizer.convert_pdf_to_images(
-                    pdf_path,
-                    first_page=page_num + 1,
-                    last_page=page_num + 1,
-                )
-
-                if not result["success"] or not result["images"]:
+            for page_number, image in pages:
+                if image is None:
                     yield {
                         "success": False,
-                        "page": page_num + 1,
-                        "error": result.get("error", "Failed to convert page"),
+                        "page": page_number,
+                        "error": "Failed to convert page",
                     }
                     continue
 
                 # OCR the page
-                ocr_result = self.ocr_engine.extract_text_from_image(result["images"][0])
+                page = {"page": page_number}
+                if self.adaptive:
+                    ocr_result, decision = self._ocr_page_adaptive(pdf_path, page_number - 1, image)
+                    page["decision"] = asdict(decision)
+                else:
+                    ocr_result = self.ocr_engine.extract_text_from_image(image)
 
                 yield {
                     "success": ocr_result["success"],
-                    "page": page_num + 1,
                     "text": ocr_result.get("text", ""),
                     "confidence": ocr_result.get("confidence", 0.0),
+                    **page,
                 }
 
         except Exception as e:
@@ -185,3 +212,69 @@ class PageByPageProcessor:
                 "success": False,
                 "error": str(e),
             }
+
+    def _iter_batches(
+        self, pdf_path: str, rasterizer: PDFRasterizer, start_page: int, end_page: int
+    ) -> Generator[tuple[int, Any], None, None]:
+        """(page_number, image) for batch_size pages rendered at a time."""
+        for batch_start in range(start_page, end_page, self.batch_size):
+            batch_end = min(batch_start + self.batch_size, end_page)
+
+            # Convert batch to images
+            result = rasterizer.convert_pdf_to_images(
+                pdf_path,
+                first_page=batch_start + 1,  # pdf2image uses 1-indexing
+                last_page=batch_end,
+            )
+
+            if not result["success"]:
+                logger.error(f"Failed to rasterize pages {batch_start}-{batch_end}")
+                continue
+
+            for i, image in enumerate(result["images"]):
+                yield batch_start + i + 1, image
+
+    def _iter_single_pages(
+        self, pdf_path: str, rasterizer: PDFRasterizer, start_page: int, end_page: int
+    ) -> Generator[tuple[int, Any], None, None]:
+        """(page_number, image) one page per conversion; image is None if it failed."""
+        for page_num in range(start_page, end_page):
+            result = rasterizer.convert_single_page(pdf_path, page_num + 1)
+            images = result["images"] if result["success"] else []
+            if not images:
+                logger.error(f"Failed to rasterize page {page_num + 1}: {result.get('error')}")
+            yield page_num + 1, images[0] if images else None
+
+    def _ocr_page_adaptive(
+        self, pdf_path: str, page_index: int, image: Any
+    ) -> tuple[dict[str, Any], PageDecision]:
+        """OCR a base-DPI page image; re-rasterize and retry at escalation DPI if it falls short."""
+        start = cpu_seconds()
+        ocr_result = self.ocr_engine.extract_text_from_image(image)
+        decision = self._decide(page_index, self.policy.base_dpi, ocr_result)
+
+        reason = self.policy.escalation_reason(decision.confidence, decision.quality_score)
+        if reason:
+            decision.escalated, decision.reason = True, reason
+            high = self.escalation_rasterizer.convert_single_page(pdf_path, page_index + 1)
+            if high["success"] and high["images"]:
+                retry = self.ocr_engine.extract_text_from_image(high["images"][0])
+                retried = self._decide(page_index, self.policy.escalation_dpi, retry)
+                # Keep whichever pass tesseract trusts more
+                if retry["success"] and retried.confidence >= decision.confidence:
+                    ocr_result = retry
+                    decision.dpi = retried.dpi
+                    decision.confidence = retried.confidence
+                    decision.quality_score = retried.quality_score
+
+        decision.cpu_seconds = round(cpu_seconds() - start, 3)
+        return ocr_result, decision
+
+    def _decide(self, page_index: int, dpi: int, ocr_result: dict[str, Any]) -> PageDecision:
+        text = ocr_result.get("text", "") if ocr_result["success"] else ""
+        return PageDecision(
+            page=page_index + 1,
+            dpi=dpi,
+            confidence=ocr_result.get("confidence", 0.0) if ocr_result["success"] else 0.0,
+            quality_score=self.quality_scorer.score_content(text).quality_score,
+        )
@@ -1,11 +1,17 @@
 """PDF rasterizer module - converts PDF pages to images."""
 
+import gc
+import os
+import tempfile
+from collections.abc import Generator
 from typing import Any
 
+import psutil
 from loguru import logger
 
 try:
     import pdf2image
+    from PIL import Image
 
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
@@ -13,18 +19,31 @@ except ImportError:
 
 # Logger is now imported globally from loguru
 
+MAX_RSS_MB = int(os.getenv("OCR_MAX_RSS_MB", "2048"))
+STREAM_MIN_MB = float(os.getenv("OCR_STREAM_MIN_MB", "10"))
+
+
+class RasterMemoryError(MemoryError):
+    """Rendering the next page would push the process past its RSS ceiling."""
+
+
+def current_rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
 
 class PDFRasterizer:
     """Converts PDF pages to images for OCR processing."""
 
-    def __init__(self, dpi: int = 300) -> None:
+    def __init__(self, dpi: int = 300, max_rss_mb: int = MAX_RSS_MB) -> None:
         """
         Initialize rasterizer with DPI setting.
 
         Args:
             dpi: Resolution for PDF to image conversion
+            max_rss_mb: Process RSS ceiling enforced by iter_pages
         """
         self.dpi = dpi
+        self.max_rss_mb = max_rss_mb
         self.available = PDF2IMAGE_AVAILABLE
 
     def convert_pdf_to_images(
@@ -64,6 +83,87 @@ class PDFRasterizer:
         """Convert a single PDF page to image."""
         return self.convert_pdf_to_images(pdf_path, page_num, page_num)
 
+    def iter_pages(
+        self, pdf_path: str, first_page: int = 1, last_page: int | None = None
+    ) -> Generator[tuple[int, "Image.Image"], None, None]:
+        """
+        Render pages one at a time, yielding (page_number, image).
+
+        A page that fails to render yields (page_number, None) so one bad
+        page does not end the stream; RasterMemoryError still propagates.
+        Each page is written to the same temp file and loaded from there,
+        so at most one page of raster data is alive. The image is closed
+        as soon as the consumer asks for the next page - do not keep it.
+        Before each page the process RSS plus the page's estimated size is
+        checked against max_rss_mb; RasterMemoryError is raised if the
+        ceiling would be crossed even after a garbage collection.
+
+        Args:
+            pdf_path: Path to PDF file
+            first_page: First page to render (1-indexed)
+            last_page: Last page to render (inclusive); defaults to the last page
+        """
+        if not self.available:
+            raise RuntimeError("pdf2image not available")
+
+        if last_page is None:
+            from .inspector import get_pdf_inspector
+
+            last_page = get_pdf_inspector().inspect(pdf_path).page_count
+
+        page_mb = self.estimate_memory_usage(1)["estimated_mb"]
+        logger.info(f"Streaming pages {first_page}-{last_page} at {self.dpi} DPI")
+
+        with tempfile.TemporaryDirectory(prefix="raster_") as tmp:
+            for page_number in range(first_page, last_page + 1):
+                self._check_memory(page_mb)
+                try:
+                    image = self._render_page(pdf_path, page_number, tmp)
+                except Exception as e:
+                    logger.error(f"Failed to render page {page_number}: {e}")
+                    yield page_number, None
+                    continue
+                try:
+                    yield page_number, image
+                finally:
+                    image.close()
+                    del image
+
+    def _render_page(self, pdf_path: str, page_number: int, tmp: str) -> Any:
+        """Render one page via a temp file and load it fully into memory."""
+        paths = pdf2image.convert_from_path(
+            pdf_path,
+            dpi=self.dpi,
+            first_page=page_number,
+            last_page=page_number,
+            output_folder=tmp,
+            output_file="page",
+            single_file=True,
+            paths_only=True,
+        )
+        if not paths:
+            raise RuntimeError(f"Failed to render page {page_number}")
+        try:
+            image = Image.open(paths[0])
+            image.load()
+        finally:
+            os.remove(paths[0])
+        return image
+
+    def should_stream(self, pdf_path: str) -> bool:
+        """Large files go through iter_pages instead of one in-memory batch."""
+        return os.path.getsize(pdf_path) >= STREAM_MIN_MB * 1024 * 1024
+
+    def _check_memory(self, page_mb: float) -> None:
+        if current_rss_mb() + page_mb <= self.max_rss_mb:
+            return
+        gc.collect()
+        rss = current_rss_mb()
+        if rss + page_mb > self.max_rss_mb:
+            raise RasterMemoryError(
+                f"RSS {rss:.0f}MB + next page {page_mb:.0f}MB exceeds ceiling {self.max_rss_mb}MB"
+            )
+
     def estimate_memory_usage(self, page_count: int) -> dict[str, Any]:
         """
         Estimate memory usage for conversion.
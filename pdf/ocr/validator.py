@@ -4,6 +4,8 @@ from typing import Any
 
 from loguru import logger
 
+from .inspector import PDFInspector, get_pdf_inspector
+
 try:
     import PyPDF2
 except ImportError:
@@ -15,8 +17,9 @@ except ImportError:
 class PDFValidator:
     """Validates PDFs and determines processing requirements."""
 
-    def __init__(self) -> None:
+    def __init__(self, inspector: PDFInspector | None = None) -> None:
         self.dependencies_valid = self._check_dependencies()
+        self.inspector = inspector or get_pdf_inspector()
 
     def _check_dependencies(self) -> bool:
         """Check if required dependencies are available."""
@@ -46,6 +49,9 @@ class PDFValidator:
         """
         Determine if PDF is scanned by checking text content.
 
+        Reads the cached inspection profile, so repeated checks on the
+        same file do not reopen it.
+
         Returns:
             Tuple[bool, float]: (is_scanned, confidence)
         """
@@ -54,35 +60,11 @@ class PDFValidator:
             return True, 0.5
 
         try:
-            total_chars = 0
-            page_count = 0
-
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                page_count = len(reader.pages)
-
-                if page_count == 0:
-                    return True, 1.0
-
-                # Sample first few pages
-                sample_pages = min(5, page_count)
-                for i in range(sample_pages):
-                    try:
-                        page = reader.pages[i]
-                        text = page.extract_text() or ""
-                        total_chars += len(text.strip())
-                    except Exception:
-                        continue
-
-            # Calculate average chars per page
-            avg_chars = total_chars / sample_pages if sample_pages > 0 else 0
-
-            # Less than 100 chars per page likely means scanned
-            is_scanned = avg_chars < 100
-            confidence = 1.0 - min(avg_chars / 1000, 1.0)
+            profile = self.inspector.inspect(pdf_path)
+            is_scanned, confidence = profile.is_scanned, profile.scan_confidence
 
             logger.info(
-                f"PDF analysis: {avg_chars:.0f} chars/page, "
+                f"PDF analysis: {profile.avg_sample_chars:.0f} chars/page, "
                 f"scanned={is_scanned}, confidence={confidence:.2f}"
             )
 
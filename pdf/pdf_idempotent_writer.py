@@ -95,29 +95,31 @@ class IdempotentPDFWriter:
             cursor = conn.cursor()
             timestamp = datetime.now().isoformat()
             
-            # Insert chunks
-            for i, chunk in enumerate(chunks):
-                chunk_id = f"{sha256}_{i}"
-                
-                cursor.execute("""
-                    INSERT OR REPLACE INTO documents (
-                        chunk_id, file_path, file_name, chunk_index,
-                        text_content, file_hash, sha256,
-                        char_count, word_count, pages,
-                        extraction_method, ocr_confidence,
-                        status, processed_at, metadata,
-                        attempt_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    chunk_id, file_path, file_name, i,
+            # Insert chunks in a single executemany
+            pages = metadata.get('pages', 0)
+            extraction_method = metadata.get('extraction_method', 'unknown')
+            ocr_confidence = metadata.get('ocr_confidence', 0.0)
+            metadata_text = str(metadata)
+            cursor.executemany("""
+                INSERT OR REPLACE INTO documents (
+                    chunk_id, file_path, file_name, chunk_index,
+                    text_content, file_hash, sha256,
+                    char_count, word_count, pages,
+                    extraction_method, ocr_confidence,
+                    status, processed_at, metadata,
+                    attempt_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    f"{sha256}_{i}", file_path, file_name, i,
                     chunk['text'], chunk.get('file_hash', sha256), sha256,
                     len(chunk['text']), len(chunk['text'].split()),
-                    metadata.get('pages', 0),
-                    metadata.get('extraction_method', 'unknown'),
-                    metadata.get('ocr_confidence', 0.0),
-                    'processed', timestamp, str(metadata),
+                    pages, extraction_method, ocr_confidence,
+                    'processed', timestamp, metadata_text,
                     0  # Reset attempt count on success
-                ))
+                )
+                for i, chunk in enumerate(chunks)
+            ])
             
             # Insert into content_unified for search integration
             cursor.execute("""
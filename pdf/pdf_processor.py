@@ -2,24 +2,45 @@
 PDF text extraction and chunking functionality
 """
 
+import os
+from collections.abc import Iterator
 from typing import Any
 
 from loguru import logger
 
+from shared.token_chunker import TokenChunker, get_token_chunker
+
 try:
     import PyPDF2
 except ImportError:
     PyPDF2 = None
 
+# Chunk to the embedding model's token window; "false" restores 900-char chunks
+TOKEN_CHUNKING = os.getenv("CHUNK_BY_TOKENS", "true").lower() == "true"
+
 
 class PDFProcessor:
     """Handles PDF text extraction and chunking operations"""
 
-    def __init__(self, chunk_size: int = 900, chunk_overlap: int = 100) -> None:
+    def __init__(
+        self,
+        chunk_size: int = 900,
+        chunk_overlap: int = 100,
+        token_chunker: TokenChunker | None = None,
+        token_chunking: bool = TOKEN_CHUNKING,
+    ) -> None:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.token_chunking = token_chunking
+        self._token_chunker = token_chunker
         # Logger is now imported globally from loguru
 
+    @property
+    def token_chunker(self) -> TokenChunker:
+        if self._token_chunker is None:
+            self._token_chunker = get_token_chunker()
+        return self._token_chunker
+
     def validate_dependencies(self) -> dict[str, Any]:
         """Validate required dependencies"""
         if PyPDF2 is None:
@@ -57,11 +78,20 @@ class PDFProcessor:
         except Exception as e:
             return {"success": False, "error": f"Text extraction failed: {str(e)}"}
 
+    def chunk_offsets(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) offsets of token-budgeted chunks without copying text"""
+        if not text:
+            return iter(())
+        return self.token_chunker.chunk_spans(text)
+
     def chunk_text(self, text: str) -> list[str]:
         """Chunk text into smaller pieces for processing"""
         if not text or not text.strip():
             return []
 
+        if self.token_chunking:
+            return [text[start:end] for start, end in self.chunk_offsets(text)]
+
         chunks = []
         text = text.strip()
         start = 0
@@ -72,6 +102,8 @@ class PDFProcessor:
 
             if chunk:
                 chunks.append(chunk)
+            if end >= len(text):
+                break
 
             start = self._calculate_next_start(start, end)
 
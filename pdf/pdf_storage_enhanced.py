@@ -64,87 +64,145 @@ class EnhancedPDFStorage:
         legal_metadata: dict = None,
         source: str = "upload",
     ) -> dict[str, Any]:
-        """Store PDF chunks with OCR and legal metadata"""
+        """Store PDF chunks with OCR and legal metadata.
+
+        All chunk rows and the content_unified row are written in one
+        transaction. Re-uploading the same file replaces its chunks and
+        reuses the existing content row.
+        """
         try:
             file_name = os.path.basename(pdf_path)
-            file_size = os.path.getsize(pdf_path)
-            modified_time = os.path.getmtime(pdf_path)
-
-            import sqlite3
-
-            with sqlite3.connect(self._get_db().db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                for chunk in chunks:
-                    # Extract chunk data
-                    chunk_id = chunk.get("chunk_id")
-                    text = chunk.get("text", "")
-                    chunk_index = chunk.get("chunk_index", 0)
-
-                    # Prepare legal metadata JSON
-                    metadata_json = None
-                    if legal_metadata or chunk.get("legal_metadata"):
-                        # Prefer chunk-level metadata, fall back to file-level
-                        meta = chunk.get("legal_metadata")
-                        if isinstance(meta, str):
-                            metadata_json = meta
-                        elif meta:
-                            metadata_json = json.dumps(meta)
-                        elif legal_metadata:
-                            metadata_json = json.dumps(legal_metadata)
-
-                    cursor.execute(
-                        """
-                        INSERT OR REPLACE INTO documents (
-                            chunk_id, file_path, file_name, chunk_index, text_content,
-                            char_count, file_size, file_hash, source_type, modified_time,
-                            processed_time, content_type, ready_for_embedding,
-                            legal_metadata, extraction_method, ocr_confidence
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'),
-                                  'document', 0, ?, ?, ?)
-                    """,
-                        (
-                            chunk_id,
-                            pdf_path,
-                            file_name,
-                            chunk_index,
-                            text,
-                            len(text),
-                            file_size,
-                            file_hash,
-                            source,
-                            modified_time,
-                            metadata_json,
-                            extraction_method or chunk.get("extraction_method"),
-                            ocr_confidence or chunk.get("ocr_confidence"),
-                        ),
+            stat = os.stat(pdf_path)
+            file_level_json = json.dumps(legal_metadata) if legal_metadata else None
+
+            # One pass: row tuples and the text pieces for the content row
+            rows = []
+            texts = []
+            for chunk in chunks:
+                text = chunk.get("text", "")
+                texts.append(text)
+
+                # Prefer chunk-level metadata, fall back to file-level
+                meta = chunk.get("legal_metadata")
+                if isinstance(meta, str):
+                    metadata_json = meta
+                else:
+                    metadata_json = json.dumps(meta) if meta else file_level_json
+
+                rows.append(
+                    (
+                        chunk.get("chunk_id"),
+                        pdf_path,
+                        file_name,
+                        chunk.get("chunk_index", 0),
+                        text,
+                        len(text),
+                        stat.st_size,
+                        file_hash,
+                        source,
+                        stat.st_mtime,
+                        metadata_json,
+                        extraction_method or chunk.get("extraction_method"),
+                        ocr_confidence or chunk.get("ocr_confidence"),
                     )
+                )
 
+            full_text = " ".join(texts)
+            content_hash = SimpleDB.content_hash("pdf", file_name, full_text)
+
+            conn = self._get_db().get_connection()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                sql, extra = self._chunk_insert_sql(conn)
+                if extra:
+                    rows = [row + (file_hash, *extra) for row in rows]
+                conn.executemany(sql, rows)
+                self._delete_stale_chunks(conn, file_hash, [row[0] for row in rows])
+                content_id, inserted = self._insert_content(
+                    conn, file_name, full_text, content_hash
+                )
                 conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
 
-                # Also add to content table for unified access
-                # Combine all chunks for the full document text
-                full_text = " ".join([chunk.get("text", "") for chunk in chunks])
-                content_id = self.db.add_content(
-                    content_type="pdf",
-                    title=file_name,
-                    content=full_text,
-                    source_path=pdf_path,
-                    metadata={
-                        "file_hash": file_hash,
-                        "extraction_method": extraction_method,
-                        "ocr_confidence": ocr_confidence,
-                        "legal_metadata": legal_metadata,
-                        "chunk_count": len(chunks),
-                    },
-                )
+            if inserted:
+                self.db.bump_content_generation()
 
             return {"success": True, "chunks_stored": len(chunks), "content_id": content_id}
 
         except Exception as e:
             return {"success": False, "error": f"Database storage failed: {str(e)}"}
 
+    @staticmethod
+    def _delete_stale_chunks(conn, file_hash: str, chunk_ids: list[str]) -> None:
+        """Drop this file's chunks that the new chunking did not write.
+
+        Covers a shorter re-chunking and a re-upload from another path (chunk
+        IDs embed the path). The kept IDs go through a temp table so the
+        delete is not bound by SQLite's parameter limit.
+        """
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS kept_chunks (chunk_id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM temp.kept_chunks")
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.kept_chunks VALUES (?)",
+            [(chunk_id,) for chunk_id in chunk_ids if chunk_id is not None],
+        )
+        conn.execute(
+            """
+            DELETE FROM documents
+            WHERE file_hash = ? AND chunk_id NOT IN (SELECT chunk_id FROM temp.kept_chunks)
+            """,
+            (file_hash,),
+        )
+        conn.execute("DROP TABLE temp.kept_chunks")
+
+    def _chunk_insert_sql(self, conn) -> tuple[str, tuple]:
+        """Chunk upsert plus extra per-row values.
+
+        When the documents table carries IdempotentPDFWriter's sha256/status
+        columns, rows are marked processed under the file hash so the writer
+        treats a re-upload as a duplicate.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(documents)")}
+        extra_columns, placeholders, extra = "", "", ()
+        if {"sha256", "status", "attempt_count"} <= columns:
+            # sha256 is bound to the file hash by the caller
+            extra_columns = ", sha256, status, attempt_count"
+            placeholders = ", ?, ?, ?"
+            extra = ("processed", 0)
+        sql = f"""
+            INSERT OR REPLACE INTO documents (
+                chunk_id, file_path, file_name, chunk_index, text_content,
+                char_count, file_size, file_hash, source_type, modified_time,
+                processed_time, content_type, ready_for_embedding,
+                legal_metadata, extraction_method, ocr_confidence{extra_columns}
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'),
+                      'document', 0, ?, ?, ?{placeholders})
+        """
+        return sql, extra
+
+    def _insert_content(self, conn, title: str, body: str, content_hash: str) -> tuple[str, bool]:
+        """SimpleDB.add_content inside the caller's transaction. Returns (id, inserted)."""
+        existing = conn.execute(
+            "SELECT id FROM content_unified WHERE sha256 = ?", (content_hash,)
+        ).fetchone()
+        if existing:
+            return str(existing[0]), False
+
+        source_id = abs(hash(content_hash)) % 2147483647
+        cursor = conn.execute(
+            """
+            INSERT INTO content_unified (
+                source_type, source_id, title, body, sha256, ready_for_embedding
+            ) VALUES ('pdf', ?, ?, ?, ?, 1)
+        """,
+            (source_id, title, body, content_hash),
+        )
+        return str(cursor.lastrowid), True
+
     def get_enhanced_pdf_stats(self) -> dict[str, Any]:
         """Get enhanced PDF statistics including OCR and legal metadata"""
         try:
@@ -10,10 +10,52 @@ from shared.simple_db import SimpleDB
 from shared.content_quality_scorer import ContentQualityScorer, ValidationStatus
 from loguru import logger
 
-def assess_all_content(limit: int = None, source_types: list = None):
+FETCH_BATCH_SIZE = 500
+UPDATE_BATCH_SIZE = 1000
+
+QUALITY_COLUMNS = [
+    'text_quality_score', 'alpha_ratio', 'symbol_ratio', 'unique_bigrams', 'english_dict_hits',
+    'chars_per_page', 'validation_status', 'pipeline_run_id', 'quality_failure_reasons',
+    'last_attempt_at',
+]
+
+
+def _stream_bodies(db: SimpleDB, records: list, batch_size: int = FETCH_BATCH_SIZE):
+    """Yield record bodies in selection order, reading one batch of rows at a time."""
+    for start in range(0, len(records), batch_size):
+        chunk = records[start:start + batch_size]
+        placeholders = ','.join('?' * len(chunk))
+        rows = db.fetch(
+            f"SELECT id, body FROM content_unified WHERE id IN ({placeholders})",
+            tuple(record['id'] for record in chunk),
+        )
+        bodies = {row['id']: row['body'] or '' for row in rows}
+        for record in chunk:
+            yield bodies.get(record['id'], '')
+
+
+def _write_updates(db: SimpleDB, updates: list) -> None:
+    """Apply a batch of quality updates in one transaction."""
+    if not updates:
+        return
+    set_sql = ', '.join(f"{column} = :{column}" for column in QUALITY_COLUMNS)
+    conn = db.get_connection()
+    try:
+        conn.executemany(f"UPDATE content_unified SET {set_sql} WHERE id = :id", updates)
+        conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to update {len(updates)} content rows: {e}")
+    finally:
+        conn.close()
+
+
+def assess_all_content(limit: int = None, source_types: list = None, workers: int = None):
     """
     Batch assess content quality for all documents.
     Updates database with quality metrics and validation status.
+
+    Bodies are read in batches and scored across worker processes; results
+    are written back with batched UPDATEs as they arrive.
     """
     
     db = SimpleDB()
@@ -32,14 +74,12 @@ def assess_all_content(limit: int = None, source_types: list = None):
     where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
     limit_sql = f"LIMIT {limit}" if limit else ""
     
-    # Get content to assess
+    # Get content to assess (bodies are streamed separately)
     query = f"""
-        SELECT id, source_type, title, body, 
-               LENGTH(COALESCE(body, '')) as text_length,
-               validation_status
+        SELECT id, source_type
         FROM content_unified 
         {where_sql}
-        ORDER BY text_length DESC 
+        ORDER BY LENGTH(COALESCE(body, '')) DESC 
         {limit_sql}
     """
     
@@ -66,11 +106,11 @@ def assess_all_content(limit: int = None, source_types: list = None):
     }
     
     batch_updates = []
+    metrics_stream = scorer.score_batch(_stream_bodies(db, content_records), page_count=1, workers=workers)
     
-    for i, record in enumerate(content_records, 1):
+    for i, (record, metrics) in enumerate(zip(content_records, metrics_stream), 1):
         content_id = record['id']
         source_type = record['source_type']
-        body = record['body'] or ''
         
         # Initialize source type stats
         if source_type not in stats['by_source_type']:
@@ -79,8 +119,8 @@ def assess_all_content(limit: int = None, source_types: list = None):
         stats['by_source_type'][source_type]['total'] += 1
         stats['processed'] += 1
         
-        # Skip empty content
-        if not body.strip():
+        if metrics.text_length == 0:
+            # Empty content
             stats['empty'] += 1
             stats['by_source_type'][source_type]['empty'] += 1
             
@@ -97,11 +137,7 @@ def assess_all_content(limit: int = None, source_types: list = None):
                 'quality_failure_reasons': 'empty_content',
                 'last_attempt_at': datetime.now().isoformat()
             })
-            continue
-        
-        # Score content quality
-        try:
-            metrics = scorer.score_content(body, page_count=1)  # Assume 1 page for now
+        else:
             status, description = scorer.classify_quality(metrics.quality_score)
             
             # Update statistics
@@ -114,7 +150,6 @@ def assess_all_content(limit: int = None, source_types: list = None):
                 stats['fail'] += 1
                 stats['by_source_type'][source_type]['fail'] += 1
             
-            # Prepare batch update
             batch_updates.append({
                 'id': content_id,
                 'text_quality_score': metrics.quality_score,
@@ -128,41 +163,16 @@ def assess_all_content(limit: int = None, source_types: list = None):
                 'quality_failure_reasons': '|'.join(metrics.failure_reasons) if metrics.failure_reasons else None,
                 'last_attempt_at': datetime.now().isoformat()
             })
-            
-        except Exception as e:
-            logger.error(f"Error scoring content {content_id}: {e}")
-            stats['fail'] += 1
-            stats['by_source_type'][source_type]['fail'] += 1
+        
+        if len(batch_updates) >= UPDATE_BATCH_SIZE:
+            _write_updates(db, batch_updates)
+            batch_updates = []
         
         # Progress indicator
-        if i % 100 == 0 or i == total_records:
+        if i % 1000 == 0 or i == total_records:
             print(f"  Progress: {i:,}/{total_records:,} ({i/total_records*100:.1f}%)")
     
-    # Batch update database
-    print(f"\\n💾 Updating database with quality metrics...")
-    
-    for update in batch_updates:
-        content_id = update.pop('id')
-        
-        # Build SET clause dynamically
-        set_clauses = []
-        values = []
-        for key, value in update.items():
-            set_clauses.append(f"{key} = ?")
-            values.append(value)
-        
-        values.append(content_id)  # For WHERE clause
-        
-        update_sql = f"""
-            UPDATE content_unified 
-            SET {', '.join(set_clauses)}
-            WHERE id = ?
-        """
-        
-        try:
-            db.execute(update_sql, values)
-        except Exception as e:
-            logger.error(f"Failed to update content {content_id}: {e}")
+    _write_updates(db, batch_updates)
     
     # Print final statistics
     print(f"\\n📊 Quality Assessment Results:")
@@ -192,6 +202,7 @@ def main():
     parser.add_argument('--source-types', nargs='+', help="Filter by source types", 
                        choices=['pdf', 'email', 'email_message', 'document', 'upload'])
     parser.add_argument('--pdfs-only', action='store_true', help="Process only PDF documents")
+    parser.add_argument('--workers', type=int, help="Scoring processes (default: cpu count - 1)")
     
     args = parser.parse_args()
     
@@ -201,7 +212,7 @@ def main():
     elif args.source_types:
         source_types = args.source_types
     
-    assess_all_content(limit=args.limit, source_types=source_types)
+    assess_all_content(limit=args.limit, source_types=source_types, workers=args.workers)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -20,7 +20,16 @@ def get_search_intelligence_service():
     return _search_intelligence_service
 
 
-__all__ = ["get_search_intelligence_service", "search"]
+__all__ = [
+    "get_search_intelligence_service",
+    "search",
+    "SearchResultCache",
+    "get_search_cache",
+    "ContentClusterService",
+    "get_cluster_service",
+]
 
 # Basic search functionality
 from .basic_search import search
+from .clustering import ContentClusterService, get_cluster_service
+from .search_cache import SearchResultCache, get_search_cache
@@ -13,6 +13,8 @@ from shared.simple_db import SimpleDB
 from utilities.embeddings import get_embedding_service
 from utilities.vector_store import get_vector_store
 
+from .search_cache import get_search_cache
+
 
 def search(
     query: str,
@@ -20,6 +22,7 @@ def search(
     filters: dict | None = None,
     keyword_weight: float = 0.4,
     semantic_weight: float = 0.6,
+    use_cache: bool = True,
 ) -> list[dict[str, Any]]:
     """Coordinate keyword + semantic search with RRF merging.
     
@@ -29,11 +32,35 @@ def search(
         filters: Optional filters (date, content_type, etc.)
         keyword_weight: Weight for keyword results in RRF (0-1)
         semantic_weight: Weight for semantic results in RRF (0-1)
+        use_cache: Serve repeated queries from the search result cache
     
     Returns:
         Merged and ranked search results
     """
     logger.debug(f"Search request: '{query}' limit={limit}")
+
+    cache = None
+    cache_key = None
+    generation = None
+    if use_cache:
+        try:
+            cache = get_search_cache()
+            # Captured before searching so results can't outlive a concurrent write
+            generation = cache.current_generation()
+            cache_key = cache.make_key(
+                query,
+                limit=limit,
+                filters=filters,
+                keyword_weight=keyword_weight,
+                semantic_weight=semantic_weight,
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Search cache hit: '{query}'")
+                return cached
+        except Exception as e:
+            logger.debug(f"Search cache unavailable: {e}")
+            cache = None
     
     # Get keyword results
     keyword_results = _keyword_search(query, limit * 2, filters)
@@ -41,11 +68,13 @@ def search(
     
     # Get semantic results (with graceful fallback)
     semantic_results = []
+    degraded = False
     if vector_store_available():
         try:
             semantic_results = semantic_search(query, limit * 2, filters)
             logger.debug(f"Semantic search returned {len(semantic_results)} results")
         except Exception as e:
+            degraded = True
             logger.warning(f"Semantic search failed, using keyword only: {e}")
     else:
         logger.debug("Vector store unavailable, using keyword search only")
@@ -59,8 +88,17 @@ def search(
     else:
         merged_results = keyword_results
         logger.debug("Using keyword results only")
-    
-    return merged_results[:limit]
+
+    results = merged_results[:limit]
+
+    # Don't pin a keyword-only fallback in the cache
+    if cache is not None and not degraded:
+        try:
+            cache.put(cache_key, results, query=query, generation=generation)
+        except Exception as e:
+            logger.debug(f"Search cache store failed: {e}")
+
+    return results
 
 
 def semantic_search(
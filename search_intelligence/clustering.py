@@ -0,0 +1,371 @@
+"""
+Incremental content clustering.
+
+Keeps a fitted TF-IDF vectorizer, the corpus matrix and DBSCAN labels on disk.
+New documents are transformed with the existing vocabulary and attached to the
+cluster of their most similar labeled neighbour, so routine calls only touch
+documents added since the last refresh. A full refit + DBSCAN runs only when
+drift (unassignable new documents, corpus growth) passes a threshold or the
+clustering parameters change.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import joblib
+import numpy as np
+from loguru import logger
+from scipy import sparse
+from sklearn.cluster import DBSCAN
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from shared.simple_db import SimpleDB
+
+DEFAULT_MODEL_DIR = "data/system_data/cache/clustering"
+PAGE_SIZE = 1000
+ASSIGN_CHUNK = 256  # new documents compared against the corpus per sparse product
+MIN_VOCAB_COVERAGE = 0.5  # below this, a new document is mostly out-of-vocabulary
+
+
+class ContentClusterService:
+    """Persisted TF-IDF + DBSCAN clustering with incremental assignment."""
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        model_dir: str | None = None,
+        max_features: int = 5000,
+        drift_threshold: float | None = None,
+        max_growth: float = 0.5,
+    ) -> None:
+        """Initialize the cluster service.
+
+        Args:
+            db_path: SQLite database path (SimpleDB default if None)
+            model_dir: Where the vectorizer, matrix and labels are kept
+                (env CLUSTER_MODEL_DIR overrides the default)
+            max_features: TF-IDF vocabulary size for full fits
+            drift_threshold: Recluster when unassigned new documents exceed this
+                fraction of the corpus (env CLUSTER_DRIFT_THRESHOLD, default 0.1)
+            max_growth: Recluster when the corpus has grown by this fraction since the fit
+        """
+        self.db = SimpleDB(db_path) if db_path else SimpleDB()
+        self.model_dir = Path(model_dir or os.getenv("CLUSTER_MODEL_DIR", DEFAULT_MODEL_DIR))
+        self.max_features = max_features
+        self.drift_threshold = (
+            drift_threshold
+            if drift_threshold is not None
+            else float(os.getenv("CLUSTER_DRIFT_THRESHOLD", "0.1"))
+        )
+        self.max_growth = max_growth
+        self._lock = threading.RLock()
+
+        self.vectorizer: TfidfVectorizer | None = None
+        self.matrix: sparse.csr_matrix | None = None
+        self.doc_ids: list[int] = []
+        self.labels = np.zeros(0, dtype=np.int64)
+        self.meta: dict[str, Any] = {}
+        self.stats = {"full_fits": 0, "incremental_updates": 0, "assigned": 0, "unassigned": 0}
+        self._load()
+
+    # --- Persistence --------------------------------------------------------
+    def _paths(self) -> dict[str, Path]:
+        return {
+            "vectorizer": self.model_dir / "vectorizer.joblib",
+            "matrix": self.model_dir / "matrix.npz",
+            "labels": self.model_dir / "labels.npy",
+            "meta": self.model_dir / "meta.json",
+        }
+
+    def _load(self) -> None:
+        paths = self._paths()
+        if not all(p.exists() for p in paths.values()):
+            return
+        try:
+            meta = json.loads(paths["meta"].read_text())
+            if meta.get("db_path") != str(self.db.db_path):
+                logger.info(f"Cluster model in {self.model_dir} belongs to another database; ignoring")
+                return
+            self.vectorizer = joblib.load(paths["vectorizer"])
+            self.matrix = sparse.load_npz(paths["matrix"]).tocsr()
+            self.labels = np.load(paths["labels"])
+            self.doc_ids = meta.pop("doc_ids")
+            self.meta = meta
+            logger.debug(f"Loaded cluster model: {len(self.doc_ids)} docs, fitted {meta.get('fitted_at')}")
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cluster model in {self.model_dir}: {e}")
+            self.vectorizer, self.matrix, self.doc_ids, self.meta = None, None, [], {}
+
+    def _save(self) -> None:
+        paths = self._paths()
+        self.model_dir.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self.vectorizer, paths["vectorizer"])
+        sparse.save_npz(paths["matrix"], self.matrix)
+        np.save(paths["labels"], self.labels)
+        # Meta last: it is the marker that the other files are complete
+        tmp = paths["meta"].with_suffix(".tmp")
+        tmp.write_text(json.dumps({**self.meta, "doc_ids": self.doc_ids}))
+        os.replace(tmp, paths["meta"])
+
+    # --- Corpus access ------------------------------------------------------
+    def _iter_documents(self, after_id: int = 0):
+        """Keyset-paged (id, body) pairs with non-empty bodies."""
+        last_id = after_id
+        while True:
+            rows = self.db.fetch(
+                """
+                SELECT id, body FROM content_unified
+                WHERE id > ? AND body IS NOT NULL AND body != ''
+                ORDER BY id LIMIT ?
+                """,
+                (last_id, PAGE_SIZE),
+            )
+            if not rows:
+                return
+            yield from ((row["id"], row["body"]) for row in rows)
+            last_id = rows[-1]["id"]
+
+    # --- Fitting ------------------------------------------------------------
+    def full_recluster(self, threshold: float = 0.7, min_samples: int = 2) -> dict[str, Any]:
+        """Refit TF-IDF and DBSCAN over the whole corpus and persist the model."""
+        with self._lock:
+            start = time.perf_counter()
+            docs = list(self._iter_documents())
+            self.doc_ids = [doc_id for doc_id, _ in docs]
+            self.vectorizer = TfidfVectorizer(max_features=self.max_features, stop_words="english")
+
+            if len(docs) >= min_samples:
+                self.matrix = self.vectorizer.fit_transform([body for _, body in docs]).tocsr()
+                # Convert similarity threshold to cosine distance
+                self.labels = DBSCAN(eps=1 - threshold, min_samples=min_samples, metric="cosine").fit_predict(
+                    self.matrix
+                )
+            else:
+                # Too few documents to cluster; keep a vocabulary so new ones can be transformed
+                bodies = [body for _, body in docs]
+                self.vectorizer.fit(bodies or ["empty"])
+                self.matrix = self.vectorizer.transform(bodies).tocsr()
+                self.labels = np.full(len(docs), -1, dtype=np.int64)
+
+            self.meta = {
+                "db_path": str(self.db.db_path),
+                "threshold": threshold,
+                "min_samples": min_samples,
+                "fitted_at": time.time(),
+                "docs_at_fit": len(docs),
+                "max_id": max(self.doc_ids, default=0),
+                "unassigned_since_fit": 0,
+                "next_label": int(self.labels.max()) + 1 if len(self.labels) else 0,
+            }
+            self._save()
+            self.stats["full_fits"] += 1
+            logger.info(
+                f"Full recluster: {len(docs)} docs, {self.meta['next_label']} clusters "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+            return self.drift()
+
+    def drift(self) -> dict[str, Any]:
+        """Drift indicators since the last full fit."""
+        total = max(len(self.doc_ids), 1)
+        docs_at_fit = max(self.meta.get("docs_at_fit", 0), 1)
+        unassigned = self.meta.get("unassigned_since_fit", 0) / total
+        growth = (len(self.doc_ids) - self.meta.get("docs_at_fit", 0)) / docs_at_fit
+        return {
+            "documents": len(self.doc_ids),
+            "unassigned_ratio": round(unassigned, 4),
+            "growth": round(growth, 4),
+            "needs_recluster": unassigned > self.drift_threshold or growth > self.max_growth,
+        }
+
+    def _vocab_coverage(self, texts: list[str]) -> np.ndarray:
+        """Fraction of each text's terms that the fitted vocabulary knows."""
+        analyzer = self.vectorizer.build_analyzer()
+        vocabulary = self.vectorizer.vocabulary_
+        coverage = np.zeros(len(texts))
+        for i, text in enumerate(texts):
+            terms = analyzer(text)
+            if terms:
+                coverage[i] = sum(term in vocabulary for term in terms) / len(terms)
+        return coverage
+
+    def _assign(self, new_matrix: sparse.csr_matrix, threshold: float, coverage: np.ndarray) -> np.ndarray:
+        """Label of each new row's most similar labeled neighbour (or -1).
+
+        Mostly out-of-vocabulary documents stay unassigned (they count as drift)
+        rather than being matched on the few terms the old vocabulary knows.
+        """
+        labels = np.full(new_matrix.shape[0], -1, dtype=np.int64)
+        labeled = np.flatnonzero(self.labels >= 0)
+        if not labeled.size or not new_matrix.shape[0]:
+            return labels
+        labeled_t = self.matrix[labeled].T.tocsc()
+        for start in range(0, new_matrix.shape[0], ASSIGN_CHUNK):
+            # Rows are L2-normalized, so the sparse dot product is cosine similarity
+            similarity = (new_matrix[start:start + ASSIGN_CHUNK] @ labeled_t).tocsr()
+            best = np.asarray(similarity.argmax(axis=1)).ravel()
+            best_sim = similarity.max(axis=1).toarray().ravel()
+            matched = np.flatnonzero(best_sim >= threshold)
+            labels[start + matched] = self.labels[labeled[best[matched]]]
+        labels[coverage < MIN_VOCAB_COVERAGE] = -1
+        return labels
+
+    def refresh(self, threshold: float = 0.7, min_samples: int = 2) -> dict[str, Any]:
+        """Bring the model up to date, refitting only when needed.
+
+        Returns:
+            Drift indicators plus which action was taken
+        """
+        with self._lock:
+            params_changed = (
+                self.meta.get("threshold") != threshold or self.meta.get("min_samples") != min_samples
+            )
+            if self.vectorizer is None or params_changed:
+                return {**self.full_recluster(threshold, min_samples), "action": "full"}
+
+            new_docs = list(self._iter_documents(after_id=self.meta.get("max_id", 0)))
+            if new_docs:
+                bodies = [body for _, body in new_docs]
+                new_matrix = self.vectorizer.transform(bodies).tocsr()
+                new_labels = self._assign(new_matrix, threshold, self._vocab_coverage(bodies))
+                self.matrix = sparse.vstack([self.matrix, new_matrix]).tocsr()
+                self.labels = np.concatenate([self.labels, new_labels])
+                self.doc_ids.extend(doc_id for doc_id, _ in new_docs)
+                unassigned = int((new_labels < 0).sum())
+                self.meta["max_id"] = max(self.doc_ids)
+                self.meta["unassigned_since_fit"] = self.meta.get("unassigned_since_fit", 0) + unassigned
+                self.stats["incremental_updates"] += 1
+                self.stats["assigned"] += len(new_docs) - unassigned
+                self.stats["unassigned"] += unassigned
+
+            drift = self.drift()
+            if drift["needs_recluster"]:
+                logger.info(f"Cluster drift {drift}; reclustering")
+                return {**self.full_recluster(threshold, min_samples), "action": "full"}
+            if new_docs:
+                self._save()
+            return {**drift, "action": "incremental" if new_docs else "none", "new_documents": len(new_docs)}
+
+    # --- Queries ------------------------------------------------------------
+    def get_clusters(self, threshold: float = 0.7, min_samples: int = 2, limit: int = 100) -> list[dict[str, Any]]:
+        """Clusters largest first, listing at most `limit` documents in total."""
+        with self._lock:
+            self.refresh(threshold, min_samples)
+            members: dict[int, list[int]] = {}
+            for doc_id, label in zip(self.doc_ids, self.labels.tolist()):
+                if label >= 0:
+                    members.setdefault(label, []).append(doc_id)
+
+        ordered = sorted(members.items(), key=lambda kv: len(kv[1]), reverse=True)
+        selected = []
+        budget = limit
+        for label, ids in ordered:
+            if budget <= 0:
+                break
+            selected.append((label, ids[:budget]))
+            budget -= len(selected[-1][1])
+
+        info = self.get_document_info([doc_id for _, ids in selected for doc_id in ids])
+        result = []
+        for label, ids in selected:
+            documents = [
+                {"content_id": str(doc_id), "title": info[doc_id]["title"], "content_type": info[doc_id]["source_type"]}
+                for doc_id in ids
+                if doc_id in info
+            ]
+            if documents:
+                result.append({"cluster_id": int(label), "size": len(members[label]), "documents": documents})
+        return result
+
+    def _similar_pairs(
+        self, rows: np.ndarray, cols: np.ndarray, threshold: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(row, col) corpus indices with cosine similarity >= threshold, never densified."""
+        found_rows, found_cols = [], []
+        cols_t = self.matrix[cols].T.tocsc()
+        for start in range(0, len(rows), ASSIGN_CHUNK):
+            chunk = rows[start:start + ASSIGN_CHUNK]
+            similarity = (self.matrix[chunk] @ cols_t).tocoo()
+            keep = similarity.data >= threshold
+            found_rows.append(chunk[similarity.row[keep]])
+            found_cols.append(cols[similarity.col[keep]])
+        if not found_rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(found_rows), np.concatenate(found_cols)
+
+    def near_duplicates(self, similarity_threshold: float = 0.95) -> list[list[int]]:
+        """Groups of near-identical documents.
+
+        When similarity_threshold is at least the clustering threshold, clustered
+        pairs above it share a cluster, so clustered rows are only compared within
+        their cluster. Noise and unassigned rows (DBSCAN with min_samples > 2, or
+        new documents that only resemble each other) are compared with every row.
+        """
+        with self._lock:
+            self.refresh(self.meta.get("threshold", 0.7), self.meta.get("min_samples", 2))
+            n = len(self.doc_ids)
+            everything = np.arange(n)
+            if similarity_threshold >= self.meta["threshold"]:
+                pairs = [
+                    self._similar_pairs(block, block, similarity_threshold)
+                    for label in np.unique(self.labels[self.labels >= 0])
+                    if len(block := np.flatnonzero(self.labels == label)) > 1
+                ]
+                unlabeled = np.flatnonzero(self.labels < 0)
+                if unlabeled.size:
+                    pairs.append(self._similar_pairs(unlabeled, everything, similarity_threshold))
+            else:
+                pairs = [self._similar_pairs(everything, everything, similarity_threshold)]
+            if not pairs:
+                return []
+
+            rows = np.concatenate([r for r, _ in pairs])
+            cols = np.concatenate([c for _, c in pairs])
+            adjacency = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n)
+            )
+            adjacency = (adjacency + adjacency.T).tocsr()  # Unlabeled-vs-all is one-sided
+            adjacency.sort_indices()
+
+            groups = []
+            assigned = np.zeros(n, dtype=bool)
+            for i in range(n):
+                if assigned[i]:
+                    continue
+                neighbours = adjacency.indices[adjacency.indptr[i]:adjacency.indptr[i + 1]]
+                close = neighbours[~assigned[neighbours]]
+                if len(close) > 1:
+                    assigned[close] = True
+                    groups.append([self.doc_ids[j] for j in close])
+            return groups
+
+    def get_document_info(self, ids: list[int]) -> dict[int, dict]:
+        """id -> {id, title, source_type, created_at} for existing documents."""
+        info = {}
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetch(
+                f"SELECT id, title, source_type, created_at FROM content_unified WHERE id IN ({placeholders})", tuple(chunk)
+            )
+            info.update({row["id"]: row for row in rows})
+        return info
+
+    def get_stats(self) -> dict[str, Any]:
+        return {**self.stats, **self.drift(), "fitted_at": self.meta.get("fitted_at")}
+
+
+# Singleton instances per database
+_cluster_services: dict[str, ContentClusterService] = {}
+
+
+def get_cluster_service(db_path: str | None = None) -> ContentClusterService:
+    """Get the cluster service for a database (one per path)."""
+    key = db_path or ""
+    if key not in _cluster_services:
+        _cluster_services[key] = ContentClusterService(db_path=db_path)
+    return _cluster_services[key]
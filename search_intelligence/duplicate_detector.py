@@ -231,13 +231,16 @@ class DuplicateDetector:
         if len(docs_to_check) < 2:
             return []
 
-        # Get embeddings for documents
+        # Get embeddings for documents - stored vectors in batched requests
         doc_ids = []
         embeddings = []
+        stored = self._get_stored_embeddings([doc["id"] for doc in docs_to_check])
 
         for doc in docs_to_check:
             doc_id = doc["id"]
-            embedding = self._get_document_embedding(doc)
+            embedding = stored.get(str(doc_id))
+            if embedding is None:
+                embedding = self._get_document_embedding(doc)
 
             if embedding is not None:
                 doc_ids.append(doc_id)
@@ -265,6 +268,19 @@ class DuplicateDetector:
 
         return duplicate_groups
 
+    def _get_stored_embeddings(self, doc_ids: list[str]) -> dict[str, np.ndarray]:
+        """Fetch existing embeddings for many documents in batched requests."""
+        try:
+            points = self.vector_store.get_many(doc_ids, with_payload=False)
+        except Exception as e:
+            logger.warning(f"Batched embedding fetch failed, falling back to per-document: {e}")
+            return {}
+        return {
+            str(point["id"]): np.array(point["vector"])
+            for point in points
+            if point.get("vector") is not None
+        }
+
     def _get_document_embedding(self, doc: dict) -> np.ndarray | None:
         """Get or generate embedding for document."""
         doc_id = doc["id"]
@@ -13,11 +13,10 @@ from typing import Any
 
 import numpy as np
 from loguru import logger
-from sklearn.cluster import DBSCAN
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from entity import EntityService
+from search_intelligence.clustering import get_cluster_service
 from shared.simple_db import SimpleDB
 from summarization import get_document_summarizer
 from utilities.embeddings import get_embedding_service
@@ -54,6 +53,7 @@ class SearchIntelligenceService:
             raise RuntimeError(f"Cannot initialize SearchIntelligenceService without embedding service: {e}")
             
         self.summarizer = get_document_summarizer()
+        self.cluster_service = get_cluster_service(db_path)
 
         # Query expansion configuration
         self.query_synonyms = {
@@ -501,63 +501,14 @@ class SearchIntelligenceService:
     def cluster_similar_content(
         self, threshold: float = 0.7, min_samples: int = 2, limit: int = 100
     ) -> list[dict[str, Any]]:
-        """Cluster similar content using DBSCAN"""
-        try:
-            # Get documents
-            docs = self.db.search_content("", limit=limit)
-            if len(docs) < min_samples:
-                return []
-
-            # Extract content
-            texts = []
-            doc_ids = []
-            for doc in docs:
-                content = doc.get("content", "")
-                if content:
-                    texts.append(content)
-                    doc_ids.append(doc["content_id"])
-
-            if len(texts) < min_samples:
-                return []
-
-            # Vectorize using TF-IDF
-            vectorizer = TfidfVectorizer(max_features=1000, stop_words="english")
-            X = vectorizer.fit_transform(texts)
-
-            # Apply DBSCAN with cosine distance
-            # Convert threshold to distance (1 - similarity)
-            eps = 1 - threshold
-            clustering = DBSCAN(eps=eps, min_samples=min_samples, metric="cosine")
-            labels = clustering.fit_predict(X)
-
-            # Group documents by cluster
-            clusters = {}
-            for i, label in enumerate(labels):
-                if label == -1:  # Noise
-                    continue
-
-                if label not in clusters:
-                    clusters[label] = []
-
-                clusters[label].append(
-                    {
-                        "content_id": doc_ids[i],
-                        "title": docs[i].get("title", ""),
-                        "content_type": docs[i].get("content_type"),
-                    }
-                )
-
-            # Format results
-            result = []
-            for cluster_id, members in clusters.items():
-                result.append(
-                    {"cluster_id": int(cluster_id), "size": len(members), "documents": members}
-                )
-
-            # Sort by cluster size
-            result.sort(key=lambda x: x["size"], reverse=True)
-            return result
+        """Cluster similar content using DBSCAN.
 
+        Backed by the persisted ContentClusterService: only documents added since
+        the last call are vectorized, and DBSCAN reruns only on drift or when
+        threshold/min_samples change. limit caps the documents listed.
+        """
+        try:
+            return self.cluster_service.get_clusters(threshold=threshold, min_samples=min_samples, limit=limit)
         except Exception as e:
             logger.error(f"Content clustering failed: {e}")
             return []
@@ -571,7 +522,7 @@ class SearchIntelligenceService:
             # Phase 1: Hash-based exact duplicates
             hash_groups = {}
             for doc in docs:
-                content = doc.get("content", "")
+                content = doc.get("body", "")
                 if not content:
                     continue
 
@@ -593,64 +544,40 @@ class SearchIntelligenceService:
                             "count": len(group),
                             "documents": [
                                 {
-                                    "content_id": d["content_id"],
+                                    "content_id": str(d["id"]),
                                     "title": d.get("title", ""),
-                                    "created_time": d.get("created_time"),
+                                    "created_time": d.get("created_at"),
                                 }
                                 for d in group
                             ],
                         }
                     )
 
-            # Phase 2: Semantic near-duplicates (only for unique hashes)
-            unique_docs = [group[0] for group in hash_groups.values()]
-
-            if len(unique_docs) > 1:
-                # Vectorize content
-                texts = [d.get("content", "") for d in unique_docs]
-                vectorizer = TfidfVectorizer(max_features=500, stop_words="english")
-                X = vectorizer.fit_transform(texts)
-
-                # Calculate pairwise similarity
-                similarities = cosine_similarity(X)
-
-                # Find near-duplicates
-                near_dupes = []
-                processed = set()
-
-                for i in range(len(unique_docs)):
-                    if i in processed:
-                        continue
-
-                    similar_group = [unique_docs[i]]
-                    processed.add(i)
-
-                    for j in range(i + 1, len(unique_docs)):
-                        if j in processed:
-                            continue
-
-                        if similarities[i][j] >= similarity_threshold:
-                            similar_group.append(unique_docs[j])
-                            processed.add(j)
-
-                    if len(similar_group) > 1:
-                        near_dupes.append(
-                            {
-                                "type": "semantic",
-                                "similarity": float(similarities[i][j]),
-                                "count": len(similar_group),
-                                "documents": [
-                                    {
-                                        "content_id": d["content_id"],
-                                        "title": d.get("title", ""),
-                                        "created_time": d.get("created_time"),
-                                    }
-                                    for d in similar_group
-                                ],
-                            }
-                        )
-
-                duplicates.extend(near_dupes)
+            # Phase 2: Semantic near-duplicates from the persisted TF-IDF matrix
+            # (clustered rows are compared within their cluster; noise and
+            # unassigned rows against every row)
+            exact_ids = {d["content_id"] for group in duplicates for d in group["documents"][1:]}
+            groups = self.cluster_service.near_duplicates(similarity_threshold)
+            group_ids = [[i for i in group if str(i) not in exact_ids] for group in groups]
+            info = self.cluster_service.get_document_info([i for group in group_ids for i in group])
+            for group in group_ids:
+                members = [info[i] for i in group if i in info]
+                if len(members) > 1:
+                    duplicates.append(
+                        {
+                            "type": "semantic",
+                            "similarity": similarity_threshold,
+                            "count": len(members),
+                            "documents": [
+                                {
+                                    "content_id": str(d["id"]),
+                                    "title": d.get("title", ""),
+                                    "created_time": d.get("created_at"),
+                                }
+                                for d in members
+                            ],
+                        }
+                    )
 
             return duplicates
 
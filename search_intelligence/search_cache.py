@@ -0,0 +1,210 @@
+"""
+Search Result Cache
+
+Two-tier cache in front of hybrid search: an in-process LRU for repeated
+dashboard queries and the SQLite search_result_cache table so results survive
+restarts. Every entry is stamped with the content generation; any write to
+content_unified or the vector store bumps the generation and makes older
+entries unreachable.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+
+from shared.simple_db import SimpleDB
+
+
+class SearchResultCache:
+    """LRU + SQLite cache for search results, invalidated by content generation."""
+
+    def __init__(
+        self,
+        db_path: str | None = None,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+        generation_check_interval: float | None = None,
+        persist: bool = True,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite database path (uses SimpleDB default if None)
+            max_entries: LRU capacity (env SEARCH_CACHE_SIZE, default 256)
+            ttl_seconds: Entry lifetime (env SEARCH_CACHE_TTL_S, default 3600)
+            generation_check_interval: Seconds between generation reads from SQLite.
+                Writes made by this process are seen immediately; writes from other
+                processes are seen within this interval (env SEARCH_CACHE_CHECK_S, default 1.0)
+            persist: Whether to use the SQLite tier
+        """
+        self.db = SimpleDB(db_path) if db_path else SimpleDB()
+        self.max_entries = max_entries or int(os.getenv("SEARCH_CACHE_SIZE", "256"))
+        self.ttl_seconds = ttl_seconds or float(os.getenv("SEARCH_CACHE_TTL_S", "3600"))
+        if generation_check_interval is None:
+            generation_check_interval = float(os.getenv("SEARCH_CACHE_CHECK_S", "1.0"))
+        self.generation_check_interval = generation_check_interval
+        self.persist = persist
+
+        self._lock = threading.Lock()
+        # key -> (generation, expires_at, results)
+        self._entries: OrderedDict[str, tuple[int, float, list[dict]]] = OrderedDict()
+        self._generation = -1
+        self._generation_checked_at = 0.0
+        self._seen_local_bumps = -1
+
+        self.stats = {
+            "memory_hits": 0,
+            "sqlite_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    @staticmethod
+    def make_key(query: str, **params: Any) -> str:
+        """Build a stable cache key from the query and search parameters."""
+        key_data = {"query": query.strip(), "params": params}
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True, default=str).encode()).hexdigest()
+
+    def current_generation(self) -> int:
+        """Content generation, re-read from SQLite only when it may have changed."""
+        now = time.monotonic()
+        local_bumps = SimpleDB.local_generation_bumps
+        if (
+            local_bumps != self._seen_local_bumps
+            or now - self._generation_checked_at >= self.generation_check_interval
+        ):
+            try:
+                generation = self.db.get_content_generation()
+            except Exception as e:
+                logger.debug(f"Content generation unavailable: {e}")
+                generation = self._generation
+            if generation != self._generation:
+                self._on_generation_change(generation)
+            self._generation_checked_at = now
+            self._seen_local_bumps = local_bumps
+        return self._generation
+
+    def _on_generation_change(self, generation: int) -> None:
+        """Drop every in-memory entry from an older generation."""
+        with self._lock:
+            if self._entries:
+                self.stats["invalidations"] += len(self._entries)
+                self._entries.clear()
+            self._generation = generation
+
+    def get(self, key: str) -> list[dict] | None:
+        """Return cached results for key, or None on miss."""
+        generation = self.current_generation()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_generation, expires_at, results = entry
+                if entry_generation == generation and expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return [dict(r) for r in results]
+                del self._entries[key]
+
+        if self.persist:
+            try:
+                results = self.db.load_search_cache_entry(key, generation)
+            except Exception as e:
+                logger.debug(f"SQLite search cache read failed: {e}")
+                results = None
+            if results is not None:
+                self._remember(key, generation, results)
+                self.stats["sqlite_hits"] += 1
+                return [dict(r) for r in results]
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        results: list[dict],
+        query: str | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store results for key.
+
+        Args:
+            generation: Content generation read before the search ran. If content
+                changed while it ran, the results may be stale and are not stored.
+                Defaults to the current generation.
+        """
+        current = self.current_generation()
+        if generation is None:
+            generation = current
+        elif generation != current:
+            logger.debug("Content changed during search; not caching its results")
+            return
+        results = [dict(r) for r in results]
+        self._remember(key, generation, results)
+        self.stats["stores"] += 1
+
+        if self.persist:
+            try:
+                self.db.store_search_cache_entry(
+                    key, generation, results, query=query, ttl_seconds=self.ttl_seconds
+                )
+            except Exception as e:
+                logger.debug(f"SQLite search cache write failed: {e}")
+
+    def _remember(self, key: str, generation: int, results: list[dict]) -> None:
+        with self._lock:
+            self._entries[key] = (generation, time.time() + self.ttl_seconds, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> int:
+        """Drop all entries from both tiers. Returns SQLite rows removed."""
+        with self._lock:
+            self._entries.clear()
+        if not self.persist:
+            return 0
+        try:
+            return self.db.purge_search_cache()
+        except Exception as e:
+            logger.warning(f"Could not clear SQLite search cache: {e}")
+            return 0
+
+    def purge_stale(self) -> int:
+        """Delete SQLite rows from older generations or past their TTL."""
+        if not self.persist:
+            return 0
+        return self.db.purge_search_cache(keep_generation=self.current_generation())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Cache hit/miss counters plus current size and generation."""
+        lookups = self.stats["memory_hits"] + self.stats["sqlite_hits"] + self.stats["misses"]
+        hits = self.stats["memory_hits"] + self.stats["sqlite_hits"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "generation": self._generation,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+
+# Singleton instance
+_search_cache: SearchResultCache | None = None
+
+
+def get_search_cache() -> SearchResultCache:
+    """Get or create the process-wide search result cache."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchResultCache()
+    return _search_cache
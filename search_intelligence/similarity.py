@@ -87,8 +87,13 @@ class DocumentSimilarityAnalyzer:
         vectors = []
         valid_ids = []
 
+        # One retrieve per batch for stored vectors; generate only the rest
+        stored = self._get_stored_vectors(doc_ids)
+
         for doc_id in doc_ids:
-            vector = self._get_document_vector(doc_id)
+            vector = stored.get(str(doc_id))
+            if vector is None:
+                vector = self._get_document_vector(doc_id)
             if vector is not None:
                 vectors.append(vector)
                 valid_ids.append(doc_id)
@@ -102,6 +107,19 @@ class DocumentSimilarityAnalyzer:
 
         return similarity_matrix, valid_ids
 
+    def _get_stored_vectors(self, doc_ids: list[str]) -> dict[str, np.ndarray]:
+        """Fetch existing vectors for many documents in batched requests."""
+        try:
+            points = self.vector_store.get_many(doc_ids, with_payload=False)
+        except Exception as e:
+            logger.warning(f"Batched vector fetch failed, falling back to per-document: {e}")
+            return {}
+        return {
+            str(point["id"]): np.array(point["vector"])
+            for point in points
+            if point.get("vector") is not None
+        }
+
     def _get_document_vector(self, doc_id: str) -> np.ndarray | None:
         """Get or generate document vector."""
         try:
@@ -5,10 +5,54 @@ Implements the quality scoring system with hard gates for OCR validation.
 
 import re
 import math
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from typing import Dict, Tuple, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+from .process_pool import default_workers, parallel_map
+
+# Character classes for the ratio gates (counted from one character histogram)
+ALPHA_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+DIGIT_CHARS = frozenset("0123456789")
+PUNCT_CHARS = frozenset(".,;:!?()[]{}\"'-")
+SYMBOL_CHARS = frozenset("&=%£€<>©#@$*+^~|\\")
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Common English words for basic dictionary check (expanded for better validation)
+ENGLISH_WORDS = frozenset({
+    # Common English words
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one',
+    'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see',
+    'two', 'way', 'who', 'its', 'did', 'yes', 'she', 'may', 'say', 'use', 'own', 'under',
+    'this', 'that', 'with', 'have', 'from', 'they', 'will', 'been', 'each', 'which', 'their',
+    'said', 'if', 'up', 'out', 'many', 'then', 'them', 'these', 'so', 'some', 'her', 'would',
+    'make', 'like', 'time', 'very', 'when', 'come', 'its', 'now', 'over', 'think', 'also',
+    'back', 'after', 'first', 'well', 'year', 'work', 'where', 'get', 'through', 'much',
+    'before', 'right', 'too', 'any', 'same', 'should', 'those', 'people', 'take', 'state',
+    'good', 'between', 'never', 'world', 'here', 'while', 'high', 'every', 'still', 'public',
+    'human', 'both', 'local', 'sure', 'something', 'without', 'come', 'me', 'back', 'better',
+    'general', 'process', 'she', 'heat', 'thanks', 'specific', 'long', 'small', 'book', 'great',
+    # Legal terms
+    'court', 'case', 'legal', 'law', 'document', 'order', 'file', 'notice', 'date', 'county',
+    'california', 'superior', 'judgment', 'plaintiff', 'defendant', 'motion', 'hearing', 'trial',
+    'attorney', 'counsel', 'evidence', 'matter', 'proceedings', 'filing', 'service', 'jurisdiction',
+    'contract', 'agreement', 'party', 'parties', 'breach', 'damages', 'relief', 'statute',
+    'code', 'section', 'civil', 'criminal', 'federal', 'state', 'appeal', 'decision', 'ruling',
+    'testimony', 'witness', 'deposition', 'discovery', 'settlement', 'mediation', 'arbitration',
+    'judge', 'jury', 'verdict', 'sentence', 'penalty', 'fine', 'prison', 'probation', 'parole',
+    # Common document words
+    'page', 'line', 'paragraph', 'section', 'chapter', 'title', 'subject', 'regarding',
+    'pursuant', 'whereas', 'therefore', 'hereby', 'furthermore', 'however', 'nevertheless',
+    'contained', 'including', 'excluding', 'unless', 'except', 'provided', 'required',
+    'shall', 'must', 'may', 'will', 'should', 'could', 'would', 'might', 'need', 'want'
+})
+
+MIN_PARALLEL_DOCS = 64
+
+
 class ValidationStatus(Enum):
     """Content validation status - 4-stage progression"""
     INGESTED = "ingested"          # File ingested, not processed
@@ -48,34 +92,7 @@ class ContentQualityScorer:
         self.MIN_ENGLISH_DICT_HIT_RATE = 0.35
         self.MIN_ENTITIES_PER_KB = 0.3
         
-        # Common English words for basic dictionary check (expanded for better validation)
-        self.english_words = {
-            # Common English words
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had', 'her', 'was', 'one',
-            'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old', 'see',
-            'two', 'way', 'who', 'its', 'did', 'yes', 'she', 'may', 'say', 'use', 'own', 'under',
-            'this', 'that', 'with', 'have', 'from', 'they', 'will', 'been', 'each', 'which', 'their',
-            'said', 'if', 'up', 'out', 'many', 'then', 'them', 'these', 'so', 'some', 'her', 'would',
-            'make', 'like', 'time', 'very', 'when', 'come', 'its', 'now', 'over', 'think', 'also',
-            'back', 'after', 'first', 'well', 'year', 'work', 'where', 'get', 'through', 'much',
-            'before', 'right', 'too', 'any', 'same', 'should', 'those', 'people', 'take', 'state',
-            'good', 'between', 'never', 'world', 'here', 'while', 'high', 'every', 'still', 'public',
-            'human', 'both', 'local', 'sure', 'something', 'without', 'come', 'me', 'back', 'better',
-            'general', 'process', 'she', 'heat', 'thanks', 'specific', 'long', 'small', 'book', 'great',
-            # Legal terms
-            'court', 'case', 'legal', 'law', 'document', 'order', 'file', 'notice', 'date', 'county',
-            'california', 'superior', 'judgment', 'plaintiff', 'defendant', 'motion', 'hearing', 'trial',
-            'attorney', 'counsel', 'evidence', 'matter', 'proceedings', 'filing', 'service', 'jurisdiction',
-            'contract', 'agreement', 'party', 'parties', 'breach', 'damages', 'relief', 'statute',
-            'code', 'section', 'civil', 'criminal', 'federal', 'state', 'appeal', 'decision', 'ruling',
-            'testimony', 'witness', 'deposition', 'discovery', 'settlement', 'mediation', 'arbitration',
-            'judge', 'jury', 'verdict', 'sentence', 'penalty', 'fine', 'prison', 'probation', 'parole',
-            # Common document words
-            'page', 'line', 'paragraph', 'section', 'chapter', 'title', 'subject', 'regarding',
-            'pursuant', 'whereas', 'therefore', 'hereby', 'furthermore', 'however', 'nevertheless',
-            'contained', 'including', 'excluding', 'unless', 'except', 'provided', 'required',
-            'shall', 'must', 'may', 'will', 'should', 'could', 'would', 'might', 'need', 'want'
-        }
+        self.english_words = ENGLISH_WORDS
     
     def score_content(self, text: str, page_count: int = 1, entity_count: int = 0) -> QualityMetrics:
         """
@@ -101,22 +118,24 @@ class ContentQualityScorer:
         text_length = len(text)
         chars_per_page = text_length / max(page_count, 1)
         
-        # Character type analysis
-        alpha_chars = len(re.findall(r'[A-Za-z]', text))
-        digit_chars = len(re.findall(r'[0-9]', text))
-        punct_chars = len(re.findall(r'[.,;:!?()\[\]{}"\'-]', text))
-        symbol_chars = len(re.findall(r'[&=%£€<>©#@$*+^~|\\]', text))
+        # Character type analysis from a single character histogram
+        char_counts = Counter(text)
+        alpha_chars = sum(n for ch, n in char_counts.items() if ch in ALPHA_CHARS)
+        digit_chars = sum(n for ch, n in char_counts.items() if ch in DIGIT_CHARS)
+        punct_chars = sum(n for ch, n in char_counts.items() if ch in PUNCT_CHARS)
+        symbol_chars = sum(n for ch, n in char_counts.items() if ch in SYMBOL_CHARS)
         
         alpha_ratio = alpha_chars / text_length if text_length > 0 else 0
         digit_punct_ratio = (digit_chars + punct_chars) / text_length if text_length > 0 else 0
         symbol_ratio = symbol_chars / text_length if text_length > 0 else 0
         
         # Bigram uniqueness (crude de-garble indicator)
-        unique_bigrams = self._count_unique_bigrams(text)
+        lowered = text.lower()
+        unique_bigrams = self._count_unique_bigrams(lowered)
         
         # English dictionary hit rate
-        words = re.findall(r'\b\w+\b', text.lower())
-        english_hits = sum(1 for word in words if word in self.english_words)
+        words = WORD_PATTERN.findall(lowered)
+        english_hits = sum(map(self.english_words.__contains__, words))
         english_dict_hit_rate = english_hits / len(words) if words else 0
         
         # Apply validation gates
@@ -182,17 +201,9 @@ class ContentQualityScorer:
         )
     
     def _count_unique_bigrams(self, text: str) -> int:
-        """Count unique character bigrams (crude garble detection)"""
-        # Clean text and create bigrams
-        clean_text = re.sub(r'\s+', ' ', text.lower())
-        bigrams = set()
-        
-        for i in range(len(clean_text) - 1):
-            bigram = clean_text[i:i+2]
-            if bigram.isalpha():  # Only count alphabetic bigrams
-                bigrams.add(bigram)
-        
-        return len(bigrams)
+        """Count unique alphabetic character bigrams in lowercased text (crude garble detection)"""
+        # Whitespace never forms part of an alphabetic bigram, so no need to collapse it
+        return sum(1 for a, b in set(zip(text, text[1:])) if (a + b).isalpha())
     
     def _calculate_quality_score(self, alpha_ratio: float, digit_punct_ratio: float, 
                                 symbol_ratio: float, unique_bigrams: int, 
@@ -230,6 +241,37 @@ class ContentQualityScorer:
         
         return round(quality_score, 3)
     
+    def score_batch(
+        self,
+        texts: Iterable[str],
+        page_count: int = 1,
+        workers: Optional[int] = None,
+        chunk_size: int = 64,
+    ) -> Iterator[QualityMetrics]:
+        """
+        Score many documents, yielding metrics in input order.
+
+        texts may be a generator; it is consumed a few chunks ahead of the
+        results, so memory stays bounded. Large inputs are scored across
+        worker processes.
+
+        Args:
+            texts: Documents to score
+            page_count: Pages per document for the chars-per-page gate
+            workers: Scoring processes (env QUALITY_WORKERS, default cpu count - 1)
+            chunk_size: Documents per pool task
+        """
+        yield from parallel_map(
+            ContentQualityScorer,
+            "score_content",
+            texts,
+            args=(page_count,),
+            workers=workers or default_workers("QUALITY_WORKERS"),
+            chunk_size=chunk_size,
+            min_items=MIN_PARALLEL_DOCS,
+            local=self,
+        )
+
     def classify_quality(self, quality_score: float) -> Tuple[str, str]:
         """
         Classify content quality based on score.
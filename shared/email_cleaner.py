@@ -3,22 +3,21 @@ Email Cleaning and Sanitization Utilities
 Handles HTML stripping, signature removal, and content normalization
 """
 
-import html as html_lib
 import re
 from functools import lru_cache
 from typing import Any, Dict, List
 
-# Compiled patterns for HTML and text cleaning
+from .cleaning_engine import clean_email_body, collapse_whitespace, normalize_text, strip_email_html
+from .process_pool import default_workers, parallel_map
+
+# Compiled patterns for text cleaning (HTML is handled by cleaning_engine)
 CLEANING_PATTERNS = {
-    'style_script': re.compile(r"<(style|script)[^>]*>.*?</\1>", re.DOTALL | re.IGNORECASE),
-    'block_elements': re.compile(r"<(p|div|br|li)[^>]*>", re.IGNORECASE),
-    'block_end': re.compile(r"</?(p|div|br|li)[^>]*>", re.IGNORECASE),
-    'html_tags': re.compile(r"<[^<]+?>"),
-    'excessive_newlines': re.compile(r"\n{3,}"),
     'whitespace': re.compile(r"\s+"),
     'filename_invalid': re.compile(r'[\\/*?:"<>|]'),
 }
 
+MIN_PARALLEL_EMAILS = 2000
+
 
 class EmailCleaner:
     """
@@ -71,13 +70,8 @@ class EmailCleaner:
         if not subject:
             return ""
         
-        # Remove HTML if present
-        subject = self._strip_html(subject)
-        
-        # Normalize whitespace
-        subject = CLEANING_PATTERNS['whitespace'].sub(" ", subject)
-        
-        return subject.strip()
+        # Remove HTML if present, normalize whitespace
+        return collapse_whitespace(strip_email_html(subject))
 
     def _clean_body(self, body: str) -> str:
         """
@@ -89,36 +83,13 @@ class EmailCleaner:
         Returns:
             Cleaned plain text
         """
-        if not body:
-            return ""
-        
-        # Strip HTML first
-        cleaned = self._strip_html(body)
-        
-        # Clean text content
-        cleaned = self._clean_text_content(cleaned)
-        
-        # Remove signatures (optional - may want to preserve for legal evidence)
-        # cleaned = self._remove_signatures(cleaned)
-        
-        return cleaned
+        # Strip HTML, then normalize whitespace and newlines
+        # Signatures are kept (may be needed as legal evidence); see _remove_signatures
+        return clean_email_body(body)
 
     def _clean_text_content(self, text: str) -> str:
         """Clean text content - whitespace, newlines, etc."""
-        if not text:
-            return ""
-        
-        # Normalize excessive newlines  
-        text = CLEANING_PATTERNS['excessive_newlines'].sub("\n\n", text)
-        
-        # Normalize whitespace within lines
-        lines = text.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            cleaned_line = CLEANING_PATTERNS['whitespace'].sub(" ", line).strip()
-            cleaned_lines.append(cleaned_line)
-        
-        return '\n'.join(cleaned_lines).strip()
+        return normalize_text(text)
 
     def _strip_html(self, html: str) -> str:
         """
@@ -130,23 +101,7 @@ class EmailCleaner:
         Returns:
             Plain text with preserved line breaks
         """
-        if not html:
-            return ""
-        
-        # Remove style and script tags completely
-        html = CLEANING_PATTERNS['style_script'].sub("", html)
-        
-        # Convert block elements to line breaks
-        html = CLEANING_PATTERNS['block_elements'].sub("\n", html)
-        html = CLEANING_PATTERNS['block_end'].sub("", html)
-        
-        # Remove all remaining HTML tags
-        html = CLEANING_PATTERNS['html_tags'].sub("", html)
-        
-        # Decode HTML entities
-        html = html_lib.unescape(html)
-        
-        return html
+        return strip_email_html(html)
 
     def _remove_signatures(self, text: str) -> str:
         """
@@ -181,17 +136,34 @@ class EmailCleaner:
         
         return False
 
-    def batch_clean(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def batch_clean(
+        self, emails: List[Dict[str, Any]], workers: int = None, chunk_size: int = 500
+    ) -> List[Dict[str, Any]]:
         """
         Clean a batch of emails efficiently.
+
+        Batches of MIN_PARALLEL_EMAILS or more are split across worker
+        processes; output order matches input order.
         
         Args:
             emails: List of email dictionaries
+            workers: Cleaning processes (env EMAIL_CLEAN_WORKERS, default cpu count - 1)
+            chunk_size: Emails per pool task
             
         Returns:
             List of cleaned email dictionaries
         """
-        return [self.clean(email) for email in emails]
+        return list(
+            parallel_map(
+                EmailCleaner,
+                "clean",
+                emails,
+                workers=workers or default_workers("EMAIL_CLEAN_WORKERS"),
+                chunk_size=chunk_size,
+                min_items=MIN_PARALLEL_EMAILS,
+                local=self,
+            )
+        )
 
 
 def sanitize_filename(filename: str) -> str:
@@ -0,0 +1,113 @@
+"""
+File Manifest - Remembers which files have already been ingested.
+
+Each row records a file's path, size, mtime and SHA-256 together with the
+content ID it produced. A rerun can then skip files whose size and mtime are
+unchanged without opening them, and files whose bytes are unchanged (touched,
+copied or moved) after hashing only, before any text extraction.
+"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from loguru import logger
+
+from .simple_db import SimpleDB
+
+LOOKUP_CHUNK = 500
+
+
+class FileManifest:
+    """Path -> (size, mtime_ns, file_hash, content_id) table in SimpleDB."""
+
+    def __init__(self, db: SimpleDB):
+        self.db = db
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS file_manifest (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                file_hash TEXT NOT NULL,
+                content_id TEXT,
+                processed_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_file_manifest_hash ON file_manifest(file_hash)"
+        )
+
+    @staticmethod
+    def key(file_path: Path) -> str:
+        """Manifest key for a file (absolute path, so relative and absolute runs agree)."""
+        return str(Path(file_path).resolve())
+
+    def lookup(self, paths: Iterable[str]) -> dict[str, dict]:
+        """Manifest rows for the given keys, chunked to stay under SQLite's parameter limit."""
+        paths = list(paths)
+        entries: dict[str, dict] = {}
+        for i in range(0, len(paths), LOOKUP_CHUNK):
+            chunk = paths[i:i + LOOKUP_CHUNK]
+            rows = self.db.fetch(
+                f"""
+                SELECT path, size, mtime_ns, file_hash, content_id FROM file_manifest
+                WHERE path IN ({','.join('?' * len(chunk))})
+                """,
+                tuple(chunk),
+            )
+            entries.update({row["path"]: row for row in rows})
+        return entries
+
+    def content_for_hash(self, file_hash: str) -> str | None:
+        """Content ID already produced by a file with these exact bytes, if any."""
+        row = self.db.fetch_one(
+            """
+            SELECT content_id FROM file_manifest
+            WHERE file_hash = ? AND content_id IS NOT NULL
+            LIMIT 1
+            """,
+            (file_hash,),
+        )
+        return row["content_id"] if row else None
+
+    def record(self, entries: list[dict]) -> int:
+        """Upsert manifest rows (path, size, mtime_ns, file_hash, content_id) in one transaction."""
+        if not entries:
+            return 0
+        conn = self.db.get_connection()
+        try:
+            conn.executemany(
+                """
+                INSERT INTO file_manifest (path, size, mtime_ns, file_hash, content_id, processed_at)
+                VALUES (:path, :size, :mtime_ns, :file_hash, :content_id, CURRENT_TIMESTAMP)
+                ON CONFLICT(path) DO UPDATE SET
+                    size = excluded.size,
+                    mtime_ns = excluded.mtime_ns,
+                    file_hash = excluded.file_hash,
+                    content_id = COALESCE(excluded.content_id, file_manifest.content_id),
+                    processed_at = excluded.processed_at
+                """,
+                entries,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        logger.debug(f"Recorded {len(entries)} file manifest entries")
+        return len(entries)
+
+    def forget(self, paths: Iterable[str] | None = None) -> None:
+        """Drop manifest rows so those files (or all files) are processed again."""
+        if paths is None:
+            self.db.execute("DELETE FROM file_manifest")
+            return
+        paths = list(paths)
+        for i in range(0, len(paths), LOOKUP_CHUNK):
+            chunk = paths[i:i + LOOKUP_CHUNK]
+            self.db.execute(
+                f"DELETE FROM file_manifest WHERE path IN ({','.join('?' * len(chunk))})",
+                tuple(chunk),
+            )
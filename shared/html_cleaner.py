@@ -3,9 +3,10 @@ Simple HTML cleaning utilities for email content.
 Uses only standard library to avoid external dependencies.
 """
 
-import html
 import re
 
+from .cleaning_engine import html_to_text, strip_boilerplate
+
 
 def clean_html_content(html_content: str) -> str:
     """
@@ -20,43 +21,8 @@ def clean_html_content(html_content: str) -> str:
     if not html_content or not isinstance(html_content, str):
         return ""
     
-    text = html_content
-    
-    # Remove script and style tags completely
-    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Convert common block elements to line breaks
-    block_elements = ['div', 'p', 'br', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote']
-    for element in block_elements:
-        text = re.sub(f'<{element}[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(f'</{element}>', '\n', text, flags=re.IGNORECASE)
-    
-    # Convert list items to bullet points
-    text = re.sub(r'<li[^>]*>', '\n• ', text, flags=re.IGNORECASE)
-    text = re.sub(r'</li>', '', text, flags=re.IGNORECASE)
-    
-    # Remove all remaining HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Decode HTML entities after removing tags (so decoded < > don't get treated as tags)
-    text = html.unescape(text)
-    
-    # Clean up whitespace
-    # Replace multiple whitespace with single space
-    text = re.sub(r'[ \t]+', ' ', text)
-    
-    # Replace multiple newlines with max 2
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
-    
-    # Remove leading/trailing whitespace on each line and filter empty lines
-    lines = []
-    for line in text.split('\n'):
-        line = line.strip()
-        if line:  # Only keep non-empty lines
-            lines.append(line)
-    
-    return '\n'.join(lines)
+    # Single-scan tag handling, entity decoding, whitespace cleanup
+    return html_to_text(html_content)
 
 
 def extract_email_content(email_html: str) -> tuple[str, dict]:
@@ -95,39 +61,7 @@ def extract_email_content(email_html: str) -> tuple[str, dict]:
 
 def remove_email_boilerplate(content: str) -> str:
     """Remove common email boilerplate and quoted content."""
-    if not content:
-        return ""
-    
-    lines = content.split('\n')
-    clean_lines = []
-    
-    skip_patterns = [
-        r'^>.*',  # Quoted lines
-        r'^\s*On .+wrote:.*',  # Gmail quote headers
-        r'^\s*From:.*',  # Email headers in body
-        r'^\s*To:.*',
-        r'^\s*Cc:.*',
-        r'^\s*Sent:.*',
-        r'^\s*Subject:.*',
-        r'^\s*\[image\d*\.\w+\]',  # Image placeholders
-        r'^\s*<image\d*\.\w+>',
-        r'alt="[^"]*"',  # Alt text
-        r'src="[^"]*"',  # Image sources
-        r'cid:[^"]*',  # Email content IDs
-    ]
-    
-    for line in lines:
-        # Skip boilerplate patterns
-        skip_line = False
-        for pattern in skip_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                skip_line = True
-                break
-        
-        if not skip_line and line.strip():
-            clean_lines.append(line)
-    
-    return '\n'.join(clean_lines)
+    return strip_boilerplate(content)
 
 
 def format_as_clean_markdown(content: str, title: str | None = None) -> str:
@@ -0,0 +1,76 @@
+"""
+Chunked process-pool mapping for CPU-bound batch helpers.
+Each worker process builds one instance of the helper class and reuses it.
+"""
+
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, Optional
+
+_worker_instances: dict[type, Any] = {}
+
+
+def default_workers(env_var: str) -> int:
+    """Worker count from env_var, defaulting to cpu count - 1."""
+    return int(os.getenv(env_var, max(1, (os.cpu_count() or 2) - 1)))
+
+
+def _run_chunk(cls: type, method: str, items: list, args: tuple) -> list:
+    """Pool task: apply method to one chunk with this process's instance."""
+    instance = _worker_instances.get(cls)
+    if instance is None:
+        instance = _worker_instances[cls] = cls()
+    call = getattr(instance, method)
+    return [call(item, *args) for item in items]
+
+
+def parallel_map(
+    cls: type,
+    method: str,
+    items: Iterable,
+    *,
+    args: tuple = (),
+    workers: int,
+    chunk_size: int,
+    min_items: int,
+    local: Optional[Any] = None,
+) -> Iterator:
+    """
+    Yield cls().method(item, *args) for each item, in input order.
+
+    Inputs shorter than min_items (or workers <= 1) run inline on local,
+    since a process pool costs more than it saves there. Otherwise items
+    are sent to the pool in chunks, at most two per worker in flight, so
+    generators are consumed only a little ahead of the results.
+
+    Args:
+        cls: Importable class with a no-argument constructor
+        method: Name of the method to call per item
+        items: Inputs; may be a generator
+        args: Extra positional arguments passed after each item
+        workers: Worker processes
+        chunk_size: Items per pool task
+        min_items: Smallest input worth a pool
+        local: Instance for inline runs (default a new cls())
+    """
+    items = iter(items)
+    head = list(islice(items, min_items))
+
+    if workers <= 1 or len(head) < min_items:
+        call = getattr(local if local is not None else cls(), method)
+        for item in chain(head, items):
+            yield call(item, *args)
+        return
+
+    stream = chain(head, items)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while chunk := list(islice(stream, chunk_size)):
+            pending.append(pool.submit(_run_chunk, cls, method, chunk, args))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,273 @@
+"""
+Quarantine Catalog - Indexed record of quarantined files and their retry state.
+
+One row per quarantined file: where it came from, why it failed, how the error
+classifies, how many retries have been made and when the next one is due.
+Listing and stats are served from this table instead of walking the
+quarantine directory and parsing every error log.
+"""
+
+import os
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from loguru import logger
+
+from .simple_db import SimpleDB
+
+RETRY_BASE_MINUTES = float(os.getenv("QUARANTINE_RETRY_BASE_MINUTES", "2"))
+RETRY_MAX_MINUTES = float(os.getenv("QUARANTINE_RETRY_MAX_MINUTES", "1440"))
+MAX_RETRY_ATTEMPTS = int(os.getenv("QUARANTINE_MAX_ATTEMPTS", "5"))
+
+# Statuses
+QUARANTINED = "quarantined"  # Waiting for its next retry
+RETRYING = "retrying"  # Claimed by a scheduler run
+RECOVERED = "recovered"
+PERMANENT_FAILURE = "permanent_failure"  # Never retried again
+
+# Errors that another attempt on the same bytes cannot fix
+PERMANENT_MARKERS = (
+    "corrupt", "invalid", "unsupported", "encrypted", "password", "eof marker",
+    "not a pdf", "can't decode", "cannot decode", "quarantined file not found",
+)
+# Errors caused by the environment at the time (locks, load, mounts)
+TRANSIENT_MARKERS = (
+    "timeout", "timed out", "locked", "busy", "temporarily", "memory", "permission",
+    "access", "connection", "no space",
+)
+
+LOOKUP_CHUNK = 500
+
+
+def categorize_error(error_message: str) -> str:
+    """Coarse error category used in quarantine stats."""
+    error_msg = (error_message or "").lower()
+    if "pdf" in error_msg:
+        return "PDF Processing"
+    if "permission" in error_msg or "access" in error_msg:
+        return "File Access"
+    if "corrupt" in error_msg or "invalid" in error_msg:
+        return "File Corruption"
+    if "timeout" in error_msg:
+        return "Timeout"
+    return "Other"
+
+
+def is_permanent_error(error_message: str) -> bool:
+    """True when retrying cannot help; unknown errors are retried until the attempt cap."""
+    error_msg = (error_message or "").lower()
+    if any(marker in error_msg for marker in TRANSIENT_MARKERS):
+        return False
+    return any(marker in error_msg for marker in PERMANENT_MARKERS)
+
+
+def next_retry_at(attempts: int, now: datetime | None = None) -> str:
+    """Exponential backoff: base, 2x base, 4x base ... capped at RETRY_MAX_MINUTES."""
+    minutes = min(RETRY_BASE_MINUTES * 2 ** attempts, RETRY_MAX_MINUTES)
+    return ((now or datetime.now()) + timedelta(minutes=minutes)).isoformat()
+
+
+class QuarantineCatalog:
+    """quarantine_path -> (error, category, status, attempts, next_retry_at) table in SimpleDB."""
+
+    def __init__(self, db: SimpleDB):
+        self.db = db
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quarantine_catalog (
+                quarantine_path TEXT PRIMARY KEY,
+                original_path TEXT,
+                error_log TEXT,
+                error_message TEXT,
+                category TEXT NOT NULL,
+                file_size INTEGER DEFAULT 0,
+                status TEXT NOT NULL,
+                attempt_count INTEGER NOT NULL DEFAULT 0,
+                next_retry_at TEXT,
+                quarantined_at TEXT NOT NULL,
+                last_attempt_at TEXT,
+                recovered_path TEXT,
+                content_id TEXT
+            )
+            """
+        )
+        self.db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_quarantine_due
+            ON quarantine_catalog(status, next_retry_at)
+            """
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_quarantine_time ON quarantine_catalog(quarantined_at)"
+        )
+
+    def add(self, entries: Iterable[dict], now: datetime | None = None) -> int:
+        """Catalog newly quarantined files (quarantine_path, original_path, error_message, ...)."""
+        now = now or datetime.now()
+        rows = []
+        for entry in entries:
+            error_message = entry.get("error_message") or ""
+            permanent = is_permanent_error(error_message)
+            rows.append({
+                "quarantine_path": entry["quarantine_path"],
+                "original_path": entry.get("original_path"),
+                "error_log": entry.get("error_log"),
+                "error_message": error_message,
+                "category": categorize_error(error_message),
+                "file_size": entry.get("file_size", 0),
+                "status": PERMANENT_FAILURE if permanent else QUARANTINED,
+                "next_retry_at": None if permanent else next_retry_at(0, now),
+                "quarantined_at": entry.get("timestamp") or now.isoformat(),
+            })
+        if not rows:
+            return 0
+        conn = self.db.get_connection()
+        try:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO quarantine_catalog (
+                    quarantine_path, original_path, error_log, error_message, category,
+                    file_size, status, next_retry_at, quarantined_at
+                ) VALUES (
+                    :quarantine_path, :original_path, :error_log, :error_message, :category,
+                    :file_size, :status, :next_retry_at, :quarantined_at
+                )
+                """,
+                rows,
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+
+    def get(self, quarantine_path: str) -> dict | None:
+        return self.db.fetch_one(
+            "SELECT * FROM quarantine_catalog WHERE quarantine_path = ?", (quarantine_path,)
+        )
+
+    def entries(self, include_recovered: bool = False) -> list[dict]:
+        """Catalog rows, newest first."""
+        where = "" if include_recovered else f"WHERE status != '{RECOVERED}'"
+        return self.db.fetch(
+            f"SELECT * FROM quarantine_catalog {where} ORDER BY quarantined_at DESC"
+        )
+
+    def is_empty(self) -> bool:
+        return self.db.fetch_one("SELECT 1 AS found FROM quarantine_catalog LIMIT 1") is None
+
+    def claim_due(self, limit: int, now: datetime | None = None) -> list[dict]:
+        """Mark up to limit due entries as retrying and return them, oldest due first."""
+        now_iso = (now or datetime.now()).isoformat()
+        conn = self.db.get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT * FROM quarantine_catalog
+                WHERE status = ? AND next_retry_at <= ?
+                ORDER BY next_retry_at
+                LIMIT ?
+                """,
+                (QUARANTINED, now_iso, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE quarantine_catalog SET status = ? WHERE quarantine_path = ?",
+                [(RETRYING, row["quarantine_path"]) for row in rows],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def release_claims(self) -> int:
+        """Return entries left in retrying (e.g. by a killed scheduler) to the queue."""
+        cursor = self.db.execute(
+            "UPDATE quarantine_catalog SET status = ? WHERE status = ?", (QUARANTINED, RETRYING)
+        )
+        return cursor.rowcount
+
+    def record_attempt(
+        self,
+        quarantine_path: str,
+        success: bool,
+        error_message: str | None = None,
+        recovered_path: str | None = None,
+        content_id: str | None = None,
+        now: datetime | None = None,
+    ) -> str:
+        """Record a retry outcome and schedule the next attempt. Returns the new status."""
+        now = now or datetime.now()
+        row = self.get(quarantine_path)
+        attempts = (row["attempt_count"] if row else 0) + 1
+
+        if success:
+            status, retry_at = RECOVERED, None
+        elif is_permanent_error(error_message) or attempts >= MAX_RETRY_ATTEMPTS:
+            status, retry_at = PERMANENT_FAILURE, None
+        else:
+            status, retry_at = QUARANTINED, next_retry_at(attempts, now)
+
+        self.db.execute(
+            """
+            UPDATE quarantine_catalog
+            SET status = ?, attempt_count = ?, next_retry_at = ?, last_attempt_at = ?,
+                error_message = COALESCE(?, error_message),
+                category = COALESCE(?, category),
+                recovered_path = ?, content_id = ?
+            WHERE quarantine_path = ?
+            """,
+            (
+                status, attempts, retry_at, now.isoformat(),
+                error_message, categorize_error(error_message) if error_message else None,
+                recovered_path, content_id, quarantine_path,
+            ),
+        )
+        if status == PERMANENT_FAILURE:
+            logger.warning(f"Quarantined file will not be retried again: {quarantine_path}")
+        return status
+
+    def stats(self) -> dict:
+        """Counts by status and by error category (recovered files excluded from categories)."""
+        by_status = {
+            row["status"]: row["n"]
+            for row in self.db.fetch(
+                "SELECT status, COUNT(*) AS n FROM quarantine_catalog GROUP BY status"
+            )
+        }
+        categories = {
+            row["category"]: row["n"]
+            for row in self.db.fetch(
+                f"""
+                SELECT category, COUNT(*) AS n FROM quarantine_catalog
+                WHERE status != '{RECOVERED}' GROUP BY category
+                """
+            )
+        }
+        next_due = self.db.fetch_one(
+            "SELECT MIN(next_retry_at) AS at FROM quarantine_catalog WHERE status = ?",
+            (QUARANTINED,),
+        )
+        return {
+            "by_status": by_status,
+            "error_categories": categories,
+            "next_retry_at": next_due["at"],
+        }
+
+    def forget(self, quarantine_paths: Iterable[str]) -> None:
+        """Drop catalog rows for files removed from quarantine."""
+        paths = list(quarantine_paths)
+        for i in range(0, len(paths), LOOKUP_CHUNK):
+            chunk = paths[i:i + LOOKUP_CHUNK]
+            self.db.execute(
+                f"""
+                DELETE FROM quarantine_catalog
+                WHERE quarantine_path IN ({','.join('?' * len(chunk))})
+                """,
+                tuple(chunk),
+            )
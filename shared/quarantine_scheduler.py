@@ -0,0 +1,110 @@
+"""
+Quarantine Retry Scheduler - Background retries of quarantined files.
+
+Each run claims the catalog entries whose backoff has expired and retries
+them in a bounded thread pool. Outcomes go back into the catalog, which
+schedules the next attempt (exponential backoff) or stops retrying files
+whose errors are permanent or that reached the attempt cap.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .simple_quarantine_manager import SimpleQuarantineManager
+
+QUARANTINE_RETRY_WORKERS = int(os.getenv("QUARANTINE_RETRY_WORKERS", "2"))
+QUARANTINE_RETRY_INTERVAL = float(os.getenv("QUARANTINE_RETRY_INTERVAL", "60"))
+QUARANTINE_RETRY_BATCH = int(os.getenv("QUARANTINE_RETRY_BATCH", "50"))
+
+
+class QuarantineRetryScheduler:
+    """Retries due quarantined files on a background thread."""
+
+    def __init__(
+        self,
+        manager: SimpleQuarantineManager | None = None,
+        workers: int = QUARANTINE_RETRY_WORKERS,
+        interval: float = QUARANTINE_RETRY_INTERVAL,
+        batch_size: int = QUARANTINE_RETRY_BATCH,
+    ):
+        self.manager = manager or SimpleQuarantineManager()
+        self.workers = max(1, workers)
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_due(self, now: datetime | None = None) -> dict[str, Any]:
+        """Retry every entry due at now, at most batch_size, workers at a time."""
+        due = self.manager.catalog.claim_due(self.batch_size, now)
+        summary = {"attempted": len(due), "recovered": 0, "rescheduled": 0, "permanent": 0}
+        if not due:
+            return summary
+
+        paths = [Path(row["quarantine_path"]) for row in due]
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(paths))) as pool:
+            results = list(pool.map(self._retry, paths))
+
+        for result in results:
+            if result["status"] == "recovered":
+                summary["recovered"] += 1
+            elif result["status"] == "permanent_failure":
+                summary["permanent"] += 1
+            else:
+                summary["rescheduled"] += 1
+        logger.info(
+            f"Quarantine retry: {summary['recovered']}/{len(due)} recovered, "
+            f"{summary['rescheduled']} rescheduled, {summary['permanent']} given up"
+        )
+        return summary
+
+    def _retry(self, quarantine_path: Path) -> dict[str, Any]:
+        try:
+            return self.manager.retry_quarantined_file(quarantine_path)
+        except Exception as e:
+            # Catalog write failed; the claim is released when the scheduler next starts
+            logger.error(f"Could not record retry of {quarantine_path}: {e}")
+            return {"success": False, "error": str(e), "status": "retrying"}
+
+    def start(self) -> None:
+        """Start retrying in the background every interval seconds."""
+        if self.running:
+            return
+        # Claims left by a scheduler that died mid-run go back in the queue
+        self.manager.catalog.release_claims()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="quarantine-retry", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Quarantine retry scheduler started ({self.workers} workers)")
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop after the current run finishes."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_due()
+            except Exception as e:
+                logger.error(f"Quarantine retry run failed: {e}")
+            self._stop.wait(self.interval)
+
+
+def get_quarantine_scheduler() -> QuarantineRetryScheduler:
+    """Get quarantine retry scheduler instance."""
+    return QuarantineRetryScheduler()
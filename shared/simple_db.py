@@ -44,6 +44,10 @@ class DBMetrics:
 class SimpleDB:
     """The entire database layer in under 100 lines. No BS."""
 
+    # Bumps to the content generation made by this process (see bump_content_generation)
+    local_generation_bumps = 0
+    _generation_tables_ready: set[str] = set()
+
     def __init__(self, db_path: str = None) -> None:
         # Use environment variable if available, otherwise use new default path
         if db_path is None:
@@ -205,6 +209,14 @@ class SimpleDB:
         return results[0] if results else None
 
     # Content operations (replaces ContentWriter)
+    @staticmethod
+    def content_hash(content_type: str, title: str, content: str) -> str:
+        """Dedup key for content_unified.sha256 (type + normalized title and body)."""
+        normalized_title = (title or "").strip().lower()
+        normalized_content = (content or "").strip()
+        hash_input = f"{content_type}:{normalized_title}:{normalized_content}"
+        return hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+
     def add_content(
         self,
         content_type: str,
@@ -215,10 +227,7 @@ class SimpleDB:
     ) -> str:
         """Add content to content_unified table - emails, transcripts, PDFs. Returns content ID."""
         # Calculate content hash for deduplication
-        normalized_title = (title or "").strip().lower()
-        normalized_content = (content or "").strip()
-        hash_input = f"{content_type}:{normalized_title}:{normalized_content}"
-        content_hash = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+        content_hash = self.content_hash(content_type, title, content)
 
         # Check if content already exists by hash
         existing = self.fetch_one(
@@ -249,6 +258,10 @@ class SimpleDB:
             ),
         )
         
+        # New content invalidates cached search results
+        if cursor.rowcount > 0:
+            self.bump_content_generation()
+
         # Get the auto-generated ID
         if cursor.lastrowid:
             return str(cursor.lastrowid)
@@ -365,6 +378,7 @@ class SimpleDB:
                 sha256 = excluded.sha256,
                 ready_for_embedding = excluded.ready_for_embedding
         """, (source_type, source_id, title, content, content_hash, 1))
+        self.bump_content_generation()
 
         # Get the ID of the upserted record
         result = self.fetch_one(
@@ -411,11 +425,15 @@ class SimpleDB:
         query = f"UPDATE content_unified SET {', '.join(set_clauses)} WHERE id = ?"
         
         cursor = self.execute(query, tuple(params))
+        if cursor.rowcount > 0:
+            self.bump_content_generation()
         return cursor.rowcount > 0
 
     def delete_content(self, content_id: str) -> bool:
         """Delete content by ID. Returns True if successful."""
         cursor = self.execute("DELETE FROM content_unified WHERE id = ?", (content_id,))
+        if cursor.rowcount > 0:
+            self.bump_content_generation()
         return cursor.rowcount > 0
 
     # Simple thread tracking methods
@@ -788,7 +806,7 @@ class SimpleDB:
 
         # Prepare data tuples with auto-generated fields
         prepared_data = []
-        content_ids = []
+        content_hashes = []
         total_chars = 0
 
         for idx, item in enumerate(content_list):
@@ -800,10 +818,7 @@ class SimpleDB:
             # Calculate content hash for deduplication
             content_type = item.get("content_type", "unknown")
             title = item.get("title", "")
-            normalized_title = (title or "").strip().lower()
-            normalized_content = (content or "").strip()
-            hash_input = f"{content_type}:{normalized_title}:{normalized_content}"
-            content_hash = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
+            content_hash = self.content_hash(content_type, title, content)
 
             # Generate numeric source_id from hash
             source_id = abs(hash(content_hash)) % 2147483647
@@ -821,8 +836,7 @@ class SimpleDB:
                 )
             )
             
-            # Store the auto-generated ID for returning
-            content_ids.append(str(source_id))
+            content_hashes.append(content_hash)
 
             if (idx + 1) % 100 == 0:
                 logger.debug(f"Prepared {idx + 1}/{len(content_list)} content items")
@@ -845,6 +859,13 @@ class SimpleDB:
 
         stats = self.batch_insert("content_unified", columns, prepared_data, batch_size, progress_callback)
 
+        if stats["inserted"] > 0:
+            self.bump_content_generation()
+
+        # Resolve row IDs (new or pre-existing duplicates) by content hash
+        id_by_hash = self.get_content_ids_by_hashes(content_hashes)
+        content_ids = [id_by_hash.get(h, "") for h in content_hashes]
+
         # Log content-specific stats
         logger.info(
             f"Content batch complete: {stats['inserted']} new items, "
@@ -853,6 +874,19 @@ class SimpleDB:
 
         return {"stats": stats, "content_ids": content_ids}
 
+    def get_content_ids_by_hashes(self, hashes: list[str]) -> dict[str, str]:
+        """Map content sha256 -> content_unified ID (chunked lookups, ≤500 per query)."""
+        id_by_hash: dict[str, str] = {}
+        unique = list(dict.fromkeys(h for h in hashes if h))
+        for i in range(0, len(unique), 500):
+            chunk = unique[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.fetch(
+                f"SELECT id, sha256 FROM content_unified WHERE sha256 IN ({placeholders})", tuple(chunk)
+            )
+            id_by_hash.update({row["sha256"]: str(row["id"]) for row in rows})
+        return id_by_hash
+
     # Batch document operations (Task 1.3 + 1.4)
     def batch_add_document_chunk(
         self,
@@ -1134,6 +1168,44 @@ class SimpleDB:
 
         return summary_id
 
+    def batch_add_document_summaries(self, summaries: list[dict], batch_size: int = 1000) -> dict[str, Any]:
+        """Insert many document summaries with chunked executemany.
+
+        Args:
+            summaries: Dicts with document_id, summary_type and optional summary_text,
+                tf_idf_keywords (dict) and textrank_sentences (list)
+            batch_size: Rows per executemany chunk
+
+        Returns:
+            batch_insert stats plus the generated summary_ids
+        """
+        rows = []
+        summary_ids = []
+        for summary in summaries:
+            summary_id = str(uuid.uuid4())
+            keywords = summary.get("tf_idf_keywords")
+            sentences = summary.get("textrank_sentences")
+            rows.append(
+                (
+                    summary_id,
+                    summary["document_id"],
+                    summary.get("summary_type", "combined"),
+                    summary.get("summary_text"),
+                    json.dumps(keywords) if keywords else None,
+                    json.dumps(sentences) if sentences else None,
+                )
+            )
+            summary_ids.append(summary_id)
+
+        stats = self.batch_insert(
+            "document_summaries",
+            ["summary_id", "document_id", "summary_type", "summary_text", "tf_idf_keywords", "textrank_sentences"],
+            rows,
+            batch_size,
+        )
+        stats["summary_ids"] = summary_ids
+        return stats
+
     def get_document_summaries(self, document_id: str) -> list[dict]:
         """Get all summaries for a document."""
         results = self.fetch(
@@ -1637,6 +1709,126 @@ class SimpleDB:
 
         return stats
 
+    # Content generation + search result cache (query cache invalidation)
+    def _ensure_generation_tables(self) -> None:
+        """Create the content generation counter and search cache tables."""
+        if self.db_path in SimpleDB._generation_tables_ready:
+            return
+        self.execute(
+            """
+            CREATE TABLE IF NOT EXISTS content_generation (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                generation INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        # No foreign keys: cache keys are query hashes, not content IDs
+        self.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_result_cache (
+                cache_key TEXT PRIMARY KEY,
+                generation INTEGER NOT NULL,
+                query TEXT,
+                results TEXT NOT NULL,
+                result_count INTEGER DEFAULT 0,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        SimpleDB._generation_tables_ready.add(self.db_path)
+
+    def get_content_generation(self) -> int:
+        """Current content generation. Any cached search result from an older one is stale."""
+        self._ensure_generation_tables()
+        row = self.fetch_one("SELECT generation FROM content_generation WHERE id = 1")
+        return int(row["generation"]) if row else 0
+
+    def bump_content_generation(self) -> int:
+        """Advance the content generation after content or vectors change.
+
+        Never raises - a failed bump must not fail the write that triggered it.
+        """
+        # Process-local counter lets in-process caches notice bumps without a query
+        SimpleDB.local_generation_bumps += 1
+        try:
+            self._ensure_generation_tables()
+            self.execute(
+                """
+                INSERT INTO content_generation (id, generation) VALUES (1, 1)
+                ON CONFLICT(id) DO UPDATE SET
+                    generation = generation + 1,
+                    updated_at = CURRENT_TIMESTAMP
+                """
+            )
+            return self.get_content_generation()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not bump content generation: {e}")
+            return -1
+
+    def store_search_cache_entry(
+        self,
+        cache_key: str,
+        generation: int,
+        results: list[dict],
+        query: str | None = None,
+        ttl_seconds: float = 3600,
+    ) -> bool:
+        """Persist search results for a cache key at the given content generation."""
+        self._ensure_generation_tables()
+        now = time.time()
+        try:
+            self.execute(
+                """
+                INSERT OR REPLACE INTO search_result_cache
+                (cache_key, generation, query, results, result_count, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    cache_key,
+                    generation,
+                    query,
+                    json.dumps(results, default=str),
+                    len(results),
+                    now,
+                    now + ttl_seconds,
+                ),
+            )
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store search cache entry: {e}")
+            return False
+
+    def load_search_cache_entry(self, cache_key: str, generation: int) -> list[dict] | None:
+        """Load cached search results; None if missing, expired or from another generation."""
+        self._ensure_generation_tables()
+        row = self.fetch_one(
+            """
+            SELECT results FROM search_result_cache
+            WHERE cache_key = ? AND generation = ? AND expires_at > ?
+            """,
+            (cache_key, generation, time.time()),
+        )
+        if not row:
+            return None
+        try:
+            return json.loads(row["results"])
+        except json.JSONDecodeError:
+            return None
+
+    def purge_search_cache(self, keep_generation: int | None = None) -> int:
+        """Delete expired search cache rows and rows from other generations."""
+        self._ensure_generation_tables()
+        if keep_generation is None:
+            cursor = self.execute("DELETE FROM search_result_cache")
+        else:
+            cursor = self.execute(
+                "DELETE FROM search_result_cache WHERE generation != ? OR expires_at <= ?",
+                (keep_generation, time.time()),
+            )
+        return cursor.rowcount
+
     def validate_pipeline_directories(self) -> dict[str, bool]:
         """Validate basic data directories exist and are writable."""
         results = {}
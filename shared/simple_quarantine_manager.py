@@ -13,13 +13,32 @@ from typing import Any, Dict, List
 
 from loguru import logger
 
+from .quarantine_catalog import QuarantineCatalog
+from .simple_db import SimpleDB
+
 
 class SimpleQuarantineManager:
     """Simple quarantine management. Copy files, log errors, enable recovery."""
 
-    def __init__(self, quarantine_dir: str = "data/system_data/quarantine"):
+    def __init__(self, quarantine_dir: str = "data/system_data/quarantine", db_path: str = None):
         self.quarantine_dir = Path(quarantine_dir)
         self.quarantine_dir.mkdir(parents=True, exist_ok=True)
+        self.db = SimpleDB(db_path)
+        self.catalog = QuarantineCatalog(self.db)
+        self._upload_processor = None
+        if self.catalog.is_empty():
+            self.rebuild_catalog()
+
+    @property
+    def upload_processor(self):
+        """Processor used for retries (created on first use, shared by retry workers)."""
+        if self._upload_processor is None:
+            from .simple_upload_processor import SimpleUploadProcessor
+
+            self._upload_processor = SimpleUploadProcessor(
+                str(self.quarantine_dir), db_path=self.db.db_path
+            )
+        return self._upload_processor
 
     def quarantine_file(self, file_path: Path, error_msg: str, metadata: Dict = None) -> Dict[str, Any]:
         """
@@ -54,6 +73,7 @@ class SimpleQuarantineManager:
             error_log_path = quarantine_path.with_suffix('.error.json')
             with open(error_log_path, 'w') as f:
                 json.dump(error_info, f, indent=2)
+            self.catalog.add([{**error_info, "error_log": str(error_log_path)}])
 
             logger.warning(f"File quarantined: {file_path.name} -> {quarantine_filename}")
             
@@ -73,40 +93,74 @@ class SimpleQuarantineManager:
             }
 
     def list_quarantined_files(self) -> List[Dict[str, Any]]:
-        """List all quarantined files with their error information."""
-        quarantined_files = []
-        
-        for error_file in self.quarantine_dir.glob("*.error.json"):
+        """List all quarantined files with their error information (from the catalog)."""
+        return [
+            {
+                "error_log": row["error_log"],
+                "quarantined_file": row["quarantine_path"],
+                "original_path": row["original_path"],
+                "timestamp": row["quarantined_at"],
+                "error_message": row["error_message"],
+                "file_size": row["file_size"],
+                "can_retry": row["status"] == "quarantined",
+                "status": row["status"],
+                "category": row["category"],
+                "attempts": row["attempt_count"],
+                "next_retry_at": row["next_retry_at"],
+            }
+            for row in self.catalog.entries()
+        ]
+
+    def rebuild_catalog(self) -> int:
+        """Catalog error logs already in the quarantine directory (one directory walk)."""
+        entries = []
+        for error_file in self.quarantine_dir.glob("*.error.*"):
             try:
-                with open(error_file, 'r') as f:
-                    error_info = json.load(f)
-                
-                # Find corresponding quarantined file
-                quarantine_file = error_file.with_suffix('')
-                if not quarantine_file.exists():
-                    # Try to find file with different extension
-                    base_name = error_file.stem[:-6]  # Remove .error
-                    possible_files = list(self.quarantine_dir.glob(f"{base_name}*"))
-                    quarantine_file = next((f for f in possible_files if not f.name.endswith('.error.json')), None)
-                
-                file_info = {
+                if error_file.suffix == ".json":
+                    with open(error_file, 'r') as f:
+                        error_info = json.load(f)
+                elif error_file.suffix == ".txt":
+                    # Written by SimpleUploadProcessor as "Key: value" lines
+                    lines = dict(
+                        line.split(": ", 1) for line in error_file.read_text().splitlines()
+                        if ": " in line
+                    )
+                    error_info = {
+                        "timestamp": lines.get("Timestamp"),
+                        "original_path": lines.get("Original path"),
+                        "quarantine_path": lines.get("Quarantine path"),
+                        "error_message": lines.get("Error"),
+                    }
+                else:
+                    continue
+
+                quarantine_file = error_info.get("quarantine_path")
+                if not quarantine_file or not Path(quarantine_file).exists():
+                    # Find corresponding quarantined file
+                    base_name = error_file.name.split(".error.")[0]
+                    quarantine_file = next(
+                        (str(f) for f in self.quarantine_dir.glob(f"{base_name}*")
+                         if ".error." not in f.name),
+                        None,
+                    )
+                if quarantine_file is None:
+                    continue
+
+                entries.append({
+                    **error_info,
+                    "quarantine_path": quarantine_file,
                     "error_log": str(error_file),
-                    "quarantined_file": str(quarantine_file) if quarantine_file and quarantine_file.exists() else None,
-                    "original_path": error_info.get("original_path"),
-                    "timestamp": error_info.get("timestamp"),
-                    "error_message": error_info.get("error_message"),
-                    "file_size": error_info.get("file_size", 0),
-                    "can_retry": quarantine_file and quarantine_file.exists()
-                }
-                
-                quarantined_files.append(file_info)
-                
+                    "file_size": error_info.get("file_size")
+                    or Path(quarantine_file).stat().st_size,
+                })
+
             except Exception as e:
                 logger.warning(f"Could not read quarantine info from {error_file}: {e}")
-        
-        # Sort by timestamp (newest first)
-        quarantined_files.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
-        return quarantined_files
+
+        added = self.catalog.add(entries)
+        if added:
+            logger.info(f"Cataloged {added} quarantined files from {self.quarantine_dir}")
+        return added
 
     def retry_quarantined_file(self, quarantine_path: Path) -> Dict[str, Any]:
         """
@@ -116,17 +170,20 @@ class SimpleQuarantineManager:
             quarantine_path: Path to quarantined file
             
         Returns:
-            Retry result information
+            Retry result information, including the file's new catalog status
         """
+        quarantine_path = Path(quarantine_path)
+        key = str(quarantine_path)
         if not quarantine_path.exists():
-            return {"success": False, "error": "Quarantined file not found"}
+            error = "Quarantined file not found"
+            status = self.catalog.record_attempt(key, success=False, error_message=error)
+            return {"success": False, "error": error, "status": status}
 
         try:
-            # Use SimpleUploadProcessor to retry
-            from .simple_upload_processor import SimpleUploadProcessor
-            
-            processor = SimpleUploadProcessor()
-            result = processor.process_file(quarantine_path, source="retry")
+            # Don't re-quarantine a copy of a file that is already in quarantine
+            result = self.upload_processor.process_file(
+                quarantine_path, source="retry", quarantine=False
+            )
             
             if result["success"]:
                 # Move quarantined file to a "recovered" subdirectory
@@ -143,58 +200,55 @@ class SimpleQuarantineManager:
                     recovered_error_log = recovered_path.with_suffix('.error.json')
                     shutil.move(error_log, recovered_error_log)
                 
+                status = self.catalog.record_attempt(
+                    key,
+                    success=True,
+                    recovered_path=str(recovered_path),
+                    content_id=str(result["content_id"]),
+                )
                 logger.info(f"Successfully recovered quarantined file: {quarantine_path.name}")
                 
                 return {
                     "success": True,
                     "content_id": result["content_id"],
                     "recovered_path": str(recovered_path),
+                    "status": status,
                     "message": "File successfully recovered and processed"
                 }
             else:
                 logger.warning(f"Retry failed for {quarantine_path.name}: {result['error']}")
+                status = self.catalog.record_attempt(
+                    key, success=False, error_message=result["error"]
+                )
                 return {
                     "success": False,
                     "error": result["error"],
+                    "status": status,
                     "message": "Retry processing failed"
                 }
                 
         except Exception as e:
             logger.error(f"Error during retry of {quarantine_path}: {e}")
+            status = self.catalog.record_attempt(key, success=False, error_message=str(e))
             return {
                 "success": False,
                 "error": str(e),
+                "status": status,
                 "message": f"Exception during retry: {e}"
             }
 
     def get_quarantine_stats(self) -> Dict[str, Any]:
-        """Get statistics about quarantined files."""
-        quarantined_files = self.list_quarantined_files()
-        
-        total_files = len(quarantined_files)
-        retryable_files = sum(1 for f in quarantined_files if f["can_retry"])
-        
-        # Count by error type (simple categorization)
-        error_categories = {}
-        for file_info in quarantined_files:
-            error_msg = file_info.get("error_message", "").lower()
-            if "pdf" in error_msg:
-                category = "PDF Processing"
-            elif "permission" in error_msg or "access" in error_msg:
-                category = "File Access"
-            elif "corrupt" in error_msg or "invalid" in error_msg:
-                category = "File Corruption"
-            elif "timeout" in error_msg:
-                category = "Timeout"
-            else:
-                category = "Other"
-            
-            error_categories[category] = error_categories.get(category, 0) + 1
-        
+        """Get statistics about quarantined files (from the catalog, no directory walk)."""
+        stats = self.catalog.stats()
+        by_status = stats["by_status"]
+
         return {
-            "total_quarantined": total_files,
-            "retryable_files": retryable_files,
-            "error_categories": error_categories,
+            "total_quarantined": sum(n for status, n in by_status.items() if status != "recovered"),
+            "retryable_files": by_status.get("quarantined", 0) + by_status.get("retrying", 0),
+            "permanent_failures": by_status.get("permanent_failure", 0),
+            "recovered_files": by_status.get("recovered", 0),
+            "error_categories": stats["error_categories"],
+            "next_retry_at": stats["next_retry_at"],
             "quarantine_directory": str(self.quarantine_dir),
             "directory_exists": self.quarantine_dir.exists()
         }
@@ -218,6 +272,8 @@ class SimpleQuarantineManager:
                         logger.debug(f"Cleaned old quarantine file: {file_path.name}")
                     except Exception as e:
                         logger.warning(f"Could not clean {file_path}: {e}")
+
+        self.catalog.forget(cleaned_files)
         
         logger.info(f"Quarantine cleanup: removed {len(cleaned_files)} files, freed {total_size_freed:,} bytes")
         
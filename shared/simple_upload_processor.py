@@ -7,31 +7,59 @@ Follows CLAUDE.md principles: Simple > Complex, Working > Perfect.
 """
 
 import hashlib
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
 from loguru import logger
 
+from .file_manifest import FileManifest
+from .quarantine_catalog import QuarantineCatalog
 from .simple_db import SimpleDB
 
+# Parallel extraction workers for directory ingestion
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", str(min(4, os.cpu_count() or 1))))
+
 
 class SimpleUploadProcessor:
     """Direct file upload processing. No pipeline directories, no state management."""
 
-    def __init__(self, quarantine_dir: str = "data/system_data/quarantine"):
+    def __init__(self, quarantine_dir: str = "data/system_data/quarantine", db_path: str = None):
         self.quarantine_dir = Path(quarantine_dir)
         self.quarantine_dir.mkdir(parents=True, exist_ok=True)
-        self.db = SimpleDB()
+        self.db = SimpleDB(db_path)
+        self._manifest = None
+        self._quarantine_catalog = None
+
+    @property
+    def manifest(self) -> FileManifest:
+        """File manifest used to skip unchanged files (created on first use)."""
+        if self._manifest is None:
+            self._manifest = FileManifest(self.db)
+        return self._manifest
 
-    def process_file(self, file_path: Path, source: str = "upload") -> Dict[str, Any]:
+    @property
+    def quarantine_catalog(self) -> QuarantineCatalog:
+        """Catalog that quarantined files are registered in for scheduled retries."""
+        if self._quarantine_catalog is None:
+            self._quarantine_catalog = QuarantineCatalog(self.db)
+        return self._quarantine_catalog
+
+    def process_file(
+        self, file_path: Path, source: str = "upload", file_hash: str = None,
+        quarantine: bool = True,
+    ) -> Dict[str, Any]:
         """
         Process file directly to database. No intermediate directories.
         
         Args:
             file_path: Path to file to process
             source: Source type (upload, pdf, email, etc.)
+            file_hash: SHA-256 of the file if the caller already computed it
+            quarantine: Quarantine the file on failure (off for quarantine retries)
             
         Returns:
             Processing result with content_id or error info
@@ -59,7 +87,7 @@ class SimpleUploadProcessor:
                             return {
                                 "success": True,
                                 "content_id": result.get('content_id', 'pdf_processed'),
-                                "file_hash": self._get_file_hash(file_path),
+                                "file_hash": file_hash or self._get_file_hash(file_path),
                                 "message": f"PDF processed via PDFService: {file_path.name}",
                                 "chunks_processed": result.get('chunks_processed', 0)
                             }
@@ -72,7 +100,7 @@ class SimpleUploadProcessor:
                     logger.warning(f"No content extracted from {file_path.name}, storing with empty body")
             
             # Generate file hash for deduplication
-            file_hash = self._get_file_hash(file_path)
+            file_hash = file_hash or self._get_file_hash(file_path)
             
             # Store directly in database (even if content is empty - for tracking)
             content_id = self.db.add_content(
@@ -102,6 +130,8 @@ class SimpleUploadProcessor:
 
         except Exception as e:
             logger.error(f"Failed to process {file_path.name}: {e}")
+            if not quarantine:
+                return {"success": False, "error": str(e)}
             quarantine_path = self._quarantine_file(file_path, str(e))
             
             return {
@@ -152,8 +182,25 @@ class SimpleUploadProcessor:
         
         return results
 
-    def process_directory_recursive(self, dir_path: Path, extensions: list[str] = None) -> Dict[str, Any]:
-        """Process all supported files in a directory recursively."""
+    def process_directory_recursive(
+        self,
+        dir_path: Path,
+        extensions: list[str] = None,
+        workers: int = None,
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """Process all supported files in a directory recursively.
+
+        Files whose size and mtime match the manifest are skipped without being
+        opened; files whose SHA-256 matches an ingested file are skipped after
+        hashing. Only new or changed files are extracted, by a worker pool.
+
+        Args:
+            dir_path: Directory to scan
+            extensions: File extensions to include
+            workers: Parallel extraction workers (default UPLOAD_WORKERS)
+            force: Ignore the manifest and process every file
+        """
         if not dir_path.exists() or not dir_path.is_dir():
             return {"success": False, "error": f"Directory not found: {dir_path}"}
 
@@ -161,41 +208,104 @@ class SimpleUploadProcessor:
             extensions = ['.pdf', '.txt', '.md', '.docx']
         
         # Collect all files recursively
-        files = []
+        files = set()
         for ext in extensions:
-            files.extend(dir_path.rglob(f"*{ext}"))
+            files.update(f for f in dir_path.rglob(f"*{ext}") if f.is_file())
+        files = sorted(files)
 
         results = {
             "total_files": len(files),
             "success_count": 0,
             "failed_count": 0,
+            "unchanged_count": 0,
+            "duplicate_count": 0,
             "processed_files": [],
             "failed_files": []
         }
 
+        keys = {file_path: self.manifest.key(file_path) for file_path in files}
+        known = {} if force else self.manifest.lookup(keys.values())
+        pending, touched = [], []
         for file_path in files:
-            result = self.process_file(file_path, source="document")
-            
-            if result["success"]:
-                results["success_count"] += 1
-                results["processed_files"].append({
-                    "file": file_path.name,
-                    "path": str(file_path),
-                    "content_id": result["content_id"]
-                })
-            else:
-                results["failed_count"] += 1
-                results["failed_files"].append({
-                    "file": file_path.name,
-                    "path": str(file_path),
-                    "error": result["error"]
-                })
+            stat = file_path.stat()
+            entry = known.get(keys[file_path])
+            if entry and entry["size"] == stat.st_size:
+                if entry["mtime_ns"] == stat.st_mtime_ns:
+                    results["unchanged_count"] += 1
+                    continue
+                # Touched but possibly identical: hashing is far cheaper than extraction
+                if self._get_file_hash(file_path) == entry["file_hash"]:
+                    touched.append({**entry, "mtime_ns": stat.st_mtime_ns})
+                    results["unchanged_count"] += 1
+                    continue
+            pending.append((file_path, stat))
+        self.manifest.record(touched)
+
+        workers = max(1, workers or UPLOAD_WORKERS)
+        if pending:
+            logger.info(
+                f"{len(pending)} new or changed files to process "
+                f"({results['unchanged_count']} unchanged), {workers} workers"
+            )
+        entries = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(lambda item: self._process_changed_file(*item, force), pending)
+            for (file_path, _), (result, entry) in zip(pending, outcomes):
+                if result["success"]:
+                    if result.get("duplicate"):
+                        results["duplicate_count"] += 1
+                    else:
+                        results["success_count"] += 1
+                    results["processed_files"].append({
+                        "file": file_path.name,
+                        "path": str(file_path),
+                        "content_id": result["content_id"]
+                    })
+                    entries.append(entry)
+                else:
+                    results["failed_count"] += 1
+                    results["failed_files"].append({
+                        "file": file_path.name,
+                        "path": str(file_path),
+                        "error": result["error"]
+                    })
+        # Failed files stay out of the manifest so the next run retries them
+        self.manifest.record(entries)
 
-        logger.info(f"Recursive directory processing complete: {results['success_count']}/{results['total_files']} successful")
+        logger.info(
+            f"Recursive directory processing complete: {results['success_count']} processed, "
+            f"{results['duplicate_count']} duplicates, {results['unchanged_count']} unchanged, "
+            f"{results['failed_count']} failed of {results['total_files']}"
+        )
         results["success"] = results["failed_count"] == 0
         
         return results
 
+    def _process_changed_file(
+        self, file_path: Path, stat: os.stat_result, force: bool = False
+    ) -> tuple[Dict[str, Any], dict]:
+        """Hash a new/changed file, reuse known content for identical bytes, else extract it."""
+        try:
+            file_hash = self._get_file_hash(file_path)
+        except OSError as e:
+            return {"success": False, "error": str(e)}, {}
+
+        content_id = None if force else self.manifest.content_for_hash(file_hash)
+        if content_id:
+            logger.debug(f"{file_path.name} matches already ingested content {content_id}")
+            result = {"success": True, "content_id": content_id, "duplicate": True}
+        else:
+            result = self.process_file(file_path, source="document", file_hash=file_hash)
+
+        entry = {
+            "path": self.manifest.key(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "file_hash": file_hash,
+            "content_id": result.get("content_id"),
+        }
+        return result, entry
+
     def _extract_content(self, file_path: Path) -> str:
         """Extract text content from file based on extension."""
         suffix = file_path.suffix.lower()
@@ -291,6 +401,13 @@ Original path: {file_path}
 Quarantine path: {quarantine_path}
 """
         error_log_path.write_text(error_info)
+        self.quarantine_catalog.add([{
+            "quarantine_path": str(quarantine_path),
+            "original_path": str(file_path),
+            "error_log": str(error_log_path),
+            "error_message": error_msg,
+            "file_size": quarantine_path.stat().st_size,
+        }])
 
         logger.warning(f"File quarantined: {file_path.name} -> {quarantine_filename}")
         return quarantine_path
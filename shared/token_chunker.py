@@ -0,0 +1,156 @@
+"""
+Token-aware text chunking.
+
+Packs sentences into chunks that fit the embedding model's 512-token window
+instead of a fixed character count. The text is tokenized once with the
+model's fast tokenizer and chunks are yielded as (start, end) character
+offsets into the original string, so no intermediate copies are made until a
+caller actually slices a chunk out.
+"""
+
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from functools import lru_cache
+
+from loguru import logger
+
+# Tokenizer of the model EmbeddingService encodes with (its default model_name); not
+# EMBEDDING_MODEL, which config/settings.py defaults to a different model
+CHUNK_TOKENIZER_MODEL = os.getenv("CHUNK_TOKENIZER_MODEL", "pile-of-law/legalbert-large-1.7M-2")
+MODEL_MAX_TOKENS = 512
+# [CLS] and [SEP] are added by EmbeddingService and count against the window
+MAX_CHUNK_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", str(MODEL_MAX_TOKENS - 2)))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("CHUNK_OVERLAP_TOKENS", "32"))
+
+# End of a sentence (punctuation followed by whitespace) or of a paragraph
+SENTENCE_END = re.compile(r"[.!?][\"')\]]*(?=\s)|(?<=\S)(?=[ \t]*\n\s*\n)")
+
+# Rough WordPiece stand-in: short numeric pieces, word pieces, single symbols
+APPROX_TOKEN = re.compile(r"\d{1,3}|[^\W\d_]{1,8}|\S")
+
+
+class ApproxTokenizer:
+    """Regex tokenizer used when the model's fast tokenizer cannot be loaded."""
+
+    name = "approx"
+
+    def offsets(self, text: str) -> list[tuple[int, int]]:
+        return [m.span() for m in APPROX_TOKEN.finditer(text)]
+
+
+class FastTokenizer:
+    """Offset-only view of a HuggingFace fast (Rust) tokenizer."""
+
+    def __init__(self, backend, name: str) -> None:
+        self.backend = backend
+        self.backend.no_truncation()  # Whole documents are tokenized in one pass
+        self.name = name
+
+    def offsets(self, text: str) -> list[tuple[int, int]]:
+        return self.backend.encode(text, add_special_tokens=False).offsets
+
+
+@lru_cache(maxsize=4)
+def get_chunk_tokenizer(model_name: str = CHUNK_TOKENIZER_MODEL) -> FastTokenizer | ApproxTokenizer:
+    """Load the fast tokenizer for model_name once; fall back to ApproxTokenizer."""
+    try:
+        from transformers import AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        return FastTokenizer(tokenizer.backend_tokenizer, model_name)
+    except Exception as e:
+        logger.warning(f"Fast tokenizer for {model_name} unavailable, estimating tokens: {e}")
+        return ApproxTokenizer()
+
+
+def count_tokens(text: str, tokenizer: FastTokenizer | ApproxTokenizer | None = None) -> int:
+    """Number of model tokens in text, excluding special tokens."""
+    return len((tokenizer or get_chunk_tokenizer()).offsets(text))
+
+
+class TokenChunker:
+    """Split text into sentence-aligned chunks of at most max_tokens tokens."""
+
+    def __init__(
+        self,
+        max_tokens: int = MAX_CHUNK_TOKENS,
+        overlap_tokens: int = CHUNK_OVERLAP_TOKENS,
+        tokenizer: FastTokenizer | ApproxTokenizer | None = None,
+    ) -> None:
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be smaller than max_tokens")
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self._tokenizer = tokenizer
+
+    @property
+    def tokenizer(self) -> FastTokenizer | ApproxTokenizer:
+        if self._tokenizer is None:
+            self._tokenizer = get_chunk_tokenizer()
+        return self._tokenizer
+
+    def chunk_spans(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) offsets of each chunk in text."""
+        offsets = self.tokenizer.offsets(text)
+        if not offsets:
+            return
+        starts = [s for s, _ in offsets]
+        ends = [e for _, e in offsets]
+        boundaries = [m.end() for m in SENTENCE_END.finditer(text)]
+        total = len(offsets)
+
+        first = 0
+        while first < total:
+            last = min(first + self.max_tokens, total)  # Exclusive token index
+            if last < total:
+                last = self._cut_point(first, last, starts, ends, boundaries)
+            yield starts[first], ends[last - 1]
+            if last >= total:
+                break
+            first = self._overlap_start(first, last, starts, ends, boundaries)
+
+    def _cut_point(self, first: int, last: int, starts: list[int], ends: list[int],
+                   boundaries: list[int]) -> int:
+        """Pull last back to the final sentence end in the window, else to a word break."""
+        floor = first + self.max_tokens // 2
+        i = bisect_right(boundaries, ends[last - 1]) - 1
+        if i >= 0:
+            cut = bisect_right(ends, boundaries[i], first, last)
+            if cut >= floor:
+                return cut
+        # Don't split a word into WordPiece fragments across chunks
+        cut = last
+        while cut > floor and starts[cut] == ends[cut - 1]:
+            cut -= 1
+        return cut if cut > floor else last
+
+    def _overlap_start(self, first: int, last: int, starts: list[int], ends: list[int],
+                       boundaries: list[int]) -> int:
+        """First token of the next chunk: a sentence or word start inside the overlap."""
+        start = max(first + 1, last - self.overlap_tokens)
+        i = bisect_left(boundaries, ends[start - 1])
+        if i < len(boundaries):
+            sentence_start = bisect_left(starts, boundaries[i], start, last)
+            if sentence_start < last:
+                return sentence_start
+        while start < last and starts[start] == ends[start - 1]:
+            start += 1
+        return start
+
+    def chunks(self, text: str) -> Iterator[str]:
+        """Yield chunk strings; slices are only made as they are consumed."""
+        for start, end in self.chunk_spans(text):
+            yield text[start:end]
+
+
+_chunker: TokenChunker | None = None
+
+
+def get_token_chunker() -> TokenChunker:
+    """Shared chunker so the tokenizer is loaded once per process."""
+    global _chunker
+    if _chunker is None:
+        _chunker = TokenChunker()
+    return _chunker
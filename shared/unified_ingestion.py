@@ -85,13 +85,17 @@ class UnifiedIngestionService:
         
         # Summary
         logger.info(f"Document ingestion complete in {elapsed:.1f}s")
-        logger.info(f"Processed: {result['success_count']}, Errors: {result['failed_count']}")
+        logger.info(
+            f"Processed: {result['success_count']}, Unchanged: {result['unchanged_count']}, "
+            f"Duplicates: {result['duplicate_count']}, Errors: {result['failed_count']}"
+        )
         
         # Convert SimpleUploadProcessor format to our format
         processed_results = {
             "success": result["success"],
             "processed": result["success_count"],
-            "duplicates": 0,  # Duplicates are handled transparently by SimpleDB
+            "duplicates": result["duplicate_count"],  # Same bytes as an ingested file
+            "unchanged": result["unchanged_count"],  # Skipped via the file manifest
             "errors": result["failed_count"],
             "files": result["processed_files"] + result["failed_files"],
             "elapsed_seconds": elapsed,
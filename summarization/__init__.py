@@ -3,6 +3,15 @@
 Provides TF-IDF and TextRank-based document summarization.
 """
 
+from .batch import BatchSummarizer, TfidfVocabulary, get_batch_summarizer
 from .engine import DocumentSummarizer, TextRankSummarizer, TFIDFSummarizer, get_document_summarizer
 
-__all__ = ["TFIDFSummarizer", "TextRankSummarizer", "DocumentSummarizer", "get_document_summarizer"]
+__all__ = [
+    "TFIDFSummarizer",
+    "TextRankSummarizer",
+    "DocumentSummarizer",
+    "get_document_summarizer",
+    "BatchSummarizer",
+    "TfidfVocabulary",
+    "get_batch_summarizer",
+]
@@ -0,0 +1,322 @@
+"""Batch summarization with a persisted, incrementally updated TF-IDF vocabulary.
+
+TFIDFSummarizer refits a vectorizer for every document, so IDF is computed
+over a single document and carries no signal. Here document frequencies are
+accumulated across batches and saved to disk, keyword scoring is spread over
+a process pool, and TextRank runs once per document in the parent process
+where the (shared) embedding model is already loaded.
+"""
+
+import json
+import math
+import os
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from .engine import TextRankSummarizer, TFIDFSummarizer
+
+DEFAULT_VOCABULARY_PATH = "data/system_data/cache/tfidf_vocabulary.json"
+
+# Below this many documents a process pool costs more than it saves
+MIN_PARALLEL_DOCS = 32
+
+
+_preprocess = TFIDFSummarizer().preprocess_text
+
+
+def _build_analyzer(ngram_range: tuple[int, int]):
+    """Same tokenization/stop words TFIDFSummarizer uses."""
+    return TfidfVectorizer(ngram_range=ngram_range, stop_words="english").build_analyzer()
+
+
+class TfidfVocabulary:
+    """Corpus document frequencies persisted as JSON, updated incrementally."""
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ngram_range: tuple[int, int] = (1, 3),
+        max_terms: int = 200_000,
+        max_df: float = 0.95,
+    ) -> None:
+        """Initialize and load any saved vocabulary.
+
+        Args:
+            path: JSON file location (env SUMMARY_VOCAB_PATH overrides the default)
+            ngram_range: N-gram range for the analyzer
+            max_terms: Rarest terms are pruned when the vocabulary grows past this
+                (pruned and unseen terms are scored as if df=1)
+            max_df: Terms in more than this fraction of documents are ignored when scoring
+        """
+        self.path = Path(path or os.getenv("SUMMARY_VOCAB_PATH", DEFAULT_VOCABULARY_PATH))
+        self.ngram_range = ngram_range
+        self.max_terms = max_terms
+        self.max_df = max_df
+        self.num_docs = 0
+        self.doc_freq: Counter = Counter()
+        self.analyzer = _build_analyzer(ngram_range)
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> bool:
+        """Load saved frequencies; returns False if there is no usable file."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+        if tuple(data.get("ngram_range", ())) != tuple(self.ngram_range):
+            logger.warning(f"Ignoring TF-IDF vocabulary at {self.path}: n-gram range changed")
+            return False
+        self.num_docs = data.get("num_docs", 0)
+        self.doc_freq = Counter(data.get("doc_freq", {}))
+        logger.debug(f"Loaded TF-IDF vocabulary: {len(self.doc_freq)} terms, {self.num_docs} docs")
+        return True
+
+    def save(self) -> None:
+        """Atomically write the vocabulary to disk."""
+        with self._lock:
+            data = {
+                "ngram_range": list(self.ngram_range),
+                "num_docs": self.num_docs,
+                "doc_freq": dict(self.doc_freq),
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+    def partial_fit(self, texts: Iterable[str]) -> int:
+        """Add documents to the frequency counts.
+
+        Returns:
+            Number of documents added
+        """
+        added = 0
+        batch_df: Counter = Counter()
+        for text in texts:
+            terms = set(self.analyzer(_preprocess(text or "")))
+            if terms:
+                batch_df.update(terms)
+                added += 1
+        with self._lock:
+            self.doc_freq.update(batch_df)
+            self.num_docs += added
+            if len(self.doc_freq) > self.max_terms:
+                self.doc_freq = Counter(dict(self.doc_freq.most_common(self.max_terms)))
+        return added
+
+    def idf_table(self) -> dict[str, float]:
+        """Smoothed IDF per term (sklearn's formula); over-common terms map to 0."""
+        with self._lock:
+            n = self.num_docs
+            cutoff = self.max_df * n if n >= 10 else float("inf")
+            return {
+                term: math.log((1 + n) / (1 + df)) + 1.0 if df <= cutoff else 0.0
+                for term, df in self.doc_freq.items()
+            }
+
+    def unseen_idf(self) -> float:
+        """IDF for terms not in the table (never seen, or pruned at max_terms): df=1."""
+        with self._lock:
+            return math.log((1 + self.num_docs) / 2) + 1.0
+
+
+# --- Process pool worker state (set once per worker by the initializer) -------
+_worker_idf: dict[str, float] = {}
+_worker_unseen_idf = 1.0
+_worker_analyzer = None
+
+
+def _init_keyword_worker(
+    idf: dict[str, float], unseen_idf: float, ngram_range: tuple[int, int]
+) -> None:
+    global _worker_idf, _worker_unseen_idf, _worker_analyzer
+    _worker_idf = idf
+    _worker_unseen_idf = unseen_idf
+    _worker_analyzer = _build_analyzer(ngram_range)
+
+
+def _score_keywords(
+    texts: list[str],
+    max_keywords: int,
+    idf: dict[str, float] | None = None,
+    analyzer=None,
+    unseen_idf: float | None = None,
+) -> list[dict[str, float]]:
+    """L2-normalized tf*idf per document, top max_keywords terms.
+
+    Pool workers use the initializer's IDF table; inline callers pass their own.
+    Terms missing from the table get unseen_idf; terms with IDF 0 are skipped.
+    """
+    idf = _worker_idf if idf is None else idf
+    unseen_idf = _worker_unseen_idf if unseen_idf is None else unseen_idf
+    analyzer = analyzer or _worker_analyzer
+    results = []
+    for text in texts:
+        counts = Counter(analyzer(_preprocess(text or "")))
+        weights = {
+            term: tf * weight
+            for term, tf in counts.items()
+            if (weight := idf.get(term, unseen_idf)) > 0
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        top = sorted(weights.items(), key=lambda kv: kv[1], reverse=True)[:max_keywords]
+        results.append({term: float(w / norm) for term, w in top})
+    return results
+
+
+class BatchSummarizer:
+    """Summarize many documents against one fitted vocabulary."""
+
+    def __init__(
+        self,
+        vocabulary: TfidfVocabulary | None = None,
+        textrank: TextRankSummarizer | None = None,
+        workers: int | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        """Initialize the batch summarizer.
+
+        Args:
+            vocabulary: TF-IDF vocabulary (loaded from the default path if omitted)
+            textrank: TextRank summarizer for key sentences
+            workers: Keyword-scoring processes (env SUMMARY_WORKERS, default cpu count - 1)
+            chunk_size: Documents per pool task
+        """
+        self.vocabulary = vocabulary or TfidfVocabulary()
+        self.textrank = textrank or TextRankSummarizer()
+        self.workers = workers or int(os.getenv("SUMMARY_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+        self.chunk_size = chunk_size
+
+    def extract_keywords(self, texts: list[str], max_keywords: int = 10) -> list[dict[str, float]]:
+        """Keywords for each text using the current vocabulary."""
+        idf = self.vocabulary.idf_table()
+        unseen_idf = self.vocabulary.unseen_idf()
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+
+        if self.workers <= 1 or len(texts) < MIN_PARALLEL_DOCS:
+            analyzer = self.vocabulary.analyzer
+            return [
+                kw
+                for chunk in chunks
+                for kw in _score_keywords(chunk, max_keywords, idf, analyzer, unseen_idf)
+            ]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            initializer=_init_keyword_worker,
+            initargs=(idf, unseen_idf, self.vocabulary.ngram_range),
+        ) as pool:
+            # map() preserves input order
+            scored = pool.map(_score_keywords, chunks, [max_keywords] * len(chunks))
+            return [kw for chunk in scored for kw in chunk]
+
+    def summarize(
+        self,
+        texts: list[str],
+        max_sentences: int = 3,
+        max_keywords: int = 10,
+        update_vocabulary: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Combined summaries (same shape as DocumentSummarizer.extract_summary).
+
+        Args:
+            texts: Documents to summarize
+            max_sentences: Key sentences per document
+            max_keywords: Keywords per document
+            update_vocabulary: Fold these documents into the vocabulary first (and save it)
+        """
+        if not texts:
+            return []
+        if update_vocabulary:
+            self.vocabulary.partial_fit(texts)
+            self.vocabulary.save()
+
+        keywords = self.extract_keywords(texts, max_keywords)
+        results = []
+        for text, kw in zip(texts, keywords):
+            sentences = self.textrank.extract_sentences(text, max_sentences) if text else []
+            results.append(
+                {
+                    "summary_type": "combined",
+                    "summary_text": " ".join(sentences) if sentences else None,
+                    "tf_idf_keywords": kw or None,
+                    "textrank_sentences": sentences or None,
+                }
+            )
+        return results
+
+    def iter_summaries(
+        self,
+        documents: Iterable[tuple[str, str]],
+        batch_size: int = 256,
+        max_sentences: int = 3,
+        max_keywords: int = 10,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Summarize (document_id, text) pairs, yielding one list of rows per batch."""
+        batch: list[tuple[str, str]] = []
+
+        def flush() -> list[dict[str, Any]]:
+            summaries = self.summarize([text for _, text in batch], max_sentences, max_keywords)
+            return [{"document_id": doc_id, **summary} for (doc_id, _), summary in zip(batch, summaries)]
+
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= batch_size:
+                yield flush()
+                batch = []
+        if batch:
+            yield flush()
+
+    def summarize_to_db(
+        self,
+        db: Any,
+        documents: Iterable[tuple[str, str]],
+        batch_size: int = 256,
+        max_sentences: int = 3,
+        max_keywords: int = 10,
+    ) -> dict[str, int]:
+        """Summarize documents and bulk-insert each batch into document_summaries.
+
+        Args:
+            db: SimpleDB instance
+            documents: (document_id, text) pairs
+            batch_size: Documents per summarize/insert batch
+
+        Returns:
+            Counts of summarized and stored documents
+        """
+        summarized = 0
+        stored = 0
+        for rows in self.iter_summaries(documents, batch_size, max_sentences, max_keywords):
+            summarized += len(rows)
+            rows = [r for r in rows if r["summary_text"] or r["tf_idf_keywords"]]
+            if rows:
+                stored += db.batch_add_document_summaries(rows)["inserted"]
+        logger.info(f"Batch summarization stored {stored}/{summarized} summaries")
+        return {"summarized": summarized, "stored": stored}
+
+
+# Singleton instance
+_batch_summarizer = None
+
+
+def get_batch_summarizer() -> BatchSummarizer:
+    """
+    Get singleton batch summarizer (shares the document summarizer's TextRank).
+    """
+    global _batch_summarizer
+    if _batch_summarizer is None:
+        from .engine import get_document_summarizer
+
+        _batch_summarizer = BatchSummarizer(textrank=get_document_summarizer().textrank_summarizer)
+    return _batch_summarizer
@@ -3,13 +3,17 @@
 Uses TF-IDF for keyword extraction and TextRank for sentence extraction.
 """
 
+import hashlib
 import re
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import networkx as nx
 import numpy as np
 from loguru import logger
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
@@ -18,6 +22,48 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 # Logger is now imported globally from loguru
 
+# Sentences per model forward pass in batched TextRank
+TEXTRANK_ENCODE_BATCH = 32
+
+
+def sparse_pagerank(
+    weights: np.ndarray | sparse.spmatrix,
+    damping: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+) -> np.ndarray:
+    """Weighted PageRank by power iteration on a sparse transition matrix.
+
+    Matches networkx.pagerank on the same weighted graph: rows are normalized
+    by out-weight and dangling nodes redistribute uniformly.
+
+    Args:
+        weights: Square non-negative edge weight matrix (dense or sparse)
+        damping: Damping factor
+        max_iter: Iteration cap
+        tol: Convergence tolerance (scaled by node count, as networkx does)
+
+    Returns:
+        Score per node, summing to 1
+    """
+    matrix = sparse.csr_matrix(weights, dtype=np.float64)
+    n = matrix.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    out_weight = np.asarray(matrix.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inv = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    transition_t = (sparse.diags(inv) @ matrix).T.tocsr()
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = scores
+        scores = damping * (transition_t @ previous + previous[dangling].sum() / n) + (1.0 - damping) / n
+        if np.abs(scores - previous).sum() < n * tol:
+            break
+    return scores / scores.sum()
+
 
 class TFIDFSummarizer:
     """
@@ -169,14 +215,28 @@ class TextRankSummarizer:
     Extract key sentences using TextRank algorithm with Legal BERT embeddings.
     """
 
-    def __init__(self, similarity_threshold: float = 0.3) -> None:
+    def __init__(
+        self,
+        similarity_threshold: float = 0.3,
+        batch_mode: bool = True,
+        embedding_cache_size: int = 32,
+    ) -> None:
         """Initialize TextRank summarizer.
 
         Args:
             similarity_threshold: Minimum similarity to create edge in graph
+            batch_mode: Encode all sentences in one length-bucketed batch and rank with
+                sparse power iteration; False keeps the per-sentence/networkx path
+            embedding_cache_size: Documents whose sentence embeddings are kept for reuse
         """
         self.similarity_threshold = similarity_threshold
+        self.batch_mode = batch_mode
+        self.embedding_cache_size = embedding_cache_size
         self.embedding_service = None
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _get_embedding_service(self):
         """
@@ -247,41 +307,18 @@ class TextRankSummarizer:
             if len(sentences) <= max_sentences:
                 return sentences
 
-            # Try to use Legal BERT embeddings
-            embedding_service = self._get_embedding_service()
-
-            if embedding_service:
-                # Get embeddings for each sentence
-                embeddings = []
-                for sentence in sentences:
-                    try:
-                        embedding = embedding_service.encode(sentence)
-                        embeddings.append(embedding)
-                    except Exception as e:
-                        logger.warning(f"Error encoding sentence: {e}")
-                        # Use basic vectorization as fallback
-                        embeddings = None
-                        break
-
-                if embeddings:
-                    embeddings = np.array(embeddings)
-                    # Calculate similarity matrix
-                    similarity_matrix = cosine_similarity(embeddings)
-                    # Remove self-similarity and sparsify by threshold
-                    np.fill_diagonal(similarity_matrix, 0.0)
-                    similarity_matrix[similarity_matrix < self.similarity_threshold] = 0.0
+            if self.batch_mode:
+                embeddings = self._batch_sentence_embeddings(text, sentences)
+                if embeddings is not None:
+                    similarity_matrix = self._embedding_similarity(embeddings)
                 else:
-                    # Fallback to TF-IDF for similarity
                     similarity_matrix = self._tfidf_similarity(sentences)
+                scores = sparse_pagerank(similarity_matrix, max_iter=100)
             else:
-                # Fallback to TF-IDF for similarity
-                similarity_matrix = self._tfidf_similarity(sentences)
-
-            # Create graph from similarity matrix
-            nx_graph = nx.from_numpy_array(similarity_matrix)
-
-            # Apply TextRank (PageRank on the graph)
-            scores = nx.pagerank(nx_graph, max_iter=100)
+                similarity_matrix = self._per_sentence_similarity(sentences)
+                # Create graph from similarity matrix and apply TextRank (PageRank on the graph)
+                nx_graph = nx.from_numpy_array(similarity_matrix)
+                scores = nx.pagerank(nx_graph, max_iter=100)
 
             # Rank by PageRank score (indices)
             ranked_indices = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)
@@ -308,6 +345,78 @@ class TextRankSummarizer:
             sentences = self.split_sentences(text)
             return sentences[:max_sentences]
 
+    def _batch_sentence_embeddings(self, text: str, sentences: list[str]) -> np.ndarray | None:
+        """Sentence embeddings from one batched, length-bucketed encode call.
+
+        Results are cached per document so repeated summaries (different
+        max_sentences, re-runs) skip the model entirely.
+        """
+        key = hashlib.sha256(text.encode("utf-8", "ignore")).hexdigest()
+        with self._cache_lock:
+            cached = self._embedding_cache.get(key)
+            if cached is not None and len(cached) == len(sentences):
+                self._embedding_cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        embedding_service = self._get_embedding_service()
+        if not embedding_service:
+            return None
+
+        # Sort by length so each model batch pads to similar lengths, then restore order
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        try:
+            if hasattr(embedding_service, "batch_encode"):
+                encoded = embedding_service.batch_encode(
+                    [sentences[i] for i in order], batch_size=TEXTRANK_ENCODE_BATCH
+                )
+            else:
+                encoded = [embedding_service.encode(sentences[i]) for i in order]
+        except Exception as e:
+            logger.warning(f"Error batch encoding sentences: {e}")
+            return None
+
+        embeddings = np.empty((len(sentences), len(encoded[0])), dtype=np.float32)
+        embeddings[order] = np.asarray(encoded, dtype=np.float32)
+
+        with self._cache_lock:
+            self._embedding_cache[key] = embeddings
+            self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+        return embeddings
+
+    def _embedding_similarity(self, embeddings: np.ndarray) -> np.ndarray:
+        """Thresholded cosine similarity matrix with zero diagonal."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        unit = embeddings / np.where(norms > 0, norms, 1.0)
+        similarity_matrix = (unit @ unit.T).astype(np.float64)
+        np.fill_diagonal(similarity_matrix, 0.0)
+        similarity_matrix[similarity_matrix < self.similarity_threshold] = 0.0
+        return similarity_matrix
+
+    def _per_sentence_similarity(self, sentences: list[str]) -> np.ndarray:
+        """Similarity matrix from one encode() call per sentence (pre-batching path)."""
+        embedding_service = self._get_embedding_service()
+        if not embedding_service:
+            return self._tfidf_similarity(sentences)
+
+        embeddings = []
+        for sentence in sentences:
+            try:
+                embeddings.append(embedding_service.encode(sentence))
+            except Exception as e:
+                logger.warning(f"Error encoding sentence: {e}")
+                # Use basic vectorization as fallback
+                return self._tfidf_similarity(sentences)
+
+        similarity_matrix = cosine_similarity(np.array(embeddings))
+        # Remove self-similarity and sparsify by threshold
+        np.fill_diagonal(similarity_matrix, 0.0)
+        similarity_matrix[similarity_matrix < self.similarity_threshold] = 0.0
+        return similarity_matrix
+
     def _tfidf_similarity(self, sentences: list[str]) -> np.ndarray:
         """Calculate sentence similarity using TF-IDF (fallback method).
 
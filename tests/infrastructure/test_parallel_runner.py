@@ -0,0 +1,115 @@
+"""Tests for the ordered process-pool runner used by document conversion."""
+
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from infrastructure.documents import document_pipeline
+    from infrastructure.documents.document_pipeline import DocumentPipeline
+    from infrastructure.documents.parallel_runner import ThroughputStats, run_parallel
+    RUNNER_AVAILABLE = True
+except ImportError:
+    RUNNER_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(
+    not RUNNER_AVAILABLE, reason="infrastructure.documents not importable"
+)
+
+
+def work(kind, value):
+    if kind == "sleep":
+        time.sleep(value)
+    if kind == "crash":
+        os._exit(1)
+    return {"success": True, "value": value}
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("x" * 100)
+    return path
+
+
+class TestRunParallel:
+    def test_results_follow_job_order(self, source):
+        jobs = [(source, ("sleep", 0.05 * (5 - i))) for i in range(6)]
+
+        results = list(run_parallel(work, jobs, workers=3))
+
+        assert [index for index, _ in results] == list(range(6))
+        assert all(result["success"] and "elapsed_seconds" in result for _, result in results)
+
+    def test_timeout_and_crash_only_fail_their_file(self, source):
+        jobs = [(source, ("ok", i)) for i in range(8)]
+        jobs[2] = (source, ("sleep", 30))
+        jobs[5] = (source, ("crash", 0))
+
+        results = dict(run_parallel(work, jobs, workers=4, file_timeout=1))
+
+        assert results[2]["timed_out"]
+        assert results[5]["error"] == "Worker process crashed"
+        assert [results[i]["value"] for i in (0, 1, 3, 4, 6, 7)] == [0, 1, 3, 4, 6, 7]
+
+    def test_byte_cap_still_makes_progress(self, source):
+        jobs = [(source, ("ok", i)) for i in range(5)]
+
+        results = list(run_parallel(work, jobs, workers=4, max_inflight_bytes=10))
+
+        assert [result["value"] for _, result in results] == list(range(5))
+
+
+class TestParallelDirectory:
+    @pytest.fixture
+    def pipeline(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(document_pipeline, "PDF_AVAILABLE", False)
+        pipeline = DocumentPipeline(str(tmp_path / "data"), str(tmp_path / "pipeline.db"))
+        monkeypatch.setattr(document_pipeline, "PDF_AVAILABLE", True)
+
+        calls = []
+        pipeline.lifecycle = MagicMock()
+        pipeline.lifecycle.process_file.side_effect = lambda path, *args: calls.append(
+            path.name
+        ) or {"processed_path": f"processed/{path.name}"}
+        pipeline.lifecycle.quarantine_file.side_effect = lambda path, error: calls.append(
+            path.name
+        ) or f"quarantine/{path.name}"
+
+        def upload_single_pdf(path):
+            if path.endswith("d.pdf"):
+                return {"success": False, "error": "EOF marker not found"}
+            return {"success": True, "content": "pdf text"}
+
+        pipeline.processors["pdf"] = MagicMock(upload_single_pdf=upload_single_pdf)
+        pipeline.lifecycle_calls = calls
+        return pipeline
+
+    def test_mixed_directory_matches_sequential_order(self, pipeline, tmp_path):
+        inbox = tmp_path / "inbox"
+        inbox.mkdir()
+        for name in ("a.txt", "c.md", "e.txt", "f.md"):
+            (inbox / name).write_text(f"Contents of {name}\n")
+        for name in ("b.pdf", "d.pdf"):
+            (inbox / name).write_bytes(b"%PDF-1.4")
+
+        result = pipeline.process_directory(str(inbox), parallel=True, workers=2)
+
+        names = ["a.txt", "b.pdf", "c.md", "d.pdf", "e.txt", "f.md"]
+        assert [r["file"].rsplit("/", 1)[-1] for r in result["results"]] == names
+        assert [r["success"] for r in result["results"]] == [True, True, True, False, True, True]
+        assert pipeline.lifecycle_calls == names
+        assert pipeline.stats["processed"] == 5 and pipeline.stats["quarantined"] == 1
+
+
+def test_throughput_summary():
+    stats = ThroughputStats()
+    stats.add("docx", 2 * 1024 * 1024, 1.0, True)
+    stats.add("docx", 2 * 1024 * 1024, 1.0, False)
+
+    summary = stats.summary()["docx"]
+    assert summary["files"] == 2 and summary["failed"] == 1
+    assert summary["files_per_sec"] == 1.0
+    assert summary["mb_per_sec"] == 2.0
@@ -0,0 +1,76 @@
+"""Tests for adaptive-DPI page OCR and the selective enhanced pass."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from pdf.ocr.adaptive import AdaptiveOCRPolicy
+    from pdf.ocr.page_processor import PageByPageProcessor
+    ADAPTIVE_AVAILABLE = True
+except (ImportError, NameError):
+    ADAPTIVE_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not ADAPTIVE_AVAILABLE, reason="pdf.ocr not importable")
+
+GOOD_TEXT = (
+    "The tenant notified the landlord about the water damage in the kitchen and "
+    "requested repairs under the lease agreement before the hearing date. "
+) * 6
+
+
+def ocr(text, confidence):
+    return {"success": True, "text": text, "confidence": confidence}
+
+
+@pytest.fixture
+def processor():
+    policy = AdaptiveOCRPolicy(base_dpi=200, escalation_dpi=400, min_confidence=0.75, min_quality=0.5)
+    processor = PageByPageProcessor(batch_size=2, adaptive=True, policy=policy)
+    processor.inspector = MagicMock()
+    processor.inspector.inspect.return_value.page_count = 3
+    processor.base_rasterizer = MagicMock()
+    processor.base_rasterizer.iter_pages.side_effect = lambda path, first, last: (
+        (page, ("low", page)) for page in range(first, last + 1)
+    )
+    processor.escalation_rasterizer = MagicMock()
+    processor.escalation_rasterizer.convert_single_page.side_effect = lambda path, page: {
+        "success": True,
+        "images": [("high", page)],
+    }
+    processor.rasterizer = MagicMock()
+    return processor
+
+
+def test_only_weak_pages_escalate(processor):
+    results = {
+        ("low", 1): ocr(GOOD_TEXT, 0.92),
+        ("low", 2): ocr("n0 1se", 0.41),
+        ("high", 2): ocr(GOOD_TEXT, 0.88),
+        ("low", 3): ocr("#@% &*+ ~|^", 0.9),
+        ("high", 3): ocr("#@% &*+", 0.6),
+    }
+    processor.ocr_engine = MagicMock()
+    processor.ocr_engine.extract_text_from_image.side_effect = lambda image: results[image]
+
+    result = processor.process_large_pdf("scan.pdf")
+
+    decisions = result["page_decisions"]
+    assert [(d["page"], d["dpi"], d["escalated"]) for d in decisions] == [
+        (1, 200, False),
+        (2, 400, True),
+        (3, 200, True),  # Escalated on quality, but the low-DPI pass was more confident
+    ]
+    assert decisions[1]["reason"].startswith("low_confidence")
+    assert decisions[2]["reason"].startswith("low_quality")
+    assert result["escalated_pages"] == 2 and result["cpu_seconds"] >= 0
+    processor.rasterizer.convert_pdf_to_images.assert_not_called()
+    assert processor.escalation_rasterizer.convert_single_page.call_count == 2
+
+
+def test_policy_skips_enhanced_only_when_confident():
+    policy = AdaptiveOCRPolicy(skip_enhanced_confidence=0.85)
+
+    assert policy.skips_enhanced_pass(0.9)
+    assert not policy.skips_enhanced_pass(0.7)
+    assert policy.escalation_reason(0.9, 0.8) is None
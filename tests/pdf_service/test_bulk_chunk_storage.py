@@ -0,0 +1,108 @@
+"""Tests for single-transaction chunk persistence in EnhancedPDFStorage."""
+
+import sqlite3
+
+import pytest
+
+try:
+    from pdf.pdf_storage_enhanced import EnhancedPDFStorage
+    STORAGE_AVAILABLE = True
+except ImportError:
+    STORAGE_AVAILABLE = False
+
+from shared.simple_db import SimpleDB
+
+pytestmark = pytest.mark.skipif(not STORAGE_AVAILABLE, reason="pdf package not importable")
+
+
+@pytest.fixture
+def storage(tmp_path):
+    db_path = str(tmp_path / "pdf.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(
+        """
+        CREATE TABLE documents (
+            chunk_id TEXT PRIMARY KEY, file_path TEXT, file_name TEXT, chunk_index INTEGER,
+            text_content TEXT, char_count INTEGER, file_size INTEGER, file_hash TEXT,
+            source_type TEXT, modified_time REAL, processed_time TEXT, content_type TEXT,
+            ready_for_embedding INTEGER, legal_metadata TEXT, extraction_method TEXT,
+            ocr_confidence REAL, sha256 TEXT, status TEXT, attempt_count INTEGER DEFAULT 0
+        );
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY, source_type TEXT, source_id INTEGER, title TEXT,
+            body TEXT, sha256 TEXT UNIQUE, ready_for_embedding INTEGER
+        );
+        """
+    )
+    conn.close()
+    return EnhancedPDFStorage(db_path)
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "lease.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+    return str(path)
+
+
+def make_chunks(count, prefix="Clause"):
+    return [
+        {"chunk_id": f"abc_{i}", "text": f"{prefix} {i} of the lease.", "chunk_index": i}
+        for i in range(count)
+    ]
+
+
+def test_stores_chunks_and_content_row(storage, pdf_file):
+    chunks = make_chunks(300)
+    result = storage.store_chunks_with_metadata(
+        pdf_file, "abc", chunks, extraction_method="pypdf2", legal_metadata={"case": "24-1"}
+    )
+
+    assert result["success"] and result["chunks_stored"] == 300
+    rows = storage.db.fetch("SELECT * FROM documents ORDER BY chunk_index")
+    assert len(rows) == 300
+    assert rows[7]["char_count"] == len(chunks[7]["text"])
+    assert rows[7]["legal_metadata"] == '{"case": "24-1"}'
+    # Marked processed under the file hash, as IdempotentPDFWriter.check_existing expects
+    assert {(r["sha256"], r["status"]) for r in rows} == {("abc", "processed")}
+
+    full_text = " ".join(c["text"] for c in chunks)
+    content = storage.db.fetch_one("SELECT * FROM content_unified")
+    assert str(content["id"]) == result["content_id"]
+    assert content["sha256"] == SimpleDB.content_hash("pdf", "lease.pdf", full_text)
+
+
+def test_reupload_is_idempotent_and_drops_stale_chunks(storage, pdf_file):
+    first = storage.store_chunks_with_metadata(pdf_file, "abc", make_chunks(10))
+    again = storage.store_chunks_with_metadata(pdf_file, "abc", make_chunks(10))
+
+    assert again["content_id"] == first["content_id"]
+    assert storage.db.fetch_one("SELECT COUNT(*) AS n FROM documents")["n"] == 10
+
+    storage.store_chunks_with_metadata(pdf_file, "abc", make_chunks(4, "Section"))
+    rows = storage.db.fetch("SELECT text_content FROM documents ORDER BY chunk_index")
+    assert [r["text_content"] for r in rows] == [f"Section {i} of the lease." for i in range(4)]
+
+
+def test_reupload_from_another_path_replaces_chunks(storage, pdf_file, tmp_path):
+    storage.store_chunks_with_metadata(pdf_file, "abc", make_chunks(10))
+    moved = tmp_path / "renamed.pdf"
+    moved.write_bytes(b"%PDF-1.4 test")
+    chunks = [
+        {"chunk_id": f"{moved}_{i}", "text": f"Clause {i} of the lease.", "chunk_index": i}
+        for i in range(10)
+    ]
+
+    storage.store_chunks_with_metadata(str(moved), "abc", chunks)
+
+    rows = storage.db.fetch("SELECT chunk_id FROM documents ORDER BY chunk_index")
+    assert [r["chunk_id"] for r in rows] == [c["chunk_id"] for c in chunks]
+
+
+def test_failure_rolls_back_chunks(storage, pdf_file):
+    storage.db.execute("DROP TABLE content_unified")
+
+    result = storage.store_chunks_with_metadata(pdf_file, "abc", make_chunks(5))
+
+    assert not result["success"]
+    assert storage.db.fetch_one("SELECT COUNT(*) AS n FROM documents")["n"] == 0
@@ -0,0 +1,107 @@
+"""Tests for the shared PDF inspection profile used by OCR decisions."""
+
+import pytest
+
+try:
+    from pdf.ocr.inspector import PDFInspector
+    from pdf.ocr.validator import PDFValidator
+    INSPECTOR_AVAILABLE = True
+except ImportError:
+    INSPECTOR_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not INSPECTOR_AVAILABLE, reason="pdf.ocr not importable")
+
+LINE = "The tenant notice was served on the landlord at the property address."
+
+
+def build_pdf(pages):
+    """Minimal PDF; each page is 'text' (12 text lines) or 'scan' (full-page image)."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+    font = len(objects) + 1
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    image = len(objects) + 1
+    objects.append(
+        b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+        b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"
+    )
+    kids = []
+    for kind in pages:
+        if kind == "text":
+            lines = "".join(f"0 -14 Td ({LINE}) Tj\n" for _ in range(12))
+            stream = f"BT /F1 10 Tf 40 760 Td\n{lines}ET".encode()
+        else:
+            stream = b"q 612 0 0 792 0 0 cm /Im1 Do Q"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> /XObject << /Im1 %d 0 R >> >> >>"
+            % (len(objects), font, image)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+@pytest.fixture
+def make_pdf(tmp_path):
+    def _make(name, pages):
+        path = tmp_path / name
+        path.write_bytes(build_pdf(pages))
+        return str(path)
+
+    return _make
+
+
+class TestPDFInspector:
+    def test_scanned_pdf_profiles_every_page(self, make_pdf):
+        profile = PDFInspector().inspect(make_pdf("scan.pdf", ["scan"] * 7 + ["text"]))
+
+        assert profile.page_count == 8 and profile.complete
+        assert profile.is_scanned
+        assert profile.page(0).image_count == 1
+        assert profile.page(0).image_coverage == pytest.approx(1.0)
+        assert not profile.page(0).is_born_digital
+        assert profile.page(7).is_born_digital
+
+    def test_born_digital_stops_after_sample(self, make_pdf):
+        profile = PDFInspector().inspect(make_pdf("text.pdf", ["text"] * 9))
+
+        assert not profile.is_scanned
+        assert profile.page_count == 9 and len(profile.pages) == 5
+        assert profile.page(8) is None
+
+    def test_profile_cached_by_hash_and_refreshed_on_change(self, make_pdf, monkeypatch):
+        inspector = PDFInspector()
+        path = make_pdf("doc.pdf", ["text"])
+        first = inspector.inspect(path)
+
+        # A copy with identical bytes is a cache hit, not a second parse
+        monkeypatch.setattr(inspector, "_build_profile", lambda *args: pytest.fail("reparsed"))
+        assert inspector.inspect(make_pdf("copy.pdf", ["text"])) is first
+        monkeypatch.undo()
+
+        with open(path, "wb") as f:
+            f.write(build_pdf(["scan", "scan"]))
+        assert inspector.inspect(path).page_count == 2
+
+
+def test_validator_reads_shared_profile(make_pdf):
+    inspector = PDFInspector()
+    validator = PDFValidator(inspector)
+    path = make_pdf("mixed.pdf", ["scan"] * 5 + ["text"])
+
+    decision = validator.should_use_ocr(path)
+
+    assert decision["use_ocr"] and decision["is_scanned"]
+    assert len(inspector._profiles) == 1
+    assert validator.is_scanned_pdf(str(path)) == (True, decision["confidence"])
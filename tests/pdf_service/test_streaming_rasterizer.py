@@ -0,0 +1,109 @@
+"""Tests for one-page-at-a-time rasterization and the RSS ceiling."""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+try:
+    from PIL import Image
+
+    from pdf.ocr import rasterizer as rasterizer_module
+    from pdf.ocr.rasterizer import PDFRasterizer, RasterMemoryError, current_rss_mb
+    RASTERIZER_AVAILABLE = rasterizer_module.PDF2IMAGE_AVAILABLE
+except (ImportError, NameError):
+    RASTERIZER_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not RASTERIZER_AVAILABLE, reason="pdf2image not available")
+
+
+class PageCalls(list):
+    """Pages requested from pdftoppm; pages in unrenderable fail to render."""
+
+    def __init__(self):
+        super().__init__()
+        self.unrenderable: set[int] = set()
+
+
+@pytest.fixture
+def fake_pdftoppm(monkeypatch):
+    """Stand-in for pdf2image that writes a 1275x1650 RGB page like pdftoppm would."""
+    calls = PageCalls()
+
+    def convert_from_path(pdf_path, dpi, first_page, last_page, output_folder, output_file,
+                          single_file, paths_only):
+        calls.append(first_page)
+        if first_page in calls.unrenderable:
+            raise RuntimeError("Syntax Error: Couldn't find trailer dictionary")
+        path = os.path.join(output_folder, f"{output_file}.ppm")
+        Image.new("RGB", (1275, 1650), (first_page % 256, 0, 0)).save(path)
+        return [path]
+
+    monkeypatch.setattr(rasterizer_module.pdf2image, "convert_from_path", convert_from_path)
+    return calls
+
+
+def test_500_pages_stream_with_flat_memory(fake_pdftoppm):
+    rasterizer = PDFRasterizer(dpi=300, max_rss_mb=100_000)
+    baseline = None
+
+    for page_number, image in rasterizer.iter_pages("exhibit.pdf", 1, 500):
+        assert image.getpixel((0, 0))[0] == page_number % 256
+        if page_number == 10:
+            baseline = current_rss_mb()
+
+    # Each page is ~6MB of raster data; 500 resident pages would be ~3GB
+    assert current_rss_mb() - baseline < 50
+    assert fake_pdftoppm == list(range(1, 501))
+
+
+def test_images_released_after_consumption(fake_pdftoppm):
+    pages = PDFRasterizer().iter_pages("exhibit.pdf", 1, 2)
+
+    _, first = next(pages)
+    first_file = first.filename
+    next(pages)
+
+    assert not os.path.exists(first_file)
+    with pytest.raises(ValueError):
+        first.load()  # Closed once the next page was requested
+    pages.close()
+
+
+def test_rss_ceiling_stops_before_rendering(fake_pdftoppm, monkeypatch):
+    monkeypatch.setattr(rasterizer_module, "current_rss_mb", lambda: 1_900.0)
+    rasterizer = PDFRasterizer(dpi=300, max_rss_mb=1_920)
+
+    with pytest.raises(RasterMemoryError):
+        next(rasterizer.iter_pages("exhibit.pdf", 1, 3))
+    assert fake_pdftoppm == []
+
+
+def test_unrenderable_page_yields_none_and_stream_continues(fake_pdftoppm):
+    fake_pdftoppm.unrenderable = {2}
+
+    pages = [(n, image is None) for n, image in PDFRasterizer().iter_pages("exhibit.pdf", 1, 3)]
+
+    assert pages == [(1, False), (2, True), (3, False)]
+
+
+def test_large_pdf_keeps_an_empty_page_for_unrenderable_pages(fake_pdftoppm):
+    from pdf.ocr.page_processor import PageByPageProcessor
+
+    fake_pdftoppm.unrenderable = {2}
+    processor = PageByPageProcessor(adaptive=False, streaming=True)
+    processor.inspector = MagicMock(inspect=lambda path: SimpleNamespace(page_count=3))
+    processor.ocr_engine = MagicMock()
+    processor.ocr_engine.extract_text_from_image.side_effect = lambda image: {
+        "success": True, "text": f"page {image.getpixel((0, 0))[0]}", "confidence": 0.9
+    }
+    processor.postprocessor.merge_page_texts = lambda texts: texts
+
+    result = processor.process_large_pdf("exhibit.pdf")
+    pages = list(processor.process_with_generator("exhibit.pdf"))
+
+    assert result["success"] and result["pages_processed"] == 3
+    assert result["text"] == ["page 1", "", "page 3"]
+    assert [page["success"] for page in pages] == [True, False, True]
+    assert pages[1] == {"success": False, "page": 2, "error": "Failed to convert page"}
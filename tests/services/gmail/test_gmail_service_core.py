@@ -169,11 +169,16 @@ class TestGmailServiceCore:
             {"id": 2, "content": "short"}      # Too short
         ]
         
-        # Only first email should be summarized
-        service._process_email_summaries(emails)
+        mocks['db'].batch_add_content.return_value = {"content_ids": ["10", "11"]}
         
-        assert mocks['summarizer'].extract_summary.call_count == 1
-        assert mocks['db'].add_content.call_count == 1
+        # Only first email should be summarized; content is added in one batch
+        with patch('gmail.main.get_batch_summarizer') as get_batch:
+            service._process_email_summaries(emails)
+        
+        assert mocks['db'].batch_add_content.call_count == 1
+        get_batch.return_value.summarize_to_db.assert_called_once()
+        documents = get_batch.return_value.summarize_to_db.call_args[0][1]
+        assert [doc_id for doc_id, _ in documents] == ["10"]
 
     def test_get_emails_basic(self, gmail_service_with_mocks):
         """Test retrieving emails from storage."""
@@ -0,0 +1,106 @@
+"""Tests for bulk edge ingestion in KnowledgeGraphService."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from knowledge_graph.main import KnowledgeGraphService
+from shared.simple_db import SimpleDB
+
+
+@pytest.fixture
+def kg(tmp_path):
+    db = SimpleDB(str(tmp_path / "graph.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    for i in range(1, 21):
+        db.execute(
+            "INSERT INTO content_unified (id, source_type, source_id, title, body) VALUES (?, ?, ?, ?, ?)",
+            (i, "email", i, f"Doc {i}", "body"),
+        )
+    return KnowledgeGraphService(db.db_path)
+
+
+def chain(n, strength=0.5):
+    return [
+        {
+            "source_content_id": i,
+            "target_content_id": i + 1,
+            "relationship_type": "followed_by",
+            "strength": strength,
+            "metadata": {"step": i},
+        }
+        for i in range(1, n)
+    ]
+
+
+def count(kg, table):
+    return kg.db.fetch_one(f"SELECT COUNT(*) AS n FROM {table}")["n"]
+
+
+class TestBulkEdges:
+    def test_creates_nodes_once_and_inserts_edges(self, kg):
+        stats = kg.add_edges_bulk(chain(20), batch_size=7)
+
+        assert stats["total"] == 19
+        assert stats["written"] == 19
+        assert count(kg, "kg_nodes") == 20
+        node = kg.get_node_by_content("3")
+        assert node["content_type"] == "email" and node["title"] == "Doc 3"
+
+    def test_existing_nodes_are_reused(self, kg):
+        existing = kg.add_node("5", "email", "Doc 5")
+
+        kg.add_edges_bulk(chain(10))
+
+        assert kg.resolve_node_ids([5])["5"] == existing
+        assert count(kg, "kg_nodes") == 10
+
+    def test_conflict_ignore_and_update(self, kg):
+        kg.add_edges_bulk(chain(5, strength=0.5))
+
+        ignored = kg.add_edges_bulk(chain(5, strength=0.9))
+        assert ignored["written"] == 0
+        assert {r["strength"] for r in kg.db.fetch("SELECT strength FROM kg_edges")} == {0.5}
+
+        kg.add_edges_bulk(chain(5, strength=0.9), on_conflict="update")
+        assert count(kg, "kg_edges") == 4
+        assert {r["strength"] for r in kg.db.fetch("SELECT strength FROM kg_edges")} == {0.9}
+
+    def test_single_and_bulk_adds_share_edge_ids(self, kg):
+        edge_id = kg.add_edge("1", "2", "followed_by", strength=0.5)
+
+        assert kg.add_edge("1", "2", "followed_by", strength=0.7) == edge_id
+        assert kg.add_edges_bulk(chain(3))["written"] == 1  # Only 2 -> 3 is new
+        assert count(kg, "kg_edges") == 2
+
+    def test_unknown_content_is_skipped(self, kg):
+        edges = chain(3) + [
+            {"source_content_id": 1, "target_content_id": 999, "relationship_type": "similar_to"}
+        ]
+
+        stats = kg.add_edges_bulk(edges)
+
+        assert stats["unresolved"] == 1
+        assert count(kg, "kg_edges") == 2
+
+    def test_node_ids_cached_for_session(self, kg):
+        kg.resolve_node_ids(range(1, 11))
+
+        with patch.object(kg, "_resolve_uncached", wraps=kg._resolve_uncached) as resolve:
+            stats = kg.add_edges_bulk(chain(10))
+
+        # Every endpoint came from the cache
+        assert all(call.args[1] == [] for call in resolve.call_args_list)
+        assert stats["written"] == 9
+        edge = kg.db.fetch_one("SELECT edge_metadata FROM kg_edges LIMIT 1")
+        assert "step" in json.loads(edge["edge_metadata"])
@@ -0,0 +1,119 @@
+"""Tests for interval-indexed temporal relationships."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from knowledge_graph.timeline_relationships import TimelineRelationships
+from shared.simple_db import SimpleDB
+
+START = datetime(2024, 3, 1, 9, 0)
+
+
+@pytest.fixture
+def timeline_db(tmp_path):
+    db = SimpleDB(str(tmp_path / "timeline.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    db.execute("CREATE TABLE emails (id INTEGER PRIMARY KEY, message_id TEXT, datetime_utc TEXT)")
+    return db
+
+
+def add_content(db, day_offset: float, source_type="pdf", source_id=None) -> str:
+    created = (START + timedelta(days=day_offset)).isoformat()
+    cursor = db.execute(
+        "INSERT INTO content_unified (source_type, source_id, title, body, created_at) VALUES (?, ?, ?, ?, ?)",
+        (source_type, source_id if source_id is not None else int(day_offset * 1000), "doc", "body", created),
+    )
+    return str(cursor.lastrowid)
+
+
+def edges(db, relationship_type):
+    return db.fetch(
+        """
+        SELECT s.id AS source, t.id AS target FROM kg_edges e
+        JOIN kg_nodes s ON s.node_id = e.source_node_id
+        JOIN kg_nodes t ON t.node_id = e.target_node_id
+        WHERE e.relationship_type = ?
+        """,
+        (relationship_type,),
+    )
+
+
+class TestTemporalRelationships:
+    def test_full_build_sequential_and_windowed(self, timeline_db):
+        ids = [add_content(timeline_db, d) for d in (0, 0.5, 3, 10, 10.25)]
+        service = TimelineRelationships(timeline_db.db_path)
+
+        result = service.create_temporal_relationships()
+
+        assert result["sequential"] == 4
+        # Pairs within 24 hours: (0, 0.5) and (10, 10.25)
+        assert result["concurrent"] == 2
+        assert {(e["source"], e["target"]) for e in edges(timeline_db, "followed_by")} == set(zip(ids, ids[1:]))
+
+    def test_rerun_is_idempotent(self, timeline_db):
+        for d in range(6):
+            add_content(timeline_db, d)
+        service = TimelineRelationships(timeline_db.db_path)
+        service.create_temporal_relationships()
+
+        assert service.create_temporal_relationships()["relationships_created"] == 0
+        assert service.create_temporal_relationships(incremental=False)["relationships_created"] == 0
+
+    def test_incremental_insert_replaces_spanning_edge(self, timeline_db):
+        first, second = add_content(timeline_db, 0), add_content(timeline_db, 5)
+        service = TimelineRelationships(timeline_db.db_path)
+        service.create_temporal_relationships()
+
+        middle = add_content(timeline_db, 2)
+        result = TimelineRelationships(timeline_db.db_path).create_temporal_relationships()
+
+        assert result["processed"] == 1
+        assert result["sequential_replaced"] == 1
+        assert {(e["source"], e["target"]) for e in edges(timeline_db, "followed_by")} == {
+            (first, middle),
+            (middle, second),
+        }
+
+    def test_dates_are_parsed_once(self, timeline_db):
+        for d in range(4):
+            add_content(timeline_db, d)
+        service = TimelineRelationships(timeline_db.db_path)
+        calls = []
+        service.index.parse_date = lambda value: calls.append(value) or datetime.fromisoformat(value)
+
+        service.find_temporal_cluster("1", window_days=2)
+        cluster = service.find_temporal_cluster("2", window_days=1)
+
+        assert len(calls) == 4
+        assert [c["content_id"] for c in cluster] == ["1", "3"]
+
+    def test_linked_email_uses_sent_date(self, timeline_db):
+        timeline_db.execute(
+            "INSERT INTO emails (id, message_id, datetime_utc) VALUES (?, ?, ?)",
+            (77, "msg-77", "2023-12-25T08:00:00+00:00"),
+        )
+        email_id = add_content(timeline_db, 4, source_type="email", source_id=77)
+        service = TimelineRelationships(timeline_db.db_path)
+
+        assert service.extract_content_dates(email_id).date().isoformat() == "2023-12-25"
+
+    def test_timeline_context_uses_index_positions(self, timeline_db):
+        ids = [add_content(timeline_db, d) for d in range(10)]
+        service = TimelineRelationships(timeline_db.db_path)
+
+        context = service.get_timeline_context(ids[5], before=2, after=3)
+
+        assert [c["content_id"] for c in context["before"]] == ids[3:5]
+        assert [c["content_id"] for c in context["after"]] == ids[6:9]
+        assert context["total_in_timeline"] == 10
@@ -0,0 +1,137 @@
+"""Tests for memory-bounded topic clustering with star edges."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from knowledge_graph.topic_clustering import TopicClusteringService
+from shared.simple_db import SimpleDB
+
+DIMS = 16
+
+
+def topic_vector(topic: int, i: int) -> np.ndarray:
+    rng = np.random.default_rng(1000 * topic + i)
+    base = np.zeros(DIMS)
+    base[topic * 4:(topic + 1) * 4] = 1.0
+    return base + rng.normal(0, 0.05, DIMS)
+
+
+class FakeVectorStore:
+    """Cached vectors for a subset of content."""
+
+    def __init__(self, vectors: dict[int, np.ndarray]):
+        self.vectors = vectors
+        self.requested = 0
+
+    def get_many(self, ids, with_payload=True, **kwargs):
+        self.requested += len(ids)
+        return [{"id": int(i), "vector": self.vectors[int(i)].tolist()} for i in ids if int(i) in self.vectors]
+
+
+class FakeEmbeddingService:
+    def __init__(self):
+        self.encoded = 0
+
+    def batch_encode(self, texts, batch_size=16):
+        self.encoded += len(texts)
+        return [topic_vector(int(t.split()[-1]), self.encoded + i) for i, t in enumerate(texts)]
+
+
+@pytest.fixture
+def topic_db(tmp_path):
+    db = SimpleDB(str(tmp_path / "topics.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    return db
+
+
+@pytest.fixture
+def service_factory(topic_db):
+    vectors = {}
+    for topic in range(3):
+        for i in range(20):
+            topic_db.execute(
+                "INSERT INTO content_unified (source_type, source_id, title, body) VALUES (?, ?, ?, ?)",
+                ("email", topic * 100 + i, None, f"topic {topic}"),
+            )
+    for row in topic_db.fetch("SELECT id, body FROM content_unified"):
+        vectors[row["id"]] = topic_vector(int(row["body"].split()[1]), row["id"])
+
+    def make(cached_ids=None):
+        cached = {cid: vectors[cid] for cid in (cached_ids if cached_ids is not None else vectors)}
+        with patch("knowledge_graph.topic_clustering.EntityService", MagicMock()):
+            service = TopicClusteringService(topic_db.db_path, vector_store=FakeVectorStore(cached))
+        service.embedding_service = FakeEmbeddingService()
+        return service
+
+    return make
+
+
+def cluster_edges(db):
+    return db.fetch("SELECT source_node_id, target_node_id, edge_metadata FROM kg_edges")
+
+
+class TestScalableClustering:
+    def test_recovers_topics_with_star_edges(self, service_factory, topic_db):
+        service = service_factory()
+
+        result = service.perform_scalable_clustering(n_clusters=3, label_clusters=False)
+
+        assert result["documents"] == 60
+        assert sorted(c["size"] for c in result["clusters"].values()) == [20, 20, 20]
+        edges = cluster_edges(topic_db)
+        # Star topology: k - 1 edges per cluster, all pointing at the hub
+        assert len(edges) == 57
+        for cluster_id in result["clusters"]:
+            targets = {
+                e["target_node_id"] for e in edges if json.loads(e["edge_metadata"])["cluster_id"] == cluster_id
+            }
+            assert len(targets) == 1
+
+    def test_only_uncached_content_is_encoded(self, service_factory):
+        service = service_factory(cached_ids=range(1, 41))
+
+        service.perform_scalable_clustering(n_clusters=3, label_clusters=False)
+
+        assert service.embedding_service.encoded == 20
+
+    def test_memmap_spill_matches_in_memory(self, service_factory):
+        in_memory = service_factory().perform_scalable_clustering(n_clusters=3, label_clusters=False)
+        # A tiny cap forces the embedding matrix to a temporary memmap
+        spilled = service_factory().perform_scalable_clustering(
+            n_clusters=3, label_clusters=False, memory_limit_mb=0
+        )
+
+        def groups(result):
+            return sorted(sorted(c["members"]) for c in result["clusters"].values())
+
+        assert groups(spilled) == groups(in_memory)
+
+    def test_rerun_replaces_edges(self, service_factory, topic_db):
+        service = service_factory()
+        service.perform_scalable_clustering(n_clusters=3, label_clusters=False)
+        service.perform_scalable_clustering(n_clusters=3, label_clusters=False)
+
+        assert len(cluster_edges(topic_db)) == 57
+        assert topic_db.fetch_one("SELECT COUNT(*) AS n FROM kg_nodes")["n"] == 60
+
+    def test_large_hierarchical_request_uses_scalable_mode(self, service_factory):
+        service = service_factory()
+        with patch("knowledge_graph.topic_clustering.HIERARCHICAL_MAX_DOCS", 10), patch(
+            "knowledge_graph.topic_clustering.pdist"
+        ) as pdist:
+            result = service.perform_hierarchical_clustering(list(range(1, 61)))
+
+        pdist.assert_not_called()
+        assert result["method"] == "minibatch_kmeans"
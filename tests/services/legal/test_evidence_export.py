@@ -0,0 +1,142 @@
+"""Tests for the streaming, resumable evidence exporter."""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from legal_evidence.evidence_export import StreamingEvidenceExporter
+from legal_evidence.evidence_tracker import EvidenceTracker
+from shared.simple_db import SimpleDB
+
+LEAK = {True: "water leak", False: ""}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    db = SimpleDB(str(tmp_path / "evidence.db"))
+    db.execute(
+        """
+        CREATE TABLE emails (
+            id INTEGER PRIMARY KEY, message_id TEXT UNIQUE, subject TEXT, sender TEXT,
+            recipient_to TEXT, datetime_utc TEXT, content TEXT
+        )
+        """
+    )
+    db.execute(
+        """
+        CREATE TABLE email_attachments (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, message_id TEXT, filename TEXT,
+            mime_type TEXT, size_bytes INTEGER, attachment_id TEXT, stored_path TEXT
+        )
+        """
+    )
+    db.batch_insert(
+        "emails",
+        ["message_id", "subject", "sender", "datetime_utc", "content"],
+        [
+            (f"m{i}", f"Subject {i % 3}", "a@x.com", f"2024-01-{i + 1:02d}", f"Body {i} {LEAK[i % 4 == 0]}")
+            for i in range(20)
+        ],
+    )
+    attachment = tmp_path / "lease.pdf"
+    attachment.write_bytes(b"%PDF" + bytes(range(256)) * 50)
+    db.execute(
+        "INSERT INTO email_attachments (message_id, filename, mime_type, stored_path) VALUES (?, ?, ?, ?)",
+        ("m4", "lease agreement.pdf", "application/pdf", str(attachment)),
+    )
+    db.execute(
+        "INSERT INTO email_attachments (message_id, filename, mime_type, stored_path) VALUES (?, ?, ?, ?)",
+        ("m8", "gone.pdf", "application/pdf", str(tmp_path / "missing.pdf")),
+    )
+    tracker = EvidenceTracker(db.db_path)
+    tracker.assign_eids()
+    tracker.assign_thread_ids()
+    return db.db_path
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestStreamingExport:
+    def test_exports_emails_attachments_and_hashes(self, db_path, tmp_path):
+        out = tmp_path / "package"
+
+        result = StreamingEvidenceExporter(db_path).export(str(out), batch_size=7)
+
+        assert result["emails"] == 20 and result["attachments"] == 1
+        emails = read_jsonl(out / "emails.jsonl")
+        assert [e["message_id"] for e in emails] == [f"m{i}" for i in range(20)]
+        manifest = read_jsonl(out / "manifest.jsonl")
+        raw = (out / "emails.jsonl").read_bytes()
+        for entry in (e for e in manifest if e["type"] == "email"):
+            line = raw[entry["offset"] : entry["offset"] + entry["bytes"]]
+            assert hashlib.sha256(line).hexdigest() == entry["sha256"]
+        copied, missing = [e for e in manifest if e["type"] == "attachment"]
+        assert hashlib.sha256((out / copied["path"]).read_bytes()).hexdigest() == copied["sha256"]
+        assert missing["missing"] is True
+        assert result["sha256"]["emails.jsonl"] == hashlib.sha256(raw).hexdigest()
+
+    def test_keyword_selection(self, db_path, tmp_path):
+        result = StreamingEvidenceExporter(db_path).export(str(tmp_path / "leak"), keywords=["leak"])
+
+        emails = read_jsonl(tmp_path / "leak" / "emails.jsonl")
+        assert result["emails"] == 5
+        assert all("leak" in e["content"] for e in emails)
+
+    def test_resume_after_interruption(self, db_path, tmp_path):
+        out = tmp_path / "package"
+        exporter = StreamingEvidenceExporter(db_path)
+        original = exporter._export_attachment
+        calls = []
+
+        def fail_on_second_batch(package_dir, email, attachment):
+            calls.append(email["message_id"])
+            if email["message_id"] == "m8":
+                raise OSError("disk went away")
+            return original(package_dir, email, attachment)
+
+        with patch.object(exporter, "_export_attachment", side_effect=fail_on_second_batch):
+            with pytest.raises(OSError):
+                exporter.export(str(out), batch_size=6)
+
+        state = json.loads((out / "export_state.json").read_text())
+        assert state["emails"] == 6 and not state["complete"]
+
+        result = StreamingEvidenceExporter(db_path).export(str(out), batch_size=6)
+
+        assert result["resumed"] and result["emails"] == 20
+        emails = read_jsonl(out / "emails.jsonl")
+        assert [e["message_id"] for e in emails] == [f"m{i}" for i in range(20)]
+        assert len(read_jsonl(out / "manifest.jsonl")) == 22
+
+        again = StreamingEvidenceExporter(db_path).export(str(out))
+        assert again["emails"] == 20 and again["sha256"] == result["sha256"]
+
+    def test_rerun_picks_up_new_and_changed_emails(self, db_path, tmp_path):
+        out = tmp_path / "package"
+        first = StreamingEvidenceExporter(db_path).export(str(out))
+
+        db = SimpleDB(db_path)
+        db.execute(
+            "INSERT INTO emails (message_id, subject, datetime_utc, content) VALUES (?, ?, ?, ?)",
+            ("m20", "Subject 2", "2024-01-21", "Body 20"),
+        )
+        appended = StreamingEvidenceExporter(db_path).export(str(out))
+
+        assert appended["resumed"] and appended["emails"] == 21
+        emails = read_jsonl(out / "emails.jsonl")
+        assert [e["message_id"] for e in emails] == [f"m{i}" for i in range(21)]
+        assert appended["sha256"]["emails.jsonl"] == hashlib.sha256(
+            (out / "emails.jsonl").read_bytes()
+        ).hexdigest() != first["sha256"]["emails.jsonl"]
+
+        # Edits bump the content generation (here via EID assignment) and rebuild the package
+        EvidenceTracker(db_path).assign_eids()
+        rebuilt = StreamingEvidenceExporter(db_path).export(str(out))
+
+        assert not rebuilt["resumed"] and rebuilt["emails"] == 21
+        assert read_jsonl(out / "emails.jsonl")[20]["eid"] is not None
+        assert len(read_jsonl(out / "manifest.jsonl")) == 23
@@ -0,0 +1,86 @@
+"""Tests for set-based EID and thread ID assignment."""
+
+import pytest
+
+from legal_evidence.evidence_tracker import EvidenceTracker
+from shared.simple_db import SimpleDB
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SimpleDB(str(tmp_path / "evidence.db"))
+    db.execute(
+        """
+        CREATE TABLE emails (
+            id INTEGER PRIMARY KEY, message_id TEXT, subject TEXT, sender TEXT,
+            recipient_to TEXT, datetime_utc TEXT, content TEXT
+        )
+        """
+    )
+    return db
+
+
+def add_emails(db, rows):
+    db.batch_insert("emails", ["message_id", "subject", "datetime_utc"], rows)
+
+
+def eids(db):
+    return [r["eid"] for r in db.fetch("SELECT eid FROM emails ORDER BY datetime_utc, id")]
+
+
+class TestAssignEids:
+    def test_sequence_per_year_in_date_order(self, db):
+        add_emails(
+            db,
+            [
+                ("m3", "c", "2024-03-01T00:00:00"),
+                ("m1", "a", "2023-12-31T00:00:00"),
+                ("m2", "b", "2024-01-01T00:00:00"),
+            ],
+        )
+        tracker = EvidenceTracker(db.db_path)
+
+        result = tracker.assign_eids(batch_size=2)
+
+        assert result["assigned"] == 3
+        assert eids(db) == ["EID-2023-0001", "EID-2024-0001", "EID-2024-0002"]
+
+    def test_rerun_continues_from_existing_numbers(self, db):
+        add_emails(db, [(f"m{i}", "s", f"2024-01-{i + 1:02d}") for i in range(5)])
+        tracker = EvidenceTracker(db.db_path)
+
+        assert tracker.assign_eids(limit=3)["total_without_eid"] == 5
+        assert tracker.assign_eids()["assigned"] == 2
+        assert tracker.assign_eids()["assigned"] == 0
+        assert eids(db) == [f"EID-2024-{n:04d}" for n in range(1, 6)]
+        assert tracker.generate_eid("new", "2024-06-01") == "EID-2024-0006"
+
+    def test_numbers_past_9999_keep_increasing(self, db):
+        add_emails(db, [("old", "s", "2024-01-01"), ("new", "s", "2024-02-01")])
+        tracker = EvidenceTracker(db.db_path)
+        db.execute("UPDATE emails SET eid = 'EID-2024-10000' WHERE message_id = 'old'")
+
+        tracker.assign_eids()
+
+        assert eids(db)[-1] == "EID-2024-10001"
+
+
+class TestAssignThreadIds:
+    def test_threads_by_normalized_subject_and_idempotent(self, db):
+        add_emails(
+            db,
+            [
+                ("m1", "Lease renewal", "2024-01-01"),
+                ("m2", "RE: Lease  Renewal", "2024-01-02"),
+                ("m3", "Parking", "2024-01-03"),
+                ("m4", "Fwd: parking", "2024-01-04"),
+            ],
+        )
+        tracker = EvidenceTracker(db.db_path)
+
+        first = tracker.assign_thread_ids(batch_size=3)
+        second = tracker.assign_thread_ids()
+
+        assert first["threads_created"] == 2 and first["emails_updated"] == 4
+        assert second["emails_updated"] == 0
+        assert [e["message_id"] for e in tracker.get_thread_emails("THREAD-0001")] == ["m1", "m2"]
@@ -0,0 +1,112 @@
+"""Tests for term-indexed disputed topics and SQL communication patterns."""
+
+import pytest
+
+from legal_evidence.evidence_tracker import EvidenceTracker
+from legal_evidence.report_generator import LegalReportGenerator
+from legal_evidence.thread_analyzer import ThreadAnalyzer
+from shared.simple_db import SimpleDB
+
+EMAILS = [
+    ("m1", "Entry notice", "landlord@x.com", "tenant@x.com", "2024-01-02T09:15:00", "We will need entry on Friday. Repairs are scheduled."),
+    ("m2", "RE: Entry notice", "tenant@x.com", "landlord@x.com", "2024-01-02T18:40:00-05:00", "No, I do not agree to entry. Parking is free."),
+    ("m3", "Repair request", "tenant@x.com", "landlord@x.com", "2024-01-05T07:00:00Z", "The heater needs repair! Please fix it."),
+    ("m4", "Complaint", "neighbor@x.com", "", "2024-01-06", "Noise complaint about unit 4-B."),
+    ("m5", "Parking", "landlord@x.com", "tenant@x.com", "2024-02-01T12:00:00", "Parking requires a permit now."),
+    ("m6", "No thread", "landlord@x.com", None, "2024-02-02 00:30:00", "Parking_lot rules"),
+]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    db = SimpleDB(str(tmp_path / "evidence.db"))
+    db.execute(
+        """
+        CREATE TABLE emails (
+            id INTEGER PRIMARY KEY, message_id TEXT, subject TEXT, sender TEXT,
+            recipient_to TEXT, datetime_utc TEXT, content TEXT
+        )
+        """
+    )
+    db.batch_insert(
+        "emails", ["message_id", "subject", "sender", "recipient_to", "datetime_utc", "content"], EMAILS
+    )
+    tracker = EvidenceTracker(db.db_path)
+    tracker.assign_eids()
+    tracker.assign_thread_ids()
+    db.execute("UPDATE emails SET thread_id = NULL WHERE message_id = 'm6'")
+    return db.db_path
+
+
+def like_scan(db, keyword):
+    rows = db.fetch(
+        "SELECT eid FROM emails WHERE (content LIKE ? OR subject LIKE ?) AND thread_id IS NOT NULL",
+        (f"%{keyword}%", f"%{keyword}%"),
+    )
+    return sorted(r["eid"] for r in rows)
+
+
+class TestDisputedTopics:
+    @pytest.mark.parametrize(
+        "keyword", ["entry", "ENTRY", "pair", "parking", "4-b", "do not agree", "!", "ing_l", "absent"]
+    )
+    def test_matches_like_scan(self, db_path, keyword):
+        analyzer = ThreadAnalyzer(db_path)
+
+        disputed = analyzer.find_disputed_topics([keyword])
+        found = sorted(row["eid"] for rows in disputed.values() for row in rows)
+
+        assert found == like_scan(analyzer.db, keyword)
+
+    def test_excerpt_and_cache_invalidation(self, db_path):
+        analyzer = ThreadAnalyzer(db_path)
+        disputed = analyzer.find_disputed_topics(["heater"])
+        (rows,) = disputed.values()
+        assert rows[0]["excerpt"] == "The heater needs repair"
+
+        analyzer.db.execute(
+            "INSERT INTO emails (message_id, subject, content, datetime_utc, thread_id) VALUES (?, ?, ?, ?, ?)",
+            ("m7", "Heater", "Heater still broken", "2024-03-01", "THREAD-0009"),
+        )
+
+        assert "THREAD-0009" in analyzer.find_disputed_topics(["heater"])
+
+    def test_search_emails_matches_search_by_pattern(self, db_path):
+        analyzer = ThreadAnalyzer(db_path)
+        tracker = EvidenceTracker(db_path)
+
+        assert analyzer.search_emails("parking", limit=2) == tracker.search_by_pattern("parking", limit=2)
+
+
+class TestCommunicationPatterns:
+    def test_sql_aggregates(self, db_path):
+        patterns = ThreadAnalyzer(db_path).analyze_communication_patterns()
+
+        assert patterns["total_emails"] == 6
+        assert patterns["unique_senders"] == 3
+        assert patterns["unique_recipients"] == 2
+        assert patterns["total_threads"] == 4
+        assert patterns["top_senders"] == {"landlord@x.com": 3, "tenant@x.com": 2, "neighbor@x.com": 1}
+        assert patterns["time_distribution"] == {"00:00": 2, "07:00": 1, "09:00": 1, "12:00": 1, "18:00": 1}
+        assert patterns["subject_patterns"] == {
+            "access_related": 2,
+            "maintenance_related": 1,
+            "notices": 2,
+            "complaints": 1,
+        }
+
+    def test_sender_filter(self, db_path):
+        patterns = ThreadAnalyzer(db_path).analyze_communication_patterns("tenant@x.com")
+
+        assert patterns["total_emails"] == 2
+        assert patterns["top_senders"] == {"tenant@x.com": 2}
+
+
+def test_export_evidence_package(db_path, tmp_path):
+    generator = LegalReportGenerator(db_path)
+
+    result = generator.export_evidence_package(str(tmp_path / "out"), keywords=["entry", "parking"])
+
+    assert result["success"]
+    narrative = next((tmp_path / "out").glob("evidence_narrative_*.md")).read_text()
+    assert 'Topic: "parking"' in narrative
@@ -0,0 +1,143 @@
+"""Tests for the persisted incremental clustering service."""
+
+from unittest.mock import patch
+
+import pytest
+
+from search_intelligence.clustering import ContentClusterService
+from shared.simple_db import SimpleDB
+
+TOPICS = {
+    "mold": "black mold growth found in bathroom ceiling moisture damage inspection report",
+    "rent": "monthly rent payment receipt late fee ledger balance due amount",
+    "hearing": "court hearing scheduled judge continuance motion filed department",
+}
+
+
+@pytest.fixture
+def cluster_db(tmp_path):
+    db = SimpleDB(str(tmp_path / "clusters.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    return db
+
+
+def add_docs(db, topic, count, start=0):
+    for i in range(start, start + count):
+        db.execute(
+            "INSERT INTO content_unified (source_type, source_id, title, body) VALUES (?, ?, ?, ?)",
+            ("email", hash((topic, i)) % 2**31, f"{topic} {i}", f"{TOPICS[topic]} ref{i} item{i * 7}"),
+        )
+
+
+def make_service(db, tmp_path, **kwargs):
+    return ContentClusterService(db_path=db.db_path, model_dir=str(tmp_path / "model"), **kwargs)
+
+
+class TestContentClusterService:
+    def test_initial_fit_groups_topics(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "mold", 5)
+        add_docs(cluster_db, "rent", 4)
+        service = make_service(cluster_db, tmp_path)
+
+        clusters = service.get_clusters(threshold=0.5)
+
+        assert [c["size"] for c in clusters] == [5, 4]
+        assert {d["title"].split()[0] for d in clusters[0]["documents"]} == {"mold"}
+        assert service.stats["full_fits"] == 1
+
+    def test_new_documents_assigned_without_refit(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "mold", 5)
+        add_docs(cluster_db, "rent", 5)
+        service = make_service(cluster_db, tmp_path, max_growth=1.0)
+        service.get_clusters(threshold=0.5)
+
+        add_docs(cluster_db, "mold", 2, start=100)
+        with patch("search_intelligence.clustering.DBSCAN") as dbscan:
+            clusters = service.get_clusters(threshold=0.5)
+
+        dbscan.assert_not_called()
+        assert service.stats == {"full_fits": 1, "incremental_updates": 1, "assigned": 2, "unassigned": 0}
+        assert clusters[0]["size"] == 7
+
+    def test_drift_triggers_recluster(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "mold", 5)
+        add_docs(cluster_db, "rent", 5)
+        service = make_service(cluster_db, tmp_path, drift_threshold=0.1, max_growth=10)
+        service.get_clusters(threshold=0.5)
+
+        # A new topic cannot be assigned to an existing cluster
+        add_docs(cluster_db, "hearing", 4)
+        result = service.refresh(threshold=0.5)
+
+        assert result["action"] == "full"
+        assert service.stats["full_fits"] == 2
+        assert len(service.get_clusters(threshold=0.5)) == 3
+
+    def test_model_persists_across_instances(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "mold", 5)
+        add_docs(cluster_db, "rent", 5)
+        make_service(cluster_db, tmp_path).get_clusters(threshold=0.5)
+
+        reloaded = make_service(cluster_db, tmp_path)
+        reloaded.get_clusters(threshold=0.5)
+
+        assert reloaded.stats["full_fits"] == 0
+        assert len(reloaded.doc_ids) == 10
+
+    def test_parameter_change_refits(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "mold", 5)
+        service = make_service(cluster_db, tmp_path)
+        service.get_clusters(threshold=0.5)
+        service.get_clusters(threshold=0.6)
+
+        assert service.stats["full_fits"] == 2
+
+    def test_near_duplicates_within_clusters(self, cluster_db, tmp_path):
+        add_docs(cluster_db, "rent", 3)
+        for _ in range(2):
+            cluster_db.execute(
+                "INSERT INTO content_unified (source_type, source_id, title, body) VALUES (?, ?, ?, ?)",
+                ("email", hash(_) % 1000, "dup", TOPICS["mold"] + " exact same text"),
+            )
+        service = make_service(cluster_db, tmp_path)
+        service.get_clusters(threshold=0.5)
+
+        groups = service.near_duplicates(0.95)
+
+        assert len(groups) == 1
+        assert len(groups[0]) == 2
+
+    def test_near_duplicates_among_noise_and_unassigned(self, cluster_db, tmp_path):
+        def add_dup(topic, source_id):
+            cluster_db.execute(
+                "INSERT INTO content_unified (source_type, source_id, title, body) VALUES (?, ?, ?, ?)",
+                ("email", source_id, "dup", TOPICS[topic] + " exact same text"),
+            )
+
+        add_docs(cluster_db, "rent", 4)
+        add_dup("mold", 1)
+        add_dup("mold", 2)
+        # min_samples=3 leaves the identical mold pair as DBSCAN noise
+        service = make_service(cluster_db, tmp_path, drift_threshold=1.0, max_growth=10)
+        service.get_clusters(threshold=0.5, min_samples=3)
+        assert (service.labels < 0).sum() == 2
+
+        # Incrementally added pair on an unseen topic stays unassigned
+        add_dup("hearing", 3)
+        add_dup("hearing", 4)
+        service.refresh(threshold=0.5, min_samples=3)
+
+        groups = service.near_duplicates(0.95)
+
+        assert sorted(len(g) for g in groups) == [2, 2]
+        assert service.stats["full_fits"] == 1
@@ -0,0 +1,150 @@
+"""Tests for the generation-invalidated search result cache."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from search_intelligence.search_cache import SearchResultCache
+from shared.simple_db import SimpleDB
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    """SimpleDB with a minimal content_unified table."""
+    db = SimpleDB(str(tmp_path / "cache.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    return db
+
+
+@pytest.fixture
+def cache(cache_db):
+    return SearchResultCache(db_path=cache_db.db_path, max_entries=3, generation_check_interval=60)
+
+
+class TestSearchResultCache:
+    """Test LRU + SQLite tiers and generation invalidation."""
+
+    def test_memory_hit_returns_copy(self, cache):
+        key = cache.make_key("contract", limit=10)
+        cache.put(key, [{"content_id": "1", "title": "Lease"}])
+
+        first = cache.get(key)
+        first[0]["title"] = "mutated"
+
+        assert cache.get(key) == [{"content_id": "1", "title": "Lease"}]
+        assert cache.stats["memory_hits"] == 2
+
+    def test_key_depends_on_params(self, cache):
+        assert cache.make_key("q", limit=10) != cache.make_key("q", limit=20)
+        assert cache.make_key("q", filters={"a": 1, "b": 2}) == cache.make_key(
+            "q", filters={"b": 2, "a": 1}
+        )
+
+    def test_lru_eviction(self, cache):
+        for i in range(4):
+            cache.put(f"k{i}", [{"id": i}])
+
+        assert cache.get_stats()["entries"] == 3
+        assert cache.stats["evictions"] == 1
+
+    def test_sqlite_tier_survives_new_instance(self, cache_db, cache):
+        key = cache.make_key("deposit")
+        cache.put(key, [{"content_id": "7"}])
+
+        fresh = SearchResultCache(db_path=cache_db.db_path, generation_check_interval=60)
+        assert fresh.get(key) == [{"content_id": "7"}]
+        assert fresh.stats["sqlite_hits"] == 1
+
+    def test_add_content_invalidates(self, cache_db, cache):
+        key = cache.make_key("notice")
+        cache.put(key, [{"content_id": "1"}])
+
+        cache_db.add_content("email", "Notice", "Notice to vacate")
+
+        assert cache.get(key) is None
+        assert cache.stats["invalidations"] == 1
+
+    def test_duplicate_add_content_keeps_cache(self, cache_db, cache):
+        cache_db.add_content("email", "Notice", "Notice to vacate")
+        key = cache.make_key("notice")
+        cache.put(key, [{"content_id": "1"}])
+
+        cache_db.add_content("email", "Notice", "Notice to vacate")
+
+        assert cache.get(key) == [{"content_id": "1"}]
+
+    def test_batch_add_content_invalidates(self, cache_db, cache):
+        key = cache.make_key("repairs")
+        cache.put(key, [{"content_id": "1"}])
+
+        cache_db.batch_add_content(
+            [{"content_type": "email", "title": "Repairs", "content": "Mold in unit"}]
+        )
+
+        assert cache.get(key) is None
+
+    def test_results_from_before_a_write_are_not_stored(self, cache_db, cache):
+        key = cache.make_key("notice")
+        generation = cache.current_generation()  # Search starts
+        cache_db.add_content("email", "Notice", "Notice to vacate")  # Concurrent write
+
+        cache.put(key, [{"content_id": "stale"}], generation=generation)
+
+        assert cache.get(key) is None
+        assert cache.stats["stores"] == 0
+
+    def test_other_process_bump_seen_after_interval(self, cache_db):
+        cache = SearchResultCache(db_path=cache_db.db_path, generation_check_interval=0.05)
+        key = cache.make_key("rent")
+        cache.put(key, [{"content_id": "1"}])
+
+        # Simulate a writer in another process: bump SQL without the local counter
+        cache_db.execute("UPDATE content_generation SET generation = generation + 5 WHERE id = 1")
+        cache_db.execute(
+            "INSERT OR IGNORE INTO content_generation (id, generation) VALUES (1, 5)"
+        )
+        time.sleep(0.06)
+
+        assert cache.get(key) is None
+
+    def test_memory_hit_is_sub_millisecond(self, cache):
+        key = cache.make_key("dashboard", limit=10)
+        cache.put(key, [{"content_id": str(i), "title": f"Doc {i}"} for i in range(10)])
+        cache.get(key)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            cache.get(key)
+        per_call = (time.perf_counter() - start) / 100
+
+        assert per_call < 0.001
+
+
+class TestHybridSearchCaching:
+    """basic_search.search consults the cache before searching."""
+
+    def test_repeated_query_served_from_cache(self, cache):
+        from search_intelligence import basic_search
+
+        keyword = [{"content_id": "1", "title": "Lease"}]
+        with patch.object(basic_search, "get_search_cache", return_value=cache), patch.object(
+            basic_search, "_keyword_search", return_value=keyword
+        ) as mock_keyword, patch.object(
+            basic_search, "vector_store_available", return_value=False
+        ):
+            first = basic_search.search("lease", limit=5)
+            second = basic_search.search("lease", limit=5)
+            basic_search.search("lease", limit=5, use_cache=False)
+
+        assert first == second == keyword
+        assert mock_keyword.call_count == 2
@@ -0,0 +1,142 @@
+"""Tests for batch summarization with a persisted TF-IDF vocabulary."""
+
+import json
+
+import numpy as np
+import pytest
+
+from shared.simple_db import SimpleDB
+from summarization.batch import BatchSummarizer, TfidfVocabulary
+from summarization.engine import TextRankSummarizer
+
+
+class FakeEmbeddingService:
+    def batch_encode(self, texts, batch_size=16):
+        rng = np.random.default_rng(len(texts))
+        return list(rng.random((len(texts), 16)))
+
+
+def make_docs(n):
+    topics = ["eviction notice", "mold inspection", "rent payment", "repair request"]
+    return [
+        f"The tenant wrote about the {topics[i % 4]} again. "
+        f"This letter concerns the property at unit {i}. "
+        f"The landlord replied regarding the {topics[i % 4]} on day {i}. "
+        f"Everyone agreed to follow up next week."
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def summarizer(tmp_path):
+    textrank = TextRankSummarizer()
+    textrank.embedding_service = FakeEmbeddingService()
+    vocabulary = TfidfVocabulary(path=str(tmp_path / "vocab.json"))
+    return BatchSummarizer(vocabulary=vocabulary, textrank=textrank, workers=1)
+
+
+@pytest.fixture
+def summary_db(tmp_path):
+    db = SimpleDB(str(tmp_path / "summaries.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    db._create_inline_intelligence_schema()
+    return db
+
+
+class TestTfidfVocabulary:
+    def test_incremental_fit_persists(self, tmp_path):
+        path = tmp_path / "vocab.json"
+        vocab = TfidfVocabulary(path=str(path))
+        vocab.partial_fit(make_docs(8))
+        vocab.save()
+        vocab.partial_fit(make_docs(4))
+
+        assert vocab.num_docs == 12
+        reloaded = TfidfVocabulary(path=str(path))
+        assert reloaded.num_docs == 8
+        assert reloaded.doc_freq["tenant"] == 8
+        assert json.loads(path.read_text())["ngram_range"] == [1, 3]
+
+    def test_common_terms_get_lower_idf(self, tmp_path):
+        vocab = TfidfVocabulary(path=str(tmp_path / "vocab.json"), max_df=1.0)
+        vocab.partial_fit(make_docs(20))
+        idf = vocab.idf_table()
+
+        assert idf["tenant"] < idf["mold"]
+
+    def test_prunes_to_max_terms(self, tmp_path):
+        vocab = TfidfVocabulary(path=str(tmp_path / "vocab.json"), max_terms=10)
+        vocab.partial_fit(make_docs(10))
+
+        assert len(vocab.doc_freq) == 10
+
+
+class TestBatchSummarizer:
+    def test_keywords_prefer_distinctive_terms(self, summarizer):
+        results = summarizer.summarize(make_docs(40), max_keywords=3)
+
+        assert len(results) == 40
+        assert all(r["summary_type"] == "combined" for r in results)
+        assert "tenant" not in results[1]["tf_idf_keywords"]
+        assert results[0]["textrank_sentences"]
+
+    def test_pool_matches_inline(self, summarizer):
+        docs = make_docs(80)
+        summarizer.vocabulary.partial_fit(docs)
+        inline = summarizer.extract_keywords(docs)
+
+        summarizer.workers = 2
+        pooled = summarizer.extract_keywords(docs)
+
+        assert pooled == inline
+
+    def test_summarize_to_db_bulk_writes(self, summarizer, summary_db):
+        docs = make_docs(25)
+        added = summary_db.batch_add_content(
+            [{"content_type": "email", "title": f"Email {i}", "content": d} for i, d in enumerate(docs)]
+        )
+        documents = list(zip(added["content_ids"], docs))
+
+        result = summarizer.summarize_to_db(summary_db, documents, batch_size=10)
+
+        assert result == {"summarized": 25, "stored": 25}
+        rows = summary_db.fetch("SELECT document_id, tf_idf_keywords FROM document_summaries")
+        assert {str(r["document_id"]) for r in rows} == set(added["content_ids"])
+        assert summarizer.vocabulary.path.exists()
+
+    def test_new_terms_scored_after_vocabulary_saturates(self, summarizer, summary_db):
+        summarizer.vocabulary.max_terms = 50
+        summarizer.summarize(make_docs(40))
+        assert len(summarizer.vocabulary.doc_freq) == 50
+
+        doc = "Asbestos abatement contractor scheduled remediation Thursday."
+        added = summary_db.batch_add_content([{"content_type": "email", "title": "New", "content": doc}])
+        result = summarizer.summarize_to_db(summary_db, [(added["content_ids"][0], doc)])
+
+        assert "asbestos" not in summarizer.vocabulary.doc_freq  # Pruned right away at df=1
+        assert result == {"summarized": 1, "stored": 1}
+        row = summary_db.fetch_one("SELECT tf_idf_keywords FROM document_summaries")
+        assert "asbestos" in json.loads(row["tf_idf_keywords"])
+
+
+def test_batch_add_content_returns_row_ids(summary_db):
+    first = summary_db.batch_add_content([{"content_type": "email", "title": "A", "content": "body a"}])
+    again = summary_db.batch_add_content(
+        [
+            {"content_type": "email", "title": "A", "content": "body a"},
+            {"content_type": "email", "title": "B", "content": "body b"},
+        ]
+    )
+
+    ids = {str(r["id"]) for r in summary_db.fetch("SELECT id FROM content_unified")}
+    assert again["content_ids"][0] == first["content_ids"][0]
+    assert set(again["content_ids"]) == ids
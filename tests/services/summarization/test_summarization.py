@@ -6,6 +6,9 @@ import sys
 import unittest
 from pathlib import Path
 
+import networkx as nx
+import numpy as np
+
 sys.path.append(str(Path(__file__).parent.parent))
 
 from summarization.engine import (
@@ -13,9 +16,34 @@ from summarization.engine import (
     TextRankSummarizer,
     TFIDFSummarizer,
     get_document_summarizer,
+    sparse_pagerank,
 )
 
 
+class FakeEmbeddingService:
+    """Deterministic bag-of-words embeddings with call counting."""
+
+    def __init__(self, dims=64):
+        self.dims = dims
+        self.encode_calls = 0
+        self.batch_calls = 0
+
+    def _embed(self, text):
+        vec = np.zeros(self.dims, dtype=np.float32)
+        for word in text.lower().split():
+            vec[sum(map(ord, word)) % self.dims] += 1.0
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def encode(self, text):
+        self.encode_calls += 1
+        return self._embed(text)
+
+    def batch_encode(self, texts, batch_size=16):
+        self.batch_calls += 1
+        return [self._embed(t) for t in texts]
+
+
 class TestTFIDFSummarizer(unittest.TestCase):
     """Test TF-IDF summarizer functionality."""
 
@@ -142,6 +170,55 @@ class TestTextRankSummarizer(unittest.TestCase):
         self.assertEqual(sentences[0], "Only one sentence here")
 
 
+class TestBatchedTextRank(unittest.TestCase):
+    """Batched encoding, numpy similarity and sparse PageRank."""
+
+    def setUp(self):
+        topics = ["contract payment terms", "arbitration dispute venue", "notice of termination"]
+        self.text = " ".join(
+            f"Sentence {i} discusses the {topics[i % 3]} in clause {i}." for i in range(60)
+        )
+
+    def _summarizer(self, batch_mode):
+        summarizer = TextRankSummarizer(batch_mode=batch_mode)
+        summarizer.embedding_service = FakeEmbeddingService()
+        return summarizer
+
+    def test_single_batch_call(self):
+        summarizer = self._summarizer(batch_mode=True)
+        summarizer.extract_sentences(self.text, max_sentences=3)
+
+        self.assertEqual(summarizer.embedding_service.batch_calls, 1)
+        self.assertEqual(summarizer.embedding_service.encode_calls, 0)
+
+    def test_matches_per_sentence_mode(self):
+        batched = self._summarizer(batch_mode=True).extract_sentences(self.text, max_sentences=3)
+        legacy = self._summarizer(batch_mode=False).extract_sentences(self.text, max_sentences=3)
+
+        self.assertEqual(batched, legacy)
+
+    def test_reuses_embeddings_for_same_document(self):
+        summarizer = self._summarizer(batch_mode=True)
+        summarizer.extract_sentences(self.text, max_sentences=3)
+        summarizer.extract_sentences(self.text, max_sentences=5)
+
+        self.assertEqual(summarizer.embedding_service.batch_calls, 1)
+        self.assertEqual(summarizer.cache_hits, 1)
+
+    def test_sparse_pagerank_matches_networkx(self):
+        rng = np.random.default_rng(3)
+        weights = rng.random((40, 40))
+        weights[weights < 0.7] = 0.0
+        weights = np.triu(weights, 1)
+        weights = weights + weights.T
+        weights[5] = weights[:, 5] = 0.0  # isolated (dangling) node
+
+        expected = nx.pagerank(nx.from_numpy_array(weights), max_iter=100)
+        scores = sparse_pagerank(weights)
+
+        np.testing.assert_allclose(scores, [expected[i] for i in range(40)], atol=1e-5)
+
+
 class TestDocumentSummarizer(unittest.TestCase):
     """Test document summarizer orchestration."""
 
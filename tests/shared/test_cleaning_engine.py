@@ -0,0 +1,88 @@
+"""Tests for the precompiled cleaning engine against the original substitution passes."""
+
+import html
+import random
+import re
+
+from shared.email_cleaner import EmailCleaner
+from shared.html_cleaner import clean_html_content, remove_email_boilerplate
+
+
+def legacy_strip_html(text):
+    text = re.sub(r"<(style|script)[^>]*>.*?</\1>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<(p|div|br|li)[^>]*>", "\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"</?(p|div|br|li)[^>]*>", "", text, flags=re.IGNORECASE)
+    text = re.sub(r"<[^<]+?>", "", text)
+    return html.unescape(text)
+
+
+def legacy_clean_text(text):
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return "\n".join(re.sub(r"\s+", " ", line).strip() for line in text.split("\n")).strip()
+
+
+def legacy_html_to_text(text):
+    text = re.sub(r"<script[^>]*>.*?</script>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
+    for element in ["div", "p", "br", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote"]:
+        text = re.sub(f"<{element}[^>]*>", "\n", text, flags=re.IGNORECASE)
+        text = re.sub(f"</{element}>", "\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<li[^>]*>", "\n• ", text, flags=re.IGNORECASE)
+    text = re.sub(r"</li>", "", text, flags=re.IGNORECASE)
+    text = html.unescape(re.sub(r"<[^>]+>", "", text))
+    text = re.sub(r"[ \t]+", " ", text)
+    return "\n".join(line.strip() for line in text.split("\n") if line.strip())
+
+
+TOKENS = [
+    "<p>", "</p>", "<P class='x'>", "<div>", "</div>", "<br>", "<BR />", "<li>", "</li>",
+    "<ul>", "<b>", "</b>", '<a href="x>y">', "</a>", "<script>var a = 1;</script>",
+    "<style>p {}</style>", "<SCRIPT type='t'>x<p>y</SCRIPT>", "<pre>", "<link rel=x>",
+    "<h1>", "</h1>", "<blockquote>", "</blockquote>", "<!-- note -->", "<img src='cid:1'>",
+    "&amp;", "&nbsp;", "&lt;b&gt;", "&#39;", "\n", "\n\n\n\n", " ", "\t", "\r\n", "\xa0",
+    "Hello", "> quoted", "On Mon John wrote:", "From: a", "[image1.png]", 'alt="x"',
+]
+
+
+def random_documents(count, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+
+class TestMatchesLegacyPasses:
+    def test_email_html_and_whitespace(self):
+        cleaner = EmailCleaner()
+        for doc in random_documents(3000):
+            assert cleaner._strip_html(doc) == legacy_strip_html(doc)
+            assert cleaner._clean_body(doc) == legacy_clean_text(legacy_strip_html(doc))
+
+    def test_html_cleaner(self):
+        for doc in random_documents(3000, seed=1):
+            assert clean_html_content(doc) == legacy_html_to_text(doc)
+
+    def test_boilerplate_lines(self):
+        content = "Keep this\n> quoted\nOn Mon, Ann wrote:\n  From: x\n\nsrc=\"a\"\nAnd this"
+        assert remove_email_boilerplate(content) == "Keep this\nAnd this"
+
+
+class TestEmailCleaner:
+    def test_clean_fields(self):
+        cleaned = EmailCleaner().clean(
+            {
+                "subject": "  Re:   <b>Lease</b>\n notice ",
+                "content": "<div>Hi&nbsp;there</div><p>Line   two</p><script>x()</script>",
+                "sender": "  Ann   <ann@example.com> ",
+            }
+        )
+        assert cleaned["subject"] == "Re: Lease notice"
+        assert cleaned["content"] == "Hi there\nLine two"
+        assert cleaned["sender"] == "Ann <ann@example.com>"
+
+    def test_parallel_batch_keeps_order(self, monkeypatch):
+        monkeypatch.setattr("shared.email_cleaner.MIN_PARALLEL_EMAILS", 10)
+        emails = [{"subject": f"<i>Subject {i}</i>", "content": f"<p>Body {i}</p>"} for i in range(50)]
+
+        cleaned = EmailCleaner().batch_clean(emails, workers=2, chunk_size=7)
+
+        assert [e["subject"] for e in cleaned] == [f"Subject {i}" for i in range(50)]
+        assert cleaned[-1]["content"] == "Body 49"
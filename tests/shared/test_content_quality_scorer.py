@@ -0,0 +1,90 @@
+"""Tests for ContentQualityScorer batch scoring and the corpus assessment script."""
+
+import random
+import re
+
+import pytest
+
+from shared.content_quality_scorer import ContentQualityScorer, ValidationStatus
+from shared.simple_db import SimpleDB
+
+LEGAL_TEXT = (
+    "The court shall hear the motion regarding the notice filed by the plaintiff. "
+    "Counsel for the defendant will provide evidence and testimony at the hearing. "
+) * 30
+
+
+def legacy_ratios(text):
+    length = len(text)
+    alpha = len(re.findall(r"[A-Za-z]", text))
+    digit_punct = len(re.findall(r"[0-9]", text)) + len(re.findall(r"[.,;:!?()\[\]{}\"'-]", text))
+    symbol = len(re.findall(r"[&=%£€<>©#@$*+^~|\\]", text))
+    clean = re.sub(r"\s+", " ", text.lower())
+    bigrams = {clean[i:i + 2] for i in range(len(clean) - 1) if clean[i:i + 2].isalpha()}
+    return alpha / length, digit_punct / length, symbol / length, len(bigrams)
+
+
+class TestScoreContent:
+    def test_matches_regex_counts(self):
+        rng = random.Random(0)
+        alphabet = "abcXYZ  \n\t019.,;:!?()[]{}\"'-&=%£€<>©#@$*+^~|\\éßİ_"
+        scorer = ContentQualityScorer()
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 2000)))
+            metrics = scorer.score_content(text)
+            assert (
+                metrics.alpha_ratio,
+                metrics.digit_punct_ratio,
+                metrics.symbol_ratio,
+                metrics.unique_bigrams,
+            ) == legacy_ratios(text)
+
+    def test_legal_text_gate_results(self):
+        metrics = ContentQualityScorer().score_content(LEGAL_TEXT)
+        assert metrics.english_dict_hits > metrics.total_words * 0.35
+        assert metrics.failure_reasons == ["low_bigram_diversity (66 < 200)"]
+
+    def test_batch_matches_single_scoring(self):
+        scorer = ContentQualityScorer()
+        texts = [LEGAL_TEXT[: 50 * i] for i in range(150)]
+
+        batch = list(scorer.score_batch(iter(texts), workers=2, chunk_size=16))
+
+        assert batch == [scorer.score_content(text) for text in texts]
+
+
+@pytest.fixture
+def corpus_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "quality.db")
+    monkeypatch.setenv("APP_DB_PATH", db_path)
+    db = SimpleDB(db_path)
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY, source_type TEXT, title TEXT, body TEXT,
+            text_quality_score REAL, alpha_ratio REAL, symbol_ratio REAL,
+            unique_bigrams INTEGER, english_dict_hits INTEGER, chars_per_page REAL,
+            validation_status TEXT, pipeline_run_id TEXT, quality_failure_reasons TEXT,
+            last_attempt_at TEXT
+        )
+        """
+    )
+    rows = [(i, "pdf" if i % 2 else "email", f"Doc {i}", LEGAL_TEXT[: 40 * i]) for i in range(1, 81)]
+    rows.append((81, "email", "Empty", "   "))
+    db.batch_insert("content_unified", ["id", "source_type", "title", "body"], rows)
+    return db
+
+
+def test_assess_all_content_writes_every_row(corpus_db, monkeypatch):
+    from scripts import assess_content_quality
+
+    monkeypatch.setattr(assess_content_quality, "UPDATE_BATCH_SIZE", 25)
+    assess_content_quality.assess_all_content(workers=1)
+
+    rows = corpus_db.fetch("SELECT * FROM content_unified ORDER BY id")
+    assert all(row["pipeline_run_id"] for row in rows)
+    assert rows[-1]["validation_status"] == ValidationStatus.INGESTED.value
+    assert rows[-1]["quality_failure_reasons"] == "empty_content"
+    expected = ContentQualityScorer().score_content(LEGAL_TEXT[:3200])
+    assert rows[79]["text_quality_score"] == expected.quality_score
+    assert rows[79]["unique_bigrams"] == expected.unique_bigrams
@@ -0,0 +1,36 @@
+"""Tests for the shared chunked process-pool helper."""
+
+from shared.process_pool import default_workers, parallel_map
+
+
+class Doubler:
+    def __init__(self):
+        self.calls = 0
+
+    def double(self, value, offset=0):
+        self.calls += 1
+        return value * 2 + offset
+
+
+def test_short_input_runs_inline_on_local_instance():
+    local = Doubler()
+    results = list(
+        parallel_map(Doubler, "double", range(5), workers=4, chunk_size=2, min_items=10, local=local)
+    )
+    assert results == [0, 2, 4, 6, 8]
+    assert local.calls == 5
+
+
+def test_pool_keeps_input_order_for_generators():
+    items = (i for i in range(103))
+    results = list(
+        parallel_map(Doubler, "double", items, args=(1,), workers=2, chunk_size=7, min_items=10)
+    )
+    assert results == [i * 2 + 1 for i in range(103)]
+
+
+def test_default_workers_reads_env(monkeypatch):
+    monkeypatch.setenv("TEST_POOL_WORKERS", "3")
+    assert default_workers("TEST_POOL_WORKERS") == 3
+    monkeypatch.delenv("TEST_POOL_WORKERS")
+    assert default_workers("TEST_POOL_WORKERS") >= 1
@@ -0,0 +1,149 @@
+"""Tests for the quarantine catalog and the background retry scheduler."""
+
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.quarantine_catalog import MAX_RETRY_ATTEMPTS, is_permanent_error
+from shared.quarantine_scheduler import QuarantineRetryScheduler
+from shared.simple_quarantine_manager import SimpleQuarantineManager
+
+LATER = datetime.now() + timedelta(days=30)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SimpleQuarantineManager(str(tmp_path / "quarantine"), db_path=str(tmp_path / "q.db"))
+    manager._upload_processor = MagicMock()
+    return manager
+
+
+def quarantine(manager, tmp_path, name, error):
+    source = tmp_path / name
+    source.write_text(f"contents of {name}")
+    return Path(manager.quarantine_file(source, error)["quarantine_path"])
+
+
+def outcomes(results):
+    """process_file stand-in keyed by the quarantined file's original name."""
+    def process_file(path, source, quarantine):
+        assert quarantine is False  # Retries must not re-quarantine
+        outcome = next(v for k, v in results.items() if path.name.startswith(k))
+        return {"success": True, "content_id": "42"} if outcome is None else {
+            "success": False, "error": outcome
+        }
+    return process_file
+
+
+def test_error_classification():
+    assert is_permanent_error("EOF marker not found")
+    assert is_permanent_error("File is encrypted and needs a password")
+    assert not is_permanent_error("database is locked")
+    assert not is_permanent_error("Invalid response: connection reset")
+    assert not is_permanent_error("something unexpected")
+
+
+def test_list_and_stats_served_from_catalog(manager, tmp_path):
+    quarantine(manager, tmp_path, "notes.txt", "Processing timeout after 30s")
+    quarantine(manager, tmp_path, "scan.pdf", "PDF is corrupt: EOF marker not found")
+
+    with patch.object(Path, "glob", side_effect=AssertionError("walked the directory")):
+        files = manager.list_quarantined_files()
+        stats = manager.get_quarantine_stats()
+
+    assert {f["original_path"].rsplit("/", 1)[-1]: f["status"] for f in files} == {
+        "notes.txt": "quarantined",
+        "scan.pdf": "permanent_failure",
+    }
+    assert stats["total_quarantined"] == 2
+    assert stats["retryable_files"] == 1 and stats["permanent_failures"] == 1
+    assert stats["error_categories"] == {"Timeout": 1, "PDF Processing": 1}
+
+
+def test_run_due_recovers_reschedules_and_gives_up(manager, tmp_path):
+    recovered = quarantine(manager, tmp_path, "good.txt", "database is locked")
+    flaky = quarantine(manager, tmp_path, "flaky.txt", "database is locked")
+    broken = quarantine(manager, tmp_path, "broken.txt", "unexpected error")
+    manager.upload_processor.process_file.side_effect = outcomes({
+        "good": None,
+        "flaky": "Connection timed out",
+        "broken": "Unsupported file encoding",
+    })
+    scheduler = QuarantineRetryScheduler(manager, workers=2)
+
+    # Nothing is due before the first backoff expires
+    assert scheduler.run_due()["attempted"] == 0
+    summary = scheduler.run_due(now=LATER)
+
+    assert summary == {"attempted": 3, "recovered": 1, "rescheduled": 1, "permanent": 1}
+    catalog = manager.catalog
+    assert catalog.get(str(recovered))["status"] == "recovered"
+    assert not recovered.exists()
+    flaky_row = catalog.get(str(flaky))
+    assert flaky_row["status"] == "quarantined" and flaky_row["attempt_count"] == 1
+    assert flaky_row["next_retry_at"] > datetime.now().isoformat()
+    assert catalog.get(str(broken))["status"] == "permanent_failure"
+
+    # Only the transient failure is claimed again
+    manager.upload_processor.process_file.reset_mock()
+    assert scheduler.run_due(now=LATER)["attempted"] == 1
+    assert manager.upload_processor.process_file.call_args.args[0] == flaky
+
+
+def test_backoff_doubles_until_attempt_cap(manager, tmp_path):
+    path = quarantine(manager, tmp_path, "flaky.txt", "database is locked")
+    manager.upload_processor.process_file.side_effect = outcomes({"flaky": "database is busy"})
+    scheduler = QuarantineRetryScheduler(manager, workers=1)
+
+    delays = []
+    for _ in range(MAX_RETRY_ATTEMPTS):
+        before = datetime.now()
+        scheduler.run_due(now=LATER)
+        row = manager.catalog.get(str(path))
+        if row["next_retry_at"]:
+            delays.append((datetime.fromisoformat(row["next_retry_at"]) - before).total_seconds())
+
+    assert row["status"] == "permanent_failure" and row["attempt_count"] == MAX_RETRY_ATTEMPTS
+    assert len(delays) == MAX_RETRY_ATTEMPTS - 1
+    assert all(b == pytest.approx(2 * a, abs=1) for a, b in zip(delays, delays[1:]))
+
+
+def test_existing_error_logs_are_cataloged(tmp_path):
+    quarantine_dir = tmp_path / "quarantine"
+    quarantine_dir.mkdir()
+    (quarantine_dir / "a_20240101_000000_failed.pdf").write_bytes(b"%PDF")
+    (quarantine_dir / "a_20240101_000000_failed.error.json").write_text(json.dumps({
+        "timestamp": "2024-01-01T00:00:00",
+        "original_path": "/docs/a.pdf",
+        "error_message": "PDF processing timeout",
+        "file_size": 4,
+    }))
+    (quarantine_dir / "b_20240102_000000_failed.txt").write_text("notes")
+    (quarantine_dir / "b_20240102_000000_failed.error.txt").write_text(
+        "Error processing file: /docs/b.txt\nTimestamp: 2024-01-02T00:00:00\n"
+        "Error: Permission denied\nOriginal path: /docs/b.txt\n"
+    )
+
+    manager = SimpleQuarantineManager(str(quarantine_dir), db_path=str(tmp_path / "q.db"))
+
+    files = manager.list_quarantined_files()
+    assert [f["original_path"] for f in files] == ["/docs/b.txt", "/docs/a.pdf"]
+    assert all(f["can_retry"] for f in files)
+
+
+def test_background_scheduler_runs_and_stops(manager, tmp_path):
+    scheduler = QuarantineRetryScheduler(manager, interval=0.01)
+    scheduler.run_due = MagicMock(return_value={})
+
+    scheduler.start()
+    deadline = time.monotonic() + 5
+    while not scheduler.run_due.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    scheduler.stop(timeout=5)
+
+    assert scheduler.run_due.called
+    assert not scheduler.running
@@ -0,0 +1,69 @@
+"""Tests for sentence-aligned, token-budgeted chunking."""
+
+import pytest
+
+from shared.token_chunker import ApproxTokenizer, TokenChunker, count_tokens
+
+SENTENCE = "The landlord failed to repair the heater in unit 4B after notice. "
+
+
+@pytest.fixture
+def tokenizer():
+    return ApproxTokenizer()
+
+
+def test_chunks_fit_budget_and_end_on_sentences(tokenizer):
+    text = SENTENCE * 60
+    chunker = TokenChunker(max_tokens=50, overlap_tokens=0, tokenizer=tokenizer)
+
+    chunks = list(chunker.chunks(text))
+
+    assert len(chunks) > 1
+    assert all(count_tokens(chunk, tokenizer) <= 50 for chunk in chunks)
+    assert all(chunk.endswith("notice.") for chunk in chunks)
+    assert "".join(chunk + " " for chunk in chunks) == text
+
+
+def test_spans_are_offsets_into_original_text(tokenizer):
+    text = "  Exhibit A.\n\nNotice to quit served on March 3.  "
+    chunker = TokenChunker(max_tokens=512, tokenizer=tokenizer)
+
+    assert list(chunker.chunk_spans(text)) == [(2, len(text.rstrip()))]
+    assert list(chunker.chunk_spans("   ")) == []
+
+
+def test_overlap_and_word_break_without_sentences(tokenizer):
+    text = " ".join(f"word{i}" for i in range(100))  # 2 tokens per word, no sentence ends
+    chunker = TokenChunker(max_tokens=21, overlap_tokens=4, tokenizer=tokenizer)
+
+    spans = list(chunker.chunk_spans(text))
+
+    assert text[slice(*spans[0])] == " ".join(f"word{i}" for i in range(10))
+    assert spans[1][0] < spans[0][1]  # Overlaps the previous chunk
+    assert spans[-1][1] == len(text)
+    assert all(text[end - 1].isdigit() for _, end in spans)  # Never splits "wordN"
+    assert all(text.startswith("word", start) for start, _ in spans)
+
+
+def test_overlap_must_be_smaller_than_budget(tokenizer):
+    with pytest.raises(ValueError):
+        TokenChunker(max_tokens=10, overlap_tokens=10, tokenizer=tokenizer)
+
+
+def test_fast_tokenizer_offsets():
+    tokenizers = pytest.importorskip("tokenizers")
+    from tokenizers.models import WordPiece
+    from tokenizers.pre_tokenizers import BertPreTokenizer
+
+    from shared.token_chunker import FastTokenizer
+
+    vocab = {"[UNK]": 0, "the": 1, "lease": 2, "term": 3, "##inated": 4, ".": 5}
+    backend = tokenizers.Tokenizer(WordPiece(vocab, unk_token="[UNK]"))
+    backend.pre_tokenizer = BertPreTokenizer()
+    text = "The lease terminated. " * 200
+
+    chunker = TokenChunker(max_tokens=40, overlap_tokens=0, tokenizer=FastTokenizer(backend, "t"))
+    lowered = [text[start:end].lower() for start, end in chunker.chunk_spans(text)]
+
+    assert count_tokens(text, chunker.tokenizer) == 1000
+    assert lowered[0] == "the lease terminated. " * 7 + "the lease terminated."
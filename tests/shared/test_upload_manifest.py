@@ -0,0 +1,106 @@
+"""Tests for manifest-based change detection in SimpleUploadProcessor."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from shared.simple_db import SimpleDB
+from shared.simple_upload_processor import SimpleUploadProcessor
+
+
+@pytest.fixture
+def processor(tmp_path):
+    db = SimpleDB(str(tmp_path / "ingest.db"))
+    db.execute(
+        """
+        CREATE TABLE content_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_type TEXT, source_id INTEGER, title TEXT, body TEXT,
+            sha256 TEXT UNIQUE, ready_for_embedding INTEGER DEFAULT 0,
+            UNIQUE(source_type, source_id)
+        )
+        """
+    )
+    return SimpleUploadProcessor(str(tmp_path / "quarantine"), db_path=db.db_path)
+
+
+@pytest.fixture
+def share(tmp_path):
+    root = tmp_path / "share"
+    for i in range(12):
+        folder = root / f"folder{i % 3}"
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"note{i}.txt").write_text(f"Document number {i} with enough text to keep.")
+    return root
+
+
+def count(processor):
+    return processor.db.fetch_one("SELECT COUNT(*) AS n FROM content_unified")["n"]
+
+
+class TestManifestIngestion:
+    def test_parallel_first_run_processes_everything(self, processor, share):
+        result = processor.process_directory_recursive(share, [".txt"], workers=4)
+
+        assert result["success_count"] == 12
+        assert result["unchanged_count"] == 0
+        assert count(processor) == 12
+
+    def test_unchanged_rerun_skips_extraction_and_hashing(self, processor, share):
+        processor.process_directory_recursive(share, [".txt"])
+
+        with patch.object(processor, "_extract_content") as extract, \
+                patch.object(processor, "_get_file_hash") as file_hash:
+            result = processor.process_directory_recursive(share, [".txt"])
+
+        extract.assert_not_called()
+        file_hash.assert_not_called()
+        assert result["unchanged_count"] == 12
+        assert result["success_count"] == 0
+
+    def test_modified_file_is_reprocessed(self, processor, share):
+        processor.process_directory_recursive(share, [".txt"])
+        target = share / "folder0" / "note0.txt"
+        target.write_text("Rewritten document with completely different content.")
+
+        result = processor.process_directory_recursive(share, [".txt"])
+
+        assert result["success_count"] == 1
+        assert result["processed_files"][0]["path"] == str(target)
+        assert count(processor) == 13
+
+    def test_touched_file_is_skipped_after_hashing(self, processor, share):
+        processor.process_directory_recursive(share, [".txt"])
+        target = share / "folder1" / "note1.txt"
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        with patch.object(processor, "_extract_content") as extract:
+            result = processor.process_directory_recursive(share, [".txt"])
+            extract.assert_not_called()
+
+        assert result["unchanged_count"] == 12
+        # The new mtime was recorded, so the next run needs no hashing either
+        with patch.object(processor, "_get_file_hash") as file_hash:
+            processor.process_directory_recursive(share, [".txt"])
+        file_hash.assert_not_called()
+
+    def test_copied_file_reuses_content(self, processor, share):
+        processor.process_directory_recursive(share, [".txt"])
+        (share / "copy.txt").write_bytes((share / "folder2" / "note2.txt").read_bytes())
+
+        with patch.object(processor, "_extract_content") as extract:
+            result = processor.process_directory_recursive(share, [".txt"])
+            extract.assert_not_called()
+
+        assert result["duplicate_count"] == 1
+        assert count(processor) == 12
+
+    def test_failed_files_are_retried(self, processor, share):
+        with patch.object(processor, "_extract_content", side_effect=RuntimeError("boom")):
+            first = processor.process_directory_recursive(share, [".txt"])
+        assert first["failed_count"] == 12
+
+        second = processor.process_directory_recursive(share, [".txt"])
+        assert second["success_count"] == 12
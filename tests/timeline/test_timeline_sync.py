@@ -0,0 +1,113 @@
+"""Tests for incremental timeline sync and the single-query timeline view."""
+
+import pytest
+
+from shared.simple_db import SimpleDB
+from utilities.timeline import TimelineService, TimelineSync
+
+
+@pytest.fixture
+def service(isolated_timeline_db_path):
+    db = SimpleDB(isolated_timeline_db_path)
+    db.execute(
+        "CREATE TABLE emails (id INTEGER PRIMARY KEY, message_id TEXT, subject TEXT, "
+        "sender TEXT, datetime_utc TEXT)"
+    )
+    db.execute(
+        "CREATE TABLE documents (chunk_id TEXT PRIMARY KEY, file_name TEXT, "
+        "processed_time TEXT, char_count INTEGER)"
+    )
+    return TimelineService(isolated_timeline_db_path)
+
+
+def add_emails(db, start, count):
+    rows = [
+        (f"msg-{i}", f"Subject {i}", "a@example.com", f"2024-01-{i % 28 + 1:02d}T10:00:00")
+        for i in range(start, start + count)
+    ]
+    db.batch_insert("emails", ["message_id", "subject", "sender", "datetime_utc"], rows)
+
+
+def event_count(db, event_type):
+    row = db.fetch_one(
+        "SELECT COUNT(*) AS n FROM timeline_events WHERE event_type = ?", (event_type,)
+    )
+    return row["n"]
+
+
+class TestTimelineSync:
+    def test_incremental_sync_uses_watermark(self, service):
+        add_emails(service.db, 0, 25)
+        first = service.sync_emails_to_timeline(batch_size=10)
+
+        add_emails(service.db, 25, 5)
+        second = service.sync_emails_to_timeline(batch_size=10)
+
+        assert first["processed"] == 25 and first["synced_events"] == 25
+        assert second["processed"] == 5 and second["synced_events"] == 5
+        assert event_count(service.db, "email") == 30
+        assert service.sync_emails_to_timeline()["processed"] == 0
+
+    def test_resync_after_reset_is_idempotent(self, service):
+        add_emails(service.db, 0, 12)
+        service.sync_emails_to_timeline()
+
+        sync = TimelineSync(service.db_path)
+        sync.reset("emails")
+        result = sync.sync("emails")
+
+        assert result["processed"] == 12
+        assert result["synced_events"] == 0
+        assert event_count(service.db, "email") == 12
+
+    def test_limit_resumes_from_watermark(self, service):
+        add_emails(service.db, 0, 10)
+
+        assert service.sync_emails_to_timeline(limit=4, batch_size=3)["processed"] == 4
+        assert service.sync_emails_to_timeline()["processed"] == 6
+        assert event_count(service.db, "email") == 10
+
+    def test_missing_source_table(self, isolated_timeline_db_path):
+        service = TimelineService(isolated_timeline_db_path)
+
+        result = service.sync_emails_to_timeline()
+
+        assert result["success"] is False
+        assert "emails" in result["error"]
+
+
+class TestTimelineView:
+    def test_single_query_filters_types_and_dates(self, service):
+        add_emails(service.db, 0, 20)
+        service.db.execute(
+            "INSERT INTO documents VALUES (?, ?, ?, ?)",
+            ("doc-1", "lease.pdf", "2024-01-05T12:00:00", 900),
+        )
+        service.sync_emails_to_timeline()
+        service.sync_documents_to_timeline()
+
+        view = service.get_timeline_view(
+            start_date="2024-01-05",
+            end_date="2024-01-08",
+            event_types=["email", "document"],
+            limit=50,
+        )
+        dates = [event["event_date"] for event in view["timeline"]]
+
+        assert view["success"] and view["count"] == 4
+        assert dates == sorted(dates, reverse=True)
+        assert {event["event_type"] for event in view["timeline"]} == {"email", "document"}
+
+        documents_only = service.get_timeline_view(event_types=["document"])
+        assert [event["content_id"] for event in documents_only["timeline"]] == ["doc-1"]
+        assert documents_only["timeline"][0]["metadata"]["file_name"] == "lease.pdf"
+
+    def test_unfiltered_view_returns_events(self, service):
+        add_emails(service.db, 0, 3)
+        service.sync_emails_to_timeline()
+
+        view = service.get_timeline_view(limit=2)
+
+        assert view["success"] and "timeline" not in view
+        assert len(view["events"]) == 2
+        assert view["events"][0]["event_date"] > view["events"][1]["event_date"]
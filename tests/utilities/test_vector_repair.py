@@ -0,0 +1,96 @@
+"""Tests for batched vector renormalization (in-memory Qdrant)."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from utilities.maintenance.vector_repair import VectorRepairEngine
+from utilities.vector_store import VectorStore
+
+DIMS = 8
+COLLECTION = "repair_test"
+
+
+@pytest.fixture
+def store():
+    """Euclidean collection (Qdrant would normalize cosine vectors on write)."""
+    client = QdrantClient(location=":memory:")
+    client.create_collection(COLLECTION, vectors_config=VectorParams(size=DIMS, distance=Distance.EUCLID))
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(200, DIMS)).astype(np.float32)
+    vectors[:50] /= np.linalg.norm(vectors[:50], axis=1, keepdims=True)  # already unit length
+    vectors[50:150] *= 3.0
+    vectors[150] = 0.0  # cannot be normalized
+    client.upsert(
+        COLLECTION,
+        points=[PointStruct(id=i + 1, vector=v.tolist(), payload={"n": i}) for i, v in enumerate(vectors)],
+    )
+    with patch("utilities.vector_store.QdrantClient", lambda **kwargs: client):
+        yield VectorStore(collection=COLLECTION, dimensions=DIMS)
+
+
+def all_norms(store):
+    return np.concatenate(
+        [np.linalg.norm(v, axis=1) for _, v, _ in store.iter_points(collection=COLLECTION, batch_size=64)]
+    )
+
+
+class TestVectorRepairEngine:
+    def test_dry_run_reports_histogram_without_writing(self, store, tmp_path):
+        before = all_norms(store)
+        engine = VectorRepairEngine(store, scroll_batch_size=64, checkpoint_dir=str(tmp_path))
+
+        report = engine.repair(COLLECTION, dry_run=True)
+
+        assert report["scanned"] == 200
+        assert report["already_normalized"] == 50
+        assert report["unrepairable"] == 1
+        assert report["unrepairable_ids"] == ["151"]
+        assert report["normalized"] == 149
+        assert sum(report["norm_histogram"].values()) == 200
+        assert report["norm_histogram"]["0.99-1.01"] == 50
+        assert np.allclose(all_norms(store), before)
+        assert not list(tmp_path.iterdir())
+
+    def test_repair_uses_batched_updates_and_verifies(self, store, tmp_path):
+        engine = VectorRepairEngine(
+            store, scroll_batch_size=64, write_batch_size=50, checkpoint_dir=str(tmp_path), seed=0
+        )
+        with patch.object(store.client, "update_vectors", wraps=store.client.update_vectors) as spy:
+            report = engine.repair(COLLECTION, dry_run=False)
+
+        # 4 scroll blocks, each needing at most 2 update requests of 50
+        assert spy.call_count <= 8
+        assert report["normalized"] == 149
+        assert report["verification"]["passed"]
+        norms = all_norms(store)
+        assert np.sum(np.abs(norms - 1.0) < 1e-3) == 199
+        assert store.get(1)["payload"] == {"n": 0}
+        assert engine.checkpoint_for(COLLECTION).load() == {}
+
+    def test_resume_after_interruption(self, store, tmp_path):
+        engine = VectorRepairEngine(store, scroll_batch_size=64, checkpoint_dir=str(tmp_path))
+        real_update = store.update_vectors_many
+        calls = {"n": 0}
+
+        def flaky_update(*args, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 2:
+                raise RuntimeError("killed")
+            return real_update(*args, **kwargs)
+
+        with patch.object(store, "update_vectors_many", flaky_update):
+            with pytest.raises(RuntimeError):
+                engine.repair(COLLECTION, dry_run=False)
+
+        state = engine.checkpoint_for(COLLECTION).load()
+        assert state["last_id"] == "64"
+
+        report = engine.repair(COLLECTION, dry_run=False)
+
+        assert report["scanned"] == 200
+        assert report["normalized"] == 149
+        assert np.sum(np.abs(all_norms(store) - 1.0) < 1e-3) == 199
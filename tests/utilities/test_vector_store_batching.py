@@ -0,0 +1,95 @@
+"""Tests for batched retrieval and filtered scroll in VectorStore (in-memory Qdrant)."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from utilities.vector_store import VectorStore
+
+DIMS = 8
+
+
+@pytest.fixture
+def store():
+    """VectorStore backed by a local in-memory Qdrant with 100 points."""
+    with patch("utilities.vector_store.QdrantClient", lambda **kwargs: QdrantClient(location=":memory:")):
+        vs = VectorStore(collection="test_batching", dimensions=DIMS)
+
+    rng = np.random.default_rng(0)
+    vs.batch_upsert(
+        None,
+        [
+            {
+                "id": i,
+                "vector": rng.random(DIMS).tolist(),
+                "metadata": {"content_type": "email" if i % 2 else "pdf", "n": i},
+            }
+            for i in range(1, 101)
+        ],
+    )
+    return vs
+
+
+class _CallCounter:
+    """Wrap a client method and count calls."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.fn(*args, **kwargs)
+
+
+class TestGetMany:
+    def test_requests_scale_with_batches(self, store):
+        counter = _CallCounter(store.client.retrieve)
+        store.client.retrieve = counter
+
+        points = store.get_many(list(range(1, 101)), batch_size=25)
+
+        assert len(points) == 100
+        assert counter.calls == 4
+
+    def test_preserves_order_and_skips_missing(self, store):
+        points = store.get_many([5, 999, 3, 1])
+
+        assert [p["id"] for p in points] == [5, 3, 1]
+
+    def test_vectors_only_projection(self, store):
+        points = store.get_many([1, 2], with_payload=False)
+
+        assert all(p["payload"] is None for p in points)
+        assert all(len(p["vector"]) == DIMS for p in points)
+
+    def test_matches_single_get(self, store):
+        single = store.get(7)
+        many = store.get_many([7])[0]
+
+        assert np.allclose(single["vector"], many["vector"])
+        assert single["payload"] == many["payload"]
+
+
+class TestIterPoints:
+    def test_streams_numpy_blocks(self, store):
+        blocks = list(store.iter_points(batch_size=30))
+
+        assert [len(ids) for ids, _, _ in blocks] == [30, 30, 30, 10]
+        ids, vectors, payloads = blocks[0]
+        assert vectors.shape == (30, DIMS)
+        assert vectors.dtype == np.float32
+        assert payloads is None
+
+    def test_filtered_scroll(self, store):
+        seen = []
+        for ids, vectors, payloads in store.iter_points(
+            filter={"content_type": "email"}, batch_size=16, with_payload=True
+        ):
+            assert vectors.shape[0] == len(ids) == len(payloads)
+            seen.extend(p["content_type"] for p in payloads)
+
+        assert len(seen) == 50
+        assert set(seen) == {"email"}
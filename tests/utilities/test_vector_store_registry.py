@@ -0,0 +1,70 @@
+"""Tests for the shared-client VectorStore registry (in-memory Qdrant)."""
+
+from unittest.mock import patch
+
+import pytest
+from qdrant_client import QdrantClient
+
+from utilities.vector_store import VectorStoreRegistry
+
+DIMS = 8
+
+
+@pytest.fixture
+def client_factory():
+    """Patch QdrantClient so every connection is a counted in-memory client."""
+    created = []
+
+    def factory(**kwargs):
+        client = QdrantClient(location=":memory:")
+        created.append(client)
+        return client
+
+    with patch("utilities.vector_store.QdrantClient", factory):
+        yield created
+
+
+class TestVectorStoreRegistry:
+    def test_alternating_collections_share_one_client(self, client_factory):
+        registry = VectorStoreRegistry()
+
+        for _ in range(5):
+            emails = registry.get("emails", dimensions=DIMS)
+            docs = registry.get("documents", dimensions=DIMS)
+
+        assert len(client_factory) == 1
+        assert emails.client is docs.client
+        stats = registry.get_stats()
+        assert stats["clients_created"] == 1
+        assert stats["handles_created"] == 2
+        assert stats["handle_reuses"] == 8
+        assert stats["collections"] == ["documents", "emails"]
+
+    def test_collection_override_reuses_registry_handle(self, client_factory):
+        registry = VectorStoreRegistry()
+        emails = registry.get("emails", dimensions=DIMS)
+
+        emails.add_vector("00000000-0000-0000-0000-000000000001", [0.1] * DIMS, {}, collection="documents")
+        emails.batch_upsert("documents", [{"id": 2, "vector": [0.2] * DIMS, "metadata": {}}])
+
+        assert len(client_factory) == 1
+        assert registry.get("documents", dimensions=DIMS).count() == 2
+        assert emails.get_collection_stats("documents")["points_count"] == 2
+
+    def test_collection_metadata_is_cached(self, client_factory):
+        registry = VectorStoreRegistry()
+        registry.get("emails", dimensions=DIMS)
+
+        with patch.object(registry.client, "get_collection", wraps=registry.client.get_collection) as spy:
+            for _ in range(3):
+                info = registry.collection_info("emails")
+
+        assert info == {"exists": True, "vector_size": DIMS}
+        assert spy.call_count == 0
+
+    def test_dimension_mismatch_raises(self, client_factory):
+        registry = VectorStoreRegistry()
+        registry.get("emails", dimensions=DIMS)
+
+        with pytest.raises(ValueError):
+            registry.get("emails", dimensions=DIMS * 2)
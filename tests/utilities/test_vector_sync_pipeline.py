@@ -0,0 +1,197 @@
+"""Tests for the overlapped vector sync pipeline (in-memory Qdrant)."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient
+
+from utilities.maintenance.vector_sync_pipeline import SyncCheckpoint, VectorSyncPipeline
+from utilities.vector_store import VectorStore, point_id_for
+
+DIMS = 8
+
+
+class FakeEmbeddingService:
+    """Deterministic batch encoder that can be slowed down."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.batches = 0
+
+    def batch_encode(self, texts, batch_size=16):
+        self.batches += 1
+        time.sleep(self.delay)
+        if self.fail_on and self.fail_on in texts:
+            raise RuntimeError("batch failed")
+        return [self.encode(t) for t in texts]
+
+    def encode(self, text):
+        if text == self.fail_on:
+            raise RuntimeError("bad text")
+        rng = np.random.default_rng(abs(hash(text)) % (2**32))
+        return rng.random(DIMS).astype(np.float32)
+
+
+@pytest.fixture
+def store():
+    with patch("utilities.vector_store.QdrantClient", lambda **kwargs: QdrantClient(location=":memory:")):
+        yield VectorStore(collection="emails", dimensions=DIMS)
+
+
+def make_batches(n_items, batch_size=10, start=1):
+    ids = list(range(start, start + n_items))
+    return [
+        [{"id": i, "text": f"email body {i}", "metadata": {"title": f"t{i}"}} for i in ids[k:k + batch_size]]
+        for k in range(0, len(ids), batch_size)
+    ]
+
+
+class TestVectorSyncPipeline:
+    def test_syncs_all_items_with_stage_stats(self, store):
+        pipeline = VectorSyncPipeline(FakeEmbeddingService(), store, collection="emails")
+
+        result = pipeline.run(make_batches(45))
+
+        assert result["status"] == "completed"
+        assert result["synced"] == 45
+        assert result["batches"] == 5
+        assert result["last_id"] == 45
+        assert store.count() == 45
+        assert set(result["stages"]) == {"read", "encode", "upsert"}
+        assert result["bottleneck"] in result["stages"]
+        assert store.get(7)["payload"]["content_id"] == "7"
+
+    def test_rerun_is_idempotent(self, store):
+        pipeline = VectorSyncPipeline(FakeEmbeddingService(), store, collection="emails")
+
+        pipeline.run(make_batches(30))
+        pipeline.run(make_batches(30))
+
+        assert store.count() == 30
+
+    def test_checkpoint_records_watermark(self, store, tmp_path):
+        checkpoint = SyncCheckpoint("test_sync", directory=tmp_path)
+        pipeline = VectorSyncPipeline(FakeEmbeddingService(), store, checkpoint=checkpoint)
+
+        pipeline.run(make_batches(20))
+        pipeline.run(make_batches(10, start=21))
+
+        state = checkpoint.load()
+        assert state["last_id"] == 30
+        assert state["synced"] == 30
+        checkpoint.clear()
+        assert checkpoint.load() == {}
+
+    def test_bad_item_does_not_drop_batch(self, store):
+        committed = []
+        pipeline = VectorSyncPipeline(
+            FakeEmbeddingService(fail_on="email body 5"), store, on_committed=committed.extend
+        )
+
+        result = pipeline.run(make_batches(10))
+
+        assert result["synced"] == 9
+        assert [e["id"] for e in result["errors"]] == [5]
+        assert 5 not in committed and len(committed) == 9
+
+    def test_queues_bound_in_flight_batches(self, store):
+        produced = []
+        lock = threading.Lock()
+        max_ahead = 0
+
+        def source():
+            for batch in make_batches(100, batch_size=5):
+                with lock:
+                    produced.append(batch[0]["id"])
+                yield batch
+
+        class SlowStore:
+            def batch_upsert(self, collection, points):
+                nonlocal max_ahead
+                time.sleep(0.01)
+                with lock:
+                    written = sum(1 for pid in produced if pid <= points[0]["id"])
+                    max_ahead = max(max_ahead, len(produced) - written)
+                store.batch_upsert(collection, points)
+
+        pipeline = VectorSyncPipeline(FakeEmbeddingService(), SlowStore(), queue_depth=2)
+        result = pipeline.run(source())
+
+        assert result["synced"] == 100
+        # read queue + encoded queue + one batch held by each of the reader and encoder
+        assert max_ahead <= 2 * 2 + 2
+
+    def test_source_failure_reports_failed(self, store):
+        def source():
+            yield make_batches(5)[0]
+            raise RuntimeError("db went away")
+
+        result = VectorSyncPipeline(FakeEmbeddingService(), store).run(source())
+
+        assert result["status"] == "failed"
+        assert result["synced"] == 5
+        assert any("db went away" in e["error"] for e in result["errors"])
+
+
+def test_point_id_for_is_stable():
+    assert point_id_for(42) == 42
+    assert point_id_for("42") == 42
+    assert point_id_for("abc") == point_id_for("abc")
+    assert isinstance(point_id_for("abc"), str)
+
+
+class TestSyncEmailsToVectors:
+    @pytest.fixture
+    def maintenance(self, store, tmp_path):
+        module = pytest.importorskip("utilities.maintenance.vector_maintenance")
+        from shared.simple_db import SimpleDB
+
+        db = SimpleDB(str(tmp_path / "emails.db"))
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS content_unified (
+                id INTEGER PRIMARY KEY, source_type TEXT, source_id INTEGER,
+                title TEXT, body TEXT, sha256 TEXT, ready_for_embedding INTEGER DEFAULT 1
+            )
+            """
+        )
+        maintenance = module.VectorMaintenance.__new__(module.VectorMaintenance)
+        maintenance.db = db
+        maintenance.embedding_service = FakeEmbeddingService()
+        maintenance.vector_store = store
+        checkpoint = SyncCheckpoint("vector_sync_emails", directory=tmp_path)
+        with patch.object(module, "SyncCheckpoint", lambda name: checkpoint):
+            yield maintenance
+
+    @staticmethod
+    def add_emails(db, ids):
+        db.batch_insert(
+            "content_unified",
+            ["id", "source_type", "source_id", "title", "body"],
+            [(i, "email", i, f"t{i}", f"email body {i}") for i in ids],
+        )
+
+    def test_only_unsynced_rows_are_embedded(self, maintenance):
+        # Vectors from an earlier sync are recognised on the first run
+        store = maintenance.vector_store
+        store.batch_upsert("emails", [
+            {"id": i, "vector": FakeEmbeddingService().encode(f"email body {i}"), "metadata": {}}
+            for i in range(1, 11)
+        ])
+        self.add_emails(maintenance.db, range(1, 21))
+
+        assert maintenance.sync_emails_to_vectors()["synced"] == 10
+        assert store.count() == 20
+
+        # Nothing to do on rerun, even without the checkpoint
+        assert maintenance.sync_emails_to_vectors(resume=False)["synced"] == 0
+
+        # Rows below the watermark that never made it into the store are picked up
+        self.add_emails(maintenance.db, [21, 22])
+        maintenance.db.execute("DELETE FROM vector_sync_state WHERE content_id = 5")
+        result = maintenance.sync_emails_to_vectors()
+        assert result["synced"] == 3
@@ -116,6 +116,9 @@ def report_command(output_dir: str = "legal_evidence_export",
             print(f"✅ Evidence package created in: {result['output_dir']}")
             print(f"📁 {result['files_created']} files generated")
             print(f"⏰ Timestamp: {result['timestamp']}")
+            if result.get('evidence'):
+                evidence = result['evidence']
+                print(f"📧 {evidence['emails']} emails, {evidence['attachments']} attachments streamed")
         else:
             print("❌ Failed to generate evidence package")
             
@@ -21,10 +21,10 @@ def show_timeline(start_date=None, end_date=None, event_types=None, limit=20):
 
         timeline_service = TimelineService()
 
-        # Sync recent content to timeline
+        # Sync content added since the last run
         print("🔄 Syncing content to timeline...")
-        sync_result = timeline_service.sync_emails_to_timeline(limit=100)
-        doc_sync_result = timeline_service.sync_documents_to_timeline(limit=50)
+        sync_result = timeline_service.sync_emails_to_timeline()
+        doc_sync_result = timeline_service.sync_documents_to_timeline()
 
         print(f"   📧 Synced {sync_result.get('synced_events', 0)} email events")
         print(f"   📄 Synced {doc_sync_result.get('synced_events', 0)} document events")
@@ -36,20 +36,11 @@ def get_orphaned_vectors(db) -> dict:
         vector_count = vector_store.count()
         logger.info(f"Vector store has {vector_count} vectors")
 
-        # Get all vector IDs from Qdrant (using scroll to get all)
+        # Get all vector IDs from Qdrant (paged scroll, IDs only)
         try:
-            # Note: This is a simplified approach. In a real production system,
-            # you'd want to use scroll/pagination for very large collections
-            all_points = vector_store.client.scroll(
-                collection_name=vector_store.collection,
-                limit=10000,  # Adjust based on your collection size
-                with_payload=True,
-                with_vectors=False,
-            )[
-                0
-            ]  # Get points, ignore next_page_offset
-
-            vector_ids = {str(point.id) for point in all_points}
+            vector_ids = set()
+            for page_ids in vector_store.iter_ids():
+                vector_ids.update(page_ids)
             logger.info(f"Retrieved {len(vector_ids)} vector IDs from Qdrant")
 
         except Exception as e:
@@ -12,6 +12,7 @@ Combines functionality from:
 
 import argparse
 import sys
+from itertools import islice
 from typing import Any, Generator, List
 
 from loguru import logger
@@ -19,12 +20,16 @@ from loguru import logger
 from gmail.main import GmailService
 from shared.simple_db import SimpleDB
 from utilities.embeddings import get_embedding_service
-from utilities.vector_store import get_vector_store
+from utilities.maintenance.vector_repair import VectorRepairEngine
+from utilities.maintenance.vector_sync_pipeline import SyncCheckpoint, VectorSyncPipeline
+from utilities.vector_store import get_vector_store, point_id_for
 
 # --- Tunables (guidelines, not hard limits) ---
 BATCH_SIZE = 500
 EMBED_BATCH_SIZE = 16
 ID_PAGE_SIZE = 1000
+QUEUE_DEPTH = 2  # batches buffered between pipeline stages
+RENORM_SCROLL_SIZE = 2048
 
 def _chunked(seq: List[Any], size: int) -> Generator[List[Any], None, None]:
     for i in range(0, len(seq), size):
@@ -163,204 +168,149 @@ class VectorMaintenance:
         logger.warning("VectorStore compat: no iter/list ids available; treating as empty")
         return
 
-    def sync_emails_to_vectors(self, limit: int | None = None) -> dict[str, Any]:
-        """Sync email content to vector store (batched with API-compat fallbacks)."""
-        logger.info("Starting email to vector sync (batched)")
+    def _ensure_sync_state(self) -> None:
+        """Per-content record of what is in the vector store (ready_for_embedding is set on insert)."""
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS vector_sync_state (
+                content_id INTEGER PRIMARY KEY,
+                collection TEXT NOT NULL,
+                synced_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
 
-        get_missing = getattr(self.db, "get_emails_without_vectors", None)
-        if not get_missing:
-            logger.error("DB compat: get_emails_without_vectors() not found")
-            return {"synced": 0, "errors": ["missing API: get_emails_without_vectors"], "status": "error"}
+    def _mark_synced(self, collection: str, content_ids: list[Any]) -> None:
+        self.db.batch_mark_vectorized(content_ids)
+        self._record_synced(collection, content_ids)
 
-        emails = get_missing(limit=limit)
-        total = len(emails) if emails else 0
-        if not emails:
-            logger.info("No emails need vector sync")
-            return {"synced": 0, "status": "no emails to sync"}
+    def _record_synced(self, collection: str, content_ids: list[Any]) -> None:
+        conn = self.db.get_connection()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO vector_sync_state (content_id, collection) VALUES (?, ?)",
+                [(int(cid), collection) for cid in content_ids],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _seed_sync_state(self, collection: str) -> None:
+        """Record points already in the store so the first run only embeds what is missing."""
+        if self.db.fetch_one(
+            "SELECT 1 AS found FROM vector_sync_state WHERE collection = ? LIMIT 1", (collection,)
+        ):
+            return
+        ids = (int(pid) for pid in self._vs_iter_ids(collection) if str(pid).isdigit())
+        for chunk in iter(lambda: list(islice(ids, ID_PAGE_SIZE)), []):
+            self._record_synced(collection, chunk)
+
+    def _iter_unsynced_batches(
+        self, source_type: str, after_id: int = 0, limit: int | None = None
+    ) -> Generator[List[dict], None, None]:
+        """Keyset-paged batches (ascending ID) of content not yet in the vector store.
+
+        Starts after after_id, then wraps around for unsynced rows at or below
+        it, so the watermark only decides where the scan begins.
+        """
+        remaining = limit
+        ranges = [(after_id, None)] + ([(0, after_id)] if after_id else [])
+        for lower, upper in ranges:
+            last_id = lower
+            while remaining is None or remaining > 0:
+                page_size = BATCH_SIZE if remaining is None else min(BATCH_SIZE, remaining)
+                rows = self.db.fetch(
+                    """
+                    SELECT c.id, c.title, c.body, c.source_type FROM content_unified c
+                    WHERE c.source_type = ? AND c.id > ? AND (? IS NULL OR c.id <= ?)
+                    AND NOT EXISTS (SELECT 1 FROM vector_sync_state s WHERE s.content_id = c.id)
+                    ORDER BY c.id LIMIT ?
+                    """,
+                    (source_type, last_id, upper, upper, page_size),
+                )
+                if not rows:
+                    break
+                last_id = rows[-1]['id']
+                if remaining is not None:
+                    remaining -= len(rows)
+                yield [self._to_sync_item(row) for row in rows]
+
+    @staticmethod
+    def _to_sync_item(row: dict) -> dict:
+        return {
+            'id': row['id'],
+            'text': row.get('body') or '',
+            'metadata': {
+                'title': row.get('title'),
+                'content_type': row.get('source_type'),
+            },
+        }
 
-        synced_count = 0
-        errors = []
-        batch_idx = 0
-
-        for batch in _chunked(emails, BATCH_SIZE):
-            batch_idx += 1
-            logger.info(f"Processing batch {batch_idx} ({synced_count}/{total} done)")
-            ids = [e['id'] for e in batch]
-            texts = [e.get('body') or '' for e in batch]
-            metas = [
-                {
-                    'subject': e.get('subject'),
-                    'from': e.get('sender'),
-                    'date': e.get('date')
-                } for e in batch
-            ]
-
-            # Embeddings (batch preferred)
-            try:
-                if hasattr(self.embedding_service, 'batch_encode'):
-                    embeddings = self.embedding_service.batch_encode(texts, batch_size=EMBED_BATCH_SIZE)
-                else:
-                    get_emb = getattr(self.embedding_service, 'get_embedding', None) or getattr(self.embedding_service, 'encode')
-                    embeddings = [get_emb(t) for t in texts]
-            except Exception as e:
-                logger.error(f"Batch embedding failed: {e}")
-                embeddings = []
-                get_emb = getattr(self.embedding_service, 'get_embedding', None) or getattr(self.embedding_service, 'encode')
-                for i, t in enumerate(texts):
-                    try:
-                        embeddings.append(get_emb(t))
-                    except Exception as ie:
-                        embeddings.append(None)
-                        errors.append({"email_id": ids[i], "error": str(ie)})
-
-            # Upsert to vector store (batch preferred)
-            valid_points = []
-            for i, emb in enumerate(embeddings):
-                if emb is None:
-                    continue
-                valid_points.append({
-                    'id': ids[i],
-                    'vector': emb,
-                    'metadata': metas[i],
-                    'collection': 'emails'
-                })
-
-            if not valid_points:
-                continue
+    def _make_pipeline(self, collection: str, checkpoint: SyncCheckpoint | None = None) -> VectorSyncPipeline:
+        self._ensure_sync_state()
+        return VectorSyncPipeline(
+            embedding_service=self.embedding_service,
+            vector_store=self.vector_store,
+            collection=collection,
+            embed_batch_size=EMBED_BATCH_SIZE,
+            queue_depth=QUEUE_DEPTH,
+            checkpoint=checkpoint,
+            on_committed=lambda ids: self._mark_synced(collection, ids),
+        )
 
-            try:
-                if hasattr(self.vector_store, 'batch_upsert'):
-                    self.vector_store.batch_upsert(collection='emails', points=valid_points)
-                else:
-                    add_email = getattr(self.vector_store, 'add_email_vector', None)
-                    add_vec = getattr(self.vector_store, 'add_vector', None)
-                    for pt in valid_points:
-                        if add_email:
-                            add_email(email_id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'])
-                        elif add_vec:
-                            add_vec(id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'], collection='emails')
-                        else:
-                            raise RuntimeError("VectorStore compat: no add_* method available")
-
-                # Mark vectorized in DB (bulk if possible)
-                self._db_mark_emails_vectorized([pt['id'] for pt in valid_points])
-
-                synced_count += len(valid_points)
+    def sync_emails_to_vectors(self, limit: int | None = None, resume: bool = True) -> dict[str, Any]:
+        """Sync email content that is not yet in the vector store.
+
+        Reads, encoding and upserts overlap in a bounded pipeline. Only rows
+        without a sync record are read, so reruns never re-embed the corpus.
+        The per-batch checkpoint is a resume hint: with resume=True the scan
+        starts after the last committed email and then picks up any unsynced
+        rows below it.
+        """
+        checkpoint = SyncCheckpoint("vector_sync_emails")
+        if not resume:
+            checkpoint.clear()
+        after_id = checkpoint.load().get('last_id') or 0
+        pipeline = self._make_pipeline('emails', checkpoint)
+        self._seed_sync_state('emails')
+        logger.info(f"Starting email to vector sync (pipelined, resuming after id {after_id})")
+
+        result = pipeline.run(
+            self._iter_unsynced_batches('email', after_id=after_id, limit=limit)
+        )
+        if result['synced'] == 0 and result['status'] == 'completed' and not result['errors']:
+            logger.info("No emails need vector sync")
+            result['status'] = "no emails to sync"
+        return result
 
-            except Exception as e:
-                logger.error(f"Failed batch upsert: {e}")
-                for pt in valid_points:
-                    try:
-                        add_email = getattr(self.vector_store, 'add_email_vector', None)
-                        add_vec = getattr(self.vector_store, 'add_vector', None)
-                        if add_email:
-                            add_email(email_id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'])
-                        elif add_vec:
-                            add_vec(id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'], collection='emails')
-                        else:
-                            raise RuntimeError("VectorStore compat: no add_* method available")
-                        self._db_mark_emails_vectorized([pt['id']])
-                        synced_count += 1
-                    except Exception as ie:
-                        errors.append({"email_id": pt['id'], "error": str(ie)})
-
-        logger.info(f"Synced {synced_count} / {total} emails to vector store")
-        return {
-            "synced": synced_count,
-            "errors": errors,
-            "batches": batch_idx,
-            "status": "completed"
-        }
-    
     def sync_missing_vectors(self, collection: str = "emails") -> dict[str, Any]:
         """Find and sync content missing from vector store."""
         logger.info(f"Checking for missing vectors in {collection}")
 
-        db_ids = self._db_get_all_content_ids(content_type=collection)
-
-        vector_ids_seen = set()
-        for vid in self._vs_iter_ids(collection):
-            vector_ids_seen.add(vid)
+        type_mapping = {'emails': 'email', 'pdfs': 'pdf', 'transcriptions': 'transcription',
+                        'notes': 'note', 'documents': 'document'}
+        db_ids = self.db.get_all_content_ids(content_type=type_mapping.get(collection, collection))
 
-        missing = db_ids - vector_ids_seen
+        vector_ids_seen = set(self._vs_iter_ids(collection))
+        missing_list = sorted(
+            cid for cid in db_ids if str(point_id_for(cid)) not in vector_ids_seen
+        )
 
-        if not missing:
+        if not missing_list:
             logger.info("No missing vectors found")
             return {"missing": 0, "status": "all synced"}
 
-        logger.info(f"Found {len(missing)} missing vectors; syncing in batches of {BATCH_SIZE}")
+        logger.info(f"Found {len(missing_list)} missing vectors; syncing in batches of {BATCH_SIZE}")
 
-        synced = 0
-        errors = []
-        missing_list = list(missing)
+        def batches() -> Generator[List[dict], None, None]:
+            for chunk in _chunked(missing_list, BATCH_SIZE):
+                rows = sorted(self.db.get_content_by_ids(chunk), key=lambda r: r['id'])
+                yield [self._to_sync_item(row) for row in rows]
 
-        for batch in _chunked(missing_list, BATCH_SIZE):
-            contents, ids, texts, metadatas = [], [], [], []
-            for cid in batch:
-                c = self._db_get_content_by_id(cid)
-                if not c:
-                    continue
-                contents.append(c)
-                ids.append(c.get('id', cid))
-                texts.append(c.get('text') or '')
-                metadatas.append(c.get('metadata', {}))
-
-            if not ids:
-                continue
-
-            try:
-                if hasattr(self.embedding_service, 'batch_encode'):
-                    embeddings = self.embedding_service.batch_encode(texts, batch_size=EMBED_BATCH_SIZE)
-                else:
-                    get_emb = getattr(self.embedding_service, 'get_embedding', None) or getattr(self.embedding_service, 'encode')
-                    embeddings = [get_emb(t) for t in texts]
-            except Exception as e:
-                logger.error(f"Batch embedding failed: {e}")
-                embeddings = []
-                get_emb = getattr(self.embedding_service, 'get_embedding', None) or getattr(self.embedding_service, 'encode')
-                for t in texts:
-                    try:
-                        embeddings.append(get_emb(t))
-                    except Exception:
-                        embeddings.append(None)
-
-            points = []
-            for i, emb in enumerate(embeddings):
-                if emb is None:
-                    errors.append({"id": ids[i], "error": "embedding failed"})
-                    continue
-                points.append({'id': ids[i], 'vector': emb, 'metadata': metadatas[i], 'collection': collection})
-
-            try:
-                if hasattr(self.vector_store, 'batch_upsert'):
-                    self.vector_store.batch_upsert(collection=collection, points=points)
-                else:
-                    add_vec = getattr(self.vector_store, 'add_vector', None)
-                    for pt in points:
-                        if add_vec:
-                            add_vec(id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'], collection=collection)
-                        else:
-                            raise RuntimeError("VectorStore compat: add_vector missing")
-                synced += len(points)
-            except Exception as e:
-                logger.error(f"Vector upsert failed: {e}")
-                add_vec = getattr(self.vector_store, 'add_vector', None)
-                for pt in points:
-                    try:
-                        if add_vec:
-                            add_vec(id=pt['id'], embedding=pt['vector'], metadata=pt['metadata'], collection=collection)
-                            synced += 1
-                        else:
-                            errors.append({"id": pt['id'], "error": "add_vector missing"})
-                    except Exception as ie:
-                        errors.append({"id": pt['id'], "error": str(ie)})
-
-        return {
-            "missing_found": len(missing_list),
-            "synced": synced,
-            "errors": errors,
-            "status": "completed"
-        }
+        # The missing set is recomputed every run, so no checkpoint is needed to resume
+        result = self._make_pipeline(collection).run(batches())
+        result["missing_found"] = len(missing_list)
+        return result
     
     def reconcile_vectors(self, fix: bool = False) -> dict[str, Any]:
         """Reconcile vector store with database."""
@@ -485,62 +435,41 @@ class VectorMaintenance:
             "status": "completed"
         }
     
-    def renormalize_vectors(self, collection: str = None, dry_run: bool = True) -> dict[str, Any]:
-        """Re-normalize existing vectors to unit length (L2 norm = 1.0)."""
-        import numpy as np
-        
+    def renormalize_vectors(
+        self, collection: str = None, dry_run: bool = True, resume: bool = True
+    ) -> dict[str, Any]:
+        """Re-normalize existing vectors to unit length (L2 norm = 1.0).
+
+        Scrolls in large blocks and rewrites off-norm vectors in batched updates
+        (see VectorRepairEngine); dry runs report norm histograms only.
+        """
         logger.info(f"Re-normalizing vectors (collection={collection}, dry_run={dry_run})")
-        
+
         collections = [collection] if collection else ["emails", "pdfs", "transcriptions", "notes"]
+        engine = VectorRepairEngine(self.vector_store, scroll_batch_size=RENORM_SCROLL_SIZE)
         normalized_count = 0
         already_normalized = 0
+        per_collection = {}
         errors = []
-        
+
         for coll in collections:
             try:
-                # Get all vectors from collection
-                vectors = self.vector_store.client.scroll(
-                    collection_name=coll,
-                    limit=100,
-                    with_vectors=True
-                )
-                
-                for batch in vectors:
-                    for point in batch:
-                        vector = np.array(point.vector)
-                        norm = np.linalg.norm(vector)
-                        
-                        # Check if already normalized (close to 1.0)
-                        if abs(norm - 1.0) < 0.01:
-                            already_normalized += 1
-                            continue
-                        
-                        # Normalize the vector
-                        if norm > 0:
-                            normalized_vector = vector / norm
-                            
-                            if not dry_run:
-                                # Update the vector in Qdrant
-                                self.vector_store.client.update_vectors(
-                                    collection_name=coll,
-                                    points=[{
-                                        "id": point.id,
-                                        "vector": normalized_vector.tolist()
-                                    }]
-                                )
-                            
-                            normalized_count += 1
-                            
-                            if normalized_count % 100 == 0:
-                                logger.info(f"Normalized {normalized_count} vectors...")
-                                
+                report = engine.repair(coll, dry_run=dry_run, resume=resume)
             except Exception as e:
                 logger.error(f"Error processing collection {coll}: {e}")
                 errors.append({"collection": coll, "error": str(e)})
-        
+                continue
+            per_collection[coll] = report
+            normalized_count += report["normalized"]
+            already_normalized += report["already_normalized"]
+            verification = report.get("verification")
+            if verification and not verification["passed"]:
+                errors.append({"collection": coll, "error": "post-write norm verification failed"})
+
         return {
             "normalized_count": normalized_count,
             "already_normalized": already_normalized,
+            "collections": per_collection,
             "errors": errors,
             "dry_run": dry_run,
             "status": "completed" if not errors else "completed_with_errors"
@@ -556,6 +485,7 @@ def main():
     # Sync emails command
     sync_emails = subparsers.add_parser('sync-emails', help='Sync emails to vectors')
     sync_emails.add_argument('--limit', type=int, help='Limit number of emails to sync')
+    sync_emails.add_argument('--restart', action='store_true', help='Ignore checkpoint and scan from the first email')
     
     # Sync missing command
     sync_missing = subparsers.add_parser('sync-missing', help='Sync missing vectors')
@@ -576,6 +506,7 @@ def main():
     renorm = subparsers.add_parser('renormalize', help='Re-normalize vectors to unit length')
     renorm.add_argument('--collection', help='Specific collection to renormalize')
     renorm.add_argument('--execute', action='store_true', help='Actually update (not dry run)')
+    renorm.add_argument('--restart', action='store_true', help='Ignore checkpoint and start over')
     
     args = parser.parse_args()
     
@@ -586,7 +517,7 @@ def main():
     maintenance = VectorMaintenance()
     
     if args.command == 'sync-emails':
-        result = maintenance.sync_emails_to_vectors(limit=args.limit)
+        result = maintenance.sync_emails_to_vectors(limit=args.limit, resume=not args.restart)
     elif args.command == 'sync-missing':
         result = maintenance.sync_missing_vectors(collection=args.collection)
     elif args.command == 'reconcile':
@@ -598,7 +529,8 @@ def main():
     elif args.command == 'renormalize':
         result = maintenance.renormalize_vectors(
             collection=args.collection,
-            dry_run=not args.execute
+            dry_run=not args.execute,
+            resume=not args.restart
         )
     else:
         parser.print_help()
@@ -0,0 +1,208 @@
+"""
+Batched vector renormalization / repair.
+
+Scrolls a collection in large blocks, computes norms for the whole block with
+numpy, rewrites only off-norm vectors in batched update requests and checks a
+random sample of the rewritten points afterwards. Non-dry runs checkpoint the
+scroll position after every block so a killed run resumes where it stopped.
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from utilities.maintenance.vector_sync_pipeline import SyncCheckpoint
+
+# Norm histogram bin edges; [0.99, 1.01) is the "already unit length" band
+NORM_BIN_EDGES = [0.0, 0.5, 0.9, 0.99, 1.01, 1.1, 2.0, np.inf]
+MAX_EXAMPLE_IDS = 20
+
+
+def _bin_labels() -> list[str]:
+    return [f"{lo:g}-{hi:g}" for lo, hi in zip(NORM_BIN_EDGES[:-1], NORM_BIN_EDGES[1:])]
+
+
+class _RepairStats:
+    """Running totals for one collection (serializable for checkpoints)."""
+
+    def __init__(self, state: dict[str, Any] | None = None) -> None:
+        state = state or {}
+        self.scanned = state.get("scanned", 0)
+        self.normalized = state.get("normalized", 0)
+        self.already_normalized = state.get("already_normalized", 0)
+        self.unrepairable = state.get("unrepairable", 0)
+        self.unrepairable_ids = state.get("unrepairable_ids", [])
+        self.histogram = np.asarray(state.get("histogram", [0] * (len(NORM_BIN_EDGES) - 1)), dtype=np.int64)
+        self.norm_sum = state.get("norm_sum", 0.0)
+        self.norm_min = state.get("norm_min")
+        self.norm_max = state.get("norm_max")
+
+    def add_block(self, norms: np.ndarray, repairable: np.ndarray, unit: np.ndarray, ids: list[str]) -> None:
+        finite = norms[np.isfinite(norms)]
+        self.scanned += len(norms)
+        self.already_normalized += int(unit.sum())
+        bad = ~repairable & ~unit
+        self.unrepairable += int(bad.sum())
+        if bad.any() and len(self.unrepairable_ids) < MAX_EXAMPLE_IDS:
+            bad_ids = [ids[i] for i in np.flatnonzero(bad)]
+            self.unrepairable_ids.extend(bad_ids[:MAX_EXAMPLE_IDS - len(self.unrepairable_ids)])
+        if finite.size:
+            self.histogram += np.histogram(finite, bins=NORM_BIN_EDGES)[0]
+            self.norm_sum += float(finite.sum())
+            lo, hi = float(finite.min()), float(finite.max())
+            self.norm_min = lo if self.norm_min is None else min(self.norm_min, lo)
+            self.norm_max = hi if self.norm_max is None else max(self.norm_max, hi)
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "normalized": self.normalized,
+            "already_normalized": self.already_normalized,
+            "unrepairable": self.unrepairable,
+            "unrepairable_ids": self.unrepairable_ids,
+            "histogram": self.histogram.tolist(),
+            "norm_sum": self.norm_sum,
+            "norm_min": self.norm_min,
+            "norm_max": self.norm_max,
+        }
+
+    def report(self) -> dict[str, Any]:
+        counted = int(self.histogram.sum())
+        return {
+            "scanned": self.scanned,
+            "normalized": self.normalized,
+            "already_normalized": self.already_normalized,
+            "unrepairable": self.unrepairable,
+            "unrepairable_ids": self.unrepairable_ids,
+            "norm_histogram": dict(zip(_bin_labels(), self.histogram.tolist())),
+            "norm_min": self.norm_min,
+            "norm_max": self.norm_max,
+            "norm_mean": self.norm_sum / counted if counted else None,
+        }
+
+
+class VectorRepairEngine:
+    """Bulk L2 renormalization for a Qdrant collection."""
+
+    def __init__(
+        self,
+        vector_store: Any,
+        scroll_batch_size: int = 2048,
+        write_batch_size: int = 256,
+        tolerance: float = 0.01,
+        verify_sample: int = 256,
+        checkpoint_dir: str | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            vector_store: VectorStore with iter_points/update_vectors_many/get_many
+            scroll_batch_size: Points read per scroll block
+            write_batch_size: Points per update request
+            tolerance: Norms within 1.0 ± tolerance count as already normalized
+            verify_sample: Rewritten points re-read afterwards to confirm unit norm
+            checkpoint_dir: Override the checkpoint directory
+            seed: RNG seed for the verification sample
+        """
+        self.vector_store = vector_store
+        self.scroll_batch_size = scroll_batch_size
+        self.write_batch_size = write_batch_size
+        self.tolerance = tolerance
+        self.verify_sample = verify_sample
+        self.checkpoint_dir = checkpoint_dir
+        self._rng = np.random.default_rng(seed)
+
+    def checkpoint_for(self, collection: str) -> SyncCheckpoint:
+        return SyncCheckpoint(f"renormalize_{collection}", directory=self.checkpoint_dir)
+
+    def repair(self, collection: str, dry_run: bool = True, resume: bool = True) -> dict[str, Any]:
+        """Renormalize one collection.
+
+        Args:
+            collection: Collection name
+            dry_run: Only collect norm statistics, write nothing
+            resume: Continue from the checkpoint of an interrupted run (ignored for dry runs)
+
+        Returns:
+            Counts, norm histogram/min/max/mean and, for real runs, sample verification
+        """
+        checkpoint = None if dry_run else self.checkpoint_for(collection)
+        state = checkpoint.load() if checkpoint and resume else {}
+        stats = _RepairStats(state.get("stats"))
+        offset = state.get("last_id")
+        if offset is not None:
+            logger.info(f"Resuming renormalization of {collection} from point {offset}")
+
+        sample: list[str] = []
+        rewritten_seen = 0
+        start = time.perf_counter()
+
+        for ids, vectors, _ in self.vector_store.iter_points(
+            batch_size=self.scroll_batch_size, collection=collection, offset=offset
+        ):
+            # Scroll offsets are inclusive; the watermark point was handled last run
+            if offset is not None:
+                if ids and ids[0] == str(offset):
+                    ids, vectors = ids[1:], vectors[1:]
+                offset = None
+            if not ids:
+                continue
+
+            norms = np.linalg.norm(vectors, axis=1)
+            finite = np.isfinite(norms)
+            unit = finite & (np.abs(norms - 1.0) < self.tolerance)
+            repairable = finite & (norms > 0) & ~unit
+            stats.add_block(norms, repairable, unit, ids)
+
+            if repairable.any():
+                idx = np.flatnonzero(repairable)
+                if not dry_run:
+                    fixed = vectors[idx] / norms[idx, None]
+                    target_ids = [ids[i] for i in idx]
+                    self.vector_store.update_vectors_many(
+                        target_ids, fixed, collection=collection, batch_size=self.write_batch_size
+                    )
+                    for point_id in target_ids:
+                        rewritten_seen += 1
+                        if len(sample) < self.verify_sample:
+                            sample.append(point_id)
+                        else:
+                            j = int(self._rng.integers(rewritten_seen))
+                            if j < self.verify_sample:
+                                sample[j] = point_id
+                stats.normalized += len(idx)
+
+            if checkpoint:
+                checkpoint.save(collection=collection, last_id=ids[-1], stats=stats.to_state())
+            logger.info(f"{collection}: scanned {stats.scanned}, normalized {stats.normalized}")
+
+        result = {
+            "collection": collection,
+            "dry_run": dry_run,
+            "elapsed_seconds": round(time.perf_counter() - start, 3),
+            **stats.report(),
+        }
+        if not dry_run:
+            result["verification"] = self.verify(collection, sample)
+            checkpoint.clear()
+        return result
+
+    def verify(self, collection: str, ids: list[str]) -> dict[str, Any]:
+        """Re-read points and check they are unit length."""
+        if not ids:
+            return {"sampled": 0, "max_deviation": 0.0, "passed": True}
+        points = self.vector_store.get_many(
+            ids, batch_size=self.write_batch_size, with_payload=False, collection=collection
+        )
+        if not points:
+            return {"sampled": 0, "max_deviation": None, "passed": False}
+        norms = np.linalg.norm(np.asarray([p["vector"] for p in points], dtype=np.float32), axis=1)
+        deviation = float(np.max(np.abs(norms - 1.0)))
+        return {
+            "sampled": len(points),
+            "max_deviation": round(deviation, 6),
+            "passed": len(points) == len(ids) and deviation < self.tolerance,
+        }
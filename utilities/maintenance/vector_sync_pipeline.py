@@ -0,0 +1,301 @@
+"""
+Overlapped vector sync pipeline.
+
+Three stages connected by bounded queues so DB reads, embedding and Qdrant
+writes run concurrently instead of strictly alternating:
+
+    reader (DB batches) -> encoder (batch_encode) -> writer (batch_upsert)
+
+Bounded queues give back-pressure: a slow writer stalls the encoder instead
+of piling encoded batches up in memory. Batches are committed in source
+order, so the checkpoint is a simple watermark (last committed content ID)
+and point IDs are derived from content IDs, making re-runs idempotent.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from utilities.vector_store import point_id_for
+
+CHECKPOINT_DIR = Path("data/system_data/checkpoints")
+
+_STOP = object()
+
+
+class SyncCheckpoint:
+    """JSON watermark file so a killed sync resumes after the last committed batch."""
+
+    def __init__(self, name: str, directory: Path | str | None = None) -> None:
+        self.path = Path(directory or CHECKPOINT_DIR) / f"{name}.json"
+
+    def load(self) -> dict[str, Any]:
+        """Return saved state, or an empty dict if there is none."""
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self, **state: Any) -> None:
+        """Atomically write state (tmp file + rename)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        state["updated_at"] = datetime.now().isoformat()
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        """Forget progress (next run starts from the beginning)."""
+        self.path.unlink(missing_ok=True)
+
+
+class _StageStats:
+    """Busy/wait time for one pipeline stage."""
+
+    def __init__(self) -> None:
+        self.busy = 0.0
+        self.waiting = 0.0
+        self.batches = 0
+        self.items = 0
+
+    def report(self, wall: float) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "busy_seconds": round(self.busy, 3),
+            "wait_seconds": round(self.waiting, 3),
+            "utilization": round(self.busy / wall, 3) if wall > 0 else 0.0,
+        }
+
+
+class VectorSyncPipeline:
+    """Overlap DB reads, encoding and upserts with bounded queues."""
+
+    def __init__(
+        self,
+        embedding_service: Any,
+        vector_store: Any,
+        collection: str = "emails",
+        embed_batch_size: int = 16,
+        queue_depth: int = 2,
+        checkpoint: SyncCheckpoint | None = None,
+        on_committed: Callable[[list[Any]], None] | None = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            embedding_service: Service with batch_encode() (or encode())
+            vector_store: VectorStore-compatible object with batch_upsert()
+            collection: Target collection
+            embed_batch_size: Model batch size passed to batch_encode
+            queue_depth: Max batches waiting between stages (back-pressure bound)
+            checkpoint: Optional checkpoint updated after every committed batch
+            on_committed: Optional callback with the content IDs of each committed batch
+        """
+        self.embedding_service = embedding_service
+        self.vector_store = vector_store
+        self.collection = collection
+        self.embed_batch_size = embed_batch_size
+        self.queue_depth = queue_depth
+        self.checkpoint = checkpoint
+        self.on_committed = on_committed
+
+    def run(self, batches: Iterable[list[dict]]) -> dict[str, Any]:
+        """Sync every batch from the source.
+
+        Args:
+            batches: Iterable of batches; each item is a dict with "id", "text"
+                and optional "metadata". Batches must be in ascending ID order
+                for the checkpoint watermark to be meaningful.
+
+        Returns:
+            Result dict with synced count, errors and per-stage utilization
+        """
+        read_q: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        encoded_q: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        stop = threading.Event()
+        failures: list[BaseException] = []
+        stats = {"read": _StageStats(), "encode": _StageStats(), "upsert": _StageStats()}
+        errors: list[dict] = []
+        synced = 0
+        last_id = None
+        base_synced = self.checkpoint.load().get("synced", 0) if self.checkpoint else 0
+        start = time.perf_counter()
+
+        def put(q: queue.Queue, item: Any, stage: _StageStats) -> bool:
+            t0 = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    stage.waiting += time.perf_counter() - t0
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(q: queue.Queue, stage: _StageStats) -> Any:
+            t0 = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    item = q.get(timeout=0.1)
+                    stage.waiting += time.perf_counter() - t0
+                    return item
+                except queue.Empty:
+                    continue
+            return _STOP
+
+        def reader() -> None:
+            try:
+                iterator = iter(batches)
+                while True:
+                    t0 = time.perf_counter()
+                    batch = next(iterator, None)
+                    stats["read"].busy += time.perf_counter() - t0
+                    if batch is None:
+                        break
+                    if not batch:
+                        continue
+                    stats["read"].batches += 1
+                    stats["read"].items += len(batch)
+                    if not put(read_q, batch, stats["read"]):
+                        return
+            except BaseException as e:
+                # Let batches already in flight drain so the checkpoint advances
+                failures.append(e)
+            finally:
+                put(read_q, _STOP, stats["read"])
+
+        def encoder() -> None:
+            try:
+                while True:
+                    batch = get(read_q, stats["encode"])
+                    if batch is _STOP:
+                        break
+                    t0 = time.perf_counter()
+                    embeddings = self._encode([item.get("text") or "" for item in batch], errors, batch)
+                    stats["encode"].busy += time.perf_counter() - t0
+                    stats["encode"].batches += 1
+                    stats["encode"].items += len(batch)
+                    if not put(encoded_q, (batch, embeddings), stats["encode"]):
+                        return
+            except BaseException as e:
+                # Let batches already in flight drain so the checkpoint advances
+                failures.append(e)
+            finally:
+                put(encoded_q, _STOP, stats["encode"])
+
+        threads = [
+            threading.Thread(target=reader, name="vector-sync-reader", daemon=True),
+            threading.Thread(target=encoder, name="vector-sync-encoder", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        # Writer runs on the calling thread so commits and checkpoints stay ordered
+        try:
+            while True:
+                item = get(encoded_q, stats["upsert"])
+                if item is _STOP:
+                    break
+                batch, embeddings = item
+                t0 = time.perf_counter()
+                committed = self._upsert(batch, embeddings, errors)
+                stats["upsert"].busy += time.perf_counter() - t0
+                stats["upsert"].batches += 1
+                stats["upsert"].items += len(committed)
+
+                synced += len(committed)
+                last_id = batch[-1]["id"]
+                if self.on_committed and committed:
+                    self.on_committed(committed)
+                if self.checkpoint:
+                    self.checkpoint.save(
+                        collection=self.collection, last_id=last_id, synced=base_synced + synced
+                    )
+        except BaseException as e:
+            failures.append(e)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        wall = time.perf_counter() - start
+        stage_report = {name: stage.report(wall) for name, stage in stats.items()}
+        bottleneck = max(stage_report, key=lambda name: stage_report[name]["busy_seconds"])
+        logger.info(
+            f"Vector sync pipeline: {synced} points in {wall:.1f}s, utilization "
+            + ", ".join(f"{n}={r['utilization']:.0%}" for n, r in stage_report.items())
+            + f" (bottleneck: {bottleneck})"
+        )
+
+        if failures:
+            logger.error(f"Vector sync pipeline aborted: {failures[0]}")
+
+        return {
+            "synced": synced,
+            "errors": errors + [{"error": str(e)} for e in failures],
+            "batches": stats["upsert"].batches,
+            "last_id": last_id,
+            "elapsed_seconds": round(wall, 3),
+            "stages": stage_report,
+            "bottleneck": bottleneck,
+            "status": "failed" if failures else "completed",
+        }
+
+    def _encode(self, texts: list[str], errors: list[dict], batch: list[dict]) -> list[Any]:
+        """Batch-encode, falling back to per-text encoding when the batch fails."""
+        try:
+            if hasattr(self.embedding_service, "batch_encode"):
+                return list(self.embedding_service.batch_encode(texts, batch_size=self.embed_batch_size))
+            return [self.embedding_service.encode(t) for t in texts]
+        except Exception as e:
+            logger.error(f"Batch embedding failed: {e}")
+            embeddings = []
+            for item, text in zip(batch, texts):
+                try:
+                    embeddings.append(self.embedding_service.encode(text))
+                except Exception as ie:
+                    embeddings.append(None)
+                    errors.append({"id": item["id"], "error": str(ie)})
+            return embeddings
+
+    def _upsert(self, batch: list[dict], embeddings: list[Any], errors: list[dict]) -> list[Any]:
+        """Upsert one encoded batch; returns the content IDs that were written."""
+        points = []
+        content_ids = []
+        for item, embedding in zip(batch, embeddings):
+            if embedding is None:
+                continue
+            metadata = dict(item.get("metadata") or {})
+            metadata.setdefault("content_id", str(item["id"]))
+            vector = embedding.tolist() if hasattr(embedding, "tolist") else list(embedding)
+            points.append({"id": point_id_for(item["id"]), "vector": vector, "metadata": metadata})
+            content_ids.append(item["id"])
+
+        if not points:
+            return []
+
+        try:
+            self.vector_store.batch_upsert(collection=self.collection, points=points)
+            return content_ids
+        except Exception as e:
+            logger.error(f"Batch upsert failed, retrying points individually: {e}")
+
+        committed = []
+        for point, content_id in zip(points, content_ids):
+            try:
+                self.vector_store.batch_upsert(collection=self.collection, points=[point])
+                committed.append(content_id)
+            except Exception as ie:
+                errors.append({"id": content_id, "error": str(ie)})
+        return committed
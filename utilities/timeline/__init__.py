@@ -2,5 +2,6 @@
 
 from .database import TimelineDatabase
 from .main import TimelineService
+from .sync import TimelineSync
 
-__all__ = ["TimelineService", "TimelineDatabase"]
+__all__ = ["TimelineService", "TimelineDatabase", "TimelineSync"]
@@ -10,6 +10,25 @@ from typing import Any
 from shared.simple_db import SimpleDB
 from config.settings import get_db_path
 
+EVENT_ID_NAMESPACE = uuid.UUID("3f7d2c1a-5b8e-4c6d-9a0f-1e2b3c4d5e6f")
+
+EVENT_COLUMNS = [
+    "event_id",
+    "event_type",
+    "content_id",
+    "title",
+    "description",
+    "event_date",
+    "metadata",
+    "source_type",
+    "importance_score",
+]
+
+
+def timeline_event_id(event_type: str, content_id: str) -> str:
+    """Deterministic event ID for a source item (re-adding it is a no-op)."""
+    return str(uuid.uuid5(EVENT_ID_NAMESPACE, f"{event_type}:{content_id}"))
+
 
 class TimelineDatabase:
     """Database operations for timeline management."""
@@ -33,7 +52,10 @@ class TimelineDatabase:
     ) -> dict[str, Any]:
         """Create a new timeline event."""
         try:
-            event_id = str(uuid.uuid4())
+            if content_id:
+                event_id = timeline_event_id(event_type, content_id)
+            else:
+                event_id = str(uuid.uuid4())
             metadata_json = json.dumps(metadata) if metadata else None
 
             query = """
@@ -43,7 +65,7 @@ class TimelineDatabase:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
 
-            result = self.db.execute_query(
+            self.db.execute(
                 query,
                 (
                     event_id,
@@ -57,11 +79,37 @@ class TimelineDatabase:
                     importance_score,
                 ),
             )
+            return {"success": True, "event_id": event_id}
 
-            if result["success"]:
-                return {"success": True, "event_id": event_id}
-            else:
-                return {"success": False, "error": result["error"]}
+        except Exception as e:
+            return {"success": False, "error": f"Database error: {str(e)}"}
+
+    def batch_create_timeline_events(
+        self, events: list[dict], batch_size: int = 1000
+    ) -> dict[str, Any]:
+        """Insert many timeline events with chunked executemany.
+
+        Events take the create_timeline_event fields; IDs are derived from
+        (event_type, content_id), so events that already exist are skipped.
+        """
+        try:
+            rows = [
+                (
+                    event.get("event_id")
+                    or timeline_event_id(event["event_type"], event["content_id"]),
+                    event["event_type"],
+                    event.get("content_id"),
+                    event["title"],
+                    event.get("description"),
+                    event["event_date"],
+                    json.dumps(event["metadata"]) if event.get("metadata") else None,
+                    event.get("source_type"),
+                    event.get("importance_score", 0),
+                )
+                for event in events
+            ]
+            stats = self.db.batch_insert("timeline_events", EVENT_COLUMNS, rows, batch_size)
+            return {"success": True, "inserted": stats["inserted"], "total": len(rows)}
 
         except Exception as e:
             return {"success": False, "error": f"Database error: {str(e)}"}
@@ -70,10 +118,13 @@ class TimelineDatabase:
         self,
         start_date: str | None = None,
         end_date: str | None = None,
-        event_type: str | None = None,
+        event_type: str | list[str] | None = None,
         limit: int = 50,
     ) -> dict[str, Any]:
-        """Get timeline events with optional filtering."""
+        """Get timeline events with optional filtering.
+
+        event_type may be a list; all types come back from one query, newest first.
+        """
         try:
             query_parts = ["SELECT * FROM timeline_events WHERE 1=1"]
             params = []
@@ -86,29 +137,24 @@ class TimelineDatabase:
                 query_parts.append("AND event_date <= ?")
                 params.append(end_date)
 
-            if event_type:
-                query_parts.append("AND event_type = ?")
-                params.append(event_type)
+            event_types = [event_type] if isinstance(event_type, str) else event_type
+            if event_types:
+                query_parts.append(f"AND event_type IN ({','.join('?' * len(event_types))})")
+                params.extend(event_types)
 
             query_parts.append("ORDER BY event_date DESC LIMIT ?")
             params.append(limit)
 
-            query = " ".join(query_parts)
-            result = self.db.execute_query(query, tuple(params))
-
-            if result["success"]:
-                events = result["data"]
-                # Parse metadata JSON
-                for event in events:
-                    if event.get("metadata"):
-                        try:
-                            event["metadata"] = json.loads(event["metadata"])
-                        except json.JSONDecodeError:
-                            event["metadata"] = {}
+            events = self.db.fetch(" ".join(query_parts), tuple(params))
+            # Parse metadata JSON
+            for event in events:
+                if event.get("metadata"):
+                    try:
+                        event["metadata"] = json.loads(event["metadata"])
+                    except json.JSONDecodeError:
+                        event["metadata"] = {}
 
-                return {"success": True, "events": events, "count": len(events)}
-            else:
-                return {"success": False, "error": result["error"]}
+            return {"success": True, "events": events, "count": len(events)}
 
         except Exception as e:
             return {"success": False, "error": f"Database error: {str(e)}"}
@@ -126,14 +172,10 @@ class TimelineDatabase:
                 VALUES (?, ?, ?, ?)
             """
 
-            result = self.db.execute_query(
+            self.db.execute(
                 query, (relationship_id, parent_event_id, child_event_id, relationship_type)
             )
-
-            if result["success"]:
-                return {"success": True, "relationship_id": relationship_id}
-            else:
-                return {"success": False, "error": result["error"]}
+            return {"success": True, "relationship_id": relationship_id}
 
         except Exception as e:
             return {"success": False, "error": f"Database error: {str(e)}"}
@@ -151,20 +193,15 @@ class TimelineDatabase:
                 AND te.event_id != ?
             """
 
-            result = self.db.execute_query(query, (event_id, event_id, event_id))
+            events = self.db.fetch(query, (event_id, event_id, event_id))
+            for event in events:
+                if event.get("metadata"):
+                    try:
+                        event["metadata"] = json.loads(event["metadata"])
+                    except json.JSONDecodeError:
+                        event["metadata"] = {}
 
-            if result["success"]:
-                events = result["data"]
-                for event in events:
-                    if event.get("metadata"):
-                        try:
-                            event["metadata"] = json.loads(event["metadata"])
-                        except json.JSONDecodeError:
-                            event["metadata"] = {}
-
-                return {"success": True, "related_events": events, "count": len(events)}
-            else:
-                return {"success": False, "error": result["error"]}
+            return {"success": True, "related_events": events, "count": len(events)}
 
         except Exception as e:
             return {"success": False, "error": f"Database error: {str(e)}"}
@@ -10,6 +10,9 @@ from loguru import logger
 from shared.simple_db import SimpleDB
 from config.settings import get_db_path
 
+from .database import TimelineDatabase
+from .sync import SYNC_BATCH_SIZE, TimelineSync
+
 
 class TimelineService:
     """Timeline management for chronological content navigation."""
@@ -55,6 +58,8 @@ class TimelineService:
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_timeline_date ON timeline_events(event_date)",
             "CREATE INDEX IF NOT EXISTS idx_timeline_type ON timeline_events(event_type)",
+            "CREATE INDEX IF NOT EXISTS idx_timeline_type_date "
+            "ON timeline_events(event_type, event_date)",
             "CREATE INDEX IF NOT EXISTS idx_timeline_importance ON timeline_events(importance_score)",
             "CREATE INDEX IF NOT EXISTS idx_relationships_parent ON timeline_relationships(parent_event_id)",
         ]
@@ -67,75 +72,23 @@ class TimelineService:
         except Exception as e:
             logger.error(f"Error creating timeline tables: {e}")
 
-    def sync_emails_to_timeline(self, limit: int = 100) -> dict[str, Any]:
-        """Sync recent emails to timeline events."""
-        try:
-            # Get emails from the emails table
-            email_query = """
-                SELECT message_id, subject, sender, datetime_utc
-                FROM emails
-                WHERE datetime_utc IS NOT NULL AND datetime_utc != ''
-                ORDER BY datetime_utc DESC
-                LIMIT ?
-            """
-
-            emails = self.db.fetch(email_query, (limit,))
-            if not emails:
-                return {"success": False, "error": "No emails found to sync"}
-
-            synced_count = 0
-            for email in emails:
-                event_result = self._create_timeline_event(
-                    event_type="email",
-                    content_id=email["message_id"],
-                    title=email["subject"] or "No Subject",
-                    description=f"Email from {email['sender']}",
-                    event_date=email["datetime_utc"],
-                    metadata={"sender": email["sender"]},
-                    source_type="gmail",
-                )
-                if event_result["success"]:
-                    synced_count += 1
-
-            return {"success": True, "synced_events": synced_count}
+    def sync_emails_to_timeline(
+        self, limit: int | None = None, batch_size: int = SYNC_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """Sync emails added since the last sync to timeline events."""
+        return self._sync("emails", limit, batch_size)
 
-        except Exception as e:
-            logger.error(f"Error syncing emails to timeline: {e}")
-            return {"success": False, "error": str(e)}
+    def sync_documents_to_timeline(
+        self, limit: int | None = None, batch_size: int = SYNC_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """Sync documents added since the last sync to timeline events."""
+        return self._sync("documents", limit, batch_size)
 
-    def sync_documents_to_timeline(self, limit: int = 50) -> dict[str, Any]:
-        """Sync recent documents to timeline events."""
+    def _sync(self, source: str, limit: int | None, batch_size: int) -> dict[str, Any]:
         try:
-            doc_query = """
-                SELECT chunk_id, file_name, processed_time, char_count
-                FROM documents
-                WHERE processed_time IS NOT NULL
-                ORDER BY processed_time DESC
-                LIMIT ?
-            """
-
-            documents = self.db.fetch(doc_query, (limit,))
-            if not documents:
-                return {"success": False, "error": "No documents found to sync"}
-
-            synced_count = 0
-            for doc in documents:
-                event_result = self._create_timeline_event(
-                    event_type="document",
-                    content_id=doc["chunk_id"],
-                    title=f"Document: {doc['file_name']}",
-                    description=f"Document chunk ({doc['char_count']} chars)",
-                    event_date=doc["processed_time"],
-                    metadata={"file_name": doc["file_name"], "char_count": doc["char_count"]},
-                    source_type="upload",
-                )
-                if event_result["success"]:
-                    synced_count += 1
-
-            return {"success": True, "synced_events": synced_count}
-
+            return TimelineSync(self.db_path).sync(source, limit=limit, batch_size=batch_size)
         except Exception as e:
-            logger.error(f"Error syncing documents to timeline: {e}")
+            logger.error(f"Error syncing {source} to timeline: {e}")
             return {"success": False, "error": str(e)}
 
     def get_timeline_view(
@@ -145,32 +98,18 @@ class TimelineService:
         event_types: list[str] | None = None,
         limit: int = 50,
     ) -> dict[str, Any]:
-        """Get chronological timeline view with filtering."""
-        try:
-            from .database import TimelineDatabase
+        """Get chronological timeline view with filtering.
 
+        All requested event types come from a single date-ordered query.
+        Without event_types the database result is returned as-is (keyed
+        "events"); a type-filtered view is keyed "timeline".
+        """
+        try:
             timeline_db = TimelineDatabase(self.db_path)
-
-            if event_types:
-                # Get events for each type separately and combine
-                all_events = []
-                for event_type in event_types:
-                    result = timeline_db.get_timeline_events(
-                        start_date=start_date,
-                        end_date=end_date,
-                        event_type=event_type,
-                        limit=limit // len(event_types),
-                    )
-                    if result["success"]:
-                        all_events.extend(result["events"])
-
-                # Sort combined results by date
-                all_events.sort(key=lambda x: x["event_date"], reverse=True)
-                all_events = all_events[:limit]
-
-                return {"success": True, "timeline": all_events, "count": len(all_events)}
-            else:
-                return timeline_db.get_timeline_events(start_date, end_date, None, limit)
+            result = timeline_db.get_timeline_events(start_date, end_date, event_types, limit)
+            if not result["success"] or not event_types:
+                return result
+            return {"success": True, "timeline": result["events"], "count": result["count"]}
 
         except Exception as e:
             logger.error(f"Error getting timeline view: {e}")
@@ -189,8 +128,6 @@ class TimelineService:
     ) -> dict[str, Any]:
         """Create timeline event using database operations."""
         try:
-            from .database import TimelineDatabase
-
             timeline_db = TimelineDatabase(self.db_path)
             return timeline_db.create_timeline_event(
                 event_type=event_type,
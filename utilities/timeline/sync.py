@@ -0,0 +1,184 @@
+"""Incremental timeline sync.
+
+Source rows are read in rowid order above a per-source watermark, turned
+into timeline events and written with batched inserts. Event IDs are
+derived from (event_type, content_id), so re-syncing a row is a no-op and
+the watermark only has to be at-least-once.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from config.settings import get_db_path
+from shared.simple_db import SimpleDB
+
+from .database import TimelineDatabase
+
+SYNC_BATCH_SIZE = 1000
+
+
+def _email_event(row: dict) -> dict:
+    return {
+        "event_type": "email",
+        "content_id": row["message_id"],
+        "title": row["subject"] or "No Subject",
+        "description": f"Email from {row['sender']}",
+        "event_date": row["datetime_utc"],
+        "metadata": {"sender": row["sender"]},
+        "source_type": "gmail",
+    }
+
+
+def _document_event(row: dict) -> dict:
+    return {
+        "event_type": "document",
+        "content_id": row["chunk_id"],
+        "title": f"Document: {row['file_name']}",
+        "description": f"Document chunk ({row['char_count']} chars)",
+        "event_date": row["processed_time"],
+        "metadata": {"file_name": row["file_name"], "char_count": row["char_count"]},
+        "source_type": "upload",
+    }
+
+
+@dataclass(frozen=True)
+class SyncSource:
+    """Where to read one kind of timeline event from."""
+
+    table: str
+    columns: str
+    date_column: str
+    to_event: Callable[[dict], dict]
+
+
+SYNC_SOURCES = {
+    "emails": SyncSource(
+        "emails", "message_id, subject, sender, datetime_utc", "datetime_utc", _email_event
+    ),
+    "documents": SyncSource(
+        "documents",
+        "chunk_id, file_name, processed_time, char_count",
+        "processed_time",
+        _document_event,
+    ),
+}
+
+
+class TimelineSync:
+    """Watermark-based incremental sync of source tables into timeline_events.
+
+    Expects the timeline tables created by TimelineService.
+    """
+
+    def __init__(self, db_path: str = None):
+        # Use centralized config if no path provided
+        if db_path is None:
+            db_path = get_db_path()
+        self.db = SimpleDB(db_path)
+        self.timeline_db = TimelineDatabase(db_path)
+        self._ensure_state_table()
+
+    def _ensure_state_table(self) -> None:
+        self.db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS timeline_sync_state (
+                source TEXT PRIMARY KEY,
+                last_rowid INTEGER NOT NULL DEFAULT 0,
+                synced_events INTEGER NOT NULL DEFAULT 0,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+
+    def get_watermark(self, source: str) -> int:
+        """
+        Highest source rowid already synced.
+        """
+        row = self.db.fetch_one(
+            "SELECT last_rowid FROM timeline_sync_state WHERE source = ?", (source,)
+        )
+        return row["last_rowid"] if row else 0
+
+    def _save_watermark(self, source: str, last_rowid: int, synced: int) -> None:
+        self.db.execute(
+            """
+            INSERT INTO timeline_sync_state (source, last_rowid, synced_events, updated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(source) DO UPDATE SET
+                last_rowid = excluded.last_rowid,
+                synced_events = synced_events + excluded.synced_events,
+                updated_at = excluded.updated_at
+            """,
+            (source, last_rowid, synced),
+        )
+
+    def reset(self, source: str | None = None) -> None:
+        """
+        Forget watermarks so the next sync rescans (events are still deduplicated).
+        """
+        if source:
+            self.db.execute("DELETE FROM timeline_sync_state WHERE source = ?", (source,))
+        else:
+            self.db.execute("DELETE FROM timeline_sync_state")
+
+    def sync(
+        self, source: str, limit: int | None = None, batch_size: int = SYNC_BATCH_SIZE
+    ) -> dict[str, Any]:
+        """Sync rows added to a source table since its watermark.
+
+        Args:
+            source: Key of SYNC_SOURCES ("emails" or "documents")
+            limit: Stop after this many source rows (None syncs everything new)
+            batch_size: Rows per read/insert batch
+
+        Returns:
+            Counts of processed rows and inserted events, plus the new watermark
+        """
+        spec = SYNC_SOURCES[source]
+        exists = self.db.fetch_one(
+            "SELECT 1 AS present FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (spec.table,),
+        )
+        if not exists:
+            return {"success": False, "error": f"No {spec.table} table to sync"}
+
+        query = f"""
+            SELECT rowid AS _rowid, {spec.columns}
+            FROM {spec.table}
+            WHERE rowid > ? AND {spec.date_column} IS NOT NULL AND {spec.date_column} != ''
+            ORDER BY rowid
+            LIMIT ?
+        """
+        watermark = self.get_watermark(source)
+        processed = synced = 0
+        while limit is None or processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            rows = self.db.fetch(query, (watermark, size))
+            if not rows:
+                break
+            events = [spec.to_event(row) for row in rows]
+            result = self.timeline_db.batch_create_timeline_events(events, batch_size)
+            if not result["success"]:
+                return {
+                    "success": False,
+                    "error": result["error"],
+                    "processed": processed,
+                    "synced_events": synced,
+                }
+            inserted = result["inserted"]
+            watermark = rows[-1]["_rowid"]
+            self._save_watermark(source, watermark, inserted)
+            processed += len(rows)
+            synced += inserted
+
+        if processed:
+            logger.info(f"Timeline sync {source}: {synced} new events from {processed} rows")
+        return {
+            "success": True,
+            "processed": processed,
+            "synced_events": synced,
+            "watermark": watermark,
+        }
@@ -3,11 +3,13 @@ Qdrant operations - store and search vectors ONLY.
 No complexity. Just vector storage.
 """
 
+import threading
 import time
 import uuid
 from collections.abc import Generator
 from typing import Any
 
+import numpy as np
 from loguru import logger
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
@@ -18,24 +20,60 @@ from qdrant_client.models import (
     MatchValue,
     PointIdsList,
     PointStruct,
+    PointVectors,
     Range,
     VectorParams,
 )
 
 # Logger is now imported globally from loguru
 
+# Same namespace tools/scripts/reindex_qdrant_points.py uses for non-numeric IDs
+POINT_ID_NAMESPACE = uuid.UUID("00000000-0000-0000-0000-00000000E1D0")
+
+
+def point_id_for(content_id: Any) -> int | str:
+    """Deterministic Qdrant point ID for a content ID.
+
+    Numeric IDs are used as-is (what existing points and vector_store.get(content_id)
+    expect); anything else maps to a stable UUID5.
+    """
+    key = str(content_id).strip()
+    if key.isdigit():
+        return int(key)
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, key))
+
+
+def _coerce_point_id(id: Any) -> int | str:
+    """Qdrant accepts unsigned ints or UUID strings; numeric strings become ints."""
+    return int(id) if isinstance(id, str) and id.isdigit() else id
+
 
 class VectorStore:
     """Simple vector storage with Qdrant."""
 
-    def __init__(self, host: str = "localhost", port: int = 6333, collection: str = "emails", dimensions: int = 1024):
-        """Initialize connection to Qdrant."""
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        collection: str = "emails",
+        dimensions: int = 1024,
+        client: QdrantClient | None = None,
+        registry: "VectorStoreRegistry | None" = None,
+    ):
+        """Initialize connection to Qdrant.
+
+        A shared client (and the registry that owns it) can be passed in so
+        per-collection handles don't open their own connection.
+        """
         self.host = host
         self.port = port
         self.collection = collection
-        self.client = None
+        self.client = client
         self.dimensions = dimensions
-        self._connect()
+        self._registry = registry
+        self._generation_db = None  # SimpleDB used to bump the content generation
+        if self.client is None:
+            self._connect()
 
     def _connect(self):
         """Connect to Qdrant with retry logic."""
@@ -84,6 +122,7 @@ class VectorStore:
         point = PointStruct(id=id, vector=vector, payload=payload or {})
 
         self.client.upsert(collection_name=self.collection, points=[point])
+        self._mark_content_changed()
 
         return id
 
@@ -107,6 +146,7 @@ class VectorStore:
         ]
 
         self.client.upsert(collection_name=self.collection, points=points)
+        self._mark_content_changed()
 
         return ids
 
@@ -207,9 +247,129 @@ class VectorStore:
         except Exception:
             return None
 
+    def get_many(
+        self,
+        ids: list[str],
+        batch_size: int = 256,
+        with_payload: bool = True,
+        with_vectors: bool = True,
+        collection: str | None = None,
+    ) -> list[dict]:
+        """Get many points with one retrieve call per batch instead of one per ID.
+
+        Args:
+            ids: Point IDs to fetch
+            batch_size: IDs per retrieve request
+            with_payload: Set False for a vectors-only projection
+            with_vectors: Set False to fetch payloads only
+            collection: Optional collection override
+
+        Returns:
+            Found points in input order ({"id", "vector", "payload"}); missing IDs are skipped
+        """
+        target_collection = collection or self.collection
+        found: dict[str, dict] = {}
+        for start in range(0, len(ids), batch_size):
+            batch = [_coerce_point_id(i) for i in ids[start:start + batch_size]]
+            try:
+                points = self.client.retrieve(
+                    collection_name=target_collection,
+                    ids=batch,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors,
+                )
+            except Exception as e:
+                logger.warning(f"Batch retrieve failed for {len(batch)} IDs in {target_collection}: {e}")
+                continue
+            for point in points:
+                found[str(point.id)] = {
+                    "id": point.id,
+                    "vector": point.vector if with_vectors else None,
+                    "payload": point.payload if with_payload else None,
+                }
+        return [found[str(id)] for id in ids if str(id) in found]
+
+    def iter_points(
+        self,
+        filter: dict | None = None,
+        batch_size: int = 512,
+        with_payload: bool = False,
+        collection: str | None = None,
+        offset: int | str | None = None,
+    ) -> Generator[tuple[list[str], np.ndarray, list[dict] | None], None, None]:
+        """Stream points via scroll as numpy blocks.
+
+        Args:
+            filter: Optional filter dict (same format as search)
+            batch_size: Points per scroll page
+            with_payload: Include payloads in each block
+            collection: Optional collection override
+            offset: Point ID to start from (inclusive), e.g. a resume watermark
+
+        Yields:
+            (ids, vectors, payloads) per page; vectors is a float32 (n, dims) array,
+            payloads is None unless with_payload is set
+        """
+        target_collection = collection or self.collection
+        scroll_filter = self._build_filter(filter) if filter else None
+        next_page = _coerce_point_id(offset)
+
+        while True:
+            points, next_page = self.client.scroll(
+                collection_name=target_collection,
+                scroll_filter=scroll_filter,
+                limit=batch_size,
+                with_payload=with_payload,
+                with_vectors=True,
+                offset=next_page,
+            )
+            if not points:
+                break
+
+            ids = [str(p.id) for p in points]
+            vectors = np.asarray([p.vector for p in points], dtype=np.float32)
+            payloads = [p.payload or {} for p in points] if with_payload else None
+            yield ids, vectors, payloads
+
+            if next_page is None:
+                break
+
+    def update_vectors_many(
+        self,
+        ids: list[int | str],
+        vectors: np.ndarray | list[list[float]],
+        collection: str | None = None,
+        batch_size: int = 256,
+    ) -> int:
+        """Overwrite vectors (payloads untouched) with one request per batch.
+
+        Args:
+            ids: Point IDs; numeric strings are sent as integers
+            vectors: Matching vectors, one row per ID
+            collection: Optional collection override
+            batch_size: Points per update request
+
+        Returns:
+            Number of points updated
+        """
+        target_collection = collection or self.collection
+        point_ids = [_coerce_point_id(i) for i in ids]
+        rows = vectors.tolist() if isinstance(vectors, np.ndarray) else [list(v) for v in vectors]
+
+        for start in range(0, len(point_ids), batch_size):
+            self.client.update_vectors(
+                collection_name=target_collection,
+                points=[
+                    PointVectors(id=pid, vector=vec)
+                    for pid, vec in zip(point_ids[start:start + batch_size], rows[start:start + batch_size])
+                ],
+            )
+        return len(point_ids)
+
     def delete(self, id: str):
         """Delete vector by ID."""
         self.client.delete(collection_name=self.collection, points_selector=PointIdsList(points=[id]))
+        self._mark_content_changed()
     
     def delete_vector(self, id: str, collection: str | None = None):
         """Delete vector by ID with optional collection override.
@@ -218,23 +378,12 @@ class VectorStore:
             id: Vector ID to delete
             collection: Optional collection name (uses instance collection if not provided)
         """
-        collection or self.collection
-        
-        if collection and collection != self.collection:
-            # Create new store instance for different collection
-            temp_store = VectorStore(
-                host=self.host, 
-                port=self.port, 
-                collection=collection, 
-                dimensions=self.dimensions
-            )
-            temp_store.delete(id)
-        else:
-            self.delete(id)
+        self._for_collection(collection).delete(id)
 
     def delete_many(self, ids: list[str]):
         """Delete multiple vectors."""
         self.client.delete(collection_name=self.collection, points_selector=PointIdsList(points=ids))
+        self._mark_content_changed()
 
     def count(self) -> int:
         """Get total number of vectors."""
@@ -244,6 +393,8 @@ class VectorStore:
     def clear(self):
         """Delete all vectors in collection."""
         self.client.delete_collection(self.collection)
+        if self._registry:
+            self._registry.invalidate(self.collection)
         self._ensure_collection()
     
     # API alignment methods for maintenance code
@@ -253,29 +404,13 @@ class VectorStore:
     
     def add_vector(self, id: str, embedding: list[float], metadata: dict[str, Any], collection: str | None = None) -> str:
         """Add vector with optional collection override."""
-        if collection and collection != self.collection:
-            # Create new store instance for different collection
-            temp_store = VectorStore(
-                host=self.host, 
-                port=self.port, 
-                collection=collection, 
-                dimensions=self.dimensions
-            )
-            return temp_store.upsert(vector=embedding, payload=metadata, id=id)
-        return self.upsert(vector=embedding, payload=metadata, id=id)
+        return self._for_collection(collection).upsert(vector=embedding, payload=metadata, id=id)
     
     def batch_upsert(self, collection: str | None, points: list[dict]) -> list[str]:
         """Batch upsert with points format: [{'id', 'vector', 'metadata'}]."""
         
         if collection and collection != self.collection:
-            # Create new store instance for different collection
-            temp_store = VectorStore(
-                host=self.host, 
-                port=self.port, 
-                collection=collection, 
-                dimensions=self.dimensions
-            )
-            return temp_store._batch_upsert_points(points)
+            return self._for_collection(collection)._batch_upsert_points(points)
         
         # Fix method name collision - use original batch_upsert
         vectors = []
@@ -313,7 +448,26 @@ class VectorStore:
         ]
         
         self.client.upsert(collection_name=self.collection, points=points_list)
+        self._mark_content_changed()
         return ids
+
+    def _for_collection(self, collection: str | None) -> "VectorStore":
+        """Handle for another collection that shares this store's client."""
+        if not collection or collection == self.collection:
+            return self
+        registry = self._registry or get_vector_store_registry(self.host, self.port)
+        return registry.get(collection, dimensions=self.dimensions)
+
+    def _mark_content_changed(self):
+        """Bump the content generation so cached search results are invalidated."""
+        try:
+            if self._generation_db is None:
+                from shared.simple_db import SimpleDB
+
+                self._generation_db = SimpleDB()
+            self._generation_db.bump_content_generation()
+        except Exception as e:
+            logger.debug(f"Could not bump content generation after upsert: {e}")
     
     def list_all_ids(self, collection: str | None = None) -> list[str]:
         """List all vector IDs in collection."""
@@ -371,14 +525,7 @@ class VectorStore:
         
         try:
             if collection and collection != self.collection:
-                # Create new store instance for different collection
-                temp_store = VectorStore(
-                    host=self.host, 
-                    port=self.port, 
-                    collection=collection, 
-                    dimensions=self.dimensions
-                )
-                return temp_store.get_collection_stats()
+                return self._for_collection(collection).get_collection_stats()
             
             info = self.client.get_collection(self.collection)
             points = getattr(info, "points_count", None)
@@ -401,13 +548,134 @@ class VectorStore:
             }
 
 
-# Singleton pattern - reuse connection
-_vector_store: VectorStore | None = None
+class VectorStoreRegistry:
+    """One shared Qdrant client plus cheap per-collection VectorStore handles.
+
+    Collection existence/dimension checks run once per collection and are
+    cached, so alternating between collections never reconnects.
+    """
+
+    def __init__(self, host: str = "localhost", port: int = 6333):
+        self.host = host
+        self.port = port
+        self._client: QdrantClient | None = None
+        self._handles: dict[tuple[str, int], VectorStore] = {}
+        self._collection_info: dict[str, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self.stats = {
+            "clients_created": 0,
+            "client_reuses": 0,
+            "handles_created": 0,
+            "handle_reuses": 0,
+            "metadata_hits": 0,
+            "metadata_misses": 0,
+        }
+
+    @property
+    def client(self) -> QdrantClient:
+        """The shared client, created on first use."""
+        with self._lock:
+            if self._client is None:
+                self._client = self._create_client()
+                self.stats["clients_created"] += 1
+            return self._client
+
+    def _create_client(self) -> QdrantClient:
+        """Connect to Qdrant with retry logic."""
+        for attempt in range(2):
+            try:
+                client = QdrantClient(host=self.host, port=self.port, timeout=10.0)
+                client.get_collections()
+                logger.info(f"Connected to Qdrant at {self.host}:{self.port}")
+                return client
+            except Exception as e:
+                if attempt == 0:
+                    logger.warning(f"Connection attempt {attempt + 1} failed, retrying in 0.5s: {e}")
+                    time.sleep(0.5)
+                else:
+                    logger.error(f"Failed to connect to Qdrant (required for vector operations): {e}")
+                    raise
+
+    def get(self, collection: str = "emails", dimensions: int = 1024) -> VectorStore:
+        """Get the handle for a collection, creating it (and the collection) once."""
+        key = (collection, dimensions)
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                self.stats["handle_reuses"] += 1
+                return handle
+
+            if self._client is not None:
+                self.stats["client_reuses"] += 1
+            handle = VectorStore(
+                host=self.host,
+                port=self.port,
+                collection=collection,
+                dimensions=dimensions,
+                client=self.client,
+                registry=self,
+            )
+            info = self.collection_info(collection)
+            if not info["exists"]:
+                handle._ensure_collection()
+                self._collection_info[collection] = {"exists": True, "vector_size": dimensions}
+            elif info["vector_size"] is not None and info["vector_size"] != dimensions:
+                raise ValueError(
+                    f"Collection {collection} has dimensions {info['vector_size']}, expected {dimensions}"
+                )
+
+            self._handles[key] = handle
+            self.stats["handles_created"] += 1
+            return handle
+
+    def collection_info(self, collection: str) -> dict[str, Any]:
+        """Cached collection metadata: {"exists", "vector_size"}."""
+        with self._lock:
+            info = self._collection_info.get(collection)
+            if info is not None:
+                self.stats["metadata_hits"] += 1
+                return info
+
+            self.stats["metadata_misses"] += 1
+            try:
+                params = self.client.get_collection(collection).config.params
+                vectors = getattr(params, "vectors", None)
+                info = {"exists": True, "vector_size": getattr(vectors, "size", None)}
+            except Exception as e:
+                if "not found" not in str(e).lower() and "does not exist" not in str(e).lower():
+                    raise
+                info = {"exists": False, "vector_size": None}
+            self._collection_info[collection] = info
+            return info
+
+    def invalidate(self, collection: str | None = None) -> None:
+        """Forget cached metadata (after creating/deleting collections)."""
+        with self._lock:
+            if collection is None:
+                self._collection_info.clear()
+            else:
+                self._collection_info.pop(collection, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Client/handle reuse and metadata cache counters."""
+        return {
+            **self.stats,
+            "collections": sorted({name for name, _ in self._handles}),
+        }
+
+
+# Registry per Qdrant endpoint - one shared connection each
+_registries: dict[tuple[str, int], VectorStoreRegistry] = {}
+
+
+def get_vector_store_registry(host: str = "localhost", port: int = 6333) -> VectorStoreRegistry:
+    """Get or create the registry for a Qdrant endpoint."""
+    key = (host, port)
+    if key not in _registries:
+        _registries[key] = VectorStoreRegistry(host=host, port=port)
+    return _registries[key]
 
 
 def get_vector_store(collection: str = "emails") -> VectorStore:
-    """Get or create singleton vector store."""
-    global _vector_store
-    if _vector_store is None or _vector_store.collection != collection:
-        _vector_store = VectorStore(collection=collection)
-    return _vector_store
+    """Get the shared handle for a collection (one client for all collections)."""
+    return get_vector_store_registry().get(collection)